@@ -0,0 +1,136 @@
+"""
+Entry point for the command line interface of Nopalli.
+"""
+import argparse
+from contextlib import ExitStack
+import sys
+
+from dotenv import load_dotenv
+
+from src.infrastructure.configuration.container import Application, create_application
+from src.interfaces.presenters.broker_presenter import WebBrokerPresenter
+from src.interfaces.presenters.clock_presenter import WebClockPresenter
+from src.interfaces.presenters.container_presenter import WebContainerPresenter
+from src.interfaces.presenters.dispatch_presenter import WebDispatchPresenter
+from src.interfaces.presenters.driver_presenter import WebDriverPresenter
+from src.interfaces.presenters.export_presenter import StreamingExportPresenter
+from src.interfaces.presenters.import_presenter import CliImportPresenter
+from src.interfaces.presenters.location_presenter import WebLocationPresenter
+from src.interfaces.presenters.search_presenter import WebSearchPresenter
+from src.interfaces.presenters.task_presenter import WebTaskPresenter
+
+
+load_dotenv()
+
+
+def export_history(app_container: Application, args: argparse.Namespace) -> int:
+    """Stream dispatch history for a date range to a file or stdout."""
+    result = app_container.export_controller.handle_export_history(
+        start_date=args.start,
+        end_date=args.end,
+        format=args.format,
+    )
+
+    if not result.is_success:
+        print(f'Error: {result.error.message}', file=sys.stderr)
+        return 1
+
+    output = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        for chunk in result.success:
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+def export_task_facts(app_container: Application, args: argparse.Namespace) -> int:
+    """Write task timing facts for a date range to a columnar file."""
+    with ExitStack() as stack:
+        result = app_container.export_controller.handle_export_task_facts(
+            start_date=args.start,
+            end_date=args.end,
+            format=args.format,
+            open_output=lambda: stack.enter_context(open(args.output, 'wb')),
+        )
+
+    if not result.is_success:
+        print(f'Error: {result.error.message}', file=sys.stderr)
+        return 1
+
+    print(f'Exported {result.success} tasks to {args.output}')
+    return 0
+
+
+def import_reference(app_container: Application, args: argparse.Namespace) -> int:
+    """Create locations, brokers or drivers from a CSV or JSON file."""
+    format = args.format or ('json' if args.file.endswith('.json') else 'csv')
+    with open(args.file, newline='') as source:
+        content = source.read()
+
+    result = app_container.import_controller.handle_import_reference(
+        kind=args.kind,
+        content=content,
+        format=format,
+    )
+
+    if not result.is_success:
+        print(f'Error: {result.error.message}', file=sys.stderr)
+        return 1
+
+    report = result.success
+    for row in report.rows:
+        print(f'Row {row.row}: {row.outcome}: {row.message}', file=sys.stderr)
+    print(f'{report.kind}: {report.created} created, {report.skipped} skipped, {report.failed} failed')
+    return 1 if report.failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='nopalli')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    history = commands.add_parser('export-history', help='Export dispatch and task history.')
+    history.add_argument('--start', required=True, help='First task date (YYYY-MM-DD).')
+    history.add_argument('--end', required=True, help='Last task date (YYYY-MM-DD).')
+    history.add_argument('--format', choices=['csv', 'ndjson'], default='csv')
+    history.add_argument('--output', help='File to write to. Defaults to stdout.')
+    history.set_defaults(handler=export_history)
+
+    facts = commands.add_parser('export-task-facts', help='Export task timing facts in a columnar format.')
+    facts.add_argument('--start', required=True, help='First task date (YYYY-MM-DD).')
+    facts.add_argument('--end', required=True, help='Last task date (YYYY-MM-DD).')
+    facts.add_argument('--format', choices=['npz', 'parquet'], default='npz')
+    facts.add_argument('--output', required=True, help='File to write to.')
+    facts.set_defaults(handler=export_task_facts)
+
+    reference = commands.add_parser('import-reference', help='Import locations, brokers or drivers.')
+    reference.add_argument('--kind', required=True, choices=['locations', 'brokers', 'drivers'])
+    reference.add_argument('--file', required=True, help='CSV file with a header row, or a JSON array.')
+    reference.add_argument('--format', choices=['csv', 'json'], help='Defaults to the file extension.')
+    reference.set_defaults(handler=import_reference)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments and run the requested command."""
+    args = build_parser().parse_args(argv)
+
+    app_container = create_application(
+        broker_presenter=WebBrokerPresenter(),
+        dispatch_presenter=WebDispatchPresenter(),
+        driver_presenter=WebDriverPresenter(),
+        location_presenter=WebLocationPresenter(),
+        task_presenter=WebTaskPresenter(),
+        export_presenter=StreamingExportPresenter(),
+        import_presenter=CliImportPresenter(),
+        search_presenter=WebSearchPresenter(),
+        container_presenter=WebContainerPresenter(),
+        clock_presenter=WebClockPresenter(),
+    )
+    return args.handler(app_container, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
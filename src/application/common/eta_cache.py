@@ -0,0 +1,71 @@
+from datetime import datetime
+from logging import getLogger
+import threading
+from typing import Optional
+from uuid import UUID
+
+from src.application.common.event_bus import EventBus
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.eta import DispatchEta, plan_fingerprint
+from src.domain.aggregates.dispatch.events import (
+    DispatchCancelled,
+    DispatchCompleted,
+    DispatchPaused,
+    DispatchResumed,
+    DispatchRevertedToDraft,
+    TaskCompleted,
+    TaskReverted,
+    TaskStarted,
+    TaskStoppedOff,
+)
+from src.domain.common.events import DomainEvent
+
+
+logger = getLogger(__name__)
+
+# The events after which a dispatch's predicted arrivals are worked out again.
+ETA_EVENTS = (
+    TaskStarted, TaskCompleted, TaskStoppedOff, TaskReverted,
+    DispatchPaused, DispatchResumed, DispatchCompleted, DispatchCancelled, DispatchRevertedToDraft,
+)
+
+
+class EtaCache:
+    """
+    The predicted arrivals of loadboard dispatches, kept between page loads.
+
+    A dispatch's prediction is dropped when one of its tasks transitions,
+    as published on the event bus, so only the dispatches that moved are
+    predicted again. A prediction is also passed over once the dispatch no
+    longer matches the plan it was made for, which catches edits, which
+    publish no events, and saves made by other processes; and once the
+    clock passes its valid_until. Requests and the event bus reach the
+    cache from different threads, so every access holds a lock.
+    """
+
+    def __init__(self) -> None:
+        self._etas: dict[UUID, DispatchEta] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        for event_type in ETA_EVENTS:
+            event_bus.subscribe(event_type, self.invalidate)
+
+    def invalidate(self, event: DomainEvent) -> None:
+        """Drop the prediction of the dispatch an event happened to."""
+        with self._lock:
+            dropped = self._etas.pop(event.dispatch_id, None)
+        if dropped is not None:
+            logger.debug(f"Dropped predicted arrivals of dispatch {event.dispatch_id}")
+
+    def get(self, dispatch: Dispatch, now: datetime) -> Optional[DispatchEta]:
+        """The prediction of a dispatch, if one still holds for it at `now`."""
+        with self._lock:
+            eta = self._etas.get(dispatch.id)
+        if eta is None or now >= eta.valid_until or eta.fingerprint != plan_fingerprint(dispatch):
+            return None
+        return eta
+
+    def put(self, eta: DispatchEta) -> None:
+        with self._lock:
+            self._etas[eta.dispatch_id] = eta
@@ -0,0 +1,54 @@
+from collections import defaultdict
+from logging import getLogger
+from typing import Callable, Iterable, Optional
+
+from src.domain.common.entity import AggregateRoot
+from src.domain.common.events import DomainEvent
+
+
+logger = getLogger(__name__)
+
+EventHandler = Callable[[DomainEvent], None]
+
+
+class EventBus:
+    """
+    Delivers domain events to in-process subscribers.
+
+    Repositories publish an aggregate's events once the transaction that
+    saved it has committed, so handlers only ever see changes that stuck.
+    A handler subscribed to an event class also receives its subclasses;
+    subscribing to DomainEvent receives everything.
+
+    The change is already committed by the time a handler runs, so a
+    failing handler is logged and the remaining handlers still run.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[type, list[EventHandler]] = defaultdict(list)
+        self._resolved: dict[type, list[EventHandler]] = {}
+
+    def subscribe(self, event_type: type[DomainEvent], handler: EventHandler) -> None:
+        self._handlers[event_type].append(handler)
+        self._resolved.clear()
+
+    def handlers_for(self, event_type: type[DomainEvent]) -> list[EventHandler]:
+        if event_type not in self._resolved:
+            self._resolved[event_type] = [
+                handler for cls in event_type.__mro__ for handler in self._handlers.get(cls, ())
+            ]
+        return self._resolved[event_type]
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        for event in events:
+            for handler in self.handlers_for(type(event)):
+                try:
+                    handler(event)
+                except Exception:
+                    logger.exception(f"Handler {handler!r} failed on {type(event).__name__}")
+
+    def publish_from(self, *aggregates: Optional[AggregateRoot]) -> None:
+        """Publish and clear the pending events of each aggregate given."""
+        for aggregate in aggregates:
+            if aggregate is not None:
+                self.publish(aggregate.pull_events())
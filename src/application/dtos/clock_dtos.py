@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Self
+from uuid import UUID
+
+from src.application.dtos.moments import parse_moment
+from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.dispatch.clocks import Clock, ClockType, FreeTimeRule
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.exceptions import ValidationError
+
+
+def _parse_id(value: Optional[str], name: str) -> Optional[UUID]:
+    if not value:
+        return None
+    try:
+        return UUID(value)
+    except ValueError:
+        raise ValidationError(f'Invalid {name} id: {value}.')
+
+
+def _parse_minutes(value: str, name: str) -> int:
+    try:
+        minutes = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f'{name} must be a whole number of minutes.')
+    if minutes < 0:
+        raise ValidationError(f'{name} cannot be negative.')
+    return minutes
+
+
+@dataclass(frozen=True)
+class ClockBoardRequest:
+    """Request for the per diem and detention clocks, read at a moment or now."""
+
+    as_of: Optional[str] = None
+    flagged_only: bool = False
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {"as_of": parse_moment(self.as_of) if self.as_of else None, "flagged_only": self.flagged_only}
+
+
+@dataclass(frozen=True)
+class SetFreeTimeRuleRequest:
+    """Request to set the free time of a clock, for a broker, a location, both, or every one of them."""
+
+    clock: str
+    free_minutes: str
+    warning_minutes: str
+    broker_id: Optional[str] = None
+    location_id: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if self.clock not in [clock.value for clock in ClockType]:
+            raise ValidationError(f'Clock must be one of: {", ".join(clock.value for clock in ClockType)}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "clock": ClockType(self.clock),
+            "free_minutes": _parse_minutes(self.free_minutes, 'Free time'),
+            "warning_minutes": _parse_minutes(self.warning_minutes, 'Warning time'),
+            "broker_id": _parse_id(self.broker_id, 'broker'),
+            "location_id": _parse_id(self.location_id, 'location'),
+        }
+
+
+@dataclass(frozen=True)
+class FreeTimeRuleResponse:
+    """A free-time rule; a broker or location left out means every one."""
+
+    clock: str
+    free_minutes: int
+    warning_minutes: int
+    broker_id: Optional[str]
+    broker_name: Optional[str]
+    location_id: Optional[str]
+    location_name: Optional[str]
+
+    @classmethod
+    def from_rule(cls, rule: FreeTimeRule, broker: Optional[Broker], location: Optional[Location]) -> Self:
+        return cls(
+            clock=rule.clock.value,
+            free_minutes=rule.free_minutes,
+            warning_minutes=rule.warning_minutes,
+            broker_id=str(broker.id) if broker else None,
+            broker_name=broker.name if broker else None,
+            location_id=str(location.id) if location else None,
+            location_name=location.name if location else None,
+        )
+
+
+@dataclass(frozen=True)
+class ClockResponse:
+    """A per diem or detention clock, read against its free time."""
+
+    clock: str
+    status: str
+    dispatch_id: str
+    task_id: str
+    broker_name: str
+    location_name: str
+    container_number: Optional[str]
+    started_at: datetime
+    stopped_at: Optional[datetime]
+    running: bool
+    elapsed_minutes: int
+    free_minutes: int
+    remaining_minutes: int
+    chargeable_minutes: int
+
+    @classmethod
+    def from_clock(cls, clock: Clock, broker: Broker, location: Location) -> Self:
+        return cls(
+            clock=clock.start.clock.value,
+            status=clock.status.value,
+            dispatch_id=str(clock.start.dispatch_id),
+            task_id=str(clock.start.task_id),
+            broker_name=broker.name,
+            location_name=location.name,
+            container_number=clock.start.container_number,
+            started_at=clock.start.started_at,
+            stopped_at=None if clock.running else clock.start.stopped_at,
+            running=clock.running,
+            elapsed_minutes=clock.elapsed_minutes,
+            free_minutes=clock.free_minutes,
+            remaining_minutes=clock.remaining_minutes,
+            chargeable_minutes=clock.chargeable_minutes,
+        )
+
+
+@dataclass(frozen=True)
+class ClockBoardResponse:
+    """The clocks read at a moment, charging first, then the closest to charging."""
+
+    as_of: datetime
+    clocks: list[ClockResponse]
@@ -0,0 +1,208 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional, Self
+from uuid import UUID
+
+from src.application.dtos.moments import parse_moment
+from src.domain.aggregates.dispatch.chassis_moves import ChassisDay
+from src.domain.aggregates.dispatch.container_moves import ContainerMove
+from src.domain.aggregates.dispatch.value_objects import normalize_container_number
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.exceptions import ValidationError
+
+
+# The longest span, in days, a daily chassis report may cover.
+MAX_CHASSIS_REPORT_DAYS = 366
+
+
+@dataclass(frozen=True)
+class YardInventoryRequest:
+    """Request for the containers sitting at a location."""
+
+    location_id: str
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        try:
+            return {"location_id": UUID(self.location_id)}
+        except ValueError:
+            raise ValidationError(f'Invalid location id: {self.location_id}.')
+
+
+@dataclass(frozen=True)
+class ContainerTimelineRequest:
+    """Request for where a container has been and where it is now."""
+
+    container_number: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if not normalize_container_number(self.container_number or '').isalnum():
+            raise ValidationError(f'Invalid container number: {self.container_number}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {"container_number": normalize_container_number(self.container_number)}
+
+
+@dataclass(frozen=True)
+class ContainerMoveResponse:
+    """A completed task that moved a container, and where it left it."""
+
+    container_number: str
+    dispatch_id: str
+    task_id: str
+    instruction: str
+    location_id: str
+    location_name: str
+    state: str
+    loaded: Optional[bool]
+    moved_at: datetime
+
+    @classmethod
+    def from_move(cls, move: ContainerMove, location: Location) -> Self:
+        return cls(
+            container_number=move.container_number,
+            dispatch_id=str(move.dispatch_id),
+            task_id=str(move.task_id),
+            instruction=move.instruction.value,
+            location_id=str(move.location_id),
+            location_name=location.name,
+            state=move.state.value,
+            loaded=move.loaded,
+            moved_at=move.moved_at,
+        )
+
+
+@dataclass(frozen=True)
+class YardInventoryResponse:
+    """The containers dropped at a location and not moved since, longest standing first."""
+
+    location_id: str
+    location_name: str
+    containers: list[ContainerMoveResponse]
+
+
+@dataclass(frozen=True)
+class ContainerTimelineResponse:
+    """Every recorded move of a container, oldest first; the last one says where it is now."""
+
+    container_number: str
+    moves: list[ContainerMoveResponse]
+
+    @property
+    def current(self) -> Optional[ContainerMoveResponse]:
+        return self.moves[-1] if self.moves else None
+
+
+@dataclass(frozen=True)
+class ChassisCountsRequest:
+    """Request for the chassis count of every pool, as of a moment or now."""
+
+    as_of: Optional[str] = None
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {"as_of": parse_moment(self.as_of) if self.as_of else datetime.now()}
+
+
+@dataclass(frozen=True)
+class RecordChassisCountRequest:
+    """Request to set a pool's chassis count to what was counted there, at a moment or now."""
+
+    location_id: str
+    count: int
+    counted_at: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if isinstance(self.count, bool) or not isinstance(self.count, int) or self.count < 0:
+            raise ValidationError('A chassis count must be a whole number of zero or more.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        try:
+            location_id = UUID(self.location_id)
+        except ValueError:
+            raise ValidationError(f'Invalid location id: {self.location_id}.')
+        return {
+            "location_id": location_id,
+            "count": self.count,
+            "counted_at": parse_moment(self.counted_at) if self.counted_at else datetime.now(),
+        }
+
+
+@dataclass(frozen=True)
+class ChassisDailyReportRequest:
+    """Request for each pool's chassis fetched, terminated and left at the end of every day over a date range."""
+
+    start_date: str
+    end_date: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        try:
+            start = date.fromisoformat(self.start_date)
+            end = date.fromisoformat(self.end_date)
+        except (TypeError, ValueError):
+            raise ValidationError('Report dates must be in YYYY-MM-DD format.')
+        if start > end:
+            raise ValidationError('Report start date cannot be after the end date.')
+        if (end - start).days >= MAX_CHASSIS_REPORT_DAYS:
+            raise ValidationError(f'Chassis reports cover at most {MAX_CHASSIS_REPORT_DAYS} days.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "start_date": date.fromisoformat(self.start_date),
+            "end_date": date.fromisoformat(self.end_date),
+        }
+
+
+@dataclass(frozen=True)
+class ChassisCountResponse:
+    """The chassis count of a pool."""
+
+    location_id: str
+    location_name: str
+    count: int
+
+
+@dataclass(frozen=True)
+class ChassisCountsResponse:
+    """The chassis count of every pool with a recorded move, as of a moment."""
+
+    as_of: datetime
+    pools: list[ChassisCountResponse]
+
+
+@dataclass(frozen=True)
+class ChassisDayResponse:
+    """A day of one pool: the chassis fetched from it and terminated at it, and its count at the end of the day."""
+
+    location_id: str
+    location_name: str
+    day: date
+    fetched: int
+    terminated: int
+    balance: int
+
+    @classmethod
+    def from_day(cls, chassis_day: ChassisDay, location: Location) -> Self:
+        return cls(
+            location_id=str(chassis_day.location_id),
+            location_name=location.name,
+            day=chassis_day.day,
+            fetched=chassis_day.fetched,
+            terminated=chassis_day.terminated,
+            balance=chassis_day.balance,
+        )
+
+
+@dataclass(frozen=True)
+class ChassisDailyReportResponse:
+    """Every pool's days over a date range, grouped by pool."""
+
+    start_date: date
+    end_date: date
+    days: list[ChassisDayResponse]
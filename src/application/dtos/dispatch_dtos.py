@@ -1,17 +1,33 @@
-from dataclasses import dataclass
-from datetime import date, time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
 from typing import Optional, Self
 from uuid import UUID
 
+from src.application.dtos.moments import parse_moment
 from src.application.dtos.task_dtos import TaskResponse
 from src.domain.aggregates.broker.aggregate import Broker
 from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.booking import BookingConflict
+from src.domain.aggregates.dispatch.sequencing import SequenceProposal
+from src.domain.aggregates.dispatch.street_turns import StreetTurn
+from src.domain.aggregates.dispatch.driver_assignment import AssignmentProposal
 from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.eta import AppointmentRisk, DispatchEta, TaskEta
+from src.domain.aggregates.dispatch.history import DispatchState
+from src.domain.aggregates.dispatch.validation import PlanRules
 from src.domain.aggregates.dispatch.value_objects import (
      Appointment, AppointmentType, Container, 
-     ContainerSize, DispatchStatus, Instruction
+     ContainerSize, DispatchStatus, Instruction, normalize_container_number
 )
 from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.common.events import DomainEvent
+from src.domain.exceptions import ValidationError
+
+
+MAXIMUM_BULK_DISPATCHES = 1000
+MAXIMUM_PLAN_SUGGESTIONS = 20
+MAXIMUM_STREET_TURN_DAYS = 14
 
 
 @dataclass(frozen=True)
@@ -59,6 +75,38 @@ class CreateDispatchRequest:
         }
 
 
+@dataclass(frozen=True)
+class BulkCreateDispatchesRequest:
+    """Request data for creating many dispatches at once."""
+
+    dispatches: list[dict]
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if not isinstance(self.dispatches, list) or not self.dispatches:
+            raise ValidationError('At least one dispatch is required.')
+        if len(self.dispatches) > MAXIMUM_BULK_DISPATCHES:
+            raise ValidationError(f'At most {MAXIMUM_BULK_DISPATCHES} dispatches can be created at once.')
+
+    def to_execution_params(self) -> dict:
+        """
+        Convert request data to use case parameters.
+
+        Items are kept as single-dispatch requests so a malformed item only
+        fails itself rather than the whole batch.
+        """
+        return {
+            "dispatches": [
+                CreateDispatchRequest(
+                    broker_id=item.get('broker_id'),
+                    driver_id=item.get('driver_id'),
+                    plan=item.get('plan') or [],
+                ) if isinstance(item, dict) else None
+                for item in self.dispatches
+            ]
+        }
+
+
 @dataclass(frozen=True)
 class GetDispatchRequest:
     """Request data for creating a new dispatch."""
@@ -126,6 +174,30 @@ class EditDispatchRequest:
         }
 
 
+@dataclass(frozen=True)
+class SuggestPlanCompletionsRequest:
+    """Request for ways to finish a partial plan."""
+
+    instructions: list[str]
+    limit: int = 5
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        valid = {instruction.value for instruction in Instruction}
+        for instruction in self.instructions:
+            if instruction not in valid:
+                raise ValidationError(f'Unknown instruction: {instruction}.')
+        if not 1 <= self.limit <= MAXIMUM_PLAN_SUGGESTIONS:
+            raise ValidationError(f'Suggestion limit must be between 1 and {MAXIMUM_PLAN_SUGGESTIONS}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "instructions": [Instruction(instruction) for instruction in self.instructions],
+            "limit": self.limit,
+        }
+
+
 @dataclass(frozen=True)
 class StartDispatchRequest:
     """Request to start a dispatch."""
@@ -164,6 +236,164 @@ class GetLoadboardDispatchesRequest:
         }
 
 
+@dataclass(frozen=True)
+class GetDispatchHistoryRequest:
+    """Request for the history of a dispatch, read as of a given moment."""
+
+    dispatch_id: str
+    as_of: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if self.as_of:
+            parse_moment(self.as_of)
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "dispatch_id": UUID(self.dispatch_id),
+            "as_of": parse_moment(self.as_of) if self.as_of else None,
+        }
+
+
+@dataclass(frozen=True)
+class GetLoadboardAsOfRequest:
+    """Request for the loadboard of a date as it stood at a given moment."""
+
+    date: str
+    as_of: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        parse_moment(self.as_of)
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "date": date.fromisoformat(self.date),
+            "as_of": parse_moment(self.as_of),
+        }
+
+
+@dataclass(frozen=True)
+class ProposeDriverAssignmentsRequest:
+    """Request for a proposal of drivers for the draft dispatches of a date."""
+
+    date: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        try:
+            date.fromisoformat(self.date)
+        except ValueError:
+            raise ValidationError(f'Invalid date: {self.date}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "date": date.fromisoformat(self.date),
+        }
+
+
+@dataclass(frozen=True)
+class ProposePlanSequenceRequest:
+    """Request for the order of a draft dispatch's tasks that needs the least travel and lateness."""
+
+    dispatch_id: str
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        try:
+            return {"dispatch_id": UUID(self.dispatch_id)}
+        except ValueError:
+            raise ValidationError(f'Invalid dispatch id: {self.dispatch_id}.')
+
+
+@dataclass(frozen=True)
+class DoubleBookingReportRequest:
+    """Request for the drivers booked on overlapping dispatches over a date range."""
+
+    start_date: str
+    end_date: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        try:
+            start = date.fromisoformat(self.start_date)
+            end = date.fromisoformat(self.end_date)
+        except (TypeError, ValueError):
+            raise ValidationError('Report dates must be in YYYY-MM-DD format.')
+        if start > end:
+            raise ValidationError('Report start date cannot be after the end date.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "start_date": date.fromisoformat(self.start_date),
+            "end_date": date.fromisoformat(self.end_date),
+        }
+
+
+@dataclass(frozen=True)
+class ProposeStreetTurnsRequest:
+    """Request for the street turns between the imports and exports planned over a date range."""
+
+    start_date: str
+    end_date: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        try:
+            start = date.fromisoformat(self.start_date)
+            end = date.fromisoformat(self.end_date)
+        except (TypeError, ValueError):
+            raise ValidationError('Board dates must be in YYYY-MM-DD format.')
+        if start > end:
+            raise ValidationError('Board start date cannot be after the end date.')
+        if (end - start).days >= MAXIMUM_STREET_TURN_DAYS:
+            raise ValidationError(f'Street turns can be proposed over {MAXIMUM_STREET_TURN_DAYS} days at most.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "start_date": date.fromisoformat(self.start_date),
+            "end_date": date.fromisoformat(self.end_date),
+        }
+
+
+@dataclass(frozen=True)
+class GetDispatchByReferenceRequest:
+    """Request for the dispatch a reference number was given to."""
+
+    reference: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if not str(self.reference).strip().isdigit():
+            raise ValidationError(f'Invalid dispatch reference: {self.reference}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {"reference": int(str(self.reference).strip())}
+
+
+@dataclass(frozen=True)
+class FindDispatchesByContainerRequest:
+    """Request for every dispatch with a task moving a container."""
+
+    container_number: str
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        number = normalize_container_number(self.container_number or '')
+        if not number.isalnum():
+            raise ValidationError(f'Invalid container number: {self.container_number}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {"container_number": normalize_container_number(self.container_number)}
+
+
 @dataclass(frozen=True)
 class StartTaskRequest:
     """Request to start current task on in progress dispatch."""
@@ -223,6 +453,28 @@ class CompleteTaskRequest:
         }
 
 
+@dataclass(frozen=True)
+class TaskEtaResponse:
+    """When a driver is expected at a remaining task, and whether its appointment will be kept."""
+
+    priority: int
+    arrival: datetime
+    departure: datetime
+    latest_arrival: datetime
+    risk: Optional[AppointmentRisk]
+
+    @classmethod
+    def from_eta(cls, eta: TaskEta) -> Self:
+        """Create response from a TaskEta."""
+        return cls(
+            priority=eta.priority,
+            arrival=eta.arrival,
+            departure=eta.departure,
+            latest_arrival=eta.latest_arrival,
+            risk=eta.risk,
+        )
+
+
 @dataclass(frozen=True)
 class DispatchResponse:
     """Response data for basic dispatch operations."""
@@ -235,10 +487,14 @@ class DispatchResponse:
     containers: list[Container]
     appointments: list[tuple[date, Appointment]]
     plan: list[Task]
+    # Predicted arrivals at the remaining tasks, on the loadboard only.
+    etas: list[TaskEtaResponse] = field(default_factory=list)
+    # The worst risk of any of those tasks.
+    risk: Optional[AppointmentRisk] = None
     
     @classmethod
-    def from_entity(cls, dispatch: Dispatch) -> Self:
-        """Create response from a Dispatch entity."""
+    def from_entity(cls, dispatch: Dispatch, eta: Optional[DispatchEta] = None) -> Self:
+        """Create response from a Dispatch entity, and its predicted arrivals when given."""
         return cls(
             id=str(dispatch.id),
             reference=dispatch.reference,
@@ -249,6 +505,8 @@ class DispatchResponse:
             containers=dispatch.containers,
             appointments=dispatch.appointments,
             plan=[TaskResponse.from_entity(task) for task in dispatch.plan],   
+            etas=[TaskEtaResponse.from_eta(task) for task in eta.tasks] if eta else [],
+            risk=eta.risk if eta else None,
         )
     
 
@@ -313,4 +571,180 @@ class CompleteTaskResponse:
         """Create response from a Dispatch entity."""
         return cls(
             reference=dispatch.reference,
-        )
\ No newline at end of file
+        )
+
+
+@dataclass(frozen=True)
+class BulkDispatchResult:
+    """Outcome of one item of a bulk dispatch creation, in request order."""
+
+    index: int
+    id: Optional[str] = None
+    reference: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BulkCreateDispatchesResponse:
+    """Response data for a bulk dispatch creation."""
+
+    created: int
+    results: list[BulkDispatchResult]
+
+
+@dataclass(frozen=True)
+class PlanCompletionsResponse:
+    """Rules a partial plan breaks and the shortest ways to finish it."""
+
+    violations: list[str]
+    completions: list[list[Instruction]]
+
+
+@dataclass(frozen=True)
+class PlanRulesResponse:
+    """The plan rules the editors check against, and a version that changes with them."""
+
+    rules: PlanRules
+    minimum_tasks: int
+    maximum_tasks: int
+    version: str
+
+
+@dataclass(frozen=True)
+class DispatchHistoryResponse:
+    """The state of a dispatch at a moment, and the events that led up to it."""
+
+    state: DispatchState
+    events: list[DomainEvent]
+
+
+@dataclass(frozen=True)
+class ProposedAssignmentResponse:
+    """One driver proposed for a draft dispatch, with the cost of the pairing."""
+
+    dispatch_id: str
+    reference: int
+    driver: Driver
+    idle_minutes: int
+    late_minutes: int
+
+
+@dataclass(frozen=True)
+class DriverAssignmentProposalResponse:
+    """Proposed drivers for a date's draft dispatches, and the dispatches left without one."""
+
+    assignments: list[ProposedAssignmentResponse]
+    unassigned: list[DispatchResponse]
+
+    @classmethod
+    def from_proposal(cls, proposal: AssignmentProposal) -> Self:
+        """Create response from an AssignmentProposal."""
+        return cls(
+            assignments=[
+                ProposedAssignmentResponse(
+                    dispatch_id=str(assignment.dispatch.id),
+                    reference=assignment.dispatch.reference,
+                    driver=assignment.driver,
+                    idle_minutes=assignment.idle_minutes,
+                    late_minutes=assignment.late_minutes,
+                )
+                for assignment in proposal.assignments
+            ],
+            unassigned=[DispatchResponse.from_entity(dispatch) for dispatch in proposal.unassigned],
+        )
+
+
+@dataclass(frozen=True)
+class PlanSequenceResponse:
+    """A draft dispatch's tasks in their proposed order, with what that order and the current one cost."""
+
+    dispatch_id: str
+    reference: int
+    tasks: list[TaskResponse]
+    travel_minutes: int
+    late_minutes: int
+    missed_appointments: int
+    current_travel_minutes: int
+    current_late_minutes: int
+    current_missed_appointments: int
+
+    @classmethod
+    def from_proposal(cls, dispatch: Dispatch, proposal: SequenceProposal) -> Self:
+        """Create response from a Dispatch and the SequenceProposal for its plan."""
+        return cls(
+            dispatch_id=str(dispatch.id),
+            reference=dispatch.reference,
+            tasks=[TaskResponse.from_entity(dispatch.plan[position]) for position in proposal.best.order],
+            travel_minutes=proposal.best.travel_minutes,
+            late_minutes=proposal.best.late_minutes,
+            missed_appointments=proposal.best.missed_appointments,
+            current_travel_minutes=proposal.current.travel_minutes,
+            current_late_minutes=proposal.current.late_minutes,
+            current_missed_appointments=proposal.current.missed_appointments,
+        )
+
+
+@dataclass(frozen=True)
+class DoubleBookingResponse:
+    """Two dispatches a driver is booked on at once."""
+
+    driver: Driver
+    date: date
+    dispatch_id: str
+    reference: int
+    other_dispatch_id: str
+    other_reference: int
+    start: time
+    end: time
+
+    @classmethod
+    def from_conflict(cls, conflict: BookingConflict) -> Self:
+        """Create response from a BookingConflict."""
+        return cls(
+            driver=conflict.dispatch.current_driver,
+            date=conflict.day,
+            dispatch_id=str(conflict.dispatch.id),
+            reference=conflict.dispatch.reference,
+            other_dispatch_id=str(conflict.other.id),
+            other_reference=conflict.other.reference,
+            start=time(*divmod(conflict.start, 60)),
+            end=time(*divmod(conflict.end, 60)),
+        )
+
+
+@dataclass(frozen=True)
+class StreetTurnResponse:
+    """An import's empty proposed for an export, with both plans as they would be rewritten."""
+
+    import_dispatch_id: str
+    import_reference: int
+    export_dispatch_id: str
+    export_reference: int
+    container: Container
+    freed_at: Location
+    freed_on: date
+    loaded_at: Location
+    loaded_on: date
+    saved_minutes: int
+    waiting_days: int
+    import_plan: list[TaskResponse]
+    export_plan: list[TaskResponse]
+
+    @classmethod
+    def from_street_turn(cls, turn: StreetTurn) -> Self:
+        """Create response from a StreetTurn."""
+        return cls(
+            import_dispatch_id=str(turn.empty.dispatch.id),
+            import_reference=turn.empty.dispatch.reference,
+            export_dispatch_id=str(turn.need.dispatch.id),
+            export_reference=turn.need.dispatch.reference,
+            container=turn.empty.task.container,
+            freed_at=turn.empty.task.location,
+            freed_on=turn.empty.task.date,
+            loaded_at=turn.need.load.location,
+            loaded_on=turn.need.load.date,
+            saved_minutes=turn.saved_minutes,
+            waiting_days=turn.waiting_days,
+            import_plan=[TaskResponse.from_entity(task) for task in turn.import_plan],
+            export_plan=[TaskResponse.from_entity(task) for task in turn.export_plan],
+        )
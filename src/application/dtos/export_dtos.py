@@ -0,0 +1,117 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from src.domain.exceptions import ValidationError
+
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+COLUMNAR_FORMATS = ('npz', 'parquet')
+
+
+@dataclass(frozen=True)
+class ExportDispatchHistoryRequest:
+    """Request data for exporting dispatch history over a date range."""
+
+    start_date: str
+    end_date: str
+    format: str = 'csv'
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        try:
+            start = date.fromisoformat(self.start_date)
+            end = date.fromisoformat(self.end_date)
+        except (TypeError, ValueError):
+            raise ValidationError('Export dates must be in YYYY-MM-DD format.')
+        if start > end:
+            raise ValidationError('Export start date cannot be after the end date.')
+        if self.format not in EXPORT_FORMATS:
+            raise ValidationError(f'Export format must be one of: {", ".join(EXPORT_FORMATS)}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "start_date": date.fromisoformat(self.start_date),
+            "end_date": date.fromisoformat(self.end_date),
+            "format": self.format,
+        }
+
+
+@dataclass(frozen=True)
+class DispatchHistoryRecord:
+    """One task of a dispatch, flattened together with its dispatch for export."""
+
+    reference: int
+    dispatch_status: str
+    broker_name: str
+    current_driver_name: Optional[str]
+    task_priority: int
+    task_status: str
+    instruction: str
+    location_name: str
+    date: date
+    appointment_type: Optional[str]
+    appointment_start_time: Optional[time]
+    appointment_end_time: Optional[time]
+    container_number: Optional[str]
+    container_size: Optional[str]
+    check_in: Optional[datetime]
+    check_out: Optional[datetime]
+    completed_by: Optional[str]
+
+
+@dataclass(frozen=True)
+class ExportTaskFactsRequest:
+    """Request data for a columnar export of task timing facts."""
+
+    start_date: str
+    end_date: str
+    format: str = 'npz'
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        try:
+            start = date.fromisoformat(self.start_date)
+            end = date.fromisoformat(self.end_date)
+        except (TypeError, ValueError):
+            raise ValidationError('Export dates must be in YYYY-MM-DD format.')
+        if start > end:
+            raise ValidationError('Export start date cannot be after the end date.')
+        if self.format not in COLUMNAR_FORMATS:
+            raise ValidationError(f'Export format must be one of: {", ".join(COLUMNAR_FORMATS)}.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "start_date": date.fromisoformat(self.start_date),
+            "end_date": date.fromisoformat(self.end_date),
+            "format": self.format,
+        }
+
+
+@dataclass
+class TaskFactsChunk:
+    """
+    A batch of task facts laid out column by column.
+
+    Each attribute holds one value per task, in the same order across all
+    columns. `duration` mirrors `Task.time_spent_completing_task` and is
+    None for tasks that have not been completed.
+    """
+
+    reference: list[int] = field(default_factory=list)
+    priority: list[int] = field(default_factory=list)
+    instruction: list[str] = field(default_factory=list)
+    location_name: list[str] = field(default_factory=list)
+    date: list[date] = field(default_factory=list)
+    appointment_type: list[Optional[str]] = field(default_factory=list)
+    appointment_start_time: list[Optional[time]] = field(default_factory=list)
+    appointment_end_time: list[Optional[time]] = field(default_factory=list)
+    check_in: list[Optional[datetime]] = field(default_factory=list)
+    check_out: list[Optional[datetime]] = field(default_factory=list)
+    duration: list[Optional[timedelta]] = field(default_factory=list)
+    driver_name: list[Optional[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.reference)
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+
+from src.domain.exceptions import ValidationError
+
+
+IMPORT_KINDS = ('locations', 'brokers', 'drivers')
+
+
+@dataclass(frozen=True)
+class ImportReferenceDataRequest:
+    """Request data for importing many locations, brokers or drivers at once."""
+
+    kind: str
+    rows: list[dict]
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if self.kind not in IMPORT_KINDS:
+            raise ValidationError(f'Import kind must be one of: {", ".join(IMPORT_KINDS)}.')
+        if not isinstance(self.rows, list) or not all(isinstance(row, dict) for row in self.rows):
+            raise ValidationError('Import rows must be a list of records.')
+        if not self.rows:
+            raise ValidationError('The import file contains no rows.')
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "kind": self.kind,
+            "rows": self.rows,
+        }
+
+
+@dataclass(frozen=True)
+class ImportRowReport:
+    """Why a single row of an import was not created. Rows are numbered from 1."""
+
+    row: int
+    message: str
+
+
+@dataclass(frozen=True)
+class ImportReferenceDataResponse:
+    """Outcome of a reference data import."""
+
+    kind: str
+    created: int
+    skipped: list[ImportRowReport] = field(default_factory=list)
+    errors: list[ImportRowReport] = field(default_factory=list)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Self
+from typing import Optional, Self
 from uuid import UUID
 
 from src.domain.aggregates.location.aggregate import Location
@@ -166,3 +166,45 @@ class LocationResponse:
             state=location.address.state,
             zipcode=str(location.address.zipcode),
         )
+
+
+@dataclass(frozen=True)
+class NearbyLocationsRequest:
+    """Request for the active locations near a zipcode, or near another location."""
+
+    zipcode: Optional[str] = None
+    location_id: Optional[str] = None
+    limit: int = 10
+    within_miles: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if (self.zipcode is None) == (self.location_id is None):
+            raise ValidationError("Either a zipcode or a location id is required")
+        if self.zipcode is not None and not (self.zipcode.strip().isdigit() and len(self.zipcode.strip()) == 5):
+            raise ValidationError("Zipcode must be 5 numbers.")
+        if not 1 <= self.limit <= 100:
+            raise ValidationError("Limit must be between 1 and 100")
+        if self.within_miles is not None and self.within_miles <= 0:
+            raise ValidationError("Distance must be a positive number of miles")
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        try:
+            location_id = None if self.location_id is None else UUID(self.location_id)
+        except ValueError:
+            raise ValidationError(f'Invalid location id: {self.location_id}.')
+        return {
+            "zipcode": None if self.zipcode is None else int(self.zipcode.strip()),
+            "location_id": location_id,
+            "limit": self.limit,
+            "within_miles": self.within_miles,
+        }
+
+
+@dataclass(frozen=True)
+class NearbyLocationResponse:
+    """A location and how far it is, in miles, from where the search started."""
+
+    location: LocationResponse
+    miles: float
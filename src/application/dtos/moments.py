@@ -0,0 +1,26 @@
+"""
+Reading the moments requests ask about.
+"""
+
+from datetime import datetime
+
+from src.domain.exceptions import ValidationError
+
+
+def parse_moment(value: str) -> datetime:
+    """
+    Read an ISO date and time as the naive local time tasks are checked in and out at.
+
+    A moment given with a UTC offset is converted to local time first, so
+    it can be compared with the times the stores record.
+
+    Raises:
+        ValidationError: If the value is not an ISO date and time
+    """
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f'Invalid date and time: {value}.')
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return moment
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.events import TaskCompleted, TaskStarted, TaskStoppedOff
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from src.domain.common.events import DomainEvent
+
+
+# The events customers are told about, and what each one means to them.
+NOTIFIED_EVENTS = {
+    TaskStarted: 'checked_in',
+    TaskCompleted: 'checked_out',
+    TaskStoppedOff: 'checked_out',
+}
+
+
+@dataclass(frozen=True)
+class StatusNotification:
+    """A status update for the customer of a dispatch, sent when a driver checks in or out."""
+
+    dispatch_id: UUID
+    reference: Optional[int]
+    status: str
+    task_priority: int
+    instruction: Instruction
+    location_name: str
+    occurred_at: datetime
+
+    @classmethod
+    def from_events(cls, dispatch: Dispatch, events: list[DomainEvent]) -> list['StatusNotification']:
+        """Build the notifications for the events a dispatch recorded, in the same order."""
+        notifications = []
+        for event in events:
+            status = NOTIFIED_EVENTS.get(type(event))
+            if status is None:
+                continue
+            task = dispatch.get_task(event.priority)
+            notifications.append(cls(
+                dispatch_id=dispatch.id,
+                reference=dispatch.reference,
+                status=status,
+                task_priority=event.priority,
+                instruction=task.instruction,
+                location_name=task.location.name,
+                occurred_at=event.occurred_at,
+            ))
+        return notifications
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """A notification waiting in the outbox, with how often its delivery was tried."""
+
+    id: int
+    notification: StatusNotification
+    attempts: int
+
+    @property
+    def dispatch_id(self) -> UUID:
+        return self.notification.dispatch_id
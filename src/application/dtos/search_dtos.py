@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import Optional, Self
+
+from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.exceptions import ValidationError
+
+
+SEARCH_KINDS = ('location', 'broker', 'driver')
+MAX_PER_PAGE = 50
+
+
+@dataclass(frozen=True)
+class TypeaheadSearchRequest:
+    """Request for the locations, brokers and drivers best matching what has been typed so far."""
+
+    query: str
+    kinds: Optional[str] = None
+    page: int = 1
+    per_page: int = 10
+
+    def __post_init__(self) -> None:
+        """Validate request data"""
+        if not self.query.strip():
+            raise ValidationError("A search query is required")
+        if len(self.query) > 100:
+            raise ValidationError("A search query cannot exceed 100 characters")
+        if self.kinds is not None and not set(self._kinds()) <= set(SEARCH_KINDS):
+            raise ValidationError(f'Search kinds must be among: {", ".join(SEARCH_KINDS)}.')
+        if self.page < 1:
+            raise ValidationError("Page must be 1 or more")
+        if not 1 <= self.per_page <= MAX_PER_PAGE:
+            raise ValidationError(f"Results per page must be between 1 and {MAX_PER_PAGE}")
+
+    def _kinds(self) -> tuple[str, ...]:
+        if self.kinds is None:
+            return SEARCH_KINDS
+        return tuple(kind.strip() for kind in self.kinds.split(',') if kind.strip())
+
+    def to_execution_params(self) -> dict:
+        """Convert request data to use case parameters."""
+        return {
+            "query": self.query.strip(),
+            "kinds": self._kinds(),
+            "offset": (self.page - 1) * self.per_page,
+            "limit": self.per_page,
+        }
+
+
+@dataclass(frozen=True)
+class SearchHitResponse:
+    """One location, broker or driver matching a search, and how well it matched."""
+
+    kind: str
+    id: str
+    label: str
+    detail: str
+    score: float
+
+    @classmethod
+    def from_location(cls, location: Location, score: float) -> Self:
+        address = location.address
+        return cls(
+            kind='location',
+            id=str(location.id),
+            label=location.name,
+            detail=f'{address.street_address}, {address.city}, {address.state} {address.zipcode}',
+            score=score,
+        )
+
+    @classmethod
+    def from_broker(cls, broker: Broker, score: float) -> Self:
+        address = broker.address
+        return cls(
+            kind='broker',
+            id=str(broker.id),
+            label=broker.name,
+            detail=f'{address.city}, {address.state}',
+            score=score,
+        )
+
+    @classmethod
+    def from_driver(cls, driver: Driver, score: float) -> Self:
+        return cls(
+            kind='driver',
+            id=str(driver.id),
+            label=f'{driver.first_name} {driver.last_name}',
+            detail=driver.nickname or '',
+            score=score,
+        )
+
+
+@dataclass(frozen=True)
+class TypeaheadSearchResponse:
+    """A page of search hits, best first."""
+
+    query: str
+    page: int
+    per_page: int
+    has_more: bool
+    hits: list[SearchHitResponse]
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.location.value_objects import Address
 
 
 
@@ -28,6 +29,22 @@ class BrokerRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, broker_ids: list[UUID]) -> list[Broker]:
+        """
+        Retrieve every broker with one of the given IDs.
+
+        IDs without a matching broker are ignored; callers compare the
+        result against the IDs they asked for.
+
+        Args:
+            broker_ids: The unique identifiers of the brokers
+
+        Returns:
+            The matching Broker entities, fetched in a single query
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> list[Broker]:
         """
@@ -42,6 +59,9 @@ class BrokerRepository(ABC):
 
         Args:
             broker: The Broker entity to save
+
+        Raises:
+            BusinessRuleViolation: If another broker already has the same name or address
         """
         pass
 
@@ -54,3 +74,44 @@ class BrokerRepository(ABC):
             broker_id: The unique identifier of the broker to delete
         """
         pass
+
+    @abstractmethod
+    def get_by_names_or_addresses(self, names: list[str], addresses: list[Address]) -> list[Broker]:
+        """
+        Retrieve every broker matching any of the given names or addresses.
+
+        Args:
+            names: Broker names to match
+            addresses: Addresses to match
+
+        Returns:
+            The matching Broker entities, fetched in a single query
+        """
+        pass
+
+    @abstractmethod
+    def add_many(self, brokers: list[Broker]) -> None:
+        """
+        Insert many new brokers in a single transaction.
+
+        Args:
+            brokers: The new Broker entities to insert
+
+        Raises:
+            BusinessRuleViolation: If any broker shares its name or address with another
+        """
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> list[tuple[Broker, float]]:
+        """
+        Retrieve the active brokers whose name best match a typeahead query.
+
+        Args:
+            query: What has been typed so far
+            limit: The most brokers to return
+
+        Returns:
+            (Broker, score) pairs, best match first, scoring at most 1.0
+        """
+        pass
@@ -0,0 +1,61 @@
+"""
+This module defines the interface for the projection of chassis counts at each pool.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from uuid import UUID
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.chassis_moves import ChassisDay
+from src.domain.common.events import DomainEvent
+
+
+class ChassisInventory(ABC):
+    """
+    Store interface for the chassis fetched from and terminated at each location.
+
+    Dispatch repositories record the tasks completed and reverted in the
+    transaction that saves the dispatch. Counts only reflect the moves
+    recorded, so a pool's count is its net change since tracking began
+    unless it has been counted. Counting a pool records an adjustment that
+    brings it to the number counted; moves after it are added on top.
+    """
+
+    @abstractmethod
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Record the chassis moves a dispatch's new events made or took back.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        pass
+
+    @abstractmethod
+    def adjust(self, location_id: UUID, change: int, moved_at: datetime) -> None:
+        """
+        Record a change to a pool's count that no task made, such as its opening count or a correction.
+
+        Args:
+            location_id: The pool's location
+            change: Chassis added to (positive) or taken from (negative) the count
+            moved_at: The moment the change applies from
+        """
+        pass
+
+    @abstractmethod
+    def counts(self, as_of: datetime) -> dict[UUID, int]:
+        """
+        Retrieve the count of every pool with a recorded move, as of a moment.
+
+        Args:
+            as_of: Moves checked out at or before this moment are counted
+        """
+        pass
+
+    @abstractmethod
+    def daily_report(self, start: date, end: date) -> list[ChassisDay]:
+        """Retrieve each pool's fetches, terminations and end-of-day count, for every day from start to end."""
+        pass
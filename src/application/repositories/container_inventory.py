@@ -0,0 +1,68 @@
+"""
+This module defines the interface for the projection of where each container is.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.container_moves import ContainerMove
+from src.domain.common.events import DomainEvent
+
+
+class ContainerInventory(ABC):
+    """
+    Store interface for the moves of each container and where each one is now.
+
+    Dispatch repositories record the tasks completed and reverted in the
+    transaction that saves the dispatch, so the inventory always agrees
+    with the saved tasks. Each container's position is its latest move by
+    check-out time, kept alongside the moves so that neither a yard check
+    nor a container's timeline has to read tasks.
+    """
+
+    @abstractmethod
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Record the moves a dispatch's new events made or took back.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        pass
+
+    @abstractmethod
+    def at_location(self, location_id: UUID) -> list[ContainerMove]:
+        """
+        Retrieve the containers dropped at a location and not moved since.
+
+        Returns:
+            The move that left each container there, longest standing first
+        """
+        pass
+
+    @abstractmethod
+    def timeline(self, container_number: str) -> list[ContainerMove]:
+        """
+        Retrieve every recorded move of a container, oldest first.
+
+        Args:
+            container_number: The container number, compared normalized
+        """
+        pass
+
+    @abstractmethod
+    def outstanding(self, as_of: Optional[datetime] = None) -> list[ContainerMove]:
+        """
+        Retrieve the containers out on a trip, not yet returned.
+
+        Args:
+            as_of: A past moment to replay the moves up to, or None for now
+
+        Returns:
+            The move that took each container out, which its per diem runs from
+        """
+        pass
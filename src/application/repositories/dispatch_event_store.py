@@ -0,0 +1,72 @@
+"""
+This module defines the interface for the append-only store of dispatch history.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.history import DispatchState
+from src.domain.common.events import DomainEvent
+
+
+# Events recorded between snapshots; reading a state never replays more than this.
+SNAPSHOT_INTERVAL = 20
+
+
+class DispatchEventStore(ABC):
+    """
+    Store interface for the event stream of each dispatch.
+
+    Events are only ever appended. A snapshot of the dispatch is stored
+    every SNAPSHOT_INTERVAL events, and whenever a save records no events
+    (creation and plan edits, which the events do not describe). A state is
+    read back from the latest snapshot plus the events after it.
+    """
+
+    @abstractmethod
+    def append(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Append the events a dispatch recorded since it was last saved.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        pass
+
+    @abstractmethod
+    def get_stream(self, dispatch_id: UUID, after_version: int = 0) -> list[DomainEvent]:
+        """
+        Retrieve the events of one dispatch in the order they were recorded.
+
+        Args:
+            dispatch_id: The unique identifier of the dispatch
+            after_version: Only return events after this many
+        """
+        pass
+
+    @abstractmethod
+    def load(self, dispatch_id: UUID, as_of: Optional[datetime] = None) -> Optional[DispatchState]:
+        """
+        Rebuild the state of a dispatch.
+
+        Args:
+            dispatch_id: The unique identifier of the dispatch
+            as_of: The moment to read the state at; now when None
+
+        Returns:
+            The DispatchState, or None if the dispatch had no history yet
+        """
+        pass
+
+    @abstractmethod
+    def load_many(self, dispatch_ids: list[UUID], as_of: Optional[datetime] = None) -> list[DispatchState]:
+        """
+        Rebuild the state of many dispatches at once, such as a board as of a given time.
+
+        Dispatches without history at that moment are left out.
+        """
+        pass
@@ -3,8 +3,11 @@ This module defines the repository interface for Dispatch entity persistence.
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterator
 from uuid import UUID
 
+from src.application.dtos.export_dtos import DispatchHistoryRecord
 from src.domain.aggregates.dispatch.aggregate import Dispatch
 
 
@@ -27,6 +30,55 @@ class DispatchRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_by_reference(self, reference: int) -> Dispatch:
+        """
+        Retrieve a dispatch by the reference number staff know it by.
+
+        Raises:
+            DispatchNotFoundError: If no dispatch has the given reference
+        """
+        pass
+
+    @abstractmethod
+    def get_by_container(self, container_number: str) -> list[Dispatch]:
+        """
+        Retrieve every dispatch with a task moving a container, in a single query.
+
+        Args:
+            container_number: The container's number, compared as normalize_container_number leaves it
+
+        Returns:
+            The matching Dispatch entities
+        """
+        pass
+
+    @abstractmethod
+    def get_ids_by_date(self, date: date) -> list[UUID]:
+        """
+        Retrieve the ID of every dispatch with a task dated on a date, whatever its status.
+
+        Args:
+            date: The task date to match
+
+        Returns:
+            The matching dispatch IDs
+        """
+        pass
+
+    @abstractmethod
+    def get_drafts_by_date(self, date: date) -> list[Dispatch]:
+        """
+        Retrieve every draft dispatch whose earliest task falls on a date.
+
+        Args:
+            date: The date of the drafts' earliest task
+
+        Returns:
+            The matching draft Dispatch entities
+        """
+        pass
+
     @abstractmethod
     def save(self, dispatch: Dispatch) -> None:
         """
@@ -37,6 +89,18 @@ class DispatchRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_many(self, dispatches: list[Dispatch]) -> None:
+        """
+        Insert many new dispatches and their plans in a single transaction.
+
+        Each dispatch is given its reference as part of the insert.
+
+        Args:
+            dispatches: The new Dispatch entities to insert
+        """
+        pass
+
     @abstractmethod
     def delete(self, dispatch_id: UUID) -> None:
         """
@@ -45,4 +109,19 @@ class DispatchRepository(ABC):
         Args:
             dispatch_id: The unique identifier of the dispatch to delete
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def stream_history(self, start_date: date, end_date: date) -> Iterator[DispatchHistoryRecord]:
+        """
+        Stream the history of every dispatch with a task dated within a range.
+
+        Records are yielded one task at a time, ordered by dispatch reference
+        and task priority, so callers can write them out without holding the
+        whole range in memory.
+
+        Args:
+            start_date: First task date included in the export
+            end_date: Last task date included in the export
+        """
+        pass
@@ -28,6 +28,22 @@ class DriverRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, driver_ids: list[UUID]) -> list[Driver]:
+        """
+        Retrieve every driver with one of the given IDs.
+
+        IDs without a matching driver are ignored; callers compare the
+        result against the IDs they asked for.
+
+        Args:
+            driver_ids: The unique identifiers of the drivers
+
+        Returns:
+            The matching Driver entities, fetched in a single query
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> list[Driver]:
         """
@@ -42,6 +58,9 @@ class DriverRepository(ABC):
 
         Args:
             driver: The Driver entity to save
+
+        Raises:
+            BusinessRuleViolation: If another driver already has the same nickname
         """
         pass
 
@@ -54,3 +73,43 @@ class DriverRepository(ABC):
             driver_id: The unique identifier of the driver to delete
         """
         pass
+
+    @abstractmethod
+    def get_by_nicknames(self, nicknames: list[str]) -> list[Driver]:
+        """
+        Retrieve every driver whose nickname is in the given list.
+
+        Args:
+            nicknames: Driver nicknames to match
+
+        Returns:
+            The matching Driver entities, fetched in a single query
+        """
+        pass
+
+    @abstractmethod
+    def add_many(self, drivers: list[Driver]) -> None:
+        """
+        Insert many new drivers in a single transaction.
+
+        Args:
+            drivers: The new Driver entities to insert
+
+        Raises:
+            BusinessRuleViolation: If any driver shares its nickname with another
+        """
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> list[tuple[Driver, float]]:
+        """
+        Retrieve the drivers who have not been deactivated whose first name, last name or nickname best match a typeahead query.
+
+        Args:
+            query: What has been typed so far
+            limit: The most drivers to return
+
+        Returns:
+            (Driver, score) pairs, best match first, scoring at most 1.0
+        """
+        pass
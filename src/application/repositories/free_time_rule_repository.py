@@ -0,0 +1,26 @@
+"""
+This module defines the interface for the free time allowed before per diem and detention charge.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.domain.aggregates.dispatch.clocks import FreeTimeRule
+
+
+class FreeTimeRuleRepository(ABC):
+    """Repository interface for free-time rules, at most one per clock, broker and location."""
+
+    @abstractmethod
+    def get_all(self) -> list[FreeTimeRule]:
+        """Retrieve every free-time rule."""
+        pass
+
+    @abstractmethod
+    def save(self, rule: FreeTimeRule) -> None:
+        """
+        Save a free-time rule, replacing the one with the same scope.
+
+        Args:
+            rule: The rule to save
+        """
+        pass
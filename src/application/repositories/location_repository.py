@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
 
 
 
@@ -28,6 +29,22 @@ class LocationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, location_ids: list[UUID]) -> list[Location]:
+        """
+        Retrieve every location with one of the given IDs.
+
+        IDs without a matching location are ignored; callers compare the
+        result against the IDs they asked for.
+
+        Args:
+            location_ids: The unique identifiers of the locations
+
+        Returns:
+            The matching Location entities, fetched in a single query
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> list[Location]:
         """
@@ -42,6 +59,9 @@ class LocationRepository(ABC):
 
         Args:
             location: The Location entity to save
+
+        Raises:
+            BusinessRuleViolation: If another location already has the same name or address
         """
         pass
 
@@ -54,3 +74,44 @@ class LocationRepository(ABC):
             location_id: The unique identifier of the location to delete
         """
         pass
+
+    @abstractmethod
+    def get_by_names_or_addresses(self, names: list[str], addresses: list[Address]) -> list[Location]:
+        """
+        Retrieve every location matching any of the given names or addresses.
+
+        Args:
+            names: Location names to match
+            addresses: Addresses to match
+
+        Returns:
+            The matching Location entities, fetched in a single query
+        """
+        pass
+
+    @abstractmethod
+    def add_many(self, locations: list[Location]) -> None:
+        """
+        Insert many new locations in a single transaction.
+
+        Args:
+            locations: The new Location entities to insert
+
+        Raises:
+            BusinessRuleViolation: If any location shares its name or address with another
+        """
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> list[tuple[Location, float]]:
+        """
+        Retrieve the active locations whose name, street address or city best match a typeahead query.
+
+        Args:
+            query: What has been typed so far
+            limit: The most locations to return
+
+        Returns:
+            (Location, score) pairs, best match first, scoring at most 1.0
+        """
+        pass
@@ -0,0 +1,54 @@
+"""
+This module defines the interface for finding locations near a place.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+from uuid import UUID
+
+from src.domain.aggregates.location.aggregate import Location
+
+
+class LocationSpatialIndex(ABC):
+    """Index of active locations by where they are."""
+
+    @property
+    @abstractmethod
+    def built(self) -> bool:
+        """Whether the index has been filled from the repository yet."""
+        pass
+
+    @abstractmethod
+    def nearest(self, zipcode: int, limit: int) -> list[tuple[UUID, float]]:
+        """
+        Retrieve the locations closest to a zipcode.
+
+        Returns:
+            Up to `limit` (location id, miles) pairs, closest first
+        """
+        pass
+
+    @abstractmethod
+    def within(self, zipcode: int, miles: float) -> list[tuple[UUID, float]]:
+        """
+        Retrieve the locations no further than `miles` from a zipcode.
+
+        Returns:
+            (location id, miles) pairs, closest first
+        """
+        pass
+
+    @abstractmethod
+    def put(self, location: Location) -> None:
+        """Add a location, or move it to where its address now is."""
+        pass
+
+    @abstractmethod
+    def remove(self, location_id: UUID) -> None:
+        """Drop a location, if it is indexed."""
+        pass
+
+    @abstractmethod
+    def rebuild(self, locations: Sequence[Location]) -> None:
+        """Replace everything indexed with the given locations."""
+        pass
@@ -0,0 +1,58 @@
+"""
+This module defines the interface for the outbox of customer notifications.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from src.application.dtos.notification_dtos import OutboxMessage, StatusNotification
+
+
+class NotificationOutbox(ABC):
+    """
+    Store interface for notifications waiting to be delivered.
+
+    Dispatch repositories add notifications in the transaction that saves
+    the dispatch, so a notification exists exactly when its change was
+    committed. A relay then delivers them at least once, in the order they
+    were added for each dispatch: while the oldest pending message of a
+    dispatch waits for a retry, the later ones of that dispatch wait too.
+    """
+
+    @abstractmethod
+    def add(self, notifications: list[StatusNotification]) -> None:
+        """Add notifications, in order, to be delivered."""
+        pass
+
+    @abstractmethod
+    def due(self, limit: int, now: datetime) -> list[OutboxMessage]:
+        """
+        Retrieve pending messages ready to be delivered.
+
+        Args:
+            limit: Most messages to return
+            now: The current time, against which retries are due
+
+        Returns:
+            Messages in the order they were added, none of them behind an
+            earlier message of the same dispatch that is still waiting
+        """
+        pass
+
+    @abstractmethod
+    def mark_delivered(self, message_ids: list[int]) -> None:
+        """Record that messages were delivered."""
+        pass
+
+    @abstractmethod
+    def mark_failed(self, message_ids: list[int], error: str, retry_at: Optional[datetime]) -> None:
+        """
+        Record a failed delivery of messages.
+
+        Args:
+            message_ids: The messages that failed
+            error: Why the delivery failed
+            retry_at: When to try again; None to give up on them
+        """
+        pass
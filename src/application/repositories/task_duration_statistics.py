@@ -0,0 +1,62 @@
+"""
+This module defines the interface for the projection of how long tasks take.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.task_durations import DurationEstimate
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from src.domain.common.events import DomainEvent
+
+
+class TaskDurationStatistics(ABC):
+    """
+    Store interface for the durations of completed tasks, as quantile sketches.
+
+    Dispatch repositories record the tasks completed and reverted when they
+    save the dispatch. Each completion updates the sketch of its instruction
+    at its location in the hour of the week it started, at its location at
+    any hour, and everywhere; estimates come from the most specific of these
+    with enough completions. A task counts once, with the duration of its
+    latest completion, and no longer once it is reverted; only completions
+    recorded since tracking began are counted.
+    """
+
+    @abstractmethod
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Record the durations of the tasks a dispatch's new events completed, and take back those reverted.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        pass
+
+    @abstractmethod
+    def estimate(self, instruction: Instruction, location_id: UUID, at: datetime) -> Optional[DurationEstimate]:
+        """
+        Retrieve the estimated duration of a task started at a moment.
+
+        Returns:
+            The estimate, or None if no task with the instruction was counted
+        """
+        pass
+
+    @abstractmethod
+    def estimate_many(
+            self, tasks: Sequence[tuple[Instruction, UUID, datetime]]) -> list[Optional[DurationEstimate]]:
+        """
+        Retrieve the estimated durations of many tasks at once.
+
+        Args:
+            tasks: The instruction, location id and start of each task
+
+        Returns:
+            One estimate per task, in the same order
+        """
+        pass
@@ -3,8 +3,11 @@ This module defines the repository interface for Task entity persistence.
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterator
 from uuid import UUID
 
+from src.application.dtos.export_dtos import TaskFactsChunk
 from src.domain.aggregates.dispatch.entities import Task
 
 
@@ -53,3 +56,15 @@ class TaskRepository(ABC):
             task_id: The unique identifier of the task to delete
         """
         pass
+
+    @abstractmethod
+    def stream_facts(self, start_date: date, end_date: date, chunk_size: int) -> Iterator[TaskFactsChunk]:
+        """
+        Stream timing facts for tasks dated within a range, in columnar chunks.
+
+        Args:
+            start_date: First task date included
+            end_date: Last task date included
+            chunk_size: Maximum number of tasks per chunk
+        """
+        pass
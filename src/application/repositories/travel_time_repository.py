@@ -0,0 +1,39 @@
+"""
+This module defines the interface for travel times between locations.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+import numpy as np
+
+from src.domain.aggregates.location.aggregate import Location
+
+
+class TravelTimeRepository(ABC):
+    """Repository interface for the minutes it takes to drive between locations."""
+
+    @abstractmethod
+    def matrix(self, origins: Sequence[Location], destinations: Sequence[Location]) -> np.ndarray:
+        """
+        Retrieve travel times from many locations to many others.
+
+        Returns:
+            A (origins, destinations) array of minutes, zero from a location to itself
+        """
+        pass
+
+    @abstractmethod
+    def from_location(self, origin: Location, destinations: Sequence[Location]) -> np.ndarray:
+        """
+        Retrieve travel times from one location to many others.
+
+        Returns:
+            An array of minutes, one per destination
+        """
+        pass
+
+    @abstractmethod
+    def refresh(self, locations: Sequence[Location]) -> None:
+        """Bring the travel times between the given locations, usually every active one, up to date."""
+        pass
@@ -24,12 +24,6 @@ class CreateBrokerUseCase:
         try:
             params = request.to_execution_params()
 
-            if self.broker_repository.get_by_name(params['name']):
-                raise BusinessRuleViolation('A broker with that name already exists.')
-            
-            if self.broker_repository.get_by_address(params['address']):
-                raise BusinessRuleViolation('A broker with that address already exists.')
-
             broker = Broker(
                 name=params['name'],
                 address=params['address'],
@@ -125,12 +119,6 @@ class EditBrokerUseCase:
         try:
             params = request.to_execution_params()
 
-            if self.broker_repository.get_by_name(params['name'], params['id']):
-                raise BusinessRuleViolation('A broker with that name already exists.')
-            
-            if self.broker_repository.get_by_address(params['address'], params['id']):
-                raise BusinessRuleViolation('A broker with that address already exists.')
-
             id = params["id"]
 
             broker = self.broker_repository.get(id)
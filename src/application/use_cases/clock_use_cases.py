@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.application.common.result import Error, Result
+from src.application.dtos.clock_dtos import (
+    ClockBoardRequest,
+    ClockBoardResponse,
+    ClockResponse,
+    FreeTimeRuleResponse,
+    SetFreeTimeRuleRequest,
+    )
+from src.application.repositories.broker_repository import BrokerRepository
+from src.application.repositories.container_inventory import ContainerInventory
+from src.application.repositories.dispatch_repository import DispatchRepository
+from src.application.repositories.free_time_rule_repository import FreeTimeRuleRepository
+from src.application.repositories.location_repository import LocationRepository
+from src.domain.aggregates.dispatch.clocks import (
+    ClockStatus,
+    FreeTimeRule,
+    FreeTimeRules,
+    detention_starts,
+    per_diem_start,
+    read_clocks,
+)
+from src.domain.exceptions import BrokerNotFoundError, LocationNotFoundError, ValidationError
+
+
+@dataclass
+class GetClockBoardUseCase:
+    """
+    Use case for reading the per diem clock of every container out and the
+    detention clock of every live task on a dispatch in progress.
+    """
+
+    dispatch_repository: DispatchRepository
+    container_inventory: ContainerInventory
+    free_time_rule_repository: FreeTimeRuleRepository
+    broker_repository: BrokerRepository
+    location_repository: LocationRepository
+
+    def execute(self, request: ClockBoardRequest) -> Result[ClockBoardResponse]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: ClockBoardResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            as_of = params['as_of'] or datetime.now()
+            starts = [per_diem_start(move) for move in self.container_inventory.outstanding(params['as_of'])]
+            for dispatch in self.dispatch_repository.get_in_progress():
+                starts.extend(detention_starts(dispatch))
+
+            clocks = read_clocks(starts, FreeTimeRules(self.free_time_rule_repository.get_all()), as_of)
+            if params['flagged_only']:
+                clocks = [clock for clock in clocks if clock.status != ClockStatus.FREE]
+
+            brokers = {broker.id: broker for broker in self.broker_repository.get_all()}
+            locations = {location.id: location for location in self.location_repository.get_all()}
+            return Result.success(ClockBoardResponse(
+                as_of=as_of,
+                clocks=[
+                    ClockResponse.from_clock(clock, brokers[clock.start.broker_id], locations[clock.start.location_id])
+                    for clock in clocks
+                ],
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+
+
+@dataclass
+class ListFreeTimeRulesUseCase:
+    """Use case for listing the free-time rules clocks run against."""
+
+    free_time_rule_repository: FreeTimeRuleRepository
+    broker_repository: BrokerRepository
+    location_repository: LocationRepository
+
+    def execute(self) -> Result[list[FreeTimeRuleResponse]]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: List of FreeTimeRuleResponse, the broadest first
+            - Failure: Error information
+        """
+        rules = sorted(
+            self.free_time_rule_repository.get_all(),
+            key=lambda rule: (rule.clock.value, rule.broker_id is not None, rule.location_id is not None),
+        )
+        brokers = {broker.id: broker for broker in self.broker_repository.get_all()}
+        locations = {location.id: location for location in self.location_repository.get_all()}
+        return Result.success([
+            FreeTimeRuleResponse.from_rule(rule, brokers.get(rule.broker_id), locations.get(rule.location_id))
+            for rule in rules
+        ])
+
+
+@dataclass
+class SetFreeTimeRuleUseCase:
+    """Use case for setting the free time of a clock, for a broker, a location, both, or every one of them."""
+
+    free_time_rule_repository: FreeTimeRuleRepository
+    broker_repository: BrokerRepository
+    location_repository: LocationRepository
+
+    def execute(self, request: SetFreeTimeRuleRequest) -> Result[FreeTimeRuleResponse]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: FreeTimeRuleResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            broker = self.broker_repository.get(params['broker_id']) if params['broker_id'] else None
+            location = self.location_repository.get(params['location_id']) if params['location_id'] else None
+
+            rule = FreeTimeRule(
+                clock=params['clock'],
+                free_minutes=params['free_minutes'],
+                warning_minutes=params['warning_minutes'],
+                broker_id=params['broker_id'],
+                location_id=params['location_id'],
+            )
+            self.free_time_rule_repository.save(rule)
+
+            return Result.success(FreeTimeRuleResponse.from_rule(rule, broker, location))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except BrokerNotFoundError:
+            return Result.failure(Error.not_found("Broker", request.broker_id))
+        except LocationNotFoundError:
+            return Result.failure(Error.not_found("Location", request.location_id))
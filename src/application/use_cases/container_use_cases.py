@@ -0,0 +1,210 @@
+from dataclasses import dataclass
+from typing import Iterable
+from uuid import UUID
+
+from src.application.common.result import Error, Result
+from src.application.dtos.container_dtos import (
+    ChassisCountResponse,
+    ChassisCountsRequest,
+    ChassisCountsResponse,
+    ChassisDailyReportRequest,
+    ChassisDailyReportResponse,
+    ChassisDayResponse,
+    ContainerMoveResponse,
+    ContainerTimelineRequest,
+    ContainerTimelineResponse,
+    RecordChassisCountRequest,
+    YardInventoryRequest,
+    YardInventoryResponse,
+    )
+from src.application.repositories.chassis_inventory import ChassisInventory
+from src.application.repositories.container_inventory import ContainerInventory
+from src.application.repositories.location_repository import LocationRepository
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.exceptions import LocationNotFoundError, ValidationError
+
+
+def _get_locations(location_repository: LocationRepository, location_ids: Iterable[UUID]) -> dict[UUID, Location]:
+    """Fetch locations by ID in one call, raising LocationNotFoundError for any that is missing."""
+    location_ids = set(location_ids)
+    locations = {location.id: location for location in location_repository.get_many(list(location_ids))}
+    missing = location_ids - locations.keys()
+    if missing:
+        raise LocationNotFoundError(next(iter(missing)))
+    return locations
+
+
+@dataclass
+class YardInventoryUseCase:
+    """Use case for listing the containers sitting at a location, read from the container inventory."""
+
+    container_inventory: ContainerInventory
+    location_repository: LocationRepository
+
+    def execute(self, request: YardInventoryRequest) -> Result[YardInventoryResponse]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: YardInventoryResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            location = self.location_repository.get(params['location_id'])
+            moves = self.container_inventory.at_location(location.id)
+
+            return Result.success(YardInventoryResponse(
+                location_id=str(location.id),
+                location_name=location.name,
+                containers=[ContainerMoveResponse.from_move(move, location) for move in moves],
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except LocationNotFoundError:
+            return Result.failure(Error.not_found("Location", request.location_id))
+
+
+@dataclass
+class ContainerTimelineUseCase:
+    """Use case for tracing where a container has been, read from the container inventory."""
+
+    container_inventory: ContainerInventory
+    location_repository: LocationRepository
+
+    def execute(self, request: ContainerTimelineRequest) -> Result[ContainerTimelineResponse]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: ContainerTimelineResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            moves = self.container_inventory.timeline(params['container_number'])
+            if not moves:
+                return Result.failure(Error.not_found("Container", params['container_number']))
+            locations = _get_locations(self.location_repository, (move.location_id for move in moves))
+
+            return Result.success(ContainerTimelineResponse(
+                container_number=params['container_number'],
+                moves=[ContainerMoveResponse.from_move(move, locations[move.location_id]) for move in moves],
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except LocationNotFoundError as e:
+            return Result.failure(Error.not_found("Location", str(e.location_id)))
+
+
+@dataclass
+class ChassisCountsUseCase:
+    """Use case for counting the chassis at every pool, read from the chassis inventory."""
+
+    chassis_inventory: ChassisInventory
+    location_repository: LocationRepository
+
+    def execute(self, request: ChassisCountsRequest) -> Result[ChassisCountsResponse]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: ChassisCountsResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            counts = self.chassis_inventory.counts(params['as_of'])
+            locations = _get_locations(self.location_repository, counts)
+            pools = [
+                ChassisCountResponse(str(location_id), locations[location_id].name, count)
+                for location_id, count in counts.items()
+            ]
+
+            return Result.success(ChassisCountsResponse(
+                as_of=params['as_of'],
+                pools=sorted(pools, key=lambda pool: pool.location_name),
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except LocationNotFoundError as e:
+            return Result.failure(Error.not_found("Location", str(e.location_id)))
+
+
+@dataclass
+class RecordChassisCountUseCase:
+    """
+    Use case for setting a pool's chassis count to what was counted there.
+
+    The chassis inventory only knows the chassis tasks fetched and
+    terminated, so a pool starts at zero. Counting it records an adjustment
+    of the difference, which serves as its opening count the first time
+    and as a correction after that.
+    """
+
+    chassis_inventory: ChassisInventory
+    location_repository: LocationRepository
+
+    def execute(self, request: RecordChassisCountRequest) -> Result[ChassisCountResponse]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: ChassisCountResponse with the count recorded
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            location = self.location_repository.get(params['location_id'])
+            balance = self.chassis_inventory.counts(params['counted_at']).get(location.id, 0)
+            # Recorded even when nothing changes, so a pool counted empty is listed from then on.
+            self.chassis_inventory.adjust(location.id, params['count'] - balance, params['counted_at'])
+
+            return Result.success(ChassisCountResponse(str(location.id), location.name, params['count']))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except LocationNotFoundError:
+            return Result.failure(Error.not_found("Location", request.location_id))
+
+
+@dataclass
+class ChassisDailyReportUseCase:
+    """Use case for reporting each pool's chassis day by day, read from the chassis inventory."""
+
+    chassis_inventory: ChassisInventory
+    location_repository: LocationRepository
+
+    def execute(self, request: ChassisDailyReportRequest) -> Result[ChassisDailyReportResponse]:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: ChassisDailyReportResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            days = self.chassis_inventory.daily_report(params['start_date'], params['end_date'])
+            locations = _get_locations(self.location_repository, (chassis_day.location_id for chassis_day in days))
+            ordered = sorted(days, key=lambda chassis_day: (locations[chassis_day.location_id].name, chassis_day.day))
+
+            return Result.success(ChassisDailyReportResponse(
+                start_date=params['start_date'],
+                end_date=params['end_date'],
+                days=[ChassisDayResponse.from_day(chassis_day, locations[chassis_day.location_id])
+                      for chassis_day in ordered],
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except LocationNotFoundError as e:
+            return Result.failure(Error.not_found("Location", str(e.location_id)))
@@ -1,12 +1,34 @@
 from dataclasses import dataclass
+from datetime import datetime
+import hashlib
 
+from src.application.common.eta_cache import EtaCache
 from src.application.common.result import Error, Result
 from src.application.dtos.dispatch_dtos import (
     CreateDispatchRequest,
+    BulkCreateDispatchesRequest,
+    BulkCreateDispatchesResponse,
+    BulkDispatchResult,
     GetDispatchRequest,
+    GetDispatchByReferenceRequest,
+    FindDispatchesByContainerRequest,
     EditDispatchRequest,
     StartDispatchRequest,
+    SuggestPlanCompletionsRequest,
+    PlanCompletionsResponse,
+    PlanRulesResponse,
     GetLoadboardDispatchesRequest,
+    GetDispatchHistoryRequest,
+    GetLoadboardAsOfRequest,
+    DispatchHistoryResponse,
+    ProposeDriverAssignmentsRequest,
+    DriverAssignmentProposalResponse,
+    DoubleBookingReportRequest,
+    DoubleBookingResponse,
+    ProposePlanSequenceRequest,
+    PlanSequenceResponse,
+    ProposeStreetTurnsRequest,
+    StreetTurnResponse,
     StartTaskRequest,
     RevertTaskRequest,
     CompleteTaskRequest,
@@ -17,11 +39,36 @@ from src.application.dtos.dispatch_dtos import (
     CompleteTaskResponse,
 )
 from src.application.repositories.broker_repository import BrokerRepository
+from src.application.repositories.dispatch_event_store import DispatchEventStore
 from src.application.repositories.dispatch_repository import DispatchRepository
 from src.application.repositories.driver_repository import DriverRepository
 from src.application.repositories.location_repository import LocationRepository
+from src.application.repositories.task_duration_statistics import TaskDurationStatistics
 from src.application.repositories.task_repository import TaskRepository
-from src.domain.exceptions import ValidationError, BusinessRuleViolation
+from src.application.repositories.travel_time_repository import TravelTimeRepository
+from src.domain.exceptions import (
+    BrokerNotFoundError,
+    BusinessRuleViolation,
+    DispatchNotFoundError,
+    DomainError,
+    DriverNotFoundError,
+    LocationNotFoundError,
+    ValidationError,
+)
+from src.domain.aggregates.dispatch.aggregate import MAXIMUM_TASKS_PERMITTED, MINIMUM_TASKS_REQUIRED, Dispatch
+from src.domain.aggregates.dispatch.booking import DriverBookings, booked_spans
+from src.domain.aggregates.dispatch.completion import PLAN_COMPLETER
+from src.domain.aggregates.dispatch.eta import DispatchEta, predict_etas, remaining_tasks
+from src.domain.aggregates.dispatch.driver_assignment import DRIVER_ASSIGNMENT_OPTIMIZER, busy_until
+from src.domain.aggregates.dispatch.sequencing import PLAN_SEQUENCER, plan_locations
+from src.domain.aggregates.dispatch.street_turns import (
+    STREET_TURN_MATCHER,
+    empty_needs,
+    freed_empties,
+    street_turn_locations,
+)
+from src.domain.aggregates.dispatch.validation import PLAN_VALIDATOR
+from src.domain.aggregates.dispatch.value_objects import DispatchStatus
 from src.domain.services import Dispatcher
 
 
@@ -57,6 +104,7 @@ class CreateDispatchUseCase:
                 self.driver_repository.get(params['driver_id']) if params['driver_id'] else None,
                 tasks
             )
+            _check_driver_booking(self.dispatch_repository, dispatch)
 
             self.dispatch_repository.save(dispatch)
 
@@ -77,6 +125,123 @@ class CreateDispatchUseCase:
             return Result.failure(Error.business_rule_violation(str(e)))
 
 
+def _check_driver_booking(dispatch_repository: DispatchRepository, dispatch: Dispatch) -> None:
+    """Refuse a dispatch whose driver is already booked on another at the same time."""
+    spans = booked_spans(dispatch)
+    if dispatch.current_driver is None or not spans:
+        return
+    booked = dispatch_repository.get_booked(min(spans), max(spans), dispatch.current_driver.id)
+    conflicts = DriverBookings(booked).conflicts_with(dispatch)
+    if conflicts:
+        raise BusinessRuleViolation(conflicts[0].message)
+
+
+def _require(entities: dict, entity_id, not_found_error):
+    if entity_id not in entities:
+        raise not_found_error(entity_id)
+    return entities[entity_id]
+
+
+def _bulk_item_error(error: Exception) -> str:
+    if isinstance(error, KeyError):
+        return f'Missing field {error}.'
+    return str(error)
+
+
+@dataclass
+class BulkCreateDispatchesUseCase:
+    """
+    Use case for creating many dispatches in one request.
+
+    Brokers, drivers and locations referenced anywhere in the batch are each
+    loaded with one query, every plan goes through the Dispatcher exactly as
+    a single creation would, and the valid dispatches are inserted together.
+    An invalid item is reported by its position and does not stop the rest.
+    """
+
+    dispatch_repository: DispatchRepository
+    broker_repository: BrokerRepository
+    driver_repository: DriverRepository
+    location_repository: LocationRepository
+
+    def execute(self, request: BulkCreateDispatchesRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: BulkCreateDispatchesResponse with one result per item
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+
+            results, parsed = {}, {}
+            for index, item in enumerate(params['dispatches']):
+                try:
+                    if item is None:
+                        raise ValidationError('Each dispatch must be an object.')
+                    parsed[index] = item.to_execution_params()
+                except (ValidationError, KeyError, TypeError, ValueError) as e:
+                    results[index] = BulkDispatchResult(index, error=_bulk_item_error(e))
+
+            brokers = {broker.id: broker for broker in self.broker_repository.get_many(
+                list({p['broker_id'] for p in parsed.values()})
+            )}
+            drivers = {driver.id: driver for driver in self.driver_repository.get_many(
+                list({p['driver_id'] for p in parsed.values() if p['driver_id']})
+            )}
+            locations = {location.id: location for location in self.location_repository.get_many(
+                list({task['location_id'] for p in parsed.values() for task in p['plan']})
+            )}
+
+            # The batch is booked against saved dispatches and against itself, with one query.
+            days = [task['date'] for p in parsed.values() if p['driver_id'] for task in p['plan']]
+            bookings = DriverBookings(self.dispatch_repository.get_booked(min(days), max(days)) if days else ())
+
+            created = []
+            for index, p in parsed.items():
+                try:
+                    tasks = [
+                        Dispatcher.create_task(
+                            task['priority'],
+                            _require(locations, task['location_id'], LocationNotFoundError),
+                            task['instruction'],
+                            task['container'],
+                            task['date'],
+                            task['appointment']
+                        ) for task in p['plan']
+                    ]
+
+                    dispatch = Dispatcher.create_dispatch(
+                        _require(brokers, p['broker_id'], BrokerNotFoundError),
+                        _require(drivers, p['driver_id'], DriverNotFoundError) if p['driver_id'] else None,
+                        tasks
+                    )
+                    conflicts = bookings.conflicts_with(dispatch)
+                    if conflicts:
+                        raise BusinessRuleViolation(conflicts[0].message)
+                    bookings.add(dispatch)
+                    created.append((index, dispatch))
+                except (DomainError, ValueError) as e:
+                    results[index] = BulkDispatchResult(index, error=_bulk_item_error(e))
+
+            self.dispatch_repository.save_many([dispatch for _, dispatch in created])
+
+            for index, dispatch in created:
+                results[index] = BulkDispatchResult(index, id=str(dispatch.id), reference=dispatch.reference)
+
+            return Result.success(BulkCreateDispatchesResponse(
+                created=len(created),
+                results=[results[index] for index in sorted(results)],
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+
 @dataclass
 class ListDispatchesUseCase:
     """Use case for listing all the dispatches."""
@@ -114,6 +279,59 @@ class GetDispatchUseCase:
             return Result.failure(Error.business_rule_violation(str(e)))
         
 
+@dataclass
+class GetDispatchByReferenceUseCase:
+    """Use case for getting the dispatch a reference number was given to."""
+
+    dispatch_repository: DispatchRepository
+
+    def execute(self, request: GetDispatchByReferenceRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: DispatchResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            dispatch = self.dispatch_repository.get_by_reference(params['reference'])
+
+            return Result.success(DispatchResponse.from_entity(dispatch))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except DispatchNotFoundError:
+            return Result.failure(Error.not_found("Dispatch", request.reference))
+
+
+@dataclass
+class FindDispatchesByContainerUseCase:
+    """Use case for listing every dispatch that moved a container, earliest first."""
+
+    dispatch_repository: DispatchRepository
+
+    def execute(self, request: FindDispatchesByContainerRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: list of DispatchResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            dispatches = self.dispatch_repository.get_by_container(params['container_number'])
+            dispatches = sorted(dispatches, key=lambda d: (min(task.date for task in d.plan), d.reference or 0))
+
+            return Result.success([DispatchResponse.from_entity(dispatch) for dispatch in dispatches])
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+
+
 @dataclass
 class EditDispatchUseCase:
     """Use case for creating a new dispatch."""
@@ -146,20 +364,25 @@ class EditDispatchUseCase:
 
             for i in range(plan_length_overlap):
                 edited_dispatch.plan[i].priority = params['plan'][i]['priority']
-                if params['plan'][i]['location_id'] != edited_dispatch.plan[i].location.id:
-                    edited_dispatch.plan[i].location = self.location_repository.get(params['plan'][i]['location_id'])
-                edited_dispatch.plan[i].instruction = params['plan'][i]['instruction']
-                edited_dispatch.plan[i].container = params['plan'][i]['container']
-                edited_dispatch.plan[i].date = params['plan'][i]['date']
-                edited_dispatch.plan[i].appointment = params['plan'][i]['appointment']
+                location = edited_dispatch.plan[i].location
+                if params['plan'][i]['location_id'] != location.id:
+                    location = self.location_repository.get(params['plan'][i]['location_id'])
+                edited_dispatch.edit_task(
+                    i + 1,
+                    location,
+                    params['plan'][i]['instruction'],
+                    params['plan'][i]['container'],
+                    params['plan'][i]['date'],
+                    params['plan'][i]['appointment'],
+                )
 
             if plan_length_difference > 0:
                 for _ in range(plan_length_difference):
-                    edited_dispatch.plan.pop()
+                    edited_dispatch.pop_task()
 
             elif plan_length_difference < 0:
                 for i in range(len(edited_dispatch.plan), len(params['plan'])):
-                    edited_dispatch.plan.append(
+                    edited_dispatch.append_task(
                         Dispatcher.create_task(
                             params['plan'][i]['priority'],
                             self.location_repository.get(params['plan'][i]['location_id']),
@@ -170,6 +393,7 @@ class EditDispatchUseCase:
                         )
                     )
 
+            _check_driver_booking(self.dispatch_repository, edited_dispatch)
             self.dispatch_repository.save(edited_dispatch)
 
             print("NEWLY EDITED DISPATCH:", edited_dispatch)
@@ -214,22 +438,351 @@ class StartDispatchUseCase:
 
 @dataclass
 class GetLoadboardDispatchesUseCase:
-    """Use case for listing all the dispatches."""
+    """
+    Use case for listing the dispatches on a date's loadboard, with their predicted arrivals.
+
+    Predictions are kept in the EtaCache between loads, so only the
+    dispatches without one that still holds are predicted again: with one
+    travel matrix over all their locations, and their task durations read
+    in one batch.
+    """
 
     dispatch_repository: DispatchRepository
+    travel_time_repository: TravelTimeRepository
+    task_durations: TaskDurationStatistics
+    eta_cache: EtaCache
 
     def execute(self, request: GetLoadboardDispatchesRequest):
         try:
             params = request.to_execution_params()
             dispatches = self.dispatch_repository.get_loadboard_by_date(params['date'])
 
-            return Result.success([DispatchResponse.from_entity(dis) for dis in dispatches])
+            now = datetime.now()
+            etas = {dispatch.id: self.eta_cache.get(dispatch, now) for dispatch in dispatches}
+            for eta in self._predict([dispatch for dispatch in dispatches if etas[dispatch.id] is None], now):
+                self.eta_cache.put(eta)
+                etas[eta.dispatch_id] = eta
+
+            return Result.success([DispatchResponse.from_entity(dis, etas[dis.id]) for dis in dispatches])
         
         except ValidationError as e:
             return Result.failure(Error.validation_error(str(e)))
         except BusinessRuleViolation as e:
             return Result.failure(Error.business_rule_violation(str(e)))
 
+    def _predict(self, dispatches: list[Dispatch], now: datetime) -> list[DispatchEta]:
+        if not dispatches:
+            return []
+        locations = {}
+        for dispatch in dispatches:
+            for task in dispatch.plan:
+                locations.setdefault(task.location.id, task.location)
+        locations = list(locations.values())
+        index = {location.id: position for position, location in enumerate(locations)}
+        travel = self.travel_time_repository.matrix(locations, locations)
+
+        # A first pass on the default stop times tells the hour each task starts in, which its duration is read for.
+        first = [predict_etas(dispatch, index, travel, now) for dispatch in dispatches]
+        estimates = iter(self.task_durations.estimate_many([
+            (task.instruction, task.location.id, eta.arrival)
+            for dispatch, prediction in zip(dispatches, first)
+            for task, eta in zip(remaining_tasks(dispatch), prediction.tasks)
+        ]))
+        return [
+            predict_etas(dispatch, index, travel, now, [next(estimates) for _ in prediction.tasks])
+            for dispatch, prediction in zip(dispatches, first)
+        ]
+
+@dataclass
+class GetDispatchHistoryUseCase:
+    """Use case for reading a dispatch back as it stood at a given moment."""
+
+    dispatch_event_store: DispatchEventStore
+
+    def execute(self, request: GetDispatchHistoryRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: DispatchHistoryResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            state = self.dispatch_event_store.load(params['dispatch_id'], params['as_of'])
+
+            if state is None:
+                return Result.failure(Error.not_found("Dispatch history", str(params['dispatch_id'])))
+
+            events = self.dispatch_event_store.get_stream(params['dispatch_id'])[:state.version]
+            return Result.success(DispatchHistoryResponse(state=state, events=events))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+
+
+@dataclass
+class GetLoadboardAsOfUseCase:
+    """Use case for the loadboard of a date as it stood at a given moment."""
+
+    dispatch_repository: DispatchRepository
+    dispatch_event_store: DispatchEventStore
+
+    def execute(self, request: GetLoadboardAsOfRequest) -> Result:
+        """
+        Execute the use case.
+
+        Every dispatch with a task on the date is read back from its history,
+        whatever its status now, and the board keeps those that were in
+        progress at that moment. Dispatches that had no history yet are left
+        off.
+
+        Returns:
+            Result containing either:
+            - Success: list of DispatchState
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            dispatch_ids = self.dispatch_repository.get_ids_by_date(params['date'])
+            states = self.dispatch_event_store.load_many(dispatch_ids, params['as_of'])
+
+            return Result.success([state for state in states if state.status == DispatchStatus.IN_PROGRESS])
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+
+
+@dataclass
+class ProposeDriverAssignmentsUseCase:
+    """
+    Use case for proposing drivers for the draft dispatches of a date.
+
+    Drafts that already have a driver keep them, and those drivers are left
+    out of the proposal. Drivers operating a dispatch on the date are
+    proposed for after its last appointment. Nothing is saved; the proposal
+    is applied by editing the dispatches.
+    """
+
+    dispatch_repository: DispatchRepository
+    driver_repository: DriverRepository
+
+    def execute(self, request: ProposeDriverAssignmentsRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: DriverAssignmentProposalResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            drafts = self.dispatch_repository.get_drafts_by_date(params['date'])
+            in_progress = self.dispatch_repository.get_loadboard_by_date(params['date'])
+
+            reserved = {draft.current_driver.id for draft in drafts if draft.current_driver}
+            drivers = [
+                driver for driver in self.driver_repository.get_available_and_operating()
+                if driver.id not in reserved
+            ]
+            proposal = DRIVER_ASSIGNMENT_OPTIMIZER.propose(
+                [draft for draft in drafts if draft.current_driver is None],
+                drivers,
+                params['date'],
+                busy_until(in_progress, params['date']),
+            )
+
+            return Result.success(DriverAssignmentProposalResponse.from_proposal(proposal))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+
+
+@dataclass
+class DoubleBookingReportUseCase:
+    """
+    Use case for reporting drivers booked on overlapping dispatches over a date range.
+
+    Catches the double bookings that predate the check on create and edit,
+    or that came in through an import.
+    """
+
+    dispatch_repository: DispatchRepository
+
+    def execute(self, request: DoubleBookingReportRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: List of DoubleBookingResponse, by date
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            booked = self.dispatch_repository.get_booked(params['start_date'], params['end_date'])
+
+            conflicts = [
+                conflict for conflict in DriverBookings(booked).conflicts()
+                if params['start_date'] <= conflict.day <= params['end_date']
+            ]
+            conflicts.sort(key=lambda conflict: (conflict.day, conflict.start))
+
+            return Result.success([DoubleBookingResponse.from_conflict(conflict) for conflict in conflicts])
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+
+
+@dataclass
+class ProposePlanSequenceUseCase:
+    """
+    Use case for proposing the order of a draft dispatch's tasks.
+
+    Only drafts are reordered, since every task of a draft is still free to
+    move. Nothing is saved; the proposal is applied by editing the dispatch.
+    """
+
+    dispatch_repository: DispatchRepository
+    travel_time_repository: TravelTimeRepository
+
+    def execute(self, request: ProposePlanSequenceRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: PlanSequenceResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            dispatch = self.dispatch_repository.get(params['dispatch_id'])
+
+            if dispatch.status != DispatchStatus.DRAFT:
+                raise BusinessRuleViolation('Only draft dispatches can be resequenced.')
+
+            locations = plan_locations(dispatch)
+            proposal = PLAN_SEQUENCER.propose(dispatch, self.travel_time_repository.matrix(locations, locations))
+            if proposal is None:
+                raise BusinessRuleViolation('No order of the plan satisfies the plan rules.')
+
+            return Result.success(PlanSequenceResponse.from_proposal(dispatch, proposal))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except DispatchNotFoundError:
+            return Result.failure(Error.not_found("Dispatch", request.dispatch_id))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+
+@dataclass
+class ProposeStreetTurnsUseCase:
+    """
+    Use case for proposing street turns between the imports and exports planned over a date range.
+
+    Nothing is saved; a street turn is applied by editing both dispatches
+    to the proposed plans.
+    """
+
+    dispatch_repository: DispatchRepository
+    travel_time_repository: TravelTimeRepository
+
+    def execute(self, request: ProposeStreetTurnsRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: List of StreetTurnResponse, the ones saving the most first
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            planned = self.dispatch_repository.get_planned(params['start_date'], params['end_date'])
+
+            freed = [
+                empty for dispatch in planned for empty in freed_empties(dispatch)
+                if params['start_date'] <= empty.task.date <= params['end_date']
+            ]
+            needs = [need for dispatch in planned for need in empty_needs(dispatch)]
+            if not freed or not needs:
+                return Result.success([])
+
+            locations = street_turn_locations(freed, needs)
+            turns = STREET_TURN_MATCHER.propose(
+                freed, needs, locations, self.travel_time_repository.matrix(locations, locations)
+            )
+
+            return Result.success([StreetTurnResponse.from_street_turn(turn) for turn in turns])
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+
+
+@dataclass
+class SuggestPlanCompletionsUseCase:
+    """Use case for suggesting how to finish a partial plan while it is edited."""
+
+    def execute(self, request: SuggestPlanCompletionsRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: PlanCompletionsResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+
+            violations = PLAN_VALIDATOR.validate(params['instructions'])
+            completions = PLAN_COMPLETER.complete(params['instructions'], params['limit'])
+
+            return Result.success(PlanCompletionsResponse(
+                violations=[violation.message for violation in violations],
+                completions=completions,
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+
+@dataclass
+class GetPlanRulesUseCase:
+    """
+    Use case for handing the plan rules to editors that validate plans themselves.
+
+    The rules only change with a deploy, so they are decoded and fingerprinted
+    once. The version is a digest of their content, letting clients cache them
+    for as long as it stays the same.
+    """
+
+    def __post_init__(self):
+        rules = PLAN_VALIDATOR.rules()
+        digest = hashlib.sha1(repr((rules, MINIMUM_TASKS_REQUIRED, MAXIMUM_TASKS_PERMITTED)).encode())
+        self._response = PlanRulesResponse(
+            rules=rules,
+            minimum_tasks=MINIMUM_TASKS_REQUIRED,
+            maximum_tasks=MAXIMUM_TASKS_PERMITTED,
+            version=digest.hexdigest()[:12],
+        )
+
+    def execute(self) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing PlanRulesResponse
+        """
+        return Result.success(self._response)
+
+
 @dataclass
 class StartTaskUseCase:
     dispatch_repository: DispatchRepository
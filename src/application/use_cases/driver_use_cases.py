@@ -26,9 +26,6 @@ class CreateDriverUseCase:
         try:
             params = request.to_execution_params()
 
-            if params['nickname'] and self.driver_repository.get_by_nickname(params['nickname']):
-                raise BusinessRuleViolation('A driver with that nickname already exists.')
-            
             driver = Driver(
                 first_name=params['first_name'],
                 last_name=params['last_name'],
@@ -176,9 +173,6 @@ class EditDriverUseCase:
         try:
             params = request.to_execution_params()
 
-            if params['nickname'] and self.driver_repository.get_by_nickname(params['nickname']):
-                raise BusinessRuleViolation('A driver with that nickname already exists.')
-            
             id = params["id"]
 
             driver = self.driver_repository.get(id)
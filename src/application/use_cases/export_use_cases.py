@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+
+from src.application.common.result import Error, Result
+from src.application.dtos.export_dtos import ExportDispatchHistoryRequest, ExportTaskFactsRequest
+from src.application.repositories.dispatch_repository import DispatchRepository
+from src.application.repositories.task_repository import TaskRepository
+from src.domain.exceptions import ValidationError, BusinessRuleViolation
+
+
+# Tasks read from the database per columnar chunk.
+TASK_FACTS_CHUNK_SIZE = 50_000
+
+
+@dataclass
+class ExportDispatchHistoryUseCase:
+    """Use case for streaming dispatch and task history over a date range."""
+
+    dispatch_repository: DispatchRepository
+
+    def execute(self, request: ExportDispatchHistoryRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: A lazy iterator of DispatchHistoryRecord objects
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+
+            records = self.dispatch_repository.stream_history(
+                params['start_date'],
+                params['end_date'],
+            )
+
+            return Result.success(records)
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+
+@dataclass
+class ExportTaskFactsUseCase:
+    """Use case for exporting task timing facts in columnar chunks."""
+
+    task_repository: TaskRepository
+
+    def execute(self, request: ExportTaskFactsRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: A lazy iterator of TaskFactsChunk objects
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+
+            chunks = self.task_repository.stream_facts(
+                params['start_date'],
+                params['end_date'],
+                TASK_FACTS_CHUNK_SIZE,
+            )
+
+            return Result.success(chunks)
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
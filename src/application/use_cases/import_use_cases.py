@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+
+from src.application.common.result import Error, Result
+from src.application.dtos.broker_dtos import CreateBrokerRequest
+from src.application.dtos.driver_dtos import CreateDriverRequest
+from src.application.dtos.import_dtos import (
+    ImportReferenceDataRequest,
+    ImportReferenceDataResponse,
+    ImportRowReport,
+    )
+from src.application.dtos.location_dtos import CreateLocationRequest
+from src.application.repositories.broker_repository import BrokerRepository
+from src.application.repositories.driver_repository import DriverRepository
+from src.application.repositories.location_repository import LocationRepository
+from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.domain.exceptions import ValidationError, BusinessRuleViolation
+
+
+ADDRESS_FIELDS = ('name', 'street_address', 'city', 'state', 'zipcode')
+DRIVER_FIELDS = ('first_name', 'last_name', 'nickname')
+
+
+def _text(value) -> str:
+    return '' if value is None else str(value)
+
+
+def _address_key(address: Address) -> tuple:
+    return (address.street_address, address.city, address.state, address.zipcode)
+
+
+@dataclass
+class ImportReferenceDataUseCase:
+    """
+    Use case for creating many locations, brokers or drivers from one file.
+
+    Every row is validated with the same request model as the single-record
+    create use case. Rows duplicating an earlier row, or a record that already
+    exists, are skipped; existing records are found with one query for the
+    whole file rather than one per row. The remaining rows are inserted
+    together.
+    """
+
+    location_repository: LocationRepository
+    broker_repository: BrokerRepository
+    driver_repository: DriverRepository
+
+    def execute(self, request: ImportReferenceDataRequest) -> Result:
+        """
+        Execute the use case.
+
+        Returns:
+            Result containing either:
+            - Success: ImportReferenceDataResponse with per-row reports
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+
+            if params['kind'] == 'locations':
+                response = self._import_addressed(
+                    params['rows'], CreateLocationRequest, Location, self.location_repository, 'location'
+                )
+            elif params['kind'] == 'brokers':
+                response = self._import_addressed(
+                    params['rows'], CreateBrokerRequest, Broker, self.broker_repository, 'broker'
+                )
+            else:
+                response = self._import_drivers(params['rows'])
+
+            return Result.success(response)
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+    def _import_addressed(self, rows, request_type, entity_type, repository, label) -> ImportReferenceDataResponse:
+        """Import locations or brokers, which are unique by name and by address."""
+        errors, skipped, valid = [], [], []
+        seen_names, seen_addresses = {}, {}
+
+        for number, row in enumerate(rows, start=1):
+            try:
+                params = request_type(**{f: _text(row.get(f)) for f in ADDRESS_FIELDS}).to_execution_params()
+            except ValidationError as e:
+                errors.append(ImportRowReport(number, str(e)))
+                continue
+
+            address = _address_key(params['address'])
+            if first := seen_names.get(params['name']) or seen_addresses.get(address):
+                skipped.append(ImportRowReport(number, f'Duplicate of row {first}.'))
+                continue
+
+            seen_names[params['name']] = number
+            seen_addresses[address] = number
+            valid.append((number, params))
+
+        existing = repository.get_by_names_or_addresses(
+            list(seen_names), [params['address'] for _, params in valid]
+        )
+        existing_names = {entity.name for entity in existing}
+        existing_addresses = {_address_key(entity.address) for entity in existing}
+
+        created = []
+        for number, params in valid:
+            if params['name'] in existing_names:
+                skipped.append(ImportRowReport(number, f'A {label} with that name already exists.'))
+            elif _address_key(params['address']) in existing_addresses:
+                skipped.append(ImportRowReport(number, f'A {label} with that address already exists.'))
+            else:
+                created.append(entity_type(name=params['name'], address=params['address']))
+
+        repository.add_many(created)
+
+        return ImportReferenceDataResponse(
+            kind=f'{label}s',
+            created=len(created),
+            skipped=sorted(skipped, key=lambda report: report.row),
+            errors=errors,
+        )
+
+    def _import_drivers(self, rows) -> ImportReferenceDataResponse:
+        """Import drivers, which are unique by nickname when they have one."""
+        errors, skipped, valid = [], [], []
+        seen_nicknames = {}
+
+        for number, row in enumerate(rows, start=1):
+            try:
+                params = CreateDriverRequest(**{f: _text(row.get(f)) for f in DRIVER_FIELDS}).to_execution_params()
+            except ValidationError as e:
+                errors.append(ImportRowReport(number, str(e)))
+                continue
+
+            if nickname := params['nickname']:
+                if first := seen_nicknames.get(nickname):
+                    skipped.append(ImportRowReport(number, f'Duplicate of row {first}.'))
+                    continue
+                seen_nicknames[nickname] = number
+            valid.append((number, params))
+
+        existing_nicknames = {
+            driver.nickname for driver in self.driver_repository.get_by_nicknames(list(seen_nicknames))
+        }
+
+        created = []
+        for number, params in valid:
+            if params['nickname'] in existing_nicknames:
+                skipped.append(ImportRowReport(number, 'A driver with that nickname already exists.'))
+            else:
+                created.append(Driver(
+                    first_name=params['first_name'],
+                    last_name=params['last_name'],
+                    nickname=params['nickname'],
+                ))
+
+        self.driver_repository.add_many(created)
+
+        return ImportReferenceDataResponse(
+            kind='drivers',
+            created=len(created),
+            skipped=sorted(skipped, key=lambda report: report.row),
+            errors=errors,
+        )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from src.application.common.result import Error, Result
 from src.application.dtos.location_dtos import (
@@ -7,11 +8,15 @@ from src.application.dtos.location_dtos import (
     DeactivateLocationRequest,
     ActivateLocationRequest,
     EditLocationRequest,
+    NearbyLocationResponse,
+    NearbyLocationsRequest,
     )
 from src.application.repositories import location_repository
 from src.application.repositories.location_repository import LocationRepository
+from src.application.repositories.location_spatial_index import LocationSpatialIndex
 from src.domain.aggregates.location.aggregate import Location
-from src.domain.exceptions import ValidationError, BusinessRuleViolation
+from src.domain.aggregates.location.value_objects import LocationStatus
+from src.domain.exceptions import ValidationError, BusinessRuleViolation, LocationNotFoundError
         
 
 @dataclass
@@ -19,24 +24,21 @@ class CreateLocationUseCase:
     """Use case for creating a new location."""
 
     location_repository: LocationRepository
+    location_index: Optional[LocationSpatialIndex] = None
 
     def execute(self, request: CreateLocationRequest) -> Result:
         """Execute the use case."""
         try:
             params = request.to_execution_params()
 
-            if self.location_repository.get_by_name(params['name']):
-                raise BusinessRuleViolation('A location with that name already exists.')
-            
-            if self.location_repository.get_by_address(params['address']):
-                raise BusinessRuleViolation('A location with that address already exists.')
-            
             location = Location(
                 name=params['name'],
                 address=params['address'],
             )
 
             self.location_repository.save(location)
+            if self.location_index is not None:
+                self.location_index.put(location)
 
             return Result.success(LocationResponse.from_entity(location))
 
@@ -71,6 +73,7 @@ class DeactivateLocationUseCase:
     """Use case for deactivating a location."""
 
     location_repository: LocationRepository
+    location_index: Optional[LocationSpatialIndex] = None
 
     def execute(self, request: DeactivateLocationRequest) -> Result:
         """Execute the use case."""
@@ -82,6 +85,8 @@ class DeactivateLocationUseCase:
             location.deactivate()
 
             self.location_repository.save(location)
+            if self.location_index is not None:
+                self.location_index.remove(location.id)
 
             return Result.success(LocationResponse.from_entity(location))
 
@@ -96,6 +101,7 @@ class ActivateLocationUseCase:
     """Use case for activating a location."""
 
     location_repository: LocationRepository
+    location_index: Optional[LocationSpatialIndex] = None
 
     def execute(self, request: ActivateLocationRequest) -> Result:
         """Execute the use case."""
@@ -107,6 +113,8 @@ class ActivateLocationUseCase:
             location.reactivate()
 
             self.location_repository.save(location)
+            if self.location_index is not None:
+                self.location_index.put(location)
 
             return Result.success(LocationResponse.from_entity(location))
 
@@ -121,18 +129,13 @@ class EditLocationUseCase:
     """Use case for editing a location."""
 
     location_repository: LocationRepository
+    location_index: Optional[LocationSpatialIndex] = None
 
     def execute(self, request: EditLocationRequest) -> Result:
         """Execute the use case."""
         try:
             params = request.to_execution_params()
 
-            if self.location_repository.get_by_name(params['name'], params['id']):
-                raise BusinessRuleViolation('A location with that name already exists.')
-            
-            if self.location_repository.get_by_address(params['address'], params['id']):
-                raise BusinessRuleViolation('A location with that address already exists.')
-
             id = params["id"]
 
             location = self.location_repository.get(id)
@@ -141,6 +144,8 @@ class EditLocationUseCase:
             location.address = params["address"]
 
             self.location_repository.save(location)
+            if self.location_index is not None and location.status == LocationStatus.ACTIVE:
+                self.location_index.put(location)
 
             return Result.success(LocationResponse.from_entity(location))
 
@@ -193,4 +198,59 @@ class ActiveLocationsUseCase:
             locations = self.location_repository.get_active()
             return Result.success([LocationResponse.from_entity(l) for l in locations])
         except BusinessRuleViolation as e:
-            return Result.failure(Error.business_rule_violation(str(e)))
\ No newline at end of file
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+
+@dataclass
+class NearbyLocationsUseCase:
+    """Use case for finding the active locations closest to a zipcode or to another location."""
+
+    location_repository: LocationRepository
+    location_index: LocationSpatialIndex
+
+    def execute(self, request: NearbyLocationsRequest) -> Result[list[NearbyLocationResponse]]:
+        """
+        Find nearby locations, closest first.
+
+        The index is filled from the active locations on first use; from
+        then on the location use cases keep it current as they save.
+
+        Returns:
+            Result containing either:
+            - Success: List of NearbyLocationResponse objects
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+
+            if not self.location_index.built:
+                self.location_index.rebuild(self.location_repository.get_active())
+
+            zipcode, origin = params["zipcode"], params["location_id"]
+            if origin is not None:
+                zipcode = self.location_repository.get(origin).address.zipcode
+
+            # Ask for one more, since a location is always nearest to itself.
+            limit = params["limit"] + (origin is not None)
+            if params["within_miles"] is None:
+                found = self.location_index.nearest(zipcode, limit)
+            else:
+                found = self.location_index.within(zipcode, params["within_miles"])
+
+            found = [(location_id, miles) for location_id, miles in found if location_id != origin][:params["limit"]]
+            locations = {
+                location.id: location
+                for location in self.location_repository.get_many([location_id for location_id, _ in found])
+            }
+            nearby = [
+                NearbyLocationResponse(LocationResponse.from_entity(locations[location_id]), miles)
+                for location_id, miles in found if location_id in locations
+            ]
+            return Result.success(nearby)
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except LocationNotFoundError:
+            return Result.failure(Error.not_found("Location", request.location_id))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
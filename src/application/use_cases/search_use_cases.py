@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from heapq import merge
+from itertools import islice
+
+from src.application.common.result import Error, Result
+from src.application.dtos.search_dtos import (
+    SearchHitResponse,
+    TypeaheadSearchRequest,
+    TypeaheadSearchResponse,
+    )
+from src.application.repositories.broker_repository import BrokerRepository
+from src.application.repositories.driver_repository import DriverRepository
+from src.application.repositories.location_repository import LocationRepository
+from src.domain.exceptions import ValidationError, BusinessRuleViolation
+
+
+@dataclass
+class TypeaheadSearchUseCase:
+    """Use case for searching locations, brokers and drivers as their names are typed."""
+
+    location_repository: LocationRepository
+    broker_repository: BrokerRepository
+    driver_repository: DriverRepository
+
+    def execute(self, request: TypeaheadSearchRequest) -> Result[TypeaheadSearchResponse]:
+        """
+        Search every kind asked for and return one page of the hits, best first.
+
+        Each repository ranks its own matches from its index, so a page only
+        needs as many hits from each as could reach the end of it; those are
+        merged by score, keeping every repository's own order for ties. One
+        hit past the page tells whether there is another.
+
+        Returns:
+            Result containing either:
+            - Success: TypeaheadSearchResponse
+            - Failure: Error information
+        """
+        try:
+            params = request.to_execution_params()
+            query, offset, limit = params["query"], params["offset"], params["limit"]
+            wanted = offset + limit + 1
+
+            searches = {
+                'location': lambda: (
+                    SearchHitResponse.from_location(location, score)
+                    for location, score in self.location_repository.search(query, wanted)
+                ),
+                'broker': lambda: (
+                    SearchHitResponse.from_broker(broker, score)
+                    for broker, score in self.broker_repository.search(query, wanted)
+                ),
+                'driver': lambda: (
+                    SearchHitResponse.from_driver(driver, score)
+                    for driver, score in self.driver_repository.search(query, wanted)
+                ),
+            }
+            hits = list(islice(
+                merge(*(searches[kind]() for kind in params["kinds"]), key=lambda hit: -hit.score),
+                offset,
+                wanted,
+            ))
+
+            return Result.success(TypeaheadSearchResponse(
+                query=query,
+                page=request.page,
+                per_page=limit,
+                has_more=len(hits) > limit,
+                hits=hits[:limit],
+            ))
+
+        except ValidationError as e:
+            return Result.failure(Error.validation_error(str(e)))
+        except BusinessRuleViolation as e:
+            return Result.failure(Error.business_rule_violation(str(e)))
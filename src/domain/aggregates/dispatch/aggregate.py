@@ -1,20 +1,41 @@
-from typing import Optional
+from contextlib import contextmanager
+from datetime import date
+from typing import Iterator, Optional
 
 from src.domain.aggregates.broker.aggregate import Broker
-from src.domain.aggregates.dispatch.value_objects import Instruction
 from src.domain.aggregates.driver.aggregate import Driver
 from src.domain.aggregates.driver.value_objects import DriverStatus
+from src.domain.aggregates.location.aggregate import Location
 
 from src.domain.common.entity import AggregateRoot
 from src.domain.exceptions import BusinessRuleViolation
 from .entities import Task
+from .events import (
+    DispatchCancelled,
+    DispatchCompleted,
+    DispatchPaused,
+    DispatchResumed,
+    DispatchRevertedToDraft,
+    DispatchStarted,
+    TaskCompleted,
+    TaskReverted,
+    TaskStarted,
+    TaskStoppedOff,
+)
+from .plan_index import PlanIndex
 from .utilities import _ALLOWED_FOLLOWS, _ENDABLE, _STARTABLE
-from .value_objects import Appointment, DispatchStatus, TaskStatus
+from .validation import PLAN_VALIDATOR, PlanRule, PlanViolation
+from .value_objects import Appointment, Container, DispatchStatus, Instruction, TaskStatus
 
 
 MINIMUM_TASKS_REQUIRED = 2
 MAXIMUM_TASKS_PERMITTED = 10
 
+
+def _driver_id(driver: Optional[Driver]):
+    return driver.id if driver else None
+
+
 class Dispatch(AggregateRoot):
     def __init__(
             self, 
@@ -28,7 +49,7 @@ class Dispatch(AggregateRoot):
         self.broker = broker
         self.current_driver = current_driver
         self.plan = plan
-        self._current_task = Optional[Task] = None
+        self._current_task: Optional[Task] = None
 
     @property
     def status(self):
@@ -36,50 +57,55 @@ class Dispatch(AggregateRoot):
 
     @property
     def assigned_drivers(self):
-        drivers = [task.completed_by for task in self.plan if task.completed_by]
+        drivers = self._index.drivers
         if self.current_driver:
             drivers.append(self.current_driver) 
         return list(dict.fromkeys(drivers))
     
     @property
     def current_container(self):
-        curr_container = [task.container for task in self.plan if task.status == 'in_progress']
-        return curr_container[0] if curr_container else None
+        current_task = self._index.current_task
+        return current_task.container if current_task else None
+
     @property
     def containers(self):
-        containers = [task.container for task in self.plan if task.container]
-        return list(dict.fromkeys(containers))
+        return self._index.containers
     
     @property
     def appointments(self):
-        return [(task.date, task.appointment) for task in self.plan if task.appointment]
+        return self._index.appointments
+
+    @property
+    def _index(self) -> PlanIndex:
+        # The ORM loads dispatches without calling __init__, so the index is
+        # built on first use rather than in the constructor.
+        index = self.__dict__.get('_plan_index')
+        if index is None:
+            index = self.refresh_index()
+        return index
+
+    def refresh_index(self) -> PlanIndex:
+        """Rebuild the derived views after the plan was changed outside the aggregate."""
+        self._plan_index = PlanIndex(self.plan)
+        return self._plan_index
+
+    @contextmanager
+    def _reindexing(self, task: Task) -> Iterator[Task]:
+        """Keep the derived views in step with a change made to one task."""
+        self._index.remove(task)
+        try:
+            yield task
+        finally:
+            self._index.add(task)
     
+    def _plan_violations(self) -> list[PlanViolation]:
+        return PLAN_VALIDATOR.validate(
+            [task.instruction for task in self.plan],
+            [task.container for task in self.plan],
+        )
+
     def _containers_assigned(self) -> bool:
-        for task in self.plan:
-            if task.instruction in (
-                Instruction.FETCH_CHASSIS,
-                Instruction.BOBTAIL_TO,
-                Instruction.TERMINATE_CHASSIS,
-            ):
-                continue
-            elif not task.container:
-                return False
-        return True
-    
-    def _get_invalid_transition(self) -> tuple | None:
-        if self.plan[0].instruction not in _STARTABLE:
-            return (None, self.plan[0].instruction)
-        
-        for idx in range(len(self.plan) - 1):
-            current = self.plan[idx].instruction
-            next_instruction = self.plan[idx + 1].instruction
-            if next_instruction not in _ALLOWED_FOLLOWS[current]:
-                return (current, next_instruction)
-        
-        if self.plan[-1].instruction not in _ENDABLE:
-            return (self.plan[-1].instruction, None)
-        
-        return None
+        return not any(v.rule == PlanRule.CONTAINER for v in self._plan_violations())
 
     def _get_start_errors(self) -> list:
         errors = []
@@ -89,18 +115,7 @@ class Dispatch(AggregateRoot):
             errors.append('Driver is not available to be dispatched.')
         if not self.appointments:
             errors.append('An appointment has not been set on at least one task.')
-        if not self._containers_assigned:
-            errors.append('Certain stops are missing their container assignment.')
-
-        invalid_transition = self._get_invalid_transition()
-        if invalid_transition:
-            current, next_instruction = invalid_transition
-            if current is None:
-                errors.append(f'{next_instruction.value} is not a valid starting instruction.')
-            elif next_instruction is None:
-                errors.append(f'{current.value} is not a valid ending instruction.')
-            else:
-                errors.append(f'{next_instruction.value} cannot follow {current.value}.')
+        errors.extend(violation.message for violation in self._plan_violations())
 
         return errors
 
@@ -114,6 +129,7 @@ class Dispatch(AggregateRoot):
         
         self._status = DispatchStatus.IN_PROGRESS
         self._current_task = self.plan[0]
+        self.record_event(DispatchStarted(self.id, self.current_driver.id))
         return []
 
     def pause(self) -> None:
@@ -124,12 +140,14 @@ class Dispatch(AggregateRoot):
                 raise ValueError('Cannot pause a dispatch when a task is in progress.')
             
         self._status = DispatchStatus.PAUSED
+        self.record_event(DispatchPaused(self.id))
 
     def resume(self) -> None:
         if self._status != DispatchStatus.PAUSED:
             raise ValueError('Only a paused dispatch can resume.')
         
         self._status = DispatchStatus.IN_PROGRESS
+        self.record_event(DispatchResumed(self.id))
 
     def complete(self) -> None:
         if self._status != DispatchStatus.IN_PROGRESS:
@@ -141,6 +159,7 @@ class Dispatch(AggregateRoot):
                 raise ValueError('All tasks must be completed before dispatch can be completed.')
             
         self._status = DispatchStatus.COMPLETED
+        self.record_event(DispatchCompleted(self.id))
 
     def cancel(self) -> None:
         if self._status == DispatchStatus.DRAFT:
@@ -151,6 +170,7 @@ class Dispatch(AggregateRoot):
             raise ValueError('A cancelled dispatch cannot be cancelled.')
             
         self._status = DispatchStatus.CANCELLED
+        self.record_event(DispatchCancelled(self.id))
 
     def revert_to_draft(self) -> None:
         if self._status != DispatchStatus.IN_PROGRESS:
@@ -159,6 +179,7 @@ class Dispatch(AggregateRoot):
             raise ValueError('Only a dispatch without any tasks started can revert to draft.')
         
         self._status = DispatchStatus.DRAFT
+        self.record_event(DispatchRevertedToDraft(self.id))
 
     def advance_to_next_task(self) -> None:
         if self._status != DispatchStatus.IN_PROGRESS:
@@ -177,25 +198,37 @@ class Dispatch(AggregateRoot):
         if priority > 1 and self.get_task(priority - 1).status != TaskStatus.COMPLETED:
             raise ValueError('Cannot start tasks out of order.')
         
-        self.get_task(priority).start()
+        with self._reindexing(self.get_task(priority)) as task:
+            task.start()
+        self.record_event(TaskStarted(self.id, task.id, task.priority, occurred_at=task._check_in_datetime))
 
     def complete_task(self, priority: int) -> None:
         if self.status != DispatchStatus.IN_PROGRESS:
             raise ValueError('Only a dispatch in progress can complete a task.')
         
-        self.get_task(priority).complete(self.current_driver)
+        with self._reindexing(self.get_task(priority)) as task:
+            task.complete(self.current_driver)
+        self.record_event(TaskCompleted(
+            self.id, task.id, task.priority, _driver_id(self.current_driver), occurred_at=task._check_out_datetime
+        ))
     
     def revert_task(self, priority: int) -> None:
         if self.status != DispatchStatus.IN_PROGRESS:
             raise ValueError('Only a dispatch in progress can revert a task.')
         
-        self.get_task(priority).revert_status()
+        with self._reindexing(self.get_task(priority)) as task:
+            task.revert_status()
+        self.record_event(TaskReverted(self.id, task.id, task.priority, task.status))
 
     def mark_stopoff(self, priority: int) -> None:
         if self.status != DispatchStatus.IN_PROGRESS:
             raise ValueError('Only a dispatch in progress can mark a task as stopoff.')
         
-        self.get_task(priority).stopoff(self.driver)
+        with self._reindexing(self.get_task(priority)) as task:
+            task.stopoff(self.current_driver)
+        self.record_event(TaskStoppedOff(
+            self.id, task.id, task.priority, _driver_id(self.current_driver), occurred_at=task._check_out_datetime
+        ))
 
     def get_task(self, priority: int):
         return self.plan[priority - 1]
@@ -216,9 +249,37 @@ class Dispatch(AggregateRoot):
         if len(self.containers) == 1:
             task.container = self.containers[0]
         self.plan.insert(task.priority - 1, task)
+        self._index.add(task)
         self._update_task_priorities()
         return
 
+    def append_task(self, task: Task) -> None:
+        """Add a task to the end of the plan without the checks add_task applies."""
+        self.plan.append(task)
+        self._index.add(task)
+
+    def pop_task(self) -> Task:
+        """Remove and return the last task of the plan without the checks remove_task applies."""
+        task = self.plan.pop()
+        self._index.remove(task)
+        return task
+
+    def edit_task(
+            self,
+            priority: int,
+            location: Location,
+            instruction: Instruction,
+            container: Optional[Container],
+            date: date,
+            appointment: Optional[Appointment],
+            ) -> None:
+        with self._reindexing(self.get_task(priority)) as task:
+            task.location = location
+            task.instruction = instruction
+            task.container = container
+            task.date = date
+            task.appointment = appointment
+
     def _update_task_priorities(self):
         for new_priority, task in enumerate(self.plan, start=1):
             task.priority = new_priority
@@ -245,12 +306,12 @@ class Dispatch(AggregateRoot):
             raise ValueError('Dispatch plan cannot have less than two tasks.')
         
         if priority == len(self.plan):
-            self.plan.pop()
+            self._index.remove(self.plan.pop())
         else:
             if self.get_task(priority).status == TaskStatus.COMPLETED:
                 raise ValueError('Cannot remove a completed task.')
             
-            self.plan.pop(priority - 1)
+            self._index.remove(self.plan.pop(priority - 1))
             self._update_task_priorities()
     
     def set_appointment(self, priority: int, appointment: Appointment):
@@ -259,7 +320,8 @@ class Dispatch(AggregateRoot):
         if self._status == DispatchStatus.CANCELLED:
             raise ValueError('A cancelled dispatch cannot set an appointment.')
         
-        self.get_task(priority).set_appointment(appointment)
+        with self._reindexing(self.get_task(priority)) as task:
+            task.set_appointment(appointment)
 
     def remove_appointment(self, priority: int):
         if self._status == DispatchStatus.COMPLETED:
@@ -267,12 +329,8 @@ class Dispatch(AggregateRoot):
         if self._status == DispatchStatus.CANCELLED:
             raise ValueError('A cancelled dispatch cannot remove an appointment.')
         
-        number_of_appts = 0
-        for task in self.plan:
-            if task.appointment:
-                number_of_appts += 1
-
-        if number_of_appts == 1 and self.status != DispatchStatus.DRAFT:
+        if self._index.appointment_count == 1 and self.status != DispatchStatus.DRAFT:
             raise ValueError('Cannot remove the only appointment on a dispatch that is in progress.')
         
-        self.get_task(priority).appointment = None
+        with self._reindexing(self.get_task(priority)) as task:
+            task.appointment = None
@@ -0,0 +1,124 @@
+from bisect import bisect_right, insort
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, time
+from typing import Iterable, Optional
+from uuid import UUID
+
+from .aggregate import Dispatch
+from .value_objects import Appointment, AppointmentType, DispatchStatus
+
+
+# Dispatches that hold on to their driver; the others have let them go.
+BOOKING_STATUSES = (DispatchStatus.DRAFT, DispatchStatus.IN_PROGRESS, DispatchStatus.PAUSED)
+
+
+def _minutes(moment: time) -> int:
+    return moment.hour * 60 + moment.minute
+
+
+def committed_window(appointment: Optional[Appointment]) -> Optional[tuple[int, int]]:
+    """
+    The minutes after midnight a driver must be at an appointment, or None if it is open.
+
+    Only the part of an appointment that cannot move is committed: all of a
+    time window, the moment of an exact time, the opening of a ready-after
+    and the deadline of a finish-by.
+    """
+    if appointment is None or appointment.appointment_type == AppointmentType.OPEN:
+        return None
+    start = appointment.start_time or appointment.end_time
+    end = appointment.end_time or appointment.start_time
+    if start is None:
+        return None
+    if appointment.appointment_type == AppointmentType.TIME_WINDOW:
+        return _minutes(start), _minutes(end)
+    if appointment.appointment_type == AppointmentType.FINISH_BY:
+        return _minutes(end), _minutes(end)
+    return _minutes(start), _minutes(start)
+
+
+def booked_spans(dispatch: Dispatch) -> dict[date, tuple[int, int]]:
+    """The span of each day a dispatch books its driver for, from its first to its last committed window."""
+    spans = {}
+    for task in dispatch.plan:
+        window = committed_window(task.appointment)
+        if window is None:
+            continue
+        start, end = spans.get(task.date, window)
+        spans[task.date] = (min(start, window[0]), max(end, window[1]))
+    return spans
+
+
+@dataclass(frozen=True)
+class BookingConflict:
+    driver_id: UUID
+    day: date
+    dispatch: Dispatch
+    other: Dispatch
+    start: int
+    end: int
+
+    @property
+    def message(self) -> str:
+        between = f'{self.start // 60:02d}:{self.start % 60:02d}'
+        if self.end != self.start:
+            between += f' and {self.end // 60:02d}:{self.end % 60:02d}'
+        return (
+            f'The driver is already booked on dispatch {self.other.reference} '
+            f'on {self.day.isoformat()} at {between}.'
+        )
+
+
+class DriverBookings:
+    """
+    An interval index of the spans each driver is booked for, per day.
+
+    Spans are kept sorted by start for every (driver, day), so checking a
+    new dispatch bisects to the spans that start before it ends and only
+    compares those. A report over the whole index is a sweep along each
+    day, keeping the spans still open at every start.
+    """
+
+    def __init__(self, dispatches: Iterable[Dispatch] = ()):
+        self._spans: dict[tuple[UUID, date], list[tuple[int, int, int, Dispatch]]] = defaultdict(list)
+        self._order = 0
+        for dispatch in dispatches:
+            self.add(dispatch)
+
+    def add(self, dispatch: Dispatch) -> None:
+        if dispatch.current_driver is None or dispatch.status not in BOOKING_STATUSES:
+            return
+        for day, (start, end) in booked_spans(dispatch).items():
+            # The running order breaks ties, so dispatches themselves are never compared.
+            self._order += 1
+            insort(self._spans[(dispatch.current_driver.id, day)], (start, end, self._order, dispatch))
+
+    def conflicts_with(self, dispatch: Dispatch) -> list[BookingConflict]:
+        """The booked spans of other dispatches that overlap the spans of `dispatch`."""
+        if dispatch.current_driver is None:
+            return []
+
+        driver_id = dispatch.current_driver.id
+        conflicts = []
+        for day, (start, end) in booked_spans(dispatch).items():
+            spans = self._spans.get((driver_id, day), [])
+            # Spans that start after this one ends cannot overlap it.
+            for other_start, other_end, _, other in spans[:bisect_right(spans, (end, float('inf')))]:
+                if other_end >= start and other.id != dispatch.id:
+                    conflicts.append(BookingConflict(
+                        driver_id, day, dispatch, other, max(start, other_start), min(end, other_end)
+                    ))
+        return conflicts
+
+    def conflicts(self) -> list[BookingConflict]:
+        """Every pair of overlapping spans in the index, by driver and day."""
+        conflicts = []
+        for (driver_id, day), spans in self._spans.items():
+            open_spans = []
+            for start, end, _, dispatch in spans:
+                open_spans = [span for span in open_spans if span[1] >= start]
+                for _, other_end, _, other in open_spans:
+                    conflicts.append(BookingConflict(driver_id, day, other, dispatch, start, min(end, other_end)))
+                open_spans.append((start, end, None, dispatch))
+        return conflicts
@@ -0,0 +1,115 @@
+"""
+Chassis taken from and returned to pools as the tasks moving them are completed.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from src.domain.common.events import DomainEvent
+from .aggregate import Dispatch
+from .container_moves import task_changes
+from .entities import Task
+from .value_objects import Instruction, TaskStatus
+
+
+# How completing a task changes the chassis count of its location.
+CHASSIS_CHANGES = {
+    Instruction.FETCH_CHASSIS: -1,
+    Instruction.TERMINATE_CHASSIS: 1,
+}
+
+
+@dataclass(frozen=True)
+class ChassisMove:
+    """
+    A completed task that took a chassis from, or returned one to, a location's pool.
+
+    Counting a pool records an adjustment too: a move with an ID of its own
+    and no dispatch, bringing the pool's count to what was counted.
+    """
+
+    task_id: UUID
+    dispatch_id: Optional[UUID]
+    location_id: UUID
+    change: int
+    moved_at: datetime
+
+
+@dataclass(frozen=True)
+class ChassisDay:
+    """A day of one pool: the chassis fetched from it and terminated at it, and its count at the end of the day."""
+
+    location_id: UUID
+    day: date
+    fetched: int
+    terminated: int
+    balance: int
+
+
+def chassis_move_of(dispatch: Dispatch, task: Task) -> Optional[ChassisMove]:
+    """The chassis move a task made, or None unless it is completed and fetched or terminated a chassis."""
+    if task.status != TaskStatus.COMPLETED or task.instruction not in CHASSIS_CHANGES:
+        return None
+    return ChassisMove(
+        task_id=task.id,
+        dispatch_id=dispatch.id,
+        location_id=task.location.id,
+        change=CHASSIS_CHANGES[task.instruction],
+        moved_at=task._check_out_datetime,
+    )
+
+
+def chassis_changes(dispatch: Dispatch, events: Iterable[DomainEvent]) -> list[tuple[UUID, Optional[ChassisMove]]]:
+    """The chassis moves a dispatch's new events made or took back, as task_changes gives them."""
+    return task_changes(dispatch, events, chassis_move_of)
+
+
+def daily_chassis_report(
+        opening: dict[UUID, int],
+        moves: Sequence[ChassisMove],
+        start: date,
+        end: date,
+        ) -> list[ChassisDay]:
+    """
+    Each pool's days from `start` to `end`, both included.
+
+    The moves are counted into a (pool, day) grid with one scatter, and
+    end-of-day counts are the opening counts plus the running sum of each
+    pool's net change along its row. Count adjustments move the end-of-day
+    counts without being reported as chassis fetched or terminated.
+
+    Args:
+        opening: The count of each pool before `start`
+        moves: The moves checked out from `start` to `end`
+    """
+    locations = sorted(set(opening) | {move.location_id for move in moves}, key=str)
+    rows = {location_id: row for row, location_id in enumerate(locations)}
+    days = (end - start).days + 1
+
+    fetched = np.zeros((len(locations), days), dtype=np.int64)
+    terminated = np.zeros((len(locations), days), dtype=np.int64)
+    adjusted = np.zeros((len(locations), days), dtype=np.int64)
+    if moves:
+        row = np.array([rows[move.location_id] for move in moves], dtype=np.int64)
+        column = np.array([(move.moved_at.date() - start).days for move in moves], dtype=np.int64)
+        change = np.array([move.change for move in moves], dtype=np.int64)
+        by_task = np.array([move.dispatch_id is not None for move in moves], dtype=bool)
+        fetches, terminations = by_task & (change < 0), by_task & (change > 0)
+        np.add.at(fetched, (row[fetches], column[fetches]), -change[fetches])
+        np.add.at(terminated, (row[terminations], column[terminations]), change[terminations])
+        np.add.at(adjusted, (row[~by_task], column[~by_task]), change[~by_task])
+
+    starting = np.array([opening.get(location_id, 0) for location_id in locations], dtype=np.int64)
+    balance = starting[:, None] + np.cumsum(terminated - fetched + adjusted, axis=1)
+
+    dates = [date.fromordinal(start.toordinal() + offset) for offset in range(days)]
+    return [
+        ChassisDay(location_id, dates[offset], int(fetched[row, offset]), int(terminated[row, offset]),
+                   int(balance[row, offset]))
+        for row, location_id in enumerate(locations)
+        for offset in range(days)
+    ]
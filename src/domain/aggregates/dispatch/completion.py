@@ -0,0 +1,131 @@
+import threading
+from typing import Iterator, Sequence
+
+from .aggregate import MAXIMUM_TASKS_PERMITTED, MINIMUM_TASKS_REQUIRED
+from .utilities import _ALLOWED_FOLLOWS, _ALLOWED_REPEAT, _ENDABLE, _STARTABLE
+from .validation import PLAN_VALIDATOR, PlanRule
+from .value_objects import Instruction
+
+
+_UNREACHABLE = MAXIMUM_TASKS_PERMITTED + 1
+
+# Completed prefixes each completer remembers before it forgets the oldest.
+_CACHE_SIZE = 4096
+
+# Rules a partial plan must already satisfy before it can be completed.
+_PREFIX_RULES = (PlanRule.START, PlanRule.FOLLOW, PlanRule.REPEAT)
+
+
+class PlanCompleter:
+    """
+    Suggests the shortest ways to finish a partial dispatch plan.
+
+    The follow graph is compiled once into integer adjacency lists, and the
+    number of tasks each instruction needs before it can end a plan is
+    precomputed with a backwards breadth-first search. The search for
+    completions only expands instructions that can still reach an ending
+    instruction within the remaining length, so it never explores dead ends.
+    A completer is shared by every request, so its cache of completions is
+    only read and written under a lock; searches run outside it.
+    """
+
+    def __init__(self):
+        self.instructions = list(Instruction)
+        self.codes = {instruction: code for code, instruction in enumerate(self.instructions)}
+
+        self._startable = [self.codes[i] for i in _STARTABLE]
+        self._endable = {self.codes[i] for i in _ENDABLE}
+        self._repeatable = {self.codes[i] for i in _ALLOWED_REPEAT}
+        self._follows = [
+            [self.codes[following] for following in _ALLOWED_FOLLOWS.get(instruction, [])]
+            for instruction in self.instructions
+        ]
+        self._tasks_to_end = self._compute_tasks_to_end()
+        self._completions: dict[tuple[tuple[int, ...], int], tuple[tuple[int, ...], ...]] = {}
+        self._lock = threading.Lock()
+
+    def _compute_tasks_to_end(self) -> list[int]:
+        """Fewest tasks that must follow each instruction before the plan can end."""
+        distance = [0 if code in self._endable else _UNREACHABLE for code in range(len(self.instructions))]
+        frontier = list(self._endable)
+
+        while frontier:
+            next_frontier = []
+            for code in range(len(self.instructions)):
+                if distance[code] != _UNREACHABLE:
+                    continue
+                best = min((distance[f] for f in self._follows[code] if f in frontier), default=_UNREACHABLE)
+                if best != _UNREACHABLE:
+                    distance[code] = best + 1
+                    next_frontier.append(code)
+            frontier = next_frontier
+
+        return distance
+
+    def complete(self, instructions: Sequence[Instruction], limit: int = 5) -> list[list[Instruction]]:
+        """
+        Return up to `limit` shortest sequences of instructions that turn the
+        partial plan into a valid one, in the order the transition tables
+        list them.
+
+        An empty list means the partial plan cannot be completed: it already
+        breaks a start, follow or repeat rule, or every way of finishing it
+        would exceed the maximum plan length. A plan that is already complete
+        returns a single empty completion.
+        """
+        codes = tuple(self.codes[instruction] for instruction in instructions)
+        key = (codes, limit)
+        with self._lock:
+            completions = self._completions.get(key)
+        if completions is None:
+            completions = self._complete(codes, limit)
+            with self._lock:
+                if key not in self._completions and len(self._completions) >= _CACHE_SIZE:
+                    self._completions.pop(next(iter(self._completions)))
+                self._completions[key] = completions
+        return [[self.instructions[code] for code in completion] for completion in completions]
+
+    def _complete(self, codes: tuple[int, ...], limit: int) -> tuple[tuple[int, ...], ...]:
+        prefix = [self.instructions[code] for code in codes]
+        if any(v.rule in _PREFIX_RULES for v in PLAN_VALIDATOR.validate(prefix)):
+            return ()
+
+        room = MAXIMUM_TASKS_PERMITTED - len(codes)
+        shortest = max(MINIMUM_TASKS_REQUIRED - len(codes), self._lower_bound(codes), 0)
+
+        seen = 0
+        for code in codes:
+            seen |= 1 << code
+
+        for length in range(shortest, room + 1):
+            completions = []
+            for completion in self._search(codes[-1] if codes else None, length, seen, ()):
+                completions.append(completion)
+                if len(completions) == limit:
+                    break
+            if completions:
+                return tuple(completions)
+
+        return ()
+
+    def _lower_bound(self, codes: tuple[int, ...]) -> int:
+        if codes:
+            return self._tasks_to_end[codes[-1]]
+        return 1 + min(self._tasks_to_end[code] for code in self._startable)
+
+    def _search(self, last, remaining: int, seen: int, path: tuple) -> Iterator[tuple[int, ...]]:
+        if remaining == 0:
+            if last is not None and last in self._endable:
+                yield path
+            return
+
+        candidates = self._startable if last is None else self._follows[last]
+        for code in candidates:
+            if self._tasks_to_end[code] > remaining - 1:
+                continue
+            if seen >> code & 1 and code not in self._repeatable:
+                continue
+            yield from self._search(code, remaining - 1, seen | 1 << code, path + (code,))
+
+
+PLAN_COMPLETER = PlanCompleter()
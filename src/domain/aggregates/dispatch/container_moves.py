@@ -0,0 +1,116 @@
+"""
+Where containers are left as the tasks moving them are completed.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Iterable, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+from .aggregate import Dispatch
+from .entities import Task
+from .events import TaskCompleted, TaskReverted
+from .value_objects import Instruction, TaskStatus, normalize_container_number
+
+
+T = TypeVar('T')
+
+
+class ContainerState(Enum):
+    ON_CHASSIS = 'on_chassis'
+    DROPPED = 'dropped'
+    RETURNED = 'returned'
+
+
+# Where completing a task leaves its container, and whether it is loaded afterwards (None when the task does not say).
+# On chassis, the container leaves the task's location with the driver; dropped, it sits there until picked up;
+# returned, it was given back to the terminal and is out of our hands.
+MOVE_EFFECTS: dict[Instruction, tuple[ContainerState, Optional[bool]]] = {
+    Instruction.PREPULL: (ContainerState.ON_CHASSIS, True),
+    Instruction.PICKUP_EMPTY: (ContainerState.ON_CHASSIS, False),
+    Instruction.PICKUP_LOADED: (ContainerState.ON_CHASSIS, True),
+    Instruction.YARD_PULL: (ContainerState.ON_CHASSIS, None),
+    Instruction.LIVE_LOAD: (ContainerState.ON_CHASSIS, True),
+    Instruction.LIVE_UNLOAD: (ContainerState.ON_CHASSIS, False),
+    Instruction.DROP_EMPTY: (ContainerState.DROPPED, False),
+    Instruction.DROP_LOADED: (ContainerState.DROPPED, True),
+    Instruction.STREET_TURN: (ContainerState.DROPPED, False),
+    Instruction.TERMINATE_EMPTY: (ContainerState.RETURNED, False),
+    Instruction.INGATE: (ContainerState.RETURNED, True),
+}
+
+
+@dataclass(frozen=True)
+class ContainerMove:
+    """A completed task that moved a container, keyed by its normalized number."""
+
+    container_number: str
+    dispatch_id: UUID
+    broker_id: UUID
+    task_id: UUID
+    instruction: Instruction
+    location_id: UUID
+    state: ContainerState
+    loaded: Optional[bool]
+    moved_at: datetime
+
+
+def move_of(dispatch: Dispatch, task: Task) -> Optional[ContainerMove]:
+    """The move a task made, or None unless it is completed and moved a container."""
+    if task.container is None or task.status != TaskStatus.COMPLETED or task.instruction not in MOVE_EFFECTS:
+        return None
+    state, loaded = MOVE_EFFECTS[task.instruction]
+    return ContainerMove(
+        container_number=normalize_container_number(task.container.number),
+        dispatch_id=dispatch.id,
+        broker_id=dispatch.broker.id,
+        task_id=task.id,
+        instruction=task.instruction,
+        location_id=task.location.id,
+        state=state,
+        loaded=loaded,
+        moved_at=task._check_out_datetime,
+    )
+
+
+def task_changes(
+        dispatch: Dispatch,
+        events: Iterable[DomainEvent],
+        move_of: Callable[[Dispatch, Task], Optional[T]],
+        ) -> list[tuple[UUID, Optional[T]]]:
+    """
+    The moves a dispatch's new events made or took back, in order.
+
+    Returns:
+        (task id, move) pairs; the move is None when the task's move, if
+        it had one, was taken back by reverting the task
+    """
+    tasks = {task.id: task for task in dispatch.plan}
+    changes = []
+    for event in events:
+        if isinstance(event, (TaskCompleted, TaskReverted)) and event.task_id in tasks:
+            # A task's move is read from the task as saved, so a completion reverted before the save leaves none.
+            changes.append((event.task_id, move_of(dispatch, tasks[event.task_id])))
+    return changes
+
+
+def container_changes(dispatch: Dispatch, events: Iterable[DomainEvent]) -> list[tuple[UUID, Optional[ContainerMove]]]:
+    """The container moves a dispatch's new events made or took back, as task_changes gives them."""
+    return task_changes(dispatch, events, move_of)
+
+
+def taken_out(timeline: Sequence[ContainerMove]) -> Optional[ContainerMove]:
+    """
+    The move that took a container out on its current trip, or None if it was returned.
+
+    A trip starts with the first move after the container was last
+    returned, and its per diem runs from there.
+    """
+    if not timeline or timeline[-1].state == ContainerState.RETURNED:
+        return None
+    start = len(timeline) - 1
+    while start > 0 and timeline[start - 1].state != ContainerState.RETURNED:
+        start -= 1
+    return timeline[start]
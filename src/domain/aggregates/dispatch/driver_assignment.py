@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from datetime import date, time
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.common.assignment import linear_sum_assignment
+from .aggregate import Dispatch
+from .value_objects import Appointment, AppointmentType, TaskStatus
+
+
+# Minutes after midnight the day's drivers are ready by, and the last an open appointment may run to.
+SHIFT_START = 6 * 60
+SHIFT_END = 22 * 60
+
+# A missed appointment costs more than any idle gap a day can hold, so one is only
+# proposed when every other assignment misses more.
+MISSED_APPOINTMENT_COST = 24 * 60
+
+
+def _minutes(moment: time) -> int:
+    return moment.hour * 60 + moment.minute
+
+
+def appointment_window(appointment: Optional[Appointment]) -> tuple[int, int]:
+    """The minutes after midnight a driver may arrive between to keep an appointment."""
+    if appointment is None or appointment.appointment_type == AppointmentType.OPEN:
+        return SHIFT_START, SHIFT_END
+    start = _minutes(appointment.start_time) if appointment.start_time else SHIFT_START
+    end = _minutes(appointment.end_time) if appointment.end_time else SHIFT_END
+    if appointment.appointment_type == AppointmentType.EXACT_TIME:
+        return start, start
+    if appointment.appointment_type == AppointmentType.READY_AFTER:
+        return start, max(start, SHIFT_END)
+    if appointment.appointment_type == AppointmentType.FINISH_BY:
+        # Some finish-by appointments keep their deadline in the start time.
+        deadline = end if appointment.end_time else start
+        return min(SHIFT_START, deadline), deadline
+    return start, end
+
+
+def first_window(dispatch: Dispatch, day: date) -> tuple[int, int]:
+    """The window of the first appointment a dispatch still has to keep on a day."""
+    windows = [
+        appointment_window(task.appointment)
+        for task in dispatch.plan
+        if task.date == day and task.appointment and task.status != TaskStatus.COMPLETED
+    ]
+    return min(windows) if windows else (SHIFT_START, SHIFT_END)
+
+
+def busy_until(dispatches: list[Dispatch], day: date) -> dict[UUID, int]:
+    """
+    When the drivers of dispatches in progress are expected to be free.
+
+    A driver is taken to be busy until the close of the last window their
+    dispatch still has to keep that day.
+    """
+    ready = {}
+    for dispatch in dispatches:
+        if dispatch.current_driver is None:
+            continue
+        closes = [
+            appointment_window(task.appointment)[1]
+            for task in dispatch.plan
+            if task.date == day and task.appointment and task.status != TaskStatus.COMPLETED
+        ]
+        ready[dispatch.current_driver.id] = max(closes, default=SHIFT_START)
+    return ready
+
+
+@dataclass(frozen=True)
+class ProposedAssignment:
+    dispatch: Dispatch
+    driver: Driver
+    idle_minutes: int
+    late_minutes: int
+
+    @property
+    def misses_appointment(self) -> bool:
+        return self.late_minutes > 0
+
+
+@dataclass(frozen=True)
+class AssignmentProposal:
+    assignments: list[ProposedAssignment]
+    unassigned: list[Dispatch]
+
+
+class DriverAssignmentOptimizer:
+    """
+    Proposes which driver should take each of a day's draft dispatches.
+
+    Every pair of dispatch and driver is costed in one NumPy broadcast: the
+    minutes the driver would wait for the dispatch's first appointment to
+    open, or the minutes they would arrive after it closes plus a penalty
+    for missing it. The Hungarian method then picks the pairs with the
+    least total cost, giving each driver one dispatch at most. When there
+    are more dispatches than drivers, the ones left over are unassigned.
+    """
+
+    def propose(
+            self,
+            dispatches: list[Dispatch],
+            drivers: list[Driver],
+            day: date,
+            ready_at: Optional[dict[UUID, int]] = None,
+            ) -> AssignmentProposal:
+        """
+        Args:
+            dispatches: Draft dispatches that need a driver
+            drivers: Drivers that may take them
+            day: The day the dispatches run
+            ready_at: Minutes after midnight each driver is free, by driver id;
+                SHIFT_START for drivers not given
+        """
+        if not dispatches or not drivers:
+            return AssignmentProposal(assignments=[], unassigned=list(dispatches))
+
+        ready_at = ready_at or {}
+        windows = np.array([first_window(dispatch, day) for dispatch in dispatches])
+        opens, closes = windows[:, :1], windows[:, 1:]
+        ready = np.array([ready_at.get(driver.id, SHIFT_START) for driver in drivers])[None, :]
+
+        idle = np.maximum(opens - ready, 0)
+        late = np.maximum(ready - closes, 0)
+        cost = idle + late + MISSED_APPOINTMENT_COST * (late > 0)
+
+        rows, columns = linear_sum_assignment(cost)
+        assignments = [
+            ProposedAssignment(
+                dispatch=dispatches[row],
+                driver=drivers[column],
+                idle_minutes=int(idle[row, column]),
+                late_minutes=int(late[row, column]),
+            )
+            for row, column in zip(rows, columns)
+        ]
+        assigned = set(rows.tolist())
+        unassigned = [dispatch for row, dispatch in enumerate(dispatches) if row not in assigned]
+        return AssignmentProposal(assignments=assignments, unassigned=unassigned)
+
+
+DRIVER_ASSIGNMENT_OPTIMIZER = DriverAssignmentOptimizer()
@@ -70,7 +70,7 @@ class Task(Entity):
             raise ValueError('Task instruction is incompatible with being marked stop off.')
         
         self._status = TaskStatus.STOP_OFF
-        self._completed_by = driver.name
+        self._completed_by = driver
         self._check_out_datetime = datetime.now()
 
     def void(self, driver: Driver) -> None:
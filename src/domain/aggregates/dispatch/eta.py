@@ -0,0 +1,192 @@
+"""
+Predicted arrivals at the tasks a dispatch has left, and whether each will keep its appointment.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from enum import Enum
+from typing import Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from .aggregate import Dispatch
+from .driver_assignment import SHIFT_START, appointment_window
+from .entities import Task
+from .sequencing import LIVE_STOP_MINUTES, STOP_MINUTES
+from .task_durations import DurationEstimate
+from .value_objects import AppointmentType, Instruction, TaskStatus
+
+
+class AppointmentRisk(Enum):
+    ON_TIME = 'on_time'
+    AT_RISK = 'at_risk'
+    LATE = 'late'
+
+
+# Appointments that only hold a task back, and so cannot be missed.
+UNMISSABLE_APPOINTMENTS = (AppointmentType.OPEN, AppointmentType.READY_AFTER)
+
+# How long a prediction that has caught up with the clock is kept before it is worked out again.
+ETA_REFRESH_MINUTES = 5
+
+_DONE = (TaskStatus.COMPLETED, TaskStatus.STOP_OFF)
+
+
+@dataclass(frozen=True)
+class TaskEta:
+    """
+    When a driver is expected at a task and away from it.
+
+    The expected times take every stop to last its median duration; the
+    latest take the 90th percentile, so an appointment kept on the first
+    but not the second is at risk.
+    """
+
+    task_id: UUID
+    priority: int
+    arrival: datetime
+    departure: datetime
+    latest_arrival: datetime
+    latest_departure: datetime
+    risk: Optional[AppointmentRisk]
+
+
+@dataclass(frozen=True)
+class DispatchEta:
+    """The predicted arrivals of a dispatch's remaining tasks, and how long they hold."""
+
+    dispatch_id: UUID
+    fingerprint: tuple
+    valid_until: datetime
+    tasks: list[TaskEta]
+
+    @property
+    def risk(self) -> Optional[AppointmentRisk]:
+        """The worst risk of any task, or None without appointments to keep."""
+        risks = [task.risk for task in self.tasks if task.risk is not None]
+        return max(risks, key=list(AppointmentRisk).index) if risks else None
+
+
+def plan_fingerprint(dispatch: Dispatch) -> tuple:
+    """What a prediction depends on in a dispatch, to tell whether one made earlier still holds."""
+    return (dispatch.status,) + tuple(
+        (
+            task.id, task.status, task.instruction, task.location.id, task.date,
+            task.appointment.appointment_type if task.appointment else None,
+            appointment_window(task.appointment), task._check_in_datetime,
+        )
+        for task in dispatch.plan
+    )
+
+
+def remaining_tasks(dispatch: Dispatch) -> list[Task]:
+    """The tasks not completed or stopped off, in plan order."""
+    return [task for task in dispatch.plan if task.status not in _DONE]
+
+
+def _default_minutes(instruction: Instruction) -> float:
+    # The sequencer's stop times stand in until enough completions are counted.
+    return LIVE_STOP_MINUTES if instruction in (Instruction.LIVE_LOAD, Instruction.LIVE_UNLOAD) else STOP_MINUTES
+
+
+def _on(task: Task, minutes: int) -> datetime:
+    return datetime.combine(task.date, time.min) + timedelta(minutes=minutes)
+
+
+def _risk(task: Task, arrival: datetime, departure: datetime, latest_arrival: datetime,
+          latest_departure: datetime) -> Optional[AppointmentRisk]:
+    if task.appointment is None or task.appointment.appointment_type in UNMISSABLE_APPOINTMENTS:
+        return None
+    closes = _on(task, appointment_window(task.appointment)[1])
+    # An exact time or window is kept by arriving in time, a finish-by by leaving in time.
+    if task.appointment.appointment_type == AppointmentType.FINISH_BY:
+        expected, latest = departure, latest_departure
+    else:
+        expected, latest = arrival, latest_arrival
+    if expected > closes:
+        return AppointmentRisk.LATE
+    if latest > closes:
+        return AppointmentRisk.AT_RISK
+    return AppointmentRisk.ON_TIME
+
+
+def predict_etas(
+        dispatch: Dispatch,
+        index: dict[UUID, int],
+        travel_minutes: np.ndarray,
+        now: datetime,
+        durations: Optional[Sequence[Optional[DurationEstimate]]] = None,
+        ) -> DispatchEta:
+    """
+    Walk a dispatch's remaining tasks from the last one it finished.
+
+    A task in progress is left once its duration has passed since check-in,
+    and not before now. Each task after is reached by driving from the one
+    before, no earlier than now or the shift's start on its day, and started
+    once its appointment window opens. Without a task finished, the driver
+    is taken to be at the first one now.
+
+    Args:
+        index: The row and column of each location in travel_minutes
+        travel_minutes: Minutes between each pair of locations of the plan
+        now: The moment of the prediction
+        durations: The estimate of each remaining task, in order, None where
+            there is none; the sequencer's stop times are used without them
+
+    Returns:
+        The prediction, which holds until its valid_until unless the
+        dispatch changes
+    """
+    remaining = remaining_tasks(dispatch)
+    durations = durations if durations is not None else [None] * len(remaining)
+    finished = [task for task in dispatch.plan if task.status in _DONE]
+    previous = finished[-1] if finished else None
+    left = (previous._check_out_datetime or now) if previous else None
+    latest_left = left
+    first_pending = None
+
+    etas = []
+    for task, estimate in zip(remaining, durations):
+        if estimate:
+            expected = timedelta(minutes=estimate.p50_minutes)
+            slow = timedelta(minutes=max(estimate.p90_minutes, estimate.p50_minutes))
+        else:
+            expected = slow = timedelta(minutes=_default_minutes(task.instruction))
+
+        if task.status == TaskStatus.IN_PROGRESS:
+            arrival = latest_arrival = task._check_in_datetime or now
+            departure = arrival + expected
+            first_pending = first_pending or departure
+            departure, latest_departure = max(departure, now), max(arrival + slow, now)
+        else:
+            if previous is None:
+                arrival = latest_arrival = now
+            else:
+                drive = timedelta(minutes=float(travel_minutes[index[previous.location.id], index[task.location.id]]))
+                arrival, latest_arrival = left + drive, latest_left + drive
+            first_pending = first_pending or arrival
+            shift = _on(task, SHIFT_START)
+            arrival, latest_arrival = max(arrival, now, shift), max(latest_arrival, now, shift)
+            opens = _on(task, appointment_window(task.appointment)[0]) if task.appointment else shift
+            departure = max(arrival, opens) + expected
+            latest_departure = max(latest_arrival, opens) + slow
+
+        etas.append(TaskEta(
+            task_id=task.id,
+            priority=task.priority,
+            arrival=arrival,
+            departure=departure,
+            latest_arrival=latest_arrival,
+            latest_departure=latest_departure,
+            risk=_risk(task, arrival, departure, latest_arrival, latest_departure),
+        ))
+        previous, left, latest_left = task, departure, latest_departure
+
+    refresh = now + timedelta(minutes=ETA_REFRESH_MINUTES)
+    return DispatchEta(
+        dispatch_id=dispatch.id,
+        fingerprint=plan_fingerprint(dispatch),
+        valid_until=max(first_pending, refresh) if first_pending else datetime.max,
+        tasks=etas,
+    )
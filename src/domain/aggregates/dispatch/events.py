@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+from .value_objects import TaskStatus
+
+
+@dataclass(frozen=True)
+class DispatchStarted(DomainEvent):
+    dispatch_id: UUID
+    driver_id: UUID
+
+
+@dataclass(frozen=True)
+class DispatchPaused(DomainEvent):
+    dispatch_id: UUID
+
+
+@dataclass(frozen=True)
+class DispatchResumed(DomainEvent):
+    dispatch_id: UUID
+
+
+@dataclass(frozen=True)
+class DispatchCompleted(DomainEvent):
+    dispatch_id: UUID
+
+
+@dataclass(frozen=True)
+class DispatchCancelled(DomainEvent):
+    dispatch_id: UUID
+
+
+@dataclass(frozen=True)
+class DispatchRevertedToDraft(DomainEvent):
+    dispatch_id: UUID
+
+
+@dataclass(frozen=True)
+class TaskStarted(DomainEvent):
+    dispatch_id: UUID
+    task_id: UUID
+    priority: int
+
+
+@dataclass(frozen=True)
+class TaskCompleted(DomainEvent):
+    dispatch_id: UUID
+    task_id: UUID
+    priority: int
+    driver_id: Optional[UUID]
+
+
+@dataclass(frozen=True)
+class TaskStoppedOff(DomainEvent):
+    dispatch_id: UUID
+    task_id: UUID
+    priority: int
+    driver_id: Optional[UUID]
+
+
+@dataclass(frozen=True)
+class TaskReverted(DomainEvent):
+    """A task stepped back one status; `status` is the status it returned to."""
+
+    dispatch_id: UUID
+    task_id: UUID
+    priority: int
+    status: TaskStatus
@@ -0,0 +1,116 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Iterable, Optional
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+from .aggregate import Dispatch
+from .events import (
+    DispatchCancelled,
+    DispatchCompleted,
+    DispatchPaused,
+    DispatchResumed,
+    DispatchRevertedToDraft,
+    DispatchStarted,
+    TaskCompleted,
+    TaskReverted,
+    TaskStarted,
+    TaskStoppedOff,
+)
+from .value_objects import DispatchStatus, Instruction, TaskStatus
+
+
+@dataclass(frozen=True)
+class TaskState:
+    task_id: UUID
+    priority: int
+    instruction: Instruction
+    status: TaskStatus
+    check_in: Optional[datetime]
+    check_out: Optional[datetime]
+    completed_by: Optional[UUID]
+
+
+@dataclass(frozen=True)
+class DispatchState:
+    """
+    The progress of a dispatch at one point in its event stream.
+
+    States are snapshotted from a live Dispatch and then moved forward by
+    applying the events recorded after the snapshot, which is how history
+    is read back for any moment without replaying the whole stream.
+    `version` is the number of events the state includes.
+    """
+
+    dispatch_id: UUID
+    reference: Optional[int]
+    status: DispatchStatus
+    driver_id: Optional[UUID]
+    tasks: tuple[TaskState, ...]
+    version: int
+
+    @classmethod
+    def of(cls, dispatch: Dispatch, version: int) -> 'DispatchState':
+        return cls(
+            dispatch_id=dispatch.id,
+            reference=dispatch.reference,
+            status=dispatch.status,
+            driver_id=dispatch.current_driver.id if dispatch.current_driver else None,
+            tasks=tuple(
+                TaskState(
+                    task_id=task.id,
+                    priority=task.priority,
+                    instruction=task.instruction,
+                    status=task.status,
+                    check_in=task._check_in_datetime,
+                    check_out=task._check_out_datetime,
+                    completed_by=getattr(task.completed_by, 'id', None),
+                )
+                for task in dispatch.plan
+            ),
+            version=version,
+        )
+
+    def apply(self, event: DomainEvent) -> 'DispatchState':
+        """Return the state after `event`, which must be the next event in this dispatch's stream."""
+        applied = _APPLIERS[type(event)](self, event)
+        return replace(applied, version=self.version + 1)
+
+    def _with_task(self, task_id: UUID, **changes) -> 'DispatchState':
+        return replace(self, tasks=tuple(
+            replace(task, **changes) if task.task_id == task_id else task for task in self.tasks
+        ))
+
+
+def replay(state: DispatchState, events: Iterable[DomainEvent]) -> DispatchState:
+    """Apply events that follow `state` in its stream, in order."""
+    for event in events:
+        state = state.apply(event)
+    return state
+
+
+def _revert(state: DispatchState, event: TaskReverted) -> DispatchState:
+    # Mirrors Task.revert_status: stepping back clears what the later status set.
+    if event.status == TaskStatus.NOT_STARTED:
+        return state._with_task(event.task_id, status=event.status, check_in=None, check_out=None, completed_by=None)
+    return state._with_task(event.task_id, status=event.status, check_out=None, completed_by=None)
+
+
+_APPLIERS = {
+    DispatchStarted: lambda state, e: replace(state, status=DispatchStatus.IN_PROGRESS, driver_id=e.driver_id),
+    DispatchPaused: lambda state, e: replace(state, status=DispatchStatus.PAUSED),
+    DispatchResumed: lambda state, e: replace(state, status=DispatchStatus.IN_PROGRESS),
+    DispatchCompleted: lambda state, e: replace(state, status=DispatchStatus.COMPLETED),
+    DispatchCancelled: lambda state, e: replace(state, status=DispatchStatus.CANCELLED),
+    DispatchRevertedToDraft: lambda state, e: replace(state, status=DispatchStatus.DRAFT),
+    TaskStarted: lambda state, e: state._with_task(
+        e.task_id, status=TaskStatus.IN_PROGRESS, check_in=e.occurred_at
+    ),
+    TaskCompleted: lambda state, e: state._with_task(
+        e.task_id, status=TaskStatus.COMPLETED, check_out=e.occurred_at, completed_by=e.driver_id
+    ),
+    TaskStoppedOff: lambda state, e: state._with_task(
+        e.task_id, status=TaskStatus.STOP_OFF, check_out=e.occurred_at, completed_by=e.driver_id
+    ),
+    TaskReverted: _revert,
+}
@@ -0,0 +1,86 @@
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import count
+from typing import Iterable, Optional
+
+from .entities import Task
+from .value_objects import Appointment, Container, TaskStatus
+
+
+class PlanIndex:
+    """
+    Views of a dispatch plan that would otherwise need a scan of every task.
+
+    The index is told about each task as it joins or leaves the plan, and a
+    task that changes is removed and added again around the change. Each
+    update costs a few dictionary operations, plus a binary search for the
+    appointment list, so reading the views costs nothing extra per task.
+
+    Containers and drivers are counted rather than stored, so a container
+    shared by several tasks stays listed until its last task goes. Both are
+    listed in the order they first joined the plan.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self._containers: Counter[Container] = Counter()
+        self._drivers: Counter = Counter()
+        self._in_progress: dict[int, Task] = {}
+        # Sorted (date, sequence) keys; the sequence keeps equal dates in the order they were added.
+        self._appointment_keys: list[tuple] = []
+        self._appointments: dict[tuple, Appointment] = {}
+        self._keys_by_task: dict[int, tuple] = {}
+        self._sequence = count()
+
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: Task) -> None:
+        if task.container:
+            self._containers[task.container] += 1
+        if task.completed_by:
+            self._drivers[task.completed_by] += 1
+        if task.status == TaskStatus.IN_PROGRESS:
+            self._in_progress[id(task)] = task
+        if task.appointment:
+            key = (task.date, next(self._sequence))
+            insort(self._appointment_keys, key)
+            self._appointments[key] = task.appointment
+            self._keys_by_task[id(task)] = key
+
+    def remove(self, task: Task) -> None:
+        if task.container:
+            self._discount(self._containers, task.container)
+        if task.completed_by:
+            self._discount(self._drivers, task.completed_by)
+        self._in_progress.pop(id(task), None)
+        if (key := self._keys_by_task.pop(id(task), None)) is not None:
+            del self._appointment_keys[bisect_left(self._appointment_keys, key)]
+            del self._appointments[key]
+
+    @staticmethod
+    def _discount(counter: Counter, item) -> None:
+        counter[item] -= 1
+        if counter[item] <= 0:
+            del counter[item]
+
+    @property
+    def containers(self) -> list[Container]:
+        return list(self._containers)
+
+    @property
+    def drivers(self) -> list:
+        return list(self._drivers)
+
+    @property
+    def appointments(self) -> list[tuple]:
+        """The (date, appointment) of every task with an appointment, earliest first."""
+        return [(key[0], self._appointments[key]) for key in self._appointment_keys]
+
+    @property
+    def appointment_count(self) -> int:
+        return len(self._appointment_keys)
+
+    @property
+    def current_task(self) -> Optional[Task]:
+        """The task in progress, if any."""
+        return next(iter(self._in_progress.values()), None)
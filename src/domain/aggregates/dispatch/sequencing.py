@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from src.domain.aggregates.location.aggregate import Location
+from .aggregate import Dispatch
+from .driver_assignment import MISSED_APPOINTMENT_COST, SHIFT_START, appointment_window
+from .utilities import _ALLOWED_FOLLOWS, _ENDABLE, _STARTABLE
+from .value_objects import Instruction
+
+
+# Minutes a driver spends at a stop; live loads and unloads wait on the customer.
+STOP_MINUTES = 15
+LIVE_STOP_MINUTES = 2 * 60
+
+
+def plan_locations(dispatch: Dispatch) -> list[Location]:
+    """The distinct locations of a plan in the order they are first visited, which index its travel matrix."""
+    locations = {}
+    for task in dispatch.plan:
+        locations.setdefault(task.location.id, task.location)
+    return list(locations.values())
+
+
+@dataclass(frozen=True)
+class PlanSequence:
+    """An order of a plan's tasks, by their 0-based positions in the plan, and what it costs."""
+
+    order: tuple[int, ...]
+    travel_minutes: int
+    late_minutes: int
+    missed_appointments: int
+
+    @property
+    def cost(self) -> int:
+        return self.travel_minutes + self.late_minutes + MISSED_APPOINTMENT_COST * self.missed_appointments
+
+
+@dataclass(frozen=True)
+class SequenceProposal:
+    current: PlanSequence
+    best: PlanSequence
+
+    @property
+    def changed(self) -> bool:
+        return self.best.order != self.current.order
+
+
+class PlanSequencer:
+    """
+    Finds the order of a plan's tasks that needs the least travel and lateness.
+
+    An order is valid when it starts on a startable instruction, steps only
+    to instructions that may follow, ends on an endable one and never goes
+    back a day. The bitmask dynamic program keeps, for each set of tasks
+    visited and the task visited last, the (cost, clock) labels that no
+    other label beats on both, so waiting for a window that opens later is
+    weighed exactly. Plans are capped at ten tasks, which bounds this to a
+    few thousand states.
+
+    Costs are those of the driver assignment: minutes of travel, plus the
+    minutes late for each appointment and the penalty for missing it. Since
+    every stop adds to the cost on its own, a label that is cheaper and
+    earlier stays so however the plan goes on. Solutions
+    are cached by the plan's instructions, days, windows and location tuple.
+    """
+
+    def __init__(self):
+        self.instructions = list(Instruction)
+        self.codes = {instruction: code for code, instruction in enumerate(self.instructions)}
+        self._startable = {self.codes[i] for i in _STARTABLE}
+        self._endable = {self.codes[i] for i in _ENDABLE}
+        self._follows = [
+            {self.codes[following] for following in _ALLOWED_FOLLOWS.get(instruction, [])}
+            for instruction in self.instructions
+        ]
+        self._stop_minutes = [
+            LIVE_STOP_MINUTES if i in (Instruction.LIVE_LOAD, Instruction.LIVE_UNLOAD) else STOP_MINUTES
+            for i in self.instructions
+        ]
+
+    def propose(self, dispatch: Dispatch, travel_minutes: np.ndarray) -> Optional[SequenceProposal]:
+        """
+        Args:
+            dispatch: A dispatch whose whole plan may be reordered
+            travel_minutes: Minutes between each pair of plan_locations(dispatch)
+
+        Returns:
+            The current order and the best one, or None when no order is valid
+        """
+        indexes = {location.id: index for index, location in enumerate(plan_locations(dispatch))}
+        first_day = min(task.date for task in dispatch.plan)
+        plan = (
+            tuple(self.codes[task.instruction] for task in dispatch.plan),
+            tuple((task.date - first_day).days for task in dispatch.plan),
+            tuple(appointment_window(task.appointment) for task in dispatch.plan),
+            tuple(indexes[task.location.id] for task in dispatch.plan),
+            tuple(map(tuple, np.rint(travel_minutes).astype(int).tolist())),
+        )
+        best = self._solve(*plan)
+        if best is None:
+            return None
+        return SequenceProposal(current=self._evaluate(tuple(range(len(dispatch.plan))), *plan), best=best)
+
+    def _arrive(self, label: tuple, following: int, days, windows, moves, service) -> tuple:
+        """Extend a label to the task at `following`."""
+        cost, clock, travel, late, missed, _, last = label
+        if last is None:
+            # The first stop needs no travel and is reached as soon as both the shift and its window open.
+            minutes, arrival = 0, SHIFT_START
+        else:
+            minutes = moves[last][following]
+            # A new day starts at the beginning of the shift, wherever the last one ended.
+            arrival = (SHIFT_START if days[following] > days[last] else clock) + minutes
+        opens, closes = windows[following]
+        lateness = max(arrival - closes, 0)
+        cost += minutes + lateness + MISSED_APPOINTMENT_COST * (lateness > 0)
+        clock = max(arrival, opens) + service[following]
+        return cost, clock, travel + minutes, late + lateness, missed + (lateness > 0), label, following
+
+    def _evaluate(self, order, codes, days, windows, stops, travel) -> PlanSequence:
+        moves = [[travel[a][b] for b in stops] for a in stops]
+        service = [self._stop_minutes[code] for code in codes]
+        label = _START
+        for position in order:
+            label = self._arrive(label, position, days, windows, moves, service)
+        return PlanSequence(order, *label[2:5])
+
+    @lru_cache(maxsize=4096)
+    def _solve(self, codes, days, windows, stops, travel) -> Optional[PlanSequence]:
+        moves = [[travel[a][b] for b in stops] for a in stops]
+        service = [self._stop_minutes[code] for code in codes]
+        count = len(codes)
+        full = (1 << count) - 1
+
+        # labels[mask][last] holds the (cost, clock, travel, late, missed, previous label, last) labels kept.
+        labels: list[dict[int, list[tuple]]] = [{} for _ in range(full + 1)]
+        for position in range(count):
+            if codes[position] in self._startable:
+                labels[1 << position][position] = [self._arrive(_START, position, days, windows, moves, service)]
+
+        for mask in range(1, full):
+            for last, kept in labels[mask].items():
+                follows = self._follows[codes[last]]
+                for following in range(count):
+                    if mask >> following & 1 or codes[following] not in follows or days[following] < days[last]:
+                        continue
+                    extended = labels[mask | 1 << following].setdefault(following, [])
+                    for label in kept:
+                        _keep(extended, self._arrive(label, following, days, windows, moves, service))
+
+        finals = [label for last, kept in labels[full].items() if codes[last] in self._endable for label in kept]
+        if not finals:
+            return None
+
+        best = min(finals, key=lambda label: (label[0], label[1]))
+        order, label = [], best
+        while label[6] is not None:
+            order.append(label[6])
+            label = label[5]
+        return PlanSequence(tuple(reversed(order)), *best[2:5])
+
+
+_START = (0, SHIFT_START, 0, 0, 0, None, None)
+
+
+def _keep(kept: list[tuple], label: tuple) -> None:
+    """Keep a label unless another is as cheap and as early, dropping the ones it beats."""
+    cost, clock = label[0], label[1]
+    if any(other[0] <= cost and other[1] <= clock for other in kept):
+        return
+    kept[:] = [other for other in kept if not (cost <= other[0] and clock <= other[1])]
+    kept.append(label)
+
+
+PLAN_SEQUENCER = PlanSequencer()
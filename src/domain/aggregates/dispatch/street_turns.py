@@ -0,0 +1,226 @@
+"""
+Street turns: an empty freed by an import loaded for an export, without a trip to the terminal in between.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.common.assignment import linear_sum_assignment
+from .aggregate import Dispatch
+from .entities import Task
+from .value_objects import ContainerSize, Instruction, TaskStatus
+
+
+# Days an empty may wait between being freed and picked up for loading.
+MAX_STREET_TURN_DAYS = 2
+
+# A day an empty waits weighs like an hour of driving, so the same-day match wins between equals.
+WAITING_DAY_COST = 60
+
+
+def _number(task: Task) -> Optional[str]:
+    return task.container.number if task.container else None
+
+
+@dataclass(frozen=True)
+class FreedEmpty:
+    """
+    An import's empty, free once unloaded or dropped.
+
+    An unloaded empty is free only if the import was to return it to the
+    terminal next, as its last task, since a street turn cannot be followed
+    by another; a dropped one is free only if the import does not move it
+    again.
+    """
+
+    dispatch: Dispatch
+    task: Task
+    returned_by: Optional[Task]
+
+    @property
+    def size(self) -> ContainerSize:
+        return self.task.container.size
+
+
+@dataclass(frozen=True)
+class EmptyNeed:
+    """An export's empty, picked up at the terminal to be loaded next."""
+
+    dispatch: Dispatch
+    pickup: Task
+    load: Task
+
+    @property
+    def size(self) -> ContainerSize:
+        return self.pickup.container.size
+
+
+def freed_empties(dispatch: Dispatch) -> list[FreedEmpty]:
+    """The empties a dispatch frees that it has not yet returned."""
+    freed = []
+    for position, task in enumerate(dispatch.plan):
+        if task.instruction not in (Instruction.LIVE_UNLOAD, Instruction.DROP_EMPTY) or task.container is None:
+            continue
+        following = next(
+            (later for later in dispatch.plan[position + 1:] if _number(later) == task.container.number), None
+        )
+        if task.instruction == Instruction.LIVE_UNLOAD:
+            if (following is not None and following.instruction == Instruction.TERMINATE_EMPTY
+                    and following.status == TaskStatus.NOT_STARTED and following is dispatch.plan[-1]):
+                freed.append(FreedEmpty(dispatch, task, following))
+        elif following is None:
+            freed.append(FreedEmpty(dispatch, task, None))
+    return freed
+
+
+def empty_needs(dispatch: Dispatch) -> list[EmptyNeed]:
+    """The empties a dispatch has yet to pick up and load next."""
+    return [
+        EmptyNeed(dispatch, task, following)
+        for task, following in zip(dispatch.plan, dispatch.plan[1:])
+        if task.instruction == Instruction.PICKUP_EMPTY and task.status == TaskStatus.NOT_STARTED
+        and task.container is not None
+        and following.instruction == Instruction.LIVE_LOAD and _number(following) == task.container.number
+    ]
+
+
+def street_turn_locations(freed: Iterable[FreedEmpty], needs: Iterable[EmptyNeed]) -> list[Location]:
+    """The distinct locations of empties and needs, which index the travel matrix of a match."""
+    seen = {}
+    for empty in freed:
+        seen.setdefault(empty.task.location.id, empty.task.location)
+        if empty.returned_by:
+            seen.setdefault(empty.returned_by.location.id, empty.returned_by.location)
+    for need in needs:
+        seen.setdefault(need.pickup.location.id, need.pickup.location)
+        seen.setdefault(need.load.location.id, need.load.location)
+    return list(seen.values())
+
+
+@dataclass(frozen=True)
+class StreetTurn:
+    """
+    An empty proposed for a need, with both plans rewritten to take it there.
+
+    An unloaded empty is street turned from the consignee to the shipper in
+    place of its return, and the export picks it up there; a dropped empty
+    is picked up where it was dropped instead of at the terminal.
+    """
+
+    empty: FreedEmpty
+    need: EmptyNeed
+    saved_minutes: int
+    waiting_days: int
+    import_plan: list[Task]
+    export_plan: list[Task]
+
+
+def _rewrite(empty: FreedEmpty, need: EmptyNeed) -> tuple[list[Task], list[Task]]:
+    freed = empty.task
+    import_plan = list(empty.dispatch.plan)
+    pickup_at = freed.location
+    if empty.returned_by is not None:
+        # The street turn ends the import, taking the empty and its chassis to the shipper.
+        position = import_plan.index(empty.returned_by)
+        street_turn = Task(
+            empty.returned_by.priority, need.load.location, Instruction.STREET_TURN, freed.container,
+            empty.returned_by.date, None,
+        )
+        import_plan[position] = street_turn
+        pickup_at = need.load.location
+
+    export_plan = []
+    for task in need.dispatch.plan:
+        if _number(task) == need.pickup.container.number:
+            location = pickup_at if task is need.pickup else task.location
+            task = Task(task.priority, location, task.instruction, freed.container, task.date, task.appointment)
+        export_plan.append(task)
+    return import_plan, export_plan
+
+
+class StreetTurnMatcher:
+    """
+    Pairs the empties imports free with the empties exports need.
+
+    An empty and a need match when their sizes are the same and the need's
+    pickup falls on the day the empty is freed or up to MAX_STREET_TURN_DAYS
+    after. A match saves the empty's trip back to the terminal and the
+    need's trip out of it, less the trip from the empty to the shipper;
+    without a return in the import's plan, the empty is taken to go back to
+    the need's terminal. Savings are computed for every pair of a size in
+    one NumPy broadcast over the travel matrix, and the Hungarian method
+    picks the pairs that save the most in total, each empty and need used
+    once at most.
+    """
+
+    def propose(
+            self,
+            freed: list[FreedEmpty],
+            needs: list[EmptyNeed],
+            locations: list[Location],
+            travel_minutes: np.ndarray,
+            ) -> list[StreetTurn]:
+        """
+        Args:
+            freed: Empties the imports free
+            needs: Empties the exports need
+            locations: The locations indexing travel_minutes, usually street_turn_locations(freed, needs)
+            travel_minutes: Minutes between each pair of locations
+
+        Returns:
+            The proposed street turns, the ones saving the most first
+        """
+        index = {location.id: position for position, location in enumerate(locations)}
+        by_size = defaultdict(lambda: ([], []))
+        for empty in freed:
+            by_size[empty.size][0].append(empty)
+        for need in needs:
+            by_size[need.size][1].append(need)
+
+        turns = []
+        for empties, wanted in by_size.values():
+            if empties and wanted:
+                turns.extend(self._match(empties, wanted, index, np.asarray(travel_minutes)))
+        return sorted(turns, key=lambda turn: -turn.saved_minutes)
+
+    def _match(self, empties, wanted, index, travel) -> list[StreetTurn]:
+        freed_at = np.array([index[empty.task.location.id] for empty in empties])[:, None]
+        returned_to = np.array([
+            index[empty.returned_by.location.id] if empty.returned_by else -1 for empty in empties
+        ])[:, None]
+        picked_at = np.array([index[need.pickup.location.id] for need in wanted])[None, :]
+        loaded_at = np.array([index[need.load.location.id] for need in wanted])[None, :]
+        # Without a return of its own, an empty would have gone back to the terminal the need picks up at.
+        returned_to = np.where(returned_to >= 0, returned_to, picked_at)
+
+        saved = travel[freed_at, returned_to] + travel[picked_at, loaded_at] - travel[freed_at, loaded_at]
+        waiting = (
+            np.array([need.pickup.date.toordinal() for need in wanted])[None, :]
+            - np.array([empty.task.date.toordinal() for empty in empties])[:, None]
+        )
+        same = np.array([[empty.dispatch.id == need.dispatch.id for need in wanted] for empty in empties])
+        cost = WAITING_DAY_COST * waiting - saved
+        eligible = (waiting >= 0) & (waiting <= MAX_STREET_TURN_DAYS) & ~same & (cost < 0)
+
+        # Pairs that are not eligible cost nothing, as if left unmatched, and are dropped after solving.
+        rows, columns = linear_sum_assignment(np.where(eligible, cost, 0.0))
+        turns = []
+        for row, column in zip(rows, columns):
+            if eligible[row, column]:
+                import_plan, export_plan = _rewrite(empties[row], wanted[column])
+                turns.append(StreetTurn(
+                    empty=empties[row],
+                    need=wanted[column],
+                    saved_minutes=int(round(saved[row, column])),
+                    waiting_days=int(waiting[row, column]),
+                    import_plan=import_plan,
+                    export_plan=export_plan,
+                ))
+        return turns
+
+
+STREET_TURN_MATCHER = StreetTurnMatcher()
@@ -0,0 +1,276 @@
+"""
+How long tasks take, from check-in to check-out, by location, instruction and hour of the week.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Mapping, Optional, Sequence
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+from .aggregate import Dispatch
+from .container_moves import task_changes
+from .entities import Task
+from .value_objects import Instruction, TaskStatus
+
+
+HOURS_PER_WEEK = 7 * 24
+
+# Completions a sketch needs before its estimate is preferred over a broader one.
+MIN_DURATION_SAMPLES = 5
+
+
+class P2Quantile:
+    """
+    One quantile of a stream, estimated with the P² algorithm of Jain and Chlamtac.
+
+    Five markers track the minimum, the quantile, the maximum and the
+    quantiles halfway between; each observation moves the markers' positions
+    and nudges their heights along a parabola through their neighbours. An
+    update and a read are constant time and the state is ten numbers,
+    whatever the length of the stream. Until five observations arrive the
+    markers hold them all and the quantile is exact.
+    """
+
+    def __init__(
+            self,
+            p: float,
+            heights: Optional[list[float]] = None,
+            positions: Optional[list[int]] = None,
+            ) -> None:
+        self.p = p
+        self.heights = list(heights or [])
+        self.positions = list(positions or [])
+
+    @property
+    def count(self) -> int:
+        return self.positions[-1] if self.positions else len(self.heights)
+
+    def _desired(self, count: int) -> list[float]:
+        p = self.p
+        return [1, 1 + (count - 1) * p / 2, 1 + (count - 1) * p, 1 + (count - 1) * (1 + p) / 2, count]
+
+    def add(self, x: float) -> None:
+        if not self.positions:
+            self.heights.append(x)
+            self.heights.sort()
+            if len(self.heights) == 5:
+                self.positions = [1, 2, 3, 4, 5]
+            return
+
+        q, n = self.heights, self.positions
+        if x < q[0]:
+            q[0] = x
+            cell = 0
+        elif x >= q[4]:
+            q[4] = x
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if q[i] <= x < q[i + 1])
+        for i in range(cell + 1, 5):
+            n[i] += 1
+
+        desired = self._desired(n[4])
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    @property
+    def value(self) -> Optional[float]:
+        """The estimated quantile, or None before any observation."""
+        if self.positions:
+            return self.heights[2]
+        if not self.heights:
+            return None
+        # Linear interpolation between the closest ranks, as numpy.quantile does by default.
+        rank = (len(self.heights) - 1) * self.p
+        below = int(rank)
+        above = min(below + 1, len(self.heights) - 1)
+        return self.heights[below] + (rank - below) * (self.heights[above] - self.heights[below])
+
+
+@dataclass(frozen=True)
+class DurationEstimate:
+    """The median and 90th percentile of the minutes a task takes, over the completions counted."""
+
+    count: int
+    p50_minutes: float
+    p90_minutes: float
+
+
+@dataclass
+class DurationSketch:
+    """The running median and 90th percentile of the durations of one kind of task."""
+
+    p50: P2Quantile = field(default_factory=lambda: P2Quantile(0.5))
+    p90: P2Quantile = field(default_factory=lambda: P2Quantile(0.9))
+
+    @property
+    def count(self) -> int:
+        return self.p50.count
+
+    def add(self, minutes: float) -> None:
+        self.p50.add(minutes)
+        self.p90.add(minutes)
+
+    def estimate(self) -> Optional[DurationEstimate]:
+        if not self.count:
+            return None
+        return DurationEstimate(self.count, self.p50.value, self.p90.value)
+
+    def to_state(self) -> dict:
+        """The sketch as plain lists, to be stored and read back with from_state."""
+        return {
+            'p50': [self.p50.heights, self.p50.positions],
+            'p90': [self.p90.heights, self.p90.positions],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'DurationSketch':
+        return cls(P2Quantile(0.5, *state['p50']), P2Quantile(0.9, *state['p90']))
+
+
+@dataclass(frozen=True)
+class DurationKey:
+    """
+    The kind of task a sketch counts.
+
+    A key without an hour counts the instruction at the location at any
+    hour, and one without a location counts it everywhere.
+    """
+
+    instruction: Instruction
+    location_id: Optional[UUID] = None
+    hour_of_week: Optional[int] = None
+
+    @property
+    def scope(self) -> str:
+        """The key as one string, for stores that index sketches by a single column."""
+        return '/'.join((
+            self.instruction.value,
+            str(self.location_id) if self.location_id else '*',
+            str(self.hour_of_week) if self.hour_of_week is not None else '*',
+        ))
+
+
+def hour_of_week(moment: datetime) -> int:
+    """The hour of the week a moment falls in, from 0 at midnight on Monday."""
+    return moment.weekday() * 24 + moment.hour
+
+
+def duration_keys(instruction: Instruction, location_id: UUID, at: datetime) -> tuple[DurationKey, ...]:
+    """The keys of a task started at a moment, most specific first."""
+    return (
+        DurationKey(instruction, location_id, hour_of_week(at)),
+        DurationKey(instruction, location_id),
+        DurationKey(instruction),
+    )
+
+
+def resolve_estimate(sketches: Sequence[Optional[DurationSketch]]) -> Optional[DurationEstimate]:
+    """
+    The estimate of the most specific sketch with enough completions.
+
+    Args:
+        sketches: The sketches of a task's duration_keys, in the same order,
+            None where nothing was counted yet
+
+    Returns:
+        The first estimate with MIN_DURATION_SAMPLES completions, else the
+        one with the most, or None without any
+    """
+    counted = [sketch for sketch in sketches if sketch is not None and sketch.count]
+    if not counted:
+        return None
+    for sketch in counted:
+        if sketch.count >= MIN_DURATION_SAMPLES:
+            return sketch.estimate()
+    return max(counted, key=lambda sketch: sketch.count).estimate()
+
+
+@dataclass(frozen=True)
+class TaskDuration:
+    """A completed task's time from check-in to check-out."""
+
+    task_id: UUID
+    dispatch_id: UUID
+    location_id: UUID
+    instruction: Instruction
+    started_at: datetime
+    minutes: float
+
+    @property
+    def keys(self) -> tuple[DurationKey, ...]:
+        return duration_keys(self.instruction, self.location_id, self.started_at)
+
+
+def task_duration_of(dispatch: Dispatch, task: Task) -> Optional[TaskDuration]:
+    """The duration of a task, or None unless it is completed."""
+    if task.status != TaskStatus.COMPLETED or task._check_in_datetime is None:
+        return None
+    return TaskDuration(
+        task_id=task.id,
+        dispatch_id=dispatch.id,
+        location_id=task.location.id,
+        instruction=task.instruction,
+        started_at=task._check_in_datetime,
+        minutes=task.time_spent_completing_task.total_seconds() / 60,
+    )
+
+
+@dataclass(frozen=True)
+class DurationChanges:
+    """
+    How a dispatch's new events change the sketches.
+
+    Sketches cannot take an observation back, so the keys of a task that
+    was counted before and is reverted, or completed again, are recounted
+    from the durations still counted; the durations added are folded into
+    the other keys' sketches as they are.
+    """
+
+    task_ids: set[UUID]
+    added: list[TaskDuration]
+    recount: set[DurationKey]
+
+    def additions(self) -> dict[DurationKey, list[float]]:
+        """The minutes to add to each sketch that is not recounted, in completion order."""
+        minutes = {}
+        for duration in self.added:
+            for key in duration.keys:
+                if key not in self.recount:
+                    minutes.setdefault(key, []).append(duration.minutes)
+        return minutes
+
+
+def duration_changes(
+        dispatch: Dispatch,
+        events: Iterable[DomainEvent],
+        counted: Mapping[UUID, TaskDuration],
+        ) -> DurationChanges:
+    """
+    The changes a dispatch's new events make to the sketches.
+
+    Args:
+        dispatch: The Dispatch entity, as saved
+        events: Its new events, in the order they were recorded
+        counted: The durations already counted of the tasks the events touch
+
+    Returns:
+        The tasks whose counted durations are replaced, by the added ones
+        if they are completed, and the keys to recount
+    """
+    changes = dict(task_changes(dispatch, events, task_duration_of))
+    recount = {key for task_id in changes if task_id in counted for key in counted[task_id].keys}
+    return DurationChanges(
+        set(changes), [duration for duration in changes.values() if duration is not None], recount
+    )
@@ -120,4 +120,10 @@ _ALLOWED_REPEAT = [
     Instruction.INGATE,
     Instruction.YARD_PULL,
     Instruction.STREET_TURN,
-]
\ No newline at end of file
+]
+
+_CONTAINERLESS = [
+    Instruction.FETCH_CHASSIS,
+    Instruction.BOBTAIL_TO,
+    Instruction.TERMINATE_CHASSIS,
+]
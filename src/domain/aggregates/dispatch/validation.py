@@ -0,0 +1,243 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from .utilities import _ALLOWED_FOLLOWS, _ALLOWED_REPEAT, _CONTAINERLESS, _ENDABLE, _STARTABLE
+from .value_objects import Container, Instruction
+
+
+class PlanRule(Enum):
+    EMPTY = 'empty'
+    START = 'start'
+    FOLLOW = 'follow'
+    END = 'end'
+    REPEAT = 'repeat'
+    CONTAINER = 'container'
+
+
+@dataclass(frozen=True)
+class PlanViolation:
+    """A broken plan rule and the 0-based position of the task that breaks it."""
+
+    rule: PlanRule
+    position: Optional[int]
+    message: str
+
+
+@dataclass(frozen=True)
+class PlanRules:
+    """The compiled plan tables decoded back into instructions, for clients that check plans themselves."""
+
+    instructions: tuple[Instruction, ...]
+    startable: tuple[Instruction, ...]
+    follows: dict[Instruction, tuple[Instruction, ...]]
+    endable: tuple[Instruction, ...]
+    repeatable: tuple[Instruction, ...]
+    needs_container: tuple[Instruction, ...]
+
+
+class PlanValidator:
+    """
+    Checks dispatch plans against the instruction tables in utilities.py.
+
+    The tables are compiled once into integer codes: each instruction gets an
+    index, and every row of the follow table, like the start, end, repeat and
+    container sets, becomes a bitmask over those indexes. Checking a plan is
+    then a handful of shifts per task, and every violation is reported rather
+    than only the first. The same tables are kept as boolean arrays so that
+    validate_many checks a whole batch of plans at once.
+    """
+
+    def __init__(
+            self,
+            startable: Iterable[Instruction] = _STARTABLE,
+            allowed_follows: dict[Instruction, Iterable[Instruction]] = _ALLOWED_FOLLOWS,
+            endable: Iterable[Instruction] = _ENDABLE,
+            allowed_repeat: Iterable[Instruction] = _ALLOWED_REPEAT,
+            containerless: Iterable[Instruction] = _CONTAINERLESS,
+            ):
+        self.instructions = list(Instruction)
+        self.codes = {instruction: code for code, instruction in enumerate(self.instructions)}
+
+        self._startable = self._mask(startable)
+        self._endable = self._mask(endable)
+        self._repeatable = self._mask(allowed_repeat)
+        self._needs_container = self._mask(
+            i for i in self.instructions if i not in set(containerless)
+        )
+        # Row `a` has bit `b` set when instruction `b` may follow instruction `a`.
+        self._follows = [self._mask(allowed_follows.get(i, ())) for i in self.instructions]
+
+        codes = np.arange(len(self.instructions))
+        self._startable_array = self._startable >> codes & 1 == 1
+        self._endable_array = self._endable >> codes & 1 == 1
+        self._repeatable_array = self._repeatable >> codes & 1 == 1
+        self._needs_container_array = self._needs_container >> codes & 1 == 1
+        self._follows_array = np.array([row >> codes & 1 == 1 for row in self._follows])
+
+    def _mask(self, instructions: Iterable[Instruction]) -> int:
+        mask = 0
+        for instruction in instructions:
+            mask |= 1 << self.codes[instruction]
+        return mask
+
+    def _decode(self, mask: int) -> tuple[Instruction, ...]:
+        return tuple(i for code, i in enumerate(self.instructions) if mask >> code & 1)
+
+    def rules(self) -> PlanRules:
+        """Return the tables this validator checks plans against, in instruction order."""
+        return PlanRules(
+            instructions=tuple(self.instructions),
+            startable=self._decode(self._startable),
+            follows={i: self._decode(self._follows[code]) for code, i in enumerate(self.instructions)},
+            endable=self._decode(self._endable),
+            repeatable=self._decode(self._repeatable),
+            needs_container=self._decode(self._needs_container),
+        )
+
+    def can_follow(self, current: Instruction, following: Instruction) -> bool:
+        return bool(self._follows[self.codes[current]] >> self.codes[following] & 1)
+
+    def validate(
+            self,
+            instructions: Sequence[Instruction],
+            containers: Optional[Sequence[Optional[Container]]] = None,
+            ) -> list[PlanViolation]:
+        """
+        Return every rule the plan breaks, in plan order.
+
+        Args:
+            instructions: The instruction of each task, in priority order
+            containers: The container of each task, in the same order. Container
+                rules are skipped when this is None.
+        """
+        codes = [self.codes[instruction] for instruction in instructions]
+        has_container = None if containers is None else [bool(c) for c in containers]
+        return self._check(codes, has_container)
+
+    def validate_many(
+            self,
+            plans: Iterable[Sequence[Instruction]],
+            containers: Optional[Iterable[Sequence[Optional[Container]]]] = None,
+            ) -> list[list[PlanViolation]]:
+        """
+        Validate many plans, returning one list of violations per plan.
+
+        Plans that share the same instructions and container gaps are only
+        checked once, which is the common case for imports and tenders. The
+        distinct plans are padded into one matrix of instruction codes and
+        every rule is checked across the whole matrix with array lookups;
+        only the violations found are turned back into PlanViolations.
+        """
+        container_lists = iter(containers) if containers is not None else None
+        keys = []
+        distinct = {}
+
+        for instructions in plans:
+            codes = tuple(self.codes[instruction] for instruction in instructions)
+            has_container = None
+            if container_lists is not None:
+                has_container = tuple(bool(c) for c in next(container_lists))
+
+            key = (codes, has_container)
+            distinct.setdefault(key, len(distinct))
+            keys.append(key)
+
+        checked = self._check_many(list(distinct))
+        return [checked[distinct[key]] for key in keys]
+
+    def _check_many(self, shapes: list[tuple[tuple[int, ...], Optional[tuple[bool, ...]]]]) -> list[list[PlanViolation]]:
+        if not shapes:
+            return []
+
+        lengths = np.array([len(codes) for codes, _ in shapes])
+        width = max(lengths.max(), 1)
+        valid = np.arange(width) < lengths[:, None]
+        # Padding takes code 0 and is masked out by `valid` wherever it is read.
+        codes = np.zeros((len(shapes), width), dtype=np.intp)
+        has_container = np.ones((len(shapes), width), dtype=bool)
+        for row, (plan_codes, plan_containers) in enumerate(shapes):
+            codes[row, :len(plan_codes)] = plan_codes
+            if plan_containers is not None:
+                has_container[row, :len(plan_containers)] = plan_containers
+
+        first, last = codes[:, 0], codes[np.arange(len(shapes)), np.maximum(lengths - 1, 0)]
+        bad_start = (lengths > 0) & ~self._startable_array[first]
+        bad_end = (lengths > 0) & ~self._endable_array[last]
+
+        # One column per rule checked task by task, in the order _check reports them.
+        per_task = np.zeros((len(shapes), width, 3), dtype=bool)
+        per_task[:, 1:, 0] = valid[:, 1:] & ~self._follows_array[codes[:, :-1], codes[:, 1:]]
+        one_hot = (codes[:, :, None] == np.arange(len(self.instructions))) & valid[:, :, None]
+        seen_before = np.take_along_axis(np.cumsum(one_hot, axis=1) - one_hot, codes[:, :, None], axis=2)[:, :, 0]
+        per_task[:, :, 1] = valid & (seen_before > 0) & ~self._repeatable_array[codes]
+        per_task[:, :, 2] = valid & ~has_container & self._needs_container_array[codes]
+
+        violations = [[] for _ in shapes]
+        name = lambda code: self.instructions[code].value
+
+        for row in np.flatnonzero(lengths == 0):
+            violations[row].append(PlanViolation(PlanRule.EMPTY, None, 'A plan requires at least one task.'))
+        for row in np.flatnonzero(bad_start):
+            violations[row].append(PlanViolation(
+                PlanRule.START, 0, f'{name(first[row])} is not a valid starting instruction.'
+            ))
+        for row, position, rule in zip(*np.nonzero(per_task)):
+            position, code = int(position), codes[row, position]
+            if rule == 0:
+                violation = PlanViolation(
+                    PlanRule.FOLLOW, position, f'{name(code)} cannot follow {name(codes[row, position - 1])}.'
+                )
+            elif rule == 1:
+                violation = PlanViolation(PlanRule.REPEAT, position, f'{name(code)} can only appear once in a plan.')
+            else:
+                violation = PlanViolation(
+                    PlanRule.CONTAINER, position, f'Task {position + 1} ({name(code)}) is missing its container assignment.'
+                )
+            violations[row].append(violation)
+        for row in np.flatnonzero(bad_end):
+            violations[row].append(PlanViolation(
+                PlanRule.END, int(lengths[row]) - 1, f'{name(last[row])} is not a valid ending instruction.'
+            ))
+
+        return violations
+
+    def _check(self, codes: Sequence[int], has_container: Optional[Sequence[bool]]) -> list[PlanViolation]:
+        if not codes:
+            return [PlanViolation(PlanRule.EMPTY, None, 'A plan requires at least one task.')]
+
+        violations = []
+        name = lambda code: self.instructions[code].value
+
+        if not self._startable >> codes[0] & 1:
+            violations.append(PlanViolation(
+                PlanRule.START, 0, f'{name(codes[0])} is not a valid starting instruction.'
+            ))
+
+        seen = 0
+        for position, code in enumerate(codes):
+            if position and not self._follows[codes[position - 1]] >> code & 1:
+                violations.append(PlanViolation(
+                    PlanRule.FOLLOW, position, f'{name(code)} cannot follow {name(codes[position - 1])}.'
+                ))
+            if seen >> code & 1 and not self._repeatable >> code & 1:
+                violations.append(PlanViolation(
+                    PlanRule.REPEAT, position, f'{name(code)} can only appear once in a plan.'
+                ))
+            seen |= 1 << code
+            if has_container is not None and not has_container[position] and self._needs_container >> code & 1:
+                violations.append(PlanViolation(
+                    PlanRule.CONTAINER, position, f'Task {position + 1} ({name(code)}) is missing its container assignment.'
+                ))
+
+        if not self._endable >> codes[-1] & 1:
+            violations.append(PlanViolation(
+                PlanRule.END, len(codes) - 1, f'{name(codes[-1])} is not a valid ending instruction.'
+            ))
+
+        return violations
+
+
+PLAN_VALIDATOR = PlanValidator()
@@ -20,6 +20,12 @@ class ContainerSize(Enum):
     FORTY_FIVE = 'forty_five'
     FIFTY_THREE = 'fifty_three'
 
+
+def normalize_container_number(number: str) -> str:
+    """A container number as it is compared: upper case, without the spaces and dashes people type into it."""
+    return number.strip().upper().replace(' ', '').replace('-', '')
+
+
 @dataclass(init=False, eq=False)
 class Container:
     number: str
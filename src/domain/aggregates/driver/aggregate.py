@@ -1,5 +1,13 @@
 from typing import Optional
 
+from src.domain.aggregates.driver.events import (
+    DriverBeganOperating,
+    DriverDeactivated,
+    DriverMadeAvailable,
+    DriverReactivated,
+    DriverReleased,
+    DriverSatOut,
+)
 from src.domain.aggregates.driver.value_objects import DriverStatus
 from src.domain.common.entity import AggregateRoot
 from src.domain.exceptions import BusinessRuleViolation
@@ -27,33 +35,39 @@ class Driver(AggregateRoot):
             raise BusinessRuleViolation('Only available drivers can begin operating.')
         
         self._status = DriverStatus.OPERATING
+        self.record_event(DriverBeganOperating(self.id))
 
     def release(self) -> None:
         if self.status != DriverStatus.OPERATING:
             raise BusinessRuleViolation('Only operating drivers can be released.')
         
         self._status = DriverStatus.AVAILABLE
+        self.record_event(DriverReleased(self.id))
 
     def sit_out(self) -> None:
         if self.status != DriverStatus.AVAILABLE:
             raise BusinessRuleViolation('Only available drivers can sit out.')
         
         self._status = DriverStatus.UNAVAILABLE
+        self.record_event(DriverSatOut(self.id))
 
     def make_available(self) -> None:
         if self.status != DriverStatus.UNAVAILABLE:
             raise BusinessRuleViolation('Only unavailable drivers can be made available.')
         
         self._status = DriverStatus.AVAILABLE
+        self.record_event(DriverMadeAvailable(self.id))
 
     def deactivate(self) -> None:
         if self.status not in (DriverStatus.UNAVAILABLE, DriverStatus.AVAILABLE):
             raise BusinessRuleViolation('Only available and unavailable drivers can be deactivated.')
     
         self._status = DriverStatus.DEACTIVATED
+        self.record_event(DriverDeactivated(self.id))
 
     def reactivate(self) -> None:
         if self.status != DriverStatus.DEACTIVATED:
             raise BusinessRuleViolation('Only deactivated drivers can be reactivated.')
         
         self._status = DriverStatus.AVAILABLE
+        self.record_event(DriverReactivated(self.id))
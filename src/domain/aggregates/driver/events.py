@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+
+
+@dataclass(frozen=True)
+class DriverBeganOperating(DomainEvent):
+    driver_id: UUID
+
+
+@dataclass(frozen=True)
+class DriverReleased(DomainEvent):
+    driver_id: UUID
+
+
+@dataclass(frozen=True)
+class DriverSatOut(DomainEvent):
+    driver_id: UUID
+
+
+@dataclass(frozen=True)
+class DriverMadeAvailable(DomainEvent):
+    driver_id: UUID
+
+
+@dataclass(frozen=True)
+class DriverDeactivated(DomainEvent):
+    driver_id: UUID
+
+
+@dataclass(frozen=True)
+class DriverReactivated(DomainEvent):
+    driver_id: UUID
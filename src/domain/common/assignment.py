@@ -0,0 +1,94 @@
+import numpy as np
+
+
+def linear_sum_assignment(cost: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Solve the assignment problem for a cost matrix with the Hungarian method.
+
+    Each row is paired with at most one column and each column with at most
+    one row, as many pairs as the smaller side allows, so that the total
+    cost of the pairs is as small as possible. This is the shortest
+    augmenting path form, O(n^3) on the squared matrix, with each step of
+    a search vectorized over the columns.
+
+    Args:
+        cost: A finite (rows, columns) matrix
+
+    Returns:
+        The row and column indices of the chosen pairs, ordered by row
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.ndim != 2:
+        raise ValueError('The cost matrix must be two-dimensional.')
+    if not np.isfinite(cost).all():
+        raise ValueError('The cost matrix must be finite.')
+
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    rows, columns = cost.shape
+    # Free rows square the matrix, which lets the columns be reduced below.
+    cost = np.vstack([cost, np.zeros((columns - rows, columns))])
+
+    # Potentials and matches are 1-based, with column 0 holding the row being placed.
+    u = np.zeros(columns + 1)
+    v = np.zeros(columns + 1)
+    match = np.zeros(columns + 1, dtype=np.int64)
+    way = np.zeros(columns + 1, dtype=np.int64)
+
+    # Start from reduced costs that are zero in every row, and pair rows with
+    # free zero-cost columns greedily; only the rows left over need a search.
+    u[1:] = cost.min(axis=1)
+    v[1:] = (cost - u[1:, None]).min(axis=0)
+    unplaced = []
+    for row in range(1, columns + 1):
+        tight = np.flatnonzero((cost[row - 1] - u[row] - v[1:] == 0) & (match[1:] == 0))
+        if tight.size:
+            match[tight[0] + 1] = row
+        else:
+            unplaced.append(row)
+
+    for row in unplaced:
+        match[0] = row
+        slack = np.full(columns + 1, np.inf)
+        used = np.zeros(columns + 1, dtype=bool)
+        used[0] = True
+        frontier = np.zeros(1, dtype=np.int64)
+
+        while True:
+            # Relax the slack of every free column through the rows just reached.
+            reached = match[frontier]
+            reduced = cost[reached - 1] - u[reached][:, None] - v[None, 1:]
+            nearest_row = reduced.argmin(axis=0)
+            best = reduced[nearest_row, np.arange(columns)]
+            better = ~used[1:] & (best < slack[1:])
+            slack[1:][better] = best[better]
+            way[1:][better] = frontier[nearest_row[better]]
+
+            candidates = np.where(used[1:], np.inf, slack[1:])
+            delta = candidates.min()
+            u[match[used]] += delta
+            v[used] -= delta
+            slack[~used] -= delta
+
+            # Every column that just became tight joins the tree at once, which
+            # keeps searches short when many costs are tied; a free one ends it.
+            tight = np.flatnonzero(candidates == delta) + 1
+            free = tight[match[tight] == 0]
+            if free.size:
+                column = int(free[0])
+                break
+            used[tight] = True
+            frontier = tight
+
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+
+    matched = np.flatnonzero(match[1:] <= rows)
+    row_indices, column_indices = match[1:][matched] - 1, matched
+    if transposed:
+        row_indices, column_indices = column_indices, row_indices
+    order = np.argsort(row_indices)
+    return row_indices[order], column_indices[order]
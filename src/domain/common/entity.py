@@ -1,9 +1,42 @@
 from uuid import uuid4
 
+from .events import DomainEvent
+
 
 class Entity:
     def __init__(self):
         self.id = uuid4()
 
 class AggregateRoot(Entity):
-    pass
\ No newline at end of file
+    """
+    An entity that owns a consistency boundary.
+
+    Aggregates record a DomainEvent for each state transition. The events
+    wait on the aggregate until its repository has committed the change,
+    and the repository then pulls and publishes them.
+    """
+
+    @property
+    def _pending_events(self) -> list[DomainEvent]:
+        # The ORM loads aggregates without calling __init__.
+        return self.__dict__.setdefault('_events', [])
+
+    def record_event(self, event: DomainEvent) -> None:
+        self._pending_events.append(event)
+
+    def __copy__(self) -> 'AggregateRoot':
+        """A copy of the aggregate's state; its pending events stay with the original, to be published once."""
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.__dict__['_events'] = []
+        return clone
+
+    def peek_events(self) -> list[DomainEvent]:
+        """Return the events recorded since the last pull, leaving them to be pulled once saved."""
+        return list(self._pending_events)
+
+    def pull_events(self) -> list[DomainEvent]:
+        """Return the events recorded since the last pull, and forget them."""
+        events = self._pending_events
+        self.__dict__['_events'] = []
+        return events
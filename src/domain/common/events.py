@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """Something that happened to an aggregate, recorded when it happens."""
+
+    occurred_at: datetime = field(default_factory=datetime.now)
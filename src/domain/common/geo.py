@@ -0,0 +1,42 @@
+import numpy as np
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(latitudes, longitudes, other_latitudes, other_longitudes) -> np.ndarray:
+    """
+    Great-circle distances in kilometres between points given in degrees.
+
+    The arguments broadcast like any NumPy arithmetic, so a column of
+    origins against a row of destinations gives the whole matrix at once.
+    """
+    phi, other_phi = np.radians(latitudes), np.radians(other_latitudes)
+    half_dphi = (other_phi - phi) / 2
+    half_dlambda = np.radians(np.subtract(other_longitudes, longitudes)) / 2
+    a = np.sin(half_dphi) ** 2 + np.cos(phi) * np.cos(other_phi) * np.sin(half_dlambda) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+EARTH_RADIUS_MILES = EARTH_RADIUS_KM / 1.609344
+
+
+def unit_vectors(latitudes, longitudes) -> np.ndarray:
+    """
+    Points on the unit sphere, one row of (x, y, z) per latitude and longitude in degrees.
+
+    Straight-line distances between them grow with great-circle distances,
+    so the nearest vector is the nearest place on Earth.
+    """
+    phi, lam = np.radians(np.asarray(latitudes, dtype=np.float64)), np.radians(np.asarray(longitudes, dtype=np.float64))
+    return np.column_stack([np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)])
+
+
+def chord_to_miles(chords) -> np.ndarray:
+    """Great-circle miles spanned by chords of the unit sphere."""
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.clip(np.asarray(chords) / 2, 0.0, 1.0))
+
+
+def miles_to_chord(miles: float) -> float:
+    """The chord of the unit sphere spanning a great-circle distance in miles."""
+    return float(2 * np.sin(min(miles / EARTH_RADIUS_MILES, np.pi) / 2))
@@ -0,0 +1,118 @@
+import heapq
+
+import numpy as np
+
+
+class KDTree:
+    """
+    A static k-d tree over a fixed set of points.
+
+    The tree is implicit: points are permuted so that every node is the
+    median of its slice of the permutation, with its lower half on the left
+    and its upper half on the right, split along the axis the slice spreads
+    widest. Slices of a leaf's size or smaller are compared in one
+    vectorized step. A nearest or radius query visits a logarithmic number
+    of nodes for points spread like locations are; it never needs more than
+    a pass over every leaf.
+    """
+
+    LEAF_SIZE = 16
+
+    def __init__(self, points: np.ndarray):
+        points = np.asarray(points, dtype=np.float64)
+        self.order = np.arange(len(points))
+        self._axes = np.zeros(len(points), dtype=np.int64)
+
+        stack = [(0, len(points))]
+        while stack:
+            low, high = stack.pop()
+            if high - low <= self.LEAF_SIZE:
+                continue
+            middle = (low + high) // 2
+            block = points[self.order[low:high]]
+            axis = int(np.argmax(block.max(axis=0) - block.min(axis=0)))
+            self.order[low:high] = self.order[low:high][np.argpartition(block[:, axis], middle - low)]
+            self._axes[middle] = axis
+            stack += [(low, middle), (middle + 1, high)]
+
+        self.points = points[self.order]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def nearest(self, point: np.ndarray, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The `count` points closest to `point`.
+
+        Returns:
+            Their indexes in the points the tree was built from, and their distances, closest first
+        """
+        point = np.asarray(point, dtype=np.float64)
+        count = min(count, len(self))
+        # A max-heap, by negated squared distance, of the closest points found so far.
+        closest: list[tuple[float, int]] = []
+
+        def offer(positions: np.ndarray, squared: np.ndarray) -> None:
+            for position, distance in zip(positions.tolist(), squared.tolist()):
+                if len(closest) < count:
+                    heapq.heappush(closest, (-distance, position))
+                elif distance < -closest[0][0]:
+                    heapq.heapreplace(closest, (-distance, position))
+
+        stack = [(0, len(self))] if count else []
+        while stack:
+            low, high = stack.pop()
+            if high - low <= self.LEAF_SIZE:
+                offer(np.arange(low, high), ((self.points[low:high] - point) ** 2).sum(axis=1))
+                continue
+            middle = (low + high) // 2
+            offer(np.array([middle]), np.array([((self.points[middle] - point) ** 2).sum()]))
+            offset = point[self._axes[middle]] - self.points[middle, self._axes[middle]]
+            near, far = ((middle + 1, high), (low, middle)) if offset > 0 else ((low, middle), (middle + 1, high))
+            # The far side is only worth a look while its slab could hold something closer.
+            if len(closest) < count or offset ** 2 < -closest[0][0]:
+                stack.append(far)
+            stack.append(near)
+
+        closest.sort(reverse=True)
+        positions = np.array([position for _, position in closest], dtype=np.int64)
+        distances = np.sqrt(np.array([-distance for distance, _ in closest]))
+        return self.order[positions], distances
+
+    def within(self, point: np.ndarray, radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Every point no further than `radius` from `point`.
+
+        Returns:
+            Their indexes in the points the tree was built from, and their distances, closest first
+        """
+        point = np.asarray(point, dtype=np.float64)
+        found_positions, found_squared = [], []
+
+        stack = [(0, len(self))]
+        while stack:
+            low, high = stack.pop()
+            if high <= low:
+                continue
+            if high - low <= self.LEAF_SIZE:
+                squared = ((self.points[low:high] - point) ** 2).sum(axis=1)
+                inside = squared <= radius ** 2
+                found_positions.append(np.arange(low, high)[inside])
+                found_squared.append(squared[inside])
+                continue
+            middle = (low + high) // 2
+            squared = ((self.points[middle] - point) ** 2).sum()
+            if squared <= radius ** 2:
+                found_positions.append(np.array([middle]))
+                found_squared.append(np.array([squared]))
+            offset = point[self._axes[middle]] - self.points[middle, self._axes[middle]]
+            if offset <= radius:
+                stack.append((low, middle))
+            if offset >= -radius:
+                stack.append((middle + 1, high))
+
+        if not found_positions:
+            return np.array([], dtype=np.int64), np.array([])
+        positions, squared = np.concatenate(found_positions), np.concatenate(found_squared)
+        by_distance = np.argsort(squared, kind='stable')
+        return self.order[positions[by_distance]], np.sqrt(squared[by_distance])
@@ -5,6 +5,7 @@ Configuration setup for the Nopalli.
 from enum import Enum
 import os
 from pathlib import Path
+from typing import Optional
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -19,6 +20,13 @@ class RepositoryType(Enum):
     DATABASE = "database"
 
 
+# Where customer notifications are delivered
+class NotificationSinkType(Enum):
+    MEMORY = "memory"
+    FILE = "file"
+    HTTP = "http"
+
+
 class Config:
     """Application configuration."""
 
@@ -26,6 +34,10 @@ class Config:
     DEFAULT_REPOSITORY_TYPE: RepositoryType = RepositoryType.MEMORY
     DEFAULT_DATA_DIR = "repo_data"
     DEFAULT_DATABASE_URL = 'postgresql+psycopg2://root:root@db:5432/nopalli'
+    DEFAULT_NOTIFICATION_SINK_TYPE: NotificationSinkType = NotificationSinkType.MEMORY
+    DEFAULT_NOTIFICATION_URL = 'http://localhost:8080/notifications'
+
+    _session_factory: Optional[sessionmaker] = None
 
     @classmethod
     def get_repository_type(cls) -> RepositoryType:
@@ -36,6 +48,26 @@ class Config:
         except ValueError:
             raise ValueError(f"Invalid repository type: {repo_type_str}")
 
+    @classmethod
+    def get_notification_sink_type(cls) -> NotificationSinkType:
+        """Get where customer notifications are delivered."""
+        sink_type_str = os.getenv("NOPALLI_NOTIFICATION_SINK", cls.DEFAULT_NOTIFICATION_SINK_TYPE.value)
+        try:
+            return NotificationSinkType(sink_type_str.lower())
+        except ValueError:
+            raise ValueError(f"Invalid notification sink type: {sink_type_str}")
+
+    @classmethod
+    def get_notification_url(cls) -> str:
+        """Get the webhook the HTTP notification sink posts to."""
+        return os.getenv("NOPALLI_NOTIFICATION_URL", cls.DEFAULT_NOTIFICATION_URL)
+
+    @classmethod
+    def get_zipcode_centroids_path(cls) -> Optional[Path]:
+        """Get the Census Gazetteer ZCTA file to locate zipcodes with, if one is configured."""
+        path = os.getenv("NOPALLI_ZIPCODE_CENTROIDS")
+        return Path(path) if path else None
+
     @classmethod
     def get_data_directory(cls) -> Path:
         """Get the data directory path."""
@@ -46,9 +78,12 @@ class Config:
     
     @classmethod
     def get_session_factory(cls) -> sessionmaker:
-        db_url = os.getenv('NOPALLI_DATABASE_URL', cls.DEFAULT_DATABASE_URL)
-        engine = create_engine(db_url, echo=True)
-        set_orm_mapping(engine)
-        return sessionmaker(bind=engine)
+        # The domain classes can only be mapped once, so every caller shares one engine.
+        if cls._session_factory is None:
+            db_url = os.getenv('NOPALLI_DATABASE_URL', cls.DEFAULT_DATABASE_URL)
+            engine = create_engine(db_url, echo=True)
+            set_orm_mapping(engine)
+            cls._session_factory = sessionmaker(bind=engine)
+        return cls._session_factory
 
 
@@ -1,6 +1,25 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from src.infrastructure.repository_factory import create_repositories
+from src.infrastructure.persistence.chassis_inventory.memory import InMemoryChassisInventory
+from src.infrastructure.persistence.container_inventory.memory import InMemoryContainerInventory
+from src.infrastructure.persistence.free_time_rule.memory import InMemoryFreeTimeRuleRepository
+from src.infrastructure.persistence.dispatch_history.memory import InMemoryDispatchEventStore
+from src.infrastructure.persistence.outbox.memory import InMemoryNotificationOutbox
+from src.infrastructure.persistence.task_durations.memory import InMemoryTaskDurationStatistics
+from src.infrastructure.persistence.travel_time.memory import InMemoryTravelTimeRepository
+from src.infrastructure.travel.spatial import InMemoryLocationSpatialIndex
+from src.infrastructure.repository_factory import (
+    create_chassis_inventory,
+    create_container_inventory,
+    create_dispatch_event_store,
+    create_free_time_rule_repository,
+    create_notification_outbox,
+    create_repositories,
+    create_task_duration_statistics,
+    create_travel_time_repository,
+)
+from src.application.common.eta_cache import EtaCache
+from src.application.common.event_bus import EventBus
 from src.application.use_cases.broker_use_cases import (
     ListBrokersUseCase,
     CreateBrokerUseCase,
@@ -11,9 +30,20 @@ from src.application.use_cases.broker_use_cases import (
 )
 from src.application.use_cases.dispatch_use_cases import (
     CreateDispatchUseCase,
+    BulkCreateDispatchesUseCase,
+    SuggestPlanCompletionsUseCase,
+    GetPlanRulesUseCase,
     GetLoadboardDispatchesUseCase,
+    GetDispatchHistoryUseCase,
+    GetLoadboardAsOfUseCase,
+    ProposeDriverAssignmentsUseCase,
+    DoubleBookingReportUseCase,
+    ProposePlanSequenceUseCase,
+    ProposeStreetTurnsUseCase,
     ListDispatchesUseCase,
     GetDispatchUseCase,
+    GetDispatchByReferenceUseCase,
+    FindDispatchesByContainerUseCase,
     EditDispatchUseCase,
     StartDispatchUseCase,
     StartTaskUseCase,
@@ -36,14 +66,34 @@ from src.application.use_cases.location_use_cases import (
     DeactivateLocationUseCase,
     ActivateLocationUseCase,
     EditLocationUseCase,
+    NearbyLocationsUseCase,
     ActiveLocationsUseCase
 )
 from src.application.use_cases.task_use_cases import (
     CreateTaskUseCase,
 )
+from src.application.use_cases.export_use_cases import (
+    ExportDispatchHistoryUseCase,
+    ExportTaskFactsUseCase,
+)
+from src.application.use_cases.import_use_cases import ImportReferenceDataUseCase
+from src.application.use_cases.search_use_cases import TypeaheadSearchUseCase
+from src.application.use_cases.container_use_cases import (
+    ChassisCountsUseCase,
+    ChassisDailyReportUseCase,
+    ContainerTimelineUseCase,
+    RecordChassisCountUseCase,
+    YardInventoryUseCase,
+)
+from src.application.use_cases.clock_use_cases import (
+    GetClockBoardUseCase,
+    ListFreeTimeRulesUseCase,
+    SetFreeTimeRuleUseCase,
+)
 from src.application.repositories.broker_repository import BrokerRepository
 from src.interfaces.controllers.broker_controller import BrokerController
 from src.interfaces.presenters.broker_presenter import BrokerPresenter
+from src.application.repositories.dispatch_event_store import DispatchEventStore
 from src.application.repositories.dispatch_repository import DispatchRepository
 from src.interfaces.controllers.dispatch_controller import DispatchController
 from src.interfaces.presenters.dispatch_presenter import DispatchPresenter
@@ -51,11 +101,28 @@ from src.application.repositories.driver_repository import DriverRepository
 from src.interfaces.controllers.driver_controller import DriverController
 from src.interfaces.presenters.driver_presenter import DriverPresenter
 from src.application.repositories.location_repository import LocationRepository
+from src.application.repositories.notification_outbox import NotificationOutbox
 from src.interfaces.controllers.location_controller import LocationController
 from src.interfaces.presenters.location_presenter import LocationPresenter
 from src.application.repositories.task_repository import TaskRepository
+from src.application.repositories.travel_time_repository import TravelTimeRepository
+from src.application.repositories.location_spatial_index import LocationSpatialIndex
 from src.interfaces.controllers.task_controller import TaskController
 from src.interfaces.presenters.task_presenter import TaskPresenter
+from src.interfaces.controllers.export_controller import ExportController
+from src.interfaces.presenters.export_presenter import ExportPresenter
+from src.interfaces.controllers.import_controller import ImportController
+from src.interfaces.presenters.import_presenter import ImportPresenter
+from src.interfaces.controllers.search_controller import SearchController
+from src.interfaces.presenters.search_presenter import SearchPresenter
+from src.application.repositories.chassis_inventory import ChassisInventory
+from src.application.repositories.task_duration_statistics import TaskDurationStatistics
+from src.application.repositories.container_inventory import ContainerInventory
+from src.interfaces.controllers.container_controller import ContainerController
+from src.interfaces.presenters.container_presenter import ContainerPresenter
+from src.application.repositories.free_time_rule_repository import FreeTimeRuleRepository
+from src.interfaces.controllers.clock_controller import ClockController
+from src.interfaces.presenters.clock_presenter import ClockPresenter
 
 
 def create_application(
@@ -63,7 +130,12 @@ def create_application(
         dispatch_presenter: DispatchPresenter,
         driver_presenter: DriverPresenter,
         location_presenter: LocationPresenter,
-        task_presenter: TaskPresenter
+        task_presenter: TaskPresenter,
+        export_presenter: ExportPresenter,
+        import_presenter: ImportPresenter,
+        search_presenter: SearchPresenter,
+        container_presenter: ContainerPresenter,
+        clock_presenter: ClockPresenter,
 ) -> "Application":
     """
     Factory function for the Application container.
@@ -74,17 +146,32 @@ def create_application(
         dispatch_presenter: Presenter for dispatch-related output
         driver_presenter: Presenter for driver-related output
         location_presenter: Presenter for location-related output
+        task_presenter: Presenter for task-related output
+        export_presenter: Presenter for exported data
+        import_presenter: Presenter for bulk import reports
+        search_presenter: Presenter for typeahead search results
+        container_presenter: Presenter for container positions and timelines, and chassis counts
+        clock_presenter: Presenter for per diem and detention clocks
 
     Returns:
         Configured Application instance
     """
+    event_bus = EventBus()
+    dispatch_event_store = create_dispatch_event_store()
+    notification_outbox = create_notification_outbox()
+    container_inventory = create_container_inventory()
+    chassis_inventory = create_chassis_inventory()
+    task_durations = create_task_duration_statistics()
     (
         broker_repository,
         dispatch_repository,
         driver_repository,
         location_repository,
         task_repository,
-    ) = create_repositories()
+    ) = create_repositories(
+        event_bus, dispatch_event_store, notification_outbox, container_inventory, chassis_inventory,
+        task_durations,
+    )
 
     return Application(
         broker_repository=broker_repository,
@@ -97,6 +184,19 @@ def create_application(
         location_presenter=location_presenter,
         task_repository=task_repository,
         task_presenter=task_presenter,
+        export_presenter=export_presenter,
+        import_presenter=import_presenter,
+        search_presenter=search_presenter,
+        container_presenter=container_presenter,
+        clock_presenter=clock_presenter,
+        event_bus=event_bus,
+        dispatch_event_store=dispatch_event_store,
+        notification_outbox=notification_outbox,
+        container_inventory=container_inventory,
+        chassis_inventory=chassis_inventory,
+        task_durations=task_durations,
+        free_time_rule_repository=create_free_time_rule_repository(),
+        travel_time_repository=create_travel_time_repository(),
     )
 
 @dataclass
@@ -113,9 +213,35 @@ class Application:
     location_presenter: LocationPresenter
     task_repository: TaskRepository
     task_presenter: TaskPresenter
+    export_presenter: ExportPresenter
+    import_presenter: ImportPresenter
+    search_presenter: SearchPresenter
+    container_presenter: ContainerPresenter
+    clock_presenter: ClockPresenter
+    # Repositories publish committed domain events here; subscribe handlers to it.
+    event_bus: EventBus = field(default_factory=EventBus)
+    # Dispatch repositories append history here; time-travel reads come from it.
+    dispatch_event_store: DispatchEventStore = field(default_factory=InMemoryDispatchEventStore)
+    # Customer notifications wait here until the outbox relay delivers them.
+    notification_outbox: NotificationOutbox = field(default_factory=InMemoryNotificationOutbox)
+    # Dispatch repositories record container moves here as tasks complete; yard checks read from it.
+    container_inventory: ContainerInventory = field(default_factory=InMemoryContainerInventory)
+    # Dispatch repositories record chassis fetched and terminated here as tasks complete.
+    chassis_inventory: ChassisInventory = field(default_factory=InMemoryChassisInventory)
+    # Dispatch repositories count the duration of each completed task here; duration estimates read from it.
+    task_durations: TaskDurationStatistics = field(default_factory=InMemoryTaskDurationStatistics)
+    # Per diem and detention clocks run against the free time set here.
+    free_time_rule_repository: FreeTimeRuleRepository = field(default_factory=InMemoryFreeTimeRuleRepository)
+    # Sequencing reads the minutes between locations from here.
+    travel_time_repository: TravelTimeRepository = field(default_factory=InMemoryTravelTimeRepository)
+    # Nearby-location searches read from here; location use cases keep it current.
+    location_index: LocationSpatialIndex = field(default_factory=InMemoryLocationSpatialIndex)
+    # Predicted loadboard arrivals, dropped as the events of their dispatches are published.
+    eta_cache: EtaCache = field(default_factory=EtaCache)
     
 
     def __post_init__(self):
+        self.eta_cache.subscribe(self.event_bus)
 
         # configure broker use cases
         self.list_brokers_use_case = ListBrokersUseCase(self.broker_repository)
@@ -143,6 +269,14 @@ class Application:
             self.driver_repository,
             self.location_repository,
             )
+        self.bulk_create_dispatches_use_case = BulkCreateDispatchesUseCase(
+            self.dispatch_repository,
+            self.broker_repository,
+            self.driver_repository,
+            self.location_repository,
+            )
+        self.suggest_plan_completions_use_case = SuggestPlanCompletionsUseCase()
+        self.get_plan_rules_use_case = GetPlanRulesUseCase()
         self.get_dispatch_use_case = GetDispatchUseCase(
             self.dispatch_repository
         )
@@ -157,6 +291,37 @@ class Application:
             self.dispatch_repository
         )
         self.get_loadboard_use_case = GetLoadboardDispatchesUseCase(
+            self.dispatch_repository,
+            self.travel_time_repository,
+            self.task_durations,
+            self.eta_cache
+        )
+        self.get_dispatch_history_use_case = GetDispatchHistoryUseCase(
+            self.dispatch_event_store
+        )
+        self.get_loadboard_as_of_use_case = GetLoadboardAsOfUseCase(
+            self.dispatch_repository,
+            self.dispatch_event_store,
+        )
+        self.propose_driver_assignments_use_case = ProposeDriverAssignmentsUseCase(
+            self.dispatch_repository,
+            self.driver_repository,
+        )
+        self.double_booking_report_use_case = DoubleBookingReportUseCase(
+            self.dispatch_repository
+        )
+        self.propose_plan_sequence_use_case = ProposePlanSequenceUseCase(
+            self.dispatch_repository,
+            self.travel_time_repository,
+        )
+        self.propose_street_turns_use_case = ProposeStreetTurnsUseCase(
+            self.dispatch_repository,
+            self.travel_time_repository,
+        )
+        self.get_dispatch_by_reference_use_case = GetDispatchByReferenceUseCase(
+            self.dispatch_repository
+        )
+        self.find_dispatches_by_container_use_case = FindDispatchesByContainerUseCase(
             self.dispatch_repository
         )
         self.start_task_use_case = StartTaskUseCase(
@@ -171,15 +336,64 @@ class Application:
 
         # configure location use cases
         self.list_locations_use_case = ListLocationsUseCase(self.location_repository)
-        self.create_location_use_case = CreateLocationUseCase(self.location_repository)
-        self.deactivate_location_use_case = DeactivateLocationUseCase(self.location_repository)
-        self.activate_location_use_case = ActivateLocationUseCase(self.location_repository)
-        self.edit_location_use_case = EditLocationUseCase(self.location_repository)
+        self.create_location_use_case = CreateLocationUseCase(self.location_repository, self.location_index)
+        self.deactivate_location_use_case = DeactivateLocationUseCase(self.location_repository, self.location_index)
+        self.activate_location_use_case = ActivateLocationUseCase(self.location_repository, self.location_index)
+        self.edit_location_use_case = EditLocationUseCase(self.location_repository, self.location_index)
         self.active_locations_use_case = ActiveLocationsUseCase(self.location_repository)
+        self.nearby_locations_use_case = NearbyLocationsUseCase(self.location_repository, self.location_index)
 
         # configure task use cases
         self.create_task_use_case = CreateTaskUseCase(self.task_repository)
 
+        # configure export use cases
+        self.export_dispatch_history_use_case = ExportDispatchHistoryUseCase(
+            self.dispatch_repository
+        )
+        self.export_task_facts_use_case = ExportTaskFactsUseCase(
+            self.task_repository
+        )
+
+        # configure import use cases
+        self.import_reference_data_use_case = ImportReferenceDataUseCase(
+            self.location_repository,
+            self.broker_repository,
+            self.driver_repository,
+        )
+
+        # configure search use cases
+        self.typeahead_search_use_case = TypeaheadSearchUseCase(
+            self.location_repository,
+            self.broker_repository,
+            self.driver_repository,
+        )
+
+        # configure container use cases
+        self.yard_inventory_use_case = YardInventoryUseCase(self.container_inventory, self.location_repository)
+        self.container_timeline_use_case = ContainerTimelineUseCase(self.container_inventory, self.location_repository)
+        self.chassis_counts_use_case = ChassisCountsUseCase(self.chassis_inventory, self.location_repository)
+        self.chassis_daily_report_use_case = ChassisDailyReportUseCase(self.chassis_inventory, self.location_repository)
+        self.record_chassis_count_use_case = RecordChassisCountUseCase(self.chassis_inventory, self.location_repository)
+
+        # configure clock use cases
+        self.clock_board_use_case = GetClockBoardUseCase(
+            self.dispatch_repository,
+            self.container_inventory,
+            self.free_time_rule_repository,
+            self.broker_repository,
+            self.location_repository,
+        )
+        self.list_free_time_rules_use_case = ListFreeTimeRulesUseCase(
+            self.free_time_rule_repository,
+            self.broker_repository,
+            self.location_repository,
+        )
+        self.set_free_time_rule_use_case = SetFreeTimeRuleUseCase(
+            self.free_time_rule_repository,
+            self.broker_repository,
+            self.location_repository,
+        )
+
         # wire up broker controller
         self.broker_controller = BrokerController(
             self.list_brokers_use_case,
@@ -202,6 +416,17 @@ class Application:
             self.start_task_use_case,
             self.revert_task_use_case,
             self.complete_task_use_case,
+            self.bulk_create_dispatches_use_case,
+            self.suggest_plan_completions_use_case,
+            self.get_plan_rules_use_case,
+            self.get_dispatch_history_use_case,
+            self.get_loadboard_as_of_use_case,
+            self.propose_driver_assignments_use_case,
+            self.double_booking_report_use_case,
+            self.propose_plan_sequence_use_case,
+            self.get_dispatch_by_reference_use_case,
+            self.find_dispatches_by_container_use_case,
+            self.propose_street_turns_use_case,
             self.dispatch_presenter
             )
         
@@ -226,6 +451,7 @@ class Application:
             self.activate_location_use_case,
             self.edit_location_use_case,
             self.active_locations_use_case,
+            self.nearby_locations_use_case,
             self.location_presenter
             )
 
@@ -233,4 +459,41 @@ class Application:
         self.task_controller = TaskController(
             self.create_task_use_case,
             self.task_presenter
-        )
\ No newline at end of file
+        )
+
+        # wire up export controller
+        self.export_controller = ExportController(
+            self.export_dispatch_history_use_case,
+            self.export_task_facts_use_case,
+            self.export_presenter
+        )
+
+        # wire up import controller
+        self.import_controller = ImportController(
+            self.import_reference_data_use_case,
+            self.import_presenter
+        )
+
+        # wire up search controller
+        self.search_controller = SearchController(
+            self.typeahead_search_use_case,
+            self.search_presenter
+        )
+
+        # wire up container controller
+        self.container_controller = ContainerController(
+            self.yard_inventory_use_case,
+            self.container_timeline_use_case,
+            self.chassis_counts_use_case,
+            self.chassis_daily_report_use_case,
+            self.record_chassis_count_use_case,
+            self.container_presenter
+        )
+
+        # wire up clock controller
+        self.clock_controller = ClockController(
+            self.clock_board_use_case,
+            self.list_free_time_rules_use_case,
+            self.set_free_time_rule_use_case,
+            self.clock_presenter
+        )
@@ -0,0 +1,108 @@
+"""
+Schema changes that create_all cannot make to tables that already exist.
+
+create_all only creates the tables that are missing. Each migration here
+checks the live schema and alters it only while it still has its old
+shape, so they all run on every start, in order, and do nothing once
+applied. The statements are written for PostgreSQL, which the application
+is deployed on.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+
+class MigrationError(Exception):
+    """The live data breaks a rule a migration adds, and must be fixed by hand before it can run."""
+
+
+def _add_unique_constraint(connection: Connection, table: str, name: str, columns: tuple[str, ...]) -> None:
+    """
+    Add a unique constraint to an existing table, unless it already has it.
+
+    Raises:
+        MigrationError: Listing the values held by more than one row, which
+            the constraint would reject
+    """
+    if name in {constraint['name'] for constraint in inspect(connection).get_unique_constraints(table)}:
+        return
+    listed = ', '.join(columns)
+    # Rows with a NULL in any of the columns never conflict, as the constraint treats NULLs as distinct.
+    filled = ' AND '.join(f'{column} IS NOT NULL' for column in columns)
+    duplicates = connection.execute(text(
+        f'SELECT {listed}, COUNT(*) FROM {table} WHERE {filled} GROUP BY {listed} HAVING COUNT(*) > 1'
+    )).all()
+    if duplicates:
+        found = '; '.join(
+            f"{', '.join(repr(value) for value in row[:-1])} ({row[-1]} rows)" for row in duplicates
+        )
+        raise MigrationError(f'Cannot add {name} to {table}, rows share these values of ({listed}): {found}.')
+    connection.execute(text(f'ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE ({listed})'))
+
+
+def add_location_uniqueness(connection: Connection) -> None:
+    """No two locations share a name or an address."""
+    _add_unique_constraint(connection, 'locations', 'uq_locations_name', ('name',))
+    _add_unique_constraint(
+        connection, 'locations', 'uq_locations_address', ('street_address', 'city', 'state', 'zipcode')
+    )
+
+
+def add_broker_uniqueness(connection: Connection) -> None:
+    """No two brokers share a name or an address."""
+    _add_unique_constraint(connection, 'brokers', 'uq_brokers_name', ('name',))
+    _add_unique_constraint(
+        connection, 'brokers', 'uq_brokers_address', ('street_address', 'city', 'state', 'zipcode')
+    )
+
+
+def add_driver_uniqueness(connection: Connection) -> None:
+    """No two drivers share a nickname."""
+    _add_unique_constraint(connection, 'drivers', 'uq_drivers_nickname', ('nickname',))
+
+
+# The typeahead search's trigram indexes: (table, index suffix, indexed column or expression).
+TRIGRAM_INDEXES = [
+    ('locations', 'name', 'name'),
+    ('locations', 'street_address', 'street_address'),
+    ('locations', 'city', 'city'),
+    ('brokers', 'name', 'name'),
+    ('drivers', 'full_name', "(first_name || ' ' || last_name)"),
+    ('drivers', 'nickname', 'nickname'),
+]
+
+
+def add_trigram_indexes(connection: Connection) -> None:
+    """Typeahead search matches names and addresses through pg_trgm indexes, which only PostgreSQL has."""
+    if connection.dialect.name != 'postgresql':
+        return
+    connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    for table, column, expression in TRIGRAM_INDEXES:
+        connection.execute(text(
+            f'CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm ON {table} USING gin ({expression} gin_trgm_ops)'
+        ))
+
+
+def add_task_lookup_indexes(connection: Connection) -> None:
+    """Plans are loaded by dispatch, and dispatches found by their tasks' normalized container numbers."""
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_tasks_dispatch_id ON tasks (dispatch_id)'))
+    connection.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_tasks_container_key '
+        "ON tasks (upper(replace(replace(container_number, ' ', ''), '-', '')))"
+    ))
+
+
+MIGRATIONS = [
+    add_location_uniqueness,
+    add_broker_uniqueness,
+    add_driver_uniqueness,
+    add_trigram_indexes,
+    add_task_lookup_indexes,
+]
+
+
+def migrate(engine: Engine) -> None:
+    """Bring the tables create_all left alone up to the current schema, in one transaction."""
+    with engine.begin() as connection:
+        for migration in MIGRATIONS:
+            migration(connection)
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+from itertools import groupby
+from logging import getLogger
+import threading
+from typing import Optional
+
+from src.application.repositories.notification_outbox import NotificationOutbox
+from src.infrastructure.notifications.sinks import NotificationSink
+
+
+logger = getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Delivers outbox messages to a sink from a background thread.
+
+    Each pass takes up to `batch_size` due messages and hands the sink one
+    batch per dispatch, in order. A failed batch is retried after an
+    exponential backoff, and abandoned after `max_attempts`. Since the
+    outbox holds back the later messages of a dispatch while an earlier one
+    waits, a failure delays that dispatch only.
+    """
+
+    def __init__(
+            self,
+            outbox: NotificationOutbox,
+            sink: NotificationSink,
+            batch_size: int = 100,
+            max_attempts: int = 8,
+            base_delay: timedelta = timedelta(seconds=2),
+            max_delay: timedelta = timedelta(minutes=10),
+            poll_interval: float = 1.0,
+            ):
+        self.outbox = outbox
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def retry_at(self, attempts: int, now: datetime) -> Optional[datetime]:
+        """When to retry after `attempts` failed deliveries, or None to give up."""
+        if attempts >= self.max_attempts:
+            return None
+        return now + min(self.base_delay * 2 ** (attempts - 1), self.max_delay)
+
+    def relay_once(self, now: Optional[datetime] = None) -> int:
+        """
+        Deliver the messages that are due.
+
+        Returns:
+            The number of messages delivered
+        """
+        now = now or datetime.now()
+        delivered = 0
+
+        messages = self.outbox.due(self.batch_size, now)
+        by_dispatch = sorted(messages, key=lambda message: (str(message.dispatch_id), message.id))
+        for _, group in groupby(by_dispatch, key=lambda message: message.dispatch_id):
+            batch = list(group)
+            ids = [message.id for message in batch]
+            try:
+                self.sink.deliver(batch)
+            except Exception as e:
+                retry_at = self.retry_at(batch[0].attempts + 1, now)
+                if retry_at is None:
+                    logger.error(f"Abandoning messages {ids} after {self.max_attempts} attempts: {e}")
+                else:
+                    logger.warning(f"Delivery of messages {ids} failed, retrying at {retry_at}: {e}")
+                self.outbox.mark_failed(ids, str(e), retry_at)
+                continue
+            self.outbox.mark_delivered(ids)
+            delivered += len(batch)
+
+        return delivered
+
+    def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                # A full batch suggests more are waiting, so go again without pausing.
+                if self.relay_once() >= self.batch_size:
+                    continue
+            except Exception:
+                logger.exception("Outbox relay pass failed")
+            self._stopping.wait(self.poll_interval)
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self.run, name='outbox-relay', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopping.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,78 @@
+"""
+Destinations the outbox relay delivers customer notifications to.
+"""
+
+from abc import ABC, abstractmethod
+import json
+from pathlib import Path
+from urllib import request as urllib_request
+
+from src.application.dtos.notification_dtos import OutboxMessage
+from src.infrastructure.config import Config, NotificationSinkType
+from src.infrastructure.persistence.serialization import to_primitive
+
+
+def _message_to_json(message: OutboxMessage) -> dict:
+    # The message id lets receivers drop the duplicates at-least-once delivery can produce.
+    return {'id': message.id, **to_primitive(message.notification)}
+
+
+class NotificationSink(ABC):
+    """A destination for notifications. Raising from deliver fails the whole batch."""
+
+    @abstractmethod
+    def deliver(self, messages: list[OutboxMessage]) -> None:
+        """Deliver messages of one dispatch, in order."""
+        pass
+
+
+class InMemoryNotificationSink(NotificationSink):
+    """Keeps delivered messages in a list, for development and tests."""
+
+    def __init__(self) -> None:
+        self.messages: list[OutboxMessage] = []
+
+    def deliver(self, messages: list[OutboxMessage]) -> None:
+        self.messages.extend(messages)
+
+
+class FileNotificationSink(NotificationSink):
+    """Appends each message to a file as a line of JSON."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def deliver(self, messages: list[OutboxMessage]) -> None:
+        with open(self.path, 'a') as file:
+            for message in messages:
+                file.write(json.dumps(_message_to_json(message)) + '\n')
+
+
+class HttpNotificationSink(NotificationSink):
+    """Posts each batch as JSON to a webhook, failing on any non-2xx response."""
+
+    def __init__(self, url: str, timeout: float = 5.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    def deliver(self, messages: list[OutboxMessage]) -> None:
+        body = json.dumps({'messages': [_message_to_json(message) for message in messages]}).encode()
+        http_request = urllib_request.Request(
+            self.url, data=body, method='POST', headers={'Content-Type': 'application/json'}
+        )
+        # urlopen raises HTTPError for 4xx and 5xx responses.
+        with urllib_request.urlopen(http_request, timeout=self.timeout):
+            pass
+
+
+def create_notification_sink() -> NotificationSink:
+    sink_type = Config.get_notification_sink_type()
+
+    if sink_type == NotificationSinkType.MEMORY:
+        return InMemoryNotificationSink()
+    if sink_type == NotificationSinkType.FILE:
+        return FileNotificationSink(Config.get_data_directory() / 'notifications.jsonl')
+    if sink_type == NotificationSinkType.HTTP:
+        return HttpNotificationSink(Config.get_notification_url())
+    else:
+        raise ValueError(f"Invalid notification sink type: {sink_type}")
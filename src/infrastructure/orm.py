@@ -1,10 +1,12 @@
-from sqlalchemy import Date, DateTime, ForeignKey, Sequence, Table, Column, Integer, String, Enum, Time
+from sqlalchemy import Boolean, DDL, Date, func, DateTime, Float, ForeignKey, Index, JSON, Sequence, Table, Column, Integer, String, Enum, Time, UniqueConstraint, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import composite, registry, relationship
 
 from src.domain.aggregates.broker.aggregate import Broker 
 from src.domain.aggregates.broker.value_objects import BrokerStatus 
 from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.clocks import ClockType
+from src.domain.aggregates.dispatch.container_moves import ContainerState
 from src.domain.aggregates.dispatch.entities import Task
 from src.domain.aggregates.driver.aggregate import Driver 
 from src.domain.aggregates.driver.value_objects import DriverStatus
@@ -14,10 +16,37 @@ from src.domain.aggregates.dispatch.value_objects import (
     ContainerSize)
 from src.domain.aggregates.location.aggregate import Location 
 from src.domain.aggregates.location.value_objects import Address, LocationStatus 
+from src.infrastructure.migrations import migrate
+
+
+def container_key(column):
+    """
+    A container number column normalized as normalize_container_number does it.
+
+    The separators are inlined rather than bound, so that queries repeat
+    the expression of the tasks index exactly and the planner can use it.
+    """
+    return func.upper(func.replace(func.replace(column, text("' '"), text("''")), text("'-'"), text("''")))
+
+
+def _trigram_index(table: str, column: str, expression: str = None) -> Index:
+    """A pg_trgm index for typeahead search on a column or expression, created on PostgreSQL only."""
+    if expression is not None:
+        return Index(
+            f'ix_{table}_{column}_trgm', text(f'({expression}) gin_trgm_ops'), postgresql_using='gin'
+        ).ddl_if(dialect='postgresql')
+    return Index(
+        f'ix_{table}_{column}_trgm', column, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+    ).ddl_if(dialect='postgresql')
 
 
 def set_orm_mapping(engine):
     mapper_registry = registry()
+    event.listen(
+        mapper_registry.metadata,
+        'before_create',
+        DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'),
+    )
 
     location_table = Table(
         'locations',
@@ -28,7 +57,12 @@ def set_orm_mapping(engine):
         Column('street_address', String, nullable=False),
         Column('city', String, nullable=False),
         Column('state', String, nullable=False),
-        Column('zipcode', Integer, nullable=False)
+        Column('zipcode', Integer, nullable=False),
+        UniqueConstraint('name', name='uq_locations_name'),
+        UniqueConstraint('street_address', 'city', 'state', 'zipcode', name='uq_locations_address'),
+        _trigram_index('locations', 'name'),
+        _trigram_index('locations', 'street_address'),
+        _trigram_index('locations', 'city'),
     )
 
     broker_table = Table(
@@ -40,7 +74,10 @@ def set_orm_mapping(engine):
         Column('street_address', String, nullable=False),
         Column('city', String, nullable=False),
         Column('state', String, nullable=False),
-        Column('zipcode', Integer, nullable=False)
+        Column('zipcode', Integer, nullable=False),
+        UniqueConstraint('name', name='uq_brokers_name'),
+        UniqueConstraint('street_address', 'city', 'state', 'zipcode', name='uq_brokers_address'),
+        _trigram_index('brokers', 'name'),
     )
 
     driver_table = Table(
@@ -50,7 +87,10 @@ def set_orm_mapping(engine):
         Column('status', Enum(DriverStatus), nullable=False),
         Column('first_name', String, nullable=False),
         Column('last_name', String, nullable=False),
-        Column('nickname', String, nullable=True)
+        Column('nickname', String, nullable=True),
+        UniqueConstraint('nickname', name='uq_drivers_nickname'),
+        _trigram_index('drivers', 'full_name', "first_name || ' ' || last_name"),
+        _trigram_index('drivers', 'nickname'),
     )
 
     task_table = Table(
@@ -70,8 +110,11 @@ def set_orm_mapping(engine):
         Column('appointment_end_time', Time, nullable=True),
         Column('driver_id', UUID(as_uuid=True), ForeignKey('drivers.id'), nullable=True),
         Column('check_in', DateTime, nullable=True),
-        Column('check_out', DateTime, nullable=True)
+        Column('check_out', DateTime, nullable=True),
+        Index('ix_tasks_dispatch_id', 'dispatch_id'),
     )
+    # Container lookups compare normalized numbers, so that is what is indexed.
+    Index('ix_tasks_container_key', container_key(task_table.c.container_number))
 
     dispatch_table = Table(
         'dispatches',
@@ -89,6 +132,124 @@ def set_orm_mapping(engine):
         Column('driver_id', UUID(as_uuid=True), ForeignKey('drivers.id'), nullable=True),
     )
 
+    # Append-only history of each dispatch; rows are never updated or deleted.
+    Table(
+        'dispatch_events',
+        mapper_registry.metadata,
+        Column('dispatch_id', UUID(as_uuid=True), primary_key=True),
+        Column('version', Integer, primary_key=True),
+        Column('event_type', String, nullable=False),
+        Column('payload', JSON, nullable=False),
+        Column('occurred_at', DateTime, nullable=False),
+    )
+
+    Table(
+        'dispatch_snapshots',
+        mapper_registry.metadata,
+        Column('id', Integer, primary_key=True, autoincrement=True),
+        Column('dispatch_id', UUID(as_uuid=True), nullable=False),
+        Column('version', Integer, nullable=False),
+        Column('taken_at', DateTime, nullable=False),
+        Column('state', JSON, nullable=False),
+        Index('ix_dispatch_snapshots_dispatch_id_taken_at', 'dispatch_id', 'taken_at'),
+    )
+
+    Table(
+        'notification_outbox',
+        mapper_registry.metadata,
+        Column('id', Integer, primary_key=True, autoincrement=True),
+        Column('dispatch_id', UUID(as_uuid=True), nullable=False),
+        Column('payload', JSON, nullable=False),
+        Column('created_at', DateTime, nullable=False),
+        Column('attempts', Integer, nullable=False, default=0),
+        Column('next_attempt_at', DateTime, nullable=False),
+        Column('last_error', String, nullable=True),
+        Column('delivered_at', DateTime, nullable=True),
+        Column('abandoned_at', DateTime, nullable=True),
+        Index('ix_notification_outbox_pending', 'dispatch_id', 'id', postgresql_where=text('delivered_at IS NULL AND abandoned_at IS NULL')),
+    )
+
+    # Moves of containers by completed tasks, kept by the dispatch repository as tasks complete and revert.
+    Table(
+        'container_moves',
+        mapper_registry.metadata,
+        Column('task_id', UUID(as_uuid=True), primary_key=True),
+        Column('container_number', String, nullable=False),
+        Column('dispatch_id', UUID(as_uuid=True), nullable=False),
+        Column('broker_id', UUID(as_uuid=True), nullable=False),
+        Column('instruction', Enum(Instruction), nullable=False),
+        Column('location_id', UUID(as_uuid=True), nullable=False),
+        Column('state', Enum(ContainerState), nullable=False),
+        Column('loaded', Boolean, nullable=True),
+        Column('moved_at', DateTime, nullable=False),
+        Index('ix_container_moves_container_number_moved_at', 'container_number', 'moved_at'),
+    )
+
+    # The latest move of each container, which says where it is now, and the move that took it out if it is not returned.
+    Table(
+        'container_positions',
+        mapper_registry.metadata,
+        Column('container_number', String, primary_key=True),
+        Column('task_id', UUID(as_uuid=True), nullable=False),
+        Column('out_task_id', UUID(as_uuid=True), nullable=True),
+        Column('location_id', UUID(as_uuid=True), nullable=False),
+        Column('state', Enum(ContainerState), nullable=False),
+        Index('ix_container_positions_location_id_state', 'location_id', 'state'),
+    )
+
+    # Chassis fetched from (-1) and terminated at (+1) each pool by completed tasks,
+    # and the adjustments that bring a pool to a count, which have no dispatch.
+    Table(
+        'chassis_moves',
+        mapper_registry.metadata,
+        Column('task_id', UUID(as_uuid=True), primary_key=True),
+        Column('dispatch_id', UUID(as_uuid=True), nullable=True),
+        Column('location_id', UUID(as_uuid=True), nullable=False),
+        Column('change', Integer, nullable=False),
+        Column('moved_at', DateTime, nullable=False),
+        Index('ix_chassis_moves_location_id_moved_at', 'location_id', 'moved_at'),
+    )
+
+    # Durations of the completed tasks counted into the sketches below, one row per task.
+    Table(
+        'task_durations',
+        mapper_registry.metadata,
+        Column('task_id', UUID(as_uuid=True), primary_key=True),
+        Column('dispatch_id', UUID(as_uuid=True), nullable=False),
+        Column('location_id', UUID(as_uuid=True), nullable=False),
+        Column('instruction', Enum(Instruction), nullable=False),
+        Column('started_at', DateTime, nullable=False),
+        Column('minutes', Float, nullable=False),
+    )
+
+    # P² quantile sketches of task durations, keyed by DurationKey.scope.
+    Table(
+        'task_duration_sketches',
+        mapper_registry.metadata,
+        Column('scope', String, primary_key=True),
+        Column('state', JSON, nullable=False),
+    )
+
+    # Free time before per diem and detention charge, for a broker, a location, both, or every one of them.
+    Table(
+        'free_time_rules',
+        mapper_registry.metadata,
+        Column('id', Integer, primary_key=True, autoincrement=True),
+        Column('clock', Enum(ClockType), nullable=False),
+        Column('broker_id', UUID(as_uuid=True), nullable=True),
+        Column('location_id', UUID(as_uuid=True), nullable=True),
+        Column('free_minutes', Integer, nullable=False),
+        Column('warning_minutes', Integer, nullable=False),
+    )
+
+    Table(
+        'travel_times',
+        mapper_registry.metadata,
+        Column('origin_zipcode', Integer, primary_key=True),
+        Column('destination_zipcode', Integer, primary_key=True),
+        Column('minutes', Float, nullable=False),
+    )
+
 
     def start_mappers():
         mapper_registry.map_imperatively(
@@ -187,4 +348,5 @@ def set_orm_mapping(engine):
     
 
     start_mappers()
-    mapper_registry.metadata.create_all(engine)
\ No newline at end of file
+    mapper_registry.metadata.create_all(engine)
+    migrate(engine)
\ No newline at end of file
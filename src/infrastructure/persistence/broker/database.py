@@ -1,7 +1,7 @@
-from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import inspect, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from src.domain.aggregates.broker.aggregate import Broker
@@ -9,6 +9,19 @@ from src.domain.aggregates.broker.value_objects import BrokerStatus
 from src.domain.aggregates.location.value_objects import Address
 from src.domain.exceptions import BrokerNotFoundError
 from src.application.repositories.broker_repository import BrokerRepository
+from src.infrastructure.persistence.bulk import bulk_insert
+from src.infrastructure.persistence.integrity import unique_violation
+from src.infrastructure.persistence.search import typeahead
+
+
+# Names and addresses matched per query when looking up many brokers at once.
+LOOKUP_BATCH_SIZE = 1000
+
+# Messages for the unique constraints declared on the brokers table.
+UNIQUE_VIOLATIONS = {
+    'uq_brokers_name': 'A broker with that name already exists.',
+    'uq_brokers_address': 'A broker with that address already exists.',
+}
 
 
 class SQLAlchemyBrokerRepository(BrokerRepository):
@@ -38,23 +51,16 @@ class SQLAlchemyBrokerRepository(BrokerRepository):
         finally:
             session.close()
 
-    def get_by_name(self, broker_name: str, broker_id: Optional[UUID] = None) -> Broker:
+    def get_many(self, broker_ids: list[UUID]) -> list[Broker]:
+        """
+        Retrieve every broker with one of the given IDs.
+        """
         session = self.session_factory()
 
         try:
-            if broker_id:
-                stmt = select(Broker).where(and_(
-                    Broker.id != broker_id,
-                    Broker.name == broker_name
-                    )
-                )
-            else:
-                stmt = select(Broker).where(Broker.name == broker_name)
-
-            if broker := session.scalars(stmt).first():
-                session.expunge(broker)
-            return broker
-
+            brokers = session.scalars(select(Broker).where(Broker.id.in_(broker_ids))).all()
+            session.expunge_all()
+            return brokers
         finally:
             session.close()
 
@@ -72,31 +78,30 @@ class SQLAlchemyBrokerRepository(BrokerRepository):
         finally:
             session.close()
 
-    def get_by_address(self, address: Address, broker_id: Optional[UUID] = None) -> Broker:
+    def get_by_names_or_addresses(self, names: list[str], addresses: list[Address]) -> list[Broker]:
+        """
+        Retrieve every broker matching any of the given names or addresses.
+        """
         session = self.session_factory()
+        address_columns = tuple_(
+            Broker.street_address, Broker.city, Broker.state, Broker.zipcode
+        )
+        keys = [(a.street_address, a.city, a.state, a.zipcode) for a in addresses]
 
         try:
-            if broker_id:
-                stmt = select(Broker).where(and_(
-                    Broker.id != broker_id,
-                    Broker.street_address == address.street_address,
-                    Broker.city == address.city,
-                    Broker.state == address.state,
-                    Broker.zipcode == address.zipcode,
-                    )
-                )
-            else:
-                stmt = select(Broker).where(and_(
-                        Broker.street_address == address.street_address,
-                        Broker.city == address.city,
-                        Broker.state == address.state,
-                        Broker.zipcode == address.zipcode,
+            brokers = []
+            for start in range(0, max(len(names), len(keys)), LOOKUP_BATCH_SIZE):
+                name_batch = names[start:start + LOOKUP_BATCH_SIZE]
+                key_batch = keys[start:start + LOOKUP_BATCH_SIZE]
+                stmt = select(Broker).where(or_(
+                    Broker.name.in_(name_batch),
+                    address_columns.in_(key_batch),
                     )
                 )
-            if broker := session.scalars(stmt).first():
-                session.expunge(broker)
-            return broker
+                brokers.extend(session.scalars(stmt).all())
 
+            session.expunge_all()
+            return list({broker.id: broker for broker in brokers}.values())
         finally:
             session.close()
 
@@ -113,6 +118,27 @@ class SQLAlchemyBrokerRepository(BrokerRepository):
         finally:
             session.close()
 
+    def search(self, query: str, limit: int) -> list[tuple[Broker, float]]:
+        """
+        Search the active brokers by name.
+
+        Returns:
+            (Broker, score) pairs, best match first
+        """
+        session = self.session_factory()
+
+        try:
+            return typeahead(
+                session,
+                Broker,
+                [Broker.name],
+                Broker._status == BrokerStatus.ACTIVE,
+                query,
+                limit,
+            )
+        finally:
+            session.close()
+
     def save(self, broker: Broker) -> None:
         """
         Save a broker to the repository.
@@ -127,6 +153,10 @@ class SQLAlchemyBrokerRepository(BrokerRepository):
             session.commit()
             session.refresh(broker)
             session.expunge(broker)
+        except IntegrityError as e:
+            if violation := unique_violation(e, inspect(Broker).local_table, UNIQUE_VIOLATIONS):
+                raise violation from e
+            raise
         finally:
             session.close()
 
@@ -145,3 +175,33 @@ class SQLAlchemyBrokerRepository(BrokerRepository):
             session.commit()
         finally:
             session.close()
+
+    def add_many(self, brokers: list[Broker]) -> None:
+        """
+        Insert many new brokers in a single transaction.
+
+        Args:
+            brokers: The new Broker entities to insert
+        """
+        session = self.session_factory()
+
+        try:
+            bulk_insert(session, inspect(Broker).local_table, [
+                {
+                    'id': broker.id,
+                    'status': broker.status,
+                    'name': broker.name,
+                    'street_address': broker.address.street_address,
+                    'city': broker.address.city,
+                    'state': broker.address.state,
+                    'zipcode': broker.address.zipcode,
+                }
+                for broker in brokers
+            ])
+            session.commit()
+        except IntegrityError as e:
+            if violation := unique_violation(e, inspect(Broker).local_table, UNIQUE_VIOLATIONS):
+                raise violation from e
+            raise
+        finally:
+            session.close()
@@ -1,20 +1,29 @@
+from copy import copy
 from typing import Dict, Sequence
 from uuid import UUID
 from logging import getLogger
 
 from src.application.repositories.broker_repository import BrokerRepository
 from src.domain.aggregates.broker.aggregate import Broker
-from src.domain.exceptions import BrokerNotFoundError
+from src.domain.aggregates.broker.value_objects import BrokerStatus
+from src.domain.aggregates.location.value_objects import Address
+from src.domain.exceptions import BusinessRuleViolation, BrokerNotFoundError
+from src.infrastructure.persistence.search import NgramIndex
 
 
 logger = getLogger(__name__)
 
 
+def _address_key(address: Address) -> tuple:
+    return (address.street_address, address.city, address.state, address.zipcode)
+
+
 class InMemoryBrokerRepository(BrokerRepository):
     """In-memory implementation of BrokerRepository."""
 
     def __init__(self) -> None:
         self._brokers: Dict[UUID, Broker] = {}
+        self._search = NgramIndex()
 
     def get(self, broker_id: UUID) -> Broker:
         """
@@ -30,9 +39,21 @@ class InMemoryBrokerRepository(BrokerRepository):
             BrokerNotFoundError: If no broker exists with the given ID
         """
         if broker := self._brokers.get(broker_id):
-            return broker
+            return copy(broker)
         raise BrokerNotFoundError(broker_id)
 
+    def get_many(self, broker_ids: list[UUID]) -> list[Broker]:
+        """
+        Retrieve every broker with one of the given IDs.
+
+        Args:
+            broker_ids: The unique identifiers of the brokers
+
+        Returns:
+            The brokers that exist
+        """
+        return [copy(self._brokers[broker_id]) for broker_id in set(broker_ids) if broker_id in self._brokers]
+
     def save(self, broker: Broker) -> None:
         """
         Save a broker.
@@ -40,8 +61,12 @@ class InMemoryBrokerRepository(BrokerRepository):
         Args:
             broker: The broker to save
         """
+        others = [other for other in self._brokers.values() if other.id != broker.id]
+        self._check_unique([broker], others)
+
         logger.debug(f"Saving broker {broker.id}")
-        self._brokers[broker.id] = broker
+        self._brokers[broker.id] = copy(broker)
+        self._index(broker)
 
     def delete(self, broker_id: UUID) -> None:
         """
@@ -51,6 +76,7 @@ class InMemoryBrokerRepository(BrokerRepository):
             broker_id: The unique identifier of the broker to delete
         """
         self._brokers.pop(broker_id, None)
+        self._search.remove(broker_id)
 
     def get_all(self) -> Sequence[Broker]:
         """
@@ -59,4 +85,61 @@ class InMemoryBrokerRepository(BrokerRepository):
         Returns:
             A sequence of all brokers
         """
-        return [broker for broker in self._brokers.values()]
+        return [copy(broker) for broker in self._brokers.values()]
+
+    def get_by_names_or_addresses(self, names: list[str], addresses: list[Address]) -> list[Broker]:
+        """
+        Get every broker matching any of the given names or addresses.
+
+        Returns:
+            The matching brokers
+        """
+        wanted_names = set(names)
+        wanted_addresses = {_address_key(address) for address in addresses}
+        return [
+            copy(broker) for broker in self._brokers.values()
+            if broker.name in wanted_names or _address_key(broker.address) in wanted_addresses
+        ]
+
+    def add_many(self, brokers: list[Broker]) -> None:
+        """
+        Save many new brokers.
+
+        Args:
+            brokers: The brokers to save
+        """
+        self._check_unique(brokers, list(self._brokers.values()))
+
+        logger.debug(f"Saving {len(brokers)} brokers")
+        self._brokers.update((broker.id, copy(broker)) for broker in brokers)
+        for broker in brokers:
+            self._index(broker)
+
+    def search(self, query: str, limit: int) -> list[tuple[Broker, float]]:
+        """
+        Search the active brokers by name.
+
+        Returns:
+            (Broker, score) pairs, best match first
+        """
+        return [(copy(self._brokers[broker_id]), score) for broker_id, score in self._search.search(query, limit)]
+
+    def _index(self, broker: Broker) -> None:
+        """Keep the search index to the active brokers."""
+        if broker.status == BrokerStatus.ACTIVE:
+            self._search.put(broker.id, (broker.name,))
+        else:
+            self._search.remove(broker.id)
+
+    def _check_unique(self, brokers: list[Broker], others: list[Broker]) -> None:
+        """Enforce the unique names and addresses the database schema declares."""
+        names = {other.name for other in others}
+        addresses = {_address_key(other.address) for other in others}
+
+        for broker in brokers:
+            if broker.name in names:
+                raise BusinessRuleViolation('A broker with that name already exists.')
+            if _address_key(broker.address) in addresses:
+                raise BusinessRuleViolation('A broker with that address already exists.')
+            names.add(broker.name)
+            addresses.add(_address_key(broker.address))
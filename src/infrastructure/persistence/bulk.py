@@ -0,0 +1,72 @@
+"""
+Helpers for writing many rows in as few round trips as possible.
+"""
+
+import csv
+from datetime import date, datetime, time
+from enum import Enum
+import io
+from typing import Iterable
+
+from sqlalchemy import Table, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+# Rows sent per multi-row INSERT on backends without COPY support.
+INSERT_BATCH_SIZE = 1000
+
+
+def _copy_value(value):
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        # SQLAlchemy's Enum type persists member names, not values.
+        return value.name
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy_rows(session: Session, table: Table, rows: list[dict]) -> None:
+    columns = [column.name for column in table.columns if column.name in rows[0]]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(['' if (value := _copy_value(row[c])) is None else value for c in columns])
+    buffer.seek(0)
+
+    statement = f'COPY {table.name} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)'
+    connection = session.connection()
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    except connection.dialect.dbapi.IntegrityError as e:
+        # Raw cursor errors bypass SQLAlchemy; wrap them as execute() would.
+        raise IntegrityError(statement, None, e) from e
+    finally:
+        cursor.close()
+
+
+def bulk_insert(session: Session, table: Table, rows: Iterable[dict]) -> int:
+    """
+    Insert rows into a table within the session's transaction.
+
+    On PostgreSQL the rows are streamed with a single COPY; elsewhere they are
+    sent as batched multi-row INSERT statements. The caller commits.
+
+    Returns:
+        The number of rows inserted
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    if session.get_bind().dialect.name == 'postgresql':
+        _copy_rows(session, table, rows)
+        return len(rows)
+
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        session.execute(insert(table), rows[start:start + INSERT_BATCH_SIZE])
+    return len(rows)
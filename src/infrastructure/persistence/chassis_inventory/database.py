@@ -0,0 +1,119 @@
+from datetime import date, datetime, time, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import Table, delete, func, insert, inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.application.repositories.chassis_inventory import ChassisInventory
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.chassis_moves import (
+    ChassisDay,
+    ChassisMove,
+    chassis_changes,
+    daily_chassis_report,
+)
+from src.domain.common.events import DomainEvent
+
+
+def _table() -> Table:
+    return inspect(Dispatch).local_table.metadata.tables['chassis_moves']
+
+
+class SQLAlchemyChassisInventory(ChassisInventory):
+    """
+    ChassisInventory over the chassis_moves table.
+
+    The dispatch repository records moves through record_in, inside the
+    transaction that saves the dispatch; a completion costs one insert and
+    a revert one delete, both by task id. Adjustments are rows of their
+    own with no dispatch. Counts are sums over the (location_id, moved_at)
+    index.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """Record the chassis moves a dispatch's new events made or took back, in a transaction of its own."""
+        session = self.session_factory()
+
+        try:
+            self.record_in(session, dispatch, events)
+            session.commit()
+        finally:
+            session.close()
+
+    def record_in(self, session: Session, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """Record chassis moves within the caller's transaction, without committing."""
+        changes = dict(chassis_changes(dispatch, events))
+        if not changes:
+            return
+        moves = _table()
+
+        session.execute(delete(moves).where(moves.c.task_id.in_(changes)))
+        made = [move for move in changes.values() if move is not None]
+        if made:
+            session.execute(insert(moves), [
+                {
+                    'task_id': move.task_id,
+                    'dispatch_id': move.dispatch_id,
+                    'location_id': move.location_id,
+                    'change': move.change,
+                    'moved_at': move.moved_at,
+                }
+                for move in made
+            ])
+
+    def adjust(self, location_id: UUID, change: int, moved_at: datetime) -> None:
+        """Record a change to a pool's count that no task made, such as its opening count or a correction."""
+        session = self.session_factory()
+
+        try:
+            session.execute(insert(_table()), [{
+                'task_id': uuid4(),
+                'dispatch_id': None,
+                'location_id': location_id,
+                'change': change,
+                'moved_at': moved_at,
+            }])
+            session.commit()
+        finally:
+            session.close()
+
+    def _balances(self, session: Session, moved) -> dict[UUID, int]:
+        moves = _table()
+        rows = session.execute(
+            select(moves.c.location_id, func.sum(moves.c.change))
+            .where(moved)
+            .group_by(moves.c.location_id)
+        ).all()
+        return {location_id: int(balance) for location_id, balance in rows}
+
+    def counts(self, as_of: datetime) -> dict[UUID, int]:
+        """Retrieve the count of every pool with a recorded move, as of a moment."""
+        session = self.session_factory()
+
+        try:
+            return self._balances(session, _table().c.moved_at <= as_of)
+        finally:
+            session.close()
+
+    def daily_report(self, start: date, end: date) -> list[ChassisDay]:
+        """Retrieve each pool's fetches, terminations and end-of-day count, for every day from start to end."""
+        moves = _table()
+        first = datetime.combine(start, time.min)
+        after = datetime.combine(end + timedelta(days=1), time.min)
+        session = self.session_factory()
+
+        try:
+            opening = self._balances(session, moves.c.moved_at < first)
+            rows = session.execute(
+                select(moves).where(moves.c.moved_at >= first, moves.c.moved_at < after)
+            ).all()
+            in_range = [
+                ChassisMove(row.task_id, row.dispatch_id, row.location_id, row.change, row.moved_at)
+                for row in rows
+            ]
+            return daily_chassis_report(opening, in_range, start, end)
+        finally:
+            session.close()
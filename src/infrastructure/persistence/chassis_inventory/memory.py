@@ -0,0 +1,105 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from logging import getLogger
+from uuid import UUID, uuid4
+
+from src.application.repositories.chassis_inventory import ChassisInventory
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.chassis_moves import (
+    ChassisDay,
+    ChassisMove,
+    chassis_changes,
+    daily_chassis_report,
+)
+from src.domain.common.events import DomainEvent
+
+
+logger = getLogger(__name__)
+
+
+class _PoolLedger:
+    """
+    The moves of one pool in check-out order, with the count after each.
+
+    Moves mostly arrive in order, which appends in constant time; one
+    checked out before others already recorded shifts the counts after it.
+    """
+
+    def __init__(self) -> None:
+        self.times: list[datetime] = []
+        self.moves: list[ChassisMove] = []
+        self.balances: list[int] = []
+
+    def add(self, move: ChassisMove) -> None:
+        position = bisect_right(self.times, move.moved_at)
+        before = self.balances[position - 1] if position else 0
+        self.times.insert(position, move.moved_at)
+        self.moves.insert(position, move)
+        self.balances.insert(position, before + move.change)
+        for later in range(position + 1, len(self.balances)):
+            self.balances[later] += move.change
+
+    def remove(self, move: ChassisMove) -> None:
+        position = bisect_left(self.times, move.moved_at)
+        while self.moves[position].task_id != move.task_id:
+            position += 1
+        del self.times[position], self.moves[position], self.balances[position]
+        for later in range(position, len(self.balances)):
+            self.balances[later] -= move.change
+
+    def balance(self, as_of: datetime) -> int:
+        """The count after the moves checked out at or before a moment."""
+        position = bisect_right(self.times, as_of)
+        return self.balances[position - 1] if position else 0
+
+    def balance_before(self, moment: datetime) -> int:
+        """The count after the moves checked out before a moment."""
+        position = bisect_left(self.times, moment)
+        return self.balances[position - 1] if position else 0
+
+    def between(self, start: datetime, end: datetime) -> list[ChassisMove]:
+        """The moves checked out at or after start and before end."""
+        return self.moves[bisect_left(self.times, start):bisect_left(self.times, end)]
+
+
+class InMemoryChassisInventory(ChassisInventory):
+    """In-memory implementation of ChassisInventory."""
+
+    def __init__(self) -> None:
+        self._moves: dict[UUID, ChassisMove] = {}
+        self._pools: dict[UUID, _PoolLedger] = {}
+
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Record the chassis moves a dispatch's new events made or took back.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        for task_id, move in chassis_changes(dispatch, events):
+            logger.debug(f"Recording chassis move of task {task_id}")
+            if previous := self._moves.pop(task_id, None):
+                self._pools[previous.location_id].remove(previous)
+            if move is not None:
+                self._moves[task_id] = move
+                self._pools.setdefault(move.location_id, _PoolLedger()).add(move)
+
+    def adjust(self, location_id: UUID, change: int, moved_at: datetime) -> None:
+        """Record a change to a pool's count that no task made, such as its opening count or a correction."""
+        move = ChassisMove(uuid4(), None, location_id, change, moved_at)
+        self._moves[move.task_id] = move
+        self._pools.setdefault(location_id, _PoolLedger()).add(move)
+
+    def counts(self, as_of: datetime) -> dict[UUID, int]:
+        """Retrieve the count of every pool with a recorded move, as of a moment."""
+        return {location_id: pool.balance(as_of) for location_id, pool in self._pools.items() if pool.moves}
+
+    def daily_report(self, start: date, end: date) -> list[ChassisDay]:
+        """Retrieve each pool's fetches, terminations and end-of-day count, for every day from start to end."""
+        first = datetime.combine(start, time.min)
+        after = datetime.combine(end + timedelta(days=1), time.min)
+        pools = {location_id: pool for location_id, pool in self._pools.items() if pool.moves}
+        opening = {location_id: pool.balance_before(first) for location_id, pool in pools.items()}
+        moves = [move for pool in pools.values() for move in pool.between(first, after)]
+        return daily_chassis_report(opening, moves, start, end)
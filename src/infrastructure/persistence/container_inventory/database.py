@@ -0,0 +1,206 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Table, delete, func, insert, inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.application.repositories.container_inventory import ContainerInventory
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.container_moves import (
+    ContainerMove,
+    ContainerState,
+    container_changes,
+)
+from src.domain.aggregates.dispatch.value_objects import normalize_container_number
+from src.domain.common.events import DomainEvent
+
+
+def _table(name: str) -> Table:
+    return inspect(Dispatch).local_table.metadata.tables[name]
+
+
+def _row(move: ContainerMove) -> dict:
+    return {
+        'task_id': move.task_id,
+        'container_number': move.container_number,
+        'dispatch_id': move.dispatch_id,
+        'broker_id': move.broker_id,
+        'instruction': move.instruction,
+        'location_id': move.location_id,
+        'state': move.state,
+        'loaded': move.loaded,
+        'moved_at': move.moved_at,
+    }
+
+
+def _position(move: ContainerMove, out: Optional[ContainerMove]) -> dict:
+    return {
+        'container_number': move.container_number,
+        'task_id': move.task_id,
+        'out_task_id': out.task_id if out else None,
+        'location_id': move.location_id,
+        'state': move.state,
+    }
+
+
+def _move(row) -> ContainerMove:
+    return ContainerMove(
+        container_number=row.container_number,
+        dispatch_id=row.dispatch_id,
+        broker_id=row.broker_id,
+        task_id=row.task_id,
+        instruction=row.instruction,
+        location_id=row.location_id,
+        state=row.state,
+        loaded=row.loaded,
+        moved_at=row.moved_at,
+    )
+
+
+class SQLAlchemyContainerInventory(ContainerInventory):
+    """
+    ContainerInventory over the container_moves and container_positions tables.
+
+    The dispatch repository records moves through record_in, inside the
+    transaction that saves the dispatch. Only the containers whose moves
+    changed have their position recomputed, each from the latest of its
+    moves and, while it is out, the first since it was last returned,
+    both read through the (container_number, moved_at) index.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """Record the moves a dispatch's new events made or took back, in a transaction of its own."""
+        session = self.session_factory()
+
+        try:
+            self.record_in(session, dispatch, events)
+            session.commit()
+        finally:
+            session.close()
+
+    def record_in(self, session: Session, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """Record moves within the caller's transaction, without committing."""
+        changes = dict(container_changes(dispatch, events))
+        if not changes:
+            return
+        moves = _table('container_moves')
+
+        containers = set(session.scalars(
+            select(moves.c.container_number).where(moves.c.task_id.in_(changes))
+        ))
+        session.execute(delete(moves).where(moves.c.task_id.in_(changes)))
+        made = [move for move in changes.values() if move is not None]
+        if made:
+            session.execute(insert(moves), [_row(move) for move in made])
+        containers.update(move.container_number for move in made)
+
+        self._place(session, containers)
+
+    def _place(self, session: Session, containers: set[str]) -> None:
+        """Point the positions of containers at their latest moves, and at the moves that took them out."""
+        positions = _table('container_positions')
+
+        session.execute(delete(positions).where(positions.c.container_number.in_(containers)))
+        rows = []
+        for container in containers:
+            latest = self._latest(session, container)
+            if latest is not None:
+                out = None if latest.state == ContainerState.RETURNED else self._taken_out(session, container)
+                rows.append(_position(latest, out))
+        if rows:
+            session.execute(insert(positions), rows)
+
+    def _latest(self, session: Session, container: str) -> Optional[ContainerMove]:
+        moves = _table('container_moves')
+        row = session.execute(
+            select(moves)
+            .where(moves.c.container_number == container)
+            .order_by(moves.c.moved_at.desc())
+            .limit(1)
+        ).first()
+        return _move(row) if row is not None else None
+
+    def _taken_out(self, session: Session, container: str) -> ContainerMove:
+        """The first move of a container since it was last returned."""
+        moves = _table('container_moves')
+        returned = (
+            select(func.max(moves.c.moved_at))
+            .where(moves.c.container_number == container, moves.c.state == ContainerState.RETURNED)
+            .scalar_subquery()
+        )
+        trip = select(moves).where(moves.c.container_number == container)
+        trip = trip.where((moves.c.moved_at > returned) | returned.is_(None))
+        return _move(session.execute(trip.order_by(moves.c.moved_at).limit(1)).first())
+
+    def at_location(self, location_id: UUID) -> list[ContainerMove]:
+        """Retrieve the containers dropped at a location and not moved since, longest standing first."""
+        moves = _table('container_moves')
+        positions = _table('container_positions')
+        session = self.session_factory()
+
+        try:
+            rows = session.execute(
+                select(moves)
+                .join(positions, positions.c.task_id == moves.c.task_id)
+                .where(positions.c.location_id == location_id, positions.c.state == ContainerState.DROPPED)
+                .order_by(moves.c.moved_at)
+            ).all()
+            return [_move(row) for row in rows]
+        finally:
+            session.close()
+
+    def outstanding(self, as_of: Optional[datetime] = None) -> list[ContainerMove]:
+        """Retrieve the move that took out each container not yet returned, then or now, longest out first."""
+        moves = _table('container_moves')
+        positions = _table('container_positions')
+        session = self.session_factory()
+
+        try:
+            if as_of is None:
+                query = select(moves).join(positions, positions.c.out_task_id == moves.c.task_id)
+            else:
+                query = self._out_at(as_of)
+            return [_move(row) for row in session.execute(query.order_by(moves.c.moved_at)).all()]
+        finally:
+            session.close()
+
+    def _out_at(self, as_of: datetime):
+        """Select the first move of each container since it was last returned, replaying its moves up to a moment."""
+        moves = _table('container_moves')
+        before = moves.c.moved_at <= as_of
+        returned = (
+            select(moves.c.container_number, func.max(moves.c.moved_at).label('moved_at'))
+            .where(before, moves.c.state == ContainerState.RETURNED)
+            .group_by(moves.c.container_number)
+            .subquery()
+        )
+        trips = (
+            select(moves.c.container_number, func.min(moves.c.moved_at).label('moved_at'))
+            .outerjoin(returned, returned.c.container_number == moves.c.container_number)
+            .where(before, returned.c.moved_at.is_(None) | (moves.c.moved_at > returned.c.moved_at))
+            .group_by(moves.c.container_number)
+            .subquery()
+        )
+        return select(moves).join(
+            trips,
+            (trips.c.container_number == moves.c.container_number) & (trips.c.moved_at == moves.c.moved_at),
+        )
+
+    def timeline(self, container_number: str) -> list[ContainerMove]:
+        """Retrieve every recorded move of a container, oldest first."""
+        moves = _table('container_moves')
+        session = self.session_factory()
+
+        try:
+            rows = session.execute(
+                select(moves)
+                .where(moves.c.container_number == normalize_container_number(container_number))
+                .order_by(moves.c.moved_at)
+            ).all()
+            return [_move(row) for row in rows]
+        finally:
+            session.close()
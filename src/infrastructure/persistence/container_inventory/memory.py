@@ -0,0 +1,105 @@
+from bisect import bisect_right, insort
+from datetime import datetime
+from logging import getLogger
+from typing import Optional
+from uuid import UUID
+
+from src.application.repositories.container_inventory import ContainerInventory
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.container_moves import (
+    ContainerMove,
+    ContainerState,
+    container_changes,
+    taken_out,
+)
+from src.domain.aggregates.dispatch.value_objects import normalize_container_number
+from src.domain.common.events import DomainEvent
+
+
+logger = getLogger(__name__)
+
+
+def _moved_at(move: ContainerMove):
+    return move.moved_at
+
+
+class InMemoryContainerInventory(ContainerInventory):
+    """In-memory implementation of ContainerInventory."""
+
+    def __init__(self) -> None:
+        self._moves: dict[UUID, ContainerMove] = {}
+        # Per container, its moves ordered by check-out time, the last being where it is now.
+        self._timelines: dict[str, list[ContainerMove]] = {}
+        # Per location, the containers sitting there and the move that left them.
+        self._dropped: dict[UUID, dict[str, ContainerMove]] = {}
+        # Per container out on a trip, the move that took it out.
+        self._out: dict[str, ContainerMove] = {}
+
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Record the moves a dispatch's new events made or took back.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        for task_id, move in container_changes(dispatch, events):
+            logger.debug(f"Recording container move of task {task_id}")
+            self._forget(task_id)
+            if move is not None:
+                self._remember(move)
+
+    def at_location(self, location_id: UUID) -> list[ContainerMove]:
+        """Retrieve the containers dropped at a location and not moved since, longest standing first."""
+        return sorted(self._dropped.get(location_id, {}).values(), key=_moved_at)
+
+    def timeline(self, container_number: str) -> list[ContainerMove]:
+        """Retrieve every recorded move of a container, oldest first."""
+        return list(self._timelines.get(normalize_container_number(container_number), []))
+
+    def outstanding(self, as_of: Optional[datetime] = None) -> list[ContainerMove]:
+        """Retrieve the move that took out each container not yet returned, then or now, longest out first."""
+        if as_of is None:
+            return sorted(self._out.values(), key=_moved_at)
+        out = []
+        for timeline in self._timelines.values():
+            if move := taken_out(timeline[:bisect_right(timeline, as_of, key=_moved_at)]):
+                out.append(move)
+        return sorted(out, key=_moved_at)
+
+    def _remember(self, move: ContainerMove) -> None:
+        self._unplace(move.container_number)
+        self._moves[move.task_id] = move
+        insort(self._timelines.setdefault(move.container_number, []), move, key=_moved_at)
+        self._place(move.container_number)
+
+    def _forget(self, task_id: UUID) -> None:
+        move = self._moves.pop(task_id, None)
+        if move is None:
+            return
+        self._unplace(move.container_number)
+        timeline = self._timelines[move.container_number]
+        timeline.remove(move)
+        if not timeline:
+            del self._timelines[move.container_number]
+        self._place(move.container_number)
+
+    def _unplace(self, container_number: str) -> None:
+        """Take a container out of the location its latest move dropped it at, if any, and off its trip."""
+        self._out.pop(container_number, None)
+        if timeline := self._timelines.get(container_number):
+            latest = timeline[-1]
+            if latest.state == ContainerState.DROPPED:
+                dropped = self._dropped[latest.location_id]
+                del dropped[container_number]
+                if not dropped:
+                    del self._dropped[latest.location_id]
+
+    def _place(self, container_number: str) -> None:
+        """Put a container at the location its latest move dropped it at, if any, and on its trip."""
+        if timeline := self._timelines.get(container_number):
+            if out := taken_out(timeline):
+                self._out[container_number] = out
+            latest = timeline[-1]
+            if latest.state == ContainerState.DROPPED:
+                self._dropped.setdefault(latest.location_id, {})[container_number] = latest
@@ -1,19 +1,57 @@
 from datetime import date
+from typing import Iterator, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import joinedload, sessionmaker
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import aliased, joinedload, sessionmaker
 
+from src.application.common.event_bus import EventBus
+from src.application.dtos.export_dtos import DispatchHistoryRecord
+from src.application.dtos.notification_dtos import StatusNotification
+from src.domain.aggregates.broker.aggregate import Broker
 from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.booking import BOOKING_STATUSES
 from src.domain.aggregates.dispatch.entities import Task
-from src.domain.aggregates.dispatch.value_objects import DispatchStatus
+from src.domain.aggregates.dispatch.value_objects import DispatchStatus, normalize_container_number
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
 from src.domain.exceptions import DispatchNotFoundError
 from src.application.repositories.dispatch_repository import DispatchRepository
+from src.infrastructure.persistence.bulk import bulk_insert
+from src.infrastructure.persistence.chassis_inventory.database import SQLAlchemyChassisInventory
+from src.infrastructure.persistence.task_durations.database import SQLAlchemyTaskDurationStatistics
+from src.infrastructure.persistence.container_inventory.database import SQLAlchemyContainerInventory
+from src.infrastructure.persistence.dispatch_history.database import SQLAlchemyDispatchEventStore
+from src.infrastructure.orm import container_key
+from src.infrastructure.persistence.outbox.database import SQLAlchemyNotificationOutbox
+
+
+# Rows fetched per round trip when streaming history through a server-side cursor.
+HISTORY_BATCH_SIZE = 1000
+
+
+def _driver_name(driver):
+    return func.coalesce(driver.nickname, driver.first_name + ' ' + driver.last_name)
 
 
 class SQLAlchemyDispatchRepository(DispatchRepository):
-    def __init__(self, session_factory: sessionmaker):
+    def __init__(
+            self,
+            session_factory: sessionmaker,
+            event_bus: Optional[EventBus] = None,
+            event_store: Optional[SQLAlchemyDispatchEventStore] = None,
+            outbox: Optional[SQLAlchemyNotificationOutbox] = None,
+            container_inventory: Optional[SQLAlchemyContainerInventory] = None,
+            chassis_inventory: Optional[SQLAlchemyChassisInventory] = None,
+            task_durations: Optional[SQLAlchemyTaskDurationStatistics] = None,
+            ):
         self.session_factory = session_factory
+        self.event_bus = event_bus or EventBus()
+        self.event_store = event_store
+        self.outbox = outbox
+        self.container_inventory = container_inventory
+        self.chassis_inventory = chassis_inventory
+        self.task_durations = task_durations
 
     def get(self, dispatch_id: UUID) -> Dispatch:
         """
@@ -43,6 +81,60 @@ class SQLAlchemyDispatchRepository(DispatchRepository):
         finally:
             session.close()
 
+    def get_by_reference(self, reference: int) -> Dispatch:
+        """
+        Retrieve a dispatch by its reference, through the reference's unique index.
+
+        Raises:
+            DispatchNotFoundError: If no dispatch has the given reference
+        """
+        session = self.session_factory()
+
+        try:
+            dispatch = session.scalars(
+                select(Dispatch)
+                .where(Dispatch.reference == reference)
+                .options(
+                    joinedload(Dispatch.broker),
+                    joinedload(Dispatch.current_driver),
+                    joinedload(Dispatch.plan).joinedload(Task.location),
+                )
+            ).unique().one_or_none()
+            if dispatch is None:
+                raise DispatchNotFoundError(reference)
+            session.expunge_all()
+            return dispatch
+        finally:
+            session.close()
+
+    def get_by_container(self, container_number: str) -> list[Dispatch]:
+        """
+        Retrieve every dispatch with a task moving a container.
+
+        The tasks are found through the index on their normalized container
+        number, and the dispatches are loaded with their plans in the same
+        statement.
+        """
+        session = self.session_factory()
+
+        try:
+            moving = select(Task.dispatch_id).where(
+                container_key(Task.container_number) == normalize_container_number(container_number)
+            )
+            dispatches = session.scalars(
+                select(Dispatch)
+                .where(Dispatch.id.in_(moving))
+                .options(
+                    joinedload(Dispatch.broker),
+                    joinedload(Dispatch.current_driver),
+                    joinedload(Dispatch.plan).joinedload(Task.location),
+                )
+            ).unique().all()
+            session.expunge_all()
+            return dispatches
+        finally:
+            session.close()
+
     def get_all(self) -> list[Dispatch]:
         """
         Retrieve all dispatchs.
@@ -89,6 +181,190 @@ class SQLAlchemyDispatchRepository(DispatchRepository):
         finally:
             session.close()
 
+    def get_in_progress(self) -> list[Dispatch]:
+        """
+        Retrieve every dispatch in progress, with its broker and plan.
+        """
+        session = self.session_factory()
+
+        try:
+            dispatches = session.scalars(
+                select(Dispatch)
+                .where(Dispatch._status == DispatchStatus.IN_PROGRESS)
+                .options(joinedload(Dispatch.broker), joinedload(Dispatch.plan).joinedload(Task.location))
+            ).unique().all()
+            session.expunge_all()
+            return dispatches
+        finally:
+            session.close()
+
+    def get_ids_by_date(self, date: date) -> list[UUID]:
+        """
+        Retrieve the ID of every dispatch with a task dated on a date, whatever its status.
+        """
+        session = self.session_factory()
+
+        try:
+            return list(session.scalars(select(Task.dispatch_id).where(Task.date == date).distinct()))
+        finally:
+            session.close()
+
+    def get_drafts_by_date(self, date: date) -> list[Dispatch]:
+        """
+        Retrieve all draft dispatches whose earliest task falls on a date.
+        """
+        session = self.session_factory()
+
+        try:
+            earliest_task = select(
+                Task.dispatch_id,
+                func.min(Task.date).label('earliest_date'),
+            ).group_by(Task.dispatch_id).subquery()
+
+            dispatches = session.scalars(
+                select(Dispatch)
+                .join(earliest_task, earliest_task.c.dispatch_id == Dispatch.id)
+                .where(Dispatch._status == DispatchStatus.DRAFT, earliest_task.c.earliest_date == date)
+                .options(
+                    joinedload(Dispatch.broker),
+                    joinedload(Dispatch.current_driver),
+                    joinedload(Dispatch.plan).joinedload(Task.location),
+                )
+            ).unique().all()
+
+            session.expunge_all()
+            return dispatches
+        finally:
+            session.close()
+
+    def get_booked(self, start_date: date, end_date: date, driver_id: Optional[UUID] = None) -> list[Dispatch]:
+        """
+        Retrieve the dispatches holding a driver with a task dated within a range.
+
+        Args:
+            start_date: First task date included
+            end_date: Last task date included
+            driver_id: Only the dispatches of this driver, when given
+        """
+        session = self.session_factory()
+
+        try:
+            dated = select(Task.dispatch_id).where(Task.date.between(start_date, end_date))
+            stmt = (
+                select(Dispatch)
+                .where(
+                    Dispatch.driver_id.isnot(None),
+                    Dispatch._status.in_(BOOKING_STATUSES),
+                    Dispatch.id.in_(dated),
+                )
+                .options(joinedload(Dispatch.current_driver), joinedload(Dispatch.plan))
+            )
+            if driver_id is not None:
+                stmt = stmt.where(Dispatch.driver_id == driver_id)
+
+            dispatches = session.scalars(stmt).unique().all()
+            session.expunge_all()
+            return dispatches
+        finally:
+            session.close()
+
+    def get_planned(self, start_date: date, end_date: date) -> list[Dispatch]:
+        """
+        Retrieve the dispatches not yet finished with a task dated within a range.
+
+        Args:
+            start_date: First task date included
+            end_date: Last task date included
+        """
+        session = self.session_factory()
+
+        try:
+            dated = select(Task.dispatch_id).where(Task.date.between(start_date, end_date))
+            dispatches = session.scalars(
+                select(Dispatch)
+                .where(Dispatch._status.in_(BOOKING_STATUSES), Dispatch.id.in_(dated))
+                .options(joinedload(Dispatch.broker), joinedload(Dispatch.plan).joinedload(Task.location))
+            ).unique().all()
+            session.expunge_all()
+            return dispatches
+        finally:
+            session.close()
+
+    def stream_history(self, start_date: date, end_date: date) -> Iterator[DispatchHistoryRecord]:
+        """
+        Stream the history of every dispatch with a task dated within a range.
+
+        Only plain columns are selected and the result is fetched with
+        `yield_per`, which makes the driver use a server-side cursor. Memory
+        use stays bounded by the batch size regardless of the range.
+        """
+        current_driver = aliased(Driver)
+        completed_by = aliased(Driver)
+
+        dispatches_in_range = select(Task.dispatch_id).where(
+            Task.date.between(start_date, end_date)
+        )
+
+        stmt = select(
+            Dispatch.reference,
+            Dispatch._status,
+            Broker.name,
+            _driver_name(current_driver),
+            Task.priority,
+            Task._status,
+            Task.instruction,
+            Location.name,
+            Task.date,
+            Task.appointment_type,
+            Task.appointment_start_time,
+            Task.appointment_end_time,
+            Task.container_number,
+            Task.container_size,
+            Task._check_in_datetime,
+            Task._check_out_datetime,
+            _driver_name(completed_by),
+        ).join(
+            Task, Task.dispatch_id == Dispatch.id
+        ).join(
+            Broker, Broker.id == Dispatch.broker_id
+        ).join(
+            Location, Location.id == Task.location_id
+        ).outerjoin(
+            current_driver, current_driver.id == Dispatch.driver_id
+        ).outerjoin(
+            completed_by, completed_by.id == Task.driver_id
+        ).where(
+            Dispatch.id.in_(dispatches_in_range)
+        ).order_by(
+            Dispatch.reference, Task.priority
+        ).execution_options(yield_per=HISTORY_BATCH_SIZE)
+
+        session = self.session_factory()
+
+        try:
+            for row in session.execute(stmt):
+                yield DispatchHistoryRecord(
+                    reference=row[0],
+                    dispatch_status=row[1].value,
+                    broker_name=row[2],
+                    current_driver_name=row[3],
+                    task_priority=row[4],
+                    task_status=row[5].value,
+                    instruction=row[6].value,
+                    location_name=row[7],
+                    date=row[8],
+                    appointment_type=row[9].value if row[9] else None,
+                    appointment_start_time=row[10],
+                    appointment_end_time=row[11],
+                    container_number=row[12],
+                    container_size=row[13].value if row[13] else None,
+                    check_in=row[14],
+                    check_out=row[15],
+                    completed_by=row[16],
+                )
+        finally:
+            session.close()
+
     def save(self, dispatch: Dispatch) -> None:
         """
         Save a dispatch to the repository.
@@ -96,16 +372,114 @@ class SQLAlchemyDispatchRepository(DispatchRepository):
         Args:
             dispatch: The Dispatch entity to save
         """
+        # The events stay on the dispatch until the save commits, so a failed save can be retried.
+        events = dispatch.peek_events()
+        durations = None
         session = self.session_factory()
 
         try:
             merged = session.merge(dispatch)
+            # Flushing first gives a new dispatch its reference before history and notifications read it.
+            session.flush()
+            if self.event_store:
+                self.event_store.append_in(session, merged, events)
+            if self.outbox:
+                self.outbox.add_in(session, StatusNotification.from_events(merged, events))
+            if self.container_inventory:
+                self.container_inventory.record_in(session, merged, events)
+            if self.chassis_inventory:
+                self.chassis_inventory.record_in(session, merged, events)
+            if self.task_durations:
+                durations = self.task_durations.record_in(session, merged, events)
             session.commit()
+            dispatch.pull_events()
             session.refresh(merged)
             session.expunge_all()
         finally:
             session.close()
 
+        if durations is not None:
+            # Sketches are shared across dispatches, so they are written outside the save's transaction.
+            self.task_durations.update_sketches(durations)
+
+        self.event_bus.publish(events)
+        # The merge cascades to the current driver, so its transitions were committed too.
+        self.event_bus.publish_from(dispatch.current_driver)
+
+    def save_many(self, dispatches: list[Dispatch]) -> None:
+        """
+        Insert many new dispatches and their plans in a single transaction.
+
+        References are reserved as one block before the insert, and the
+        dispatch and task rows are then written with bulk statements.
+
+        Args:
+            dispatches: The new Dispatch entities to insert
+        """
+        if not dispatches:
+            return
+
+        session = self.session_factory()
+
+        try:
+            references = self._allocate_references(session, len(dispatches))
+
+            bulk_insert(session, inspect(Dispatch).local_table, [
+                {
+                    'id': dispatch.id,
+                    'reference': reference,
+                    'status': dispatch.status,
+                    'broker_id': dispatch.broker.id,
+                    'driver_id': dispatch.current_driver.id if dispatch.current_driver else None,
+                }
+                for dispatch, reference in zip(dispatches, references)
+            ])
+            bulk_insert(session, inspect(Task).local_table, [
+                {
+                    'id': task.id,
+                    'dispatch_id': dispatch.id,
+                    'status': task.status,
+                    'priority': task.priority,
+                    'location_id': task.location.id,
+                    'instruction': task.instruction,
+                    'container_number': task.container.number if task.container else None,
+                    'container_size': task.container.size if task.container else None,
+                    'date': task.date,
+                    'appointment_type': task.appointment.appointment_type if task.appointment else None,
+                    'appointment_start_time': task.appointment.start_time if task.appointment else None,
+                    'appointment_end_time': task.appointment.end_time if task.appointment else None,
+                    'driver_id': task.completed_by.id if task.completed_by else None,
+                    'check_in': task._check_in_datetime,
+                    'check_out': task._check_out_datetime,
+                }
+                for dispatch in dispatches
+                for task in dispatch.plan
+            ])
+
+            for dispatch, reference in zip(dispatches, references):
+                dispatch.reference = reference
+
+            if self.event_store:
+                self.event_store.start_streams_in(session, dispatches)
+            session.commit()
+        finally:
+            session.close()
+
+        self.event_bus.publish_from(*dispatches)
+
+    def _allocate_references(self, session, count: int) -> list[int]:
+        """Reserve `count` dispatch references in a single round trip."""
+        reference = inspect(Dispatch).local_table.c.reference
+        sequence = reference.default
+
+        if session.get_bind().dialect.name == 'postgresql':
+            stmt = select(sequence.next_value()).select_from(func.generate_series(1, count))
+            return list(session.scalars(stmt))
+
+        # Backends without sequences continue from the highest reference in use.
+        first = session.scalar(select(func.coalesce(func.max(reference), sequence.start - 1))) + 1
+        return list(range(first, first + count))
+
     def delete(self, dispatch_id: UUID) -> None:
         """
         Delete a dispatch from the repository.
@@ -1,20 +1,59 @@
-from typing import Dict, Sequence
+from datetime import date
+from typing import Dict, Iterator, Optional, Sequence
 from uuid import UUID
 from logging import getLogger
 
+from src.application.common.event_bus import EventBus
+from src.application.dtos.export_dtos import DispatchHistoryRecord
+from src.application.dtos.notification_dtos import StatusNotification
+from src.application.repositories.chassis_inventory import ChassisInventory
+from src.application.repositories.container_inventory import ContainerInventory
+from src.application.repositories.dispatch_event_store import DispatchEventStore
+from src.application.repositories.notification_outbox import NotificationOutbox
+from src.application.repositories.task_duration_statistics import TaskDurationStatistics
 from src.application.repositories.dispatch_repository import DispatchRepository
 from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.booking import BOOKING_STATUSES
+from src.domain.aggregates.dispatch.value_objects import DispatchStatus, normalize_container_number
+from src.domain.aggregates.driver.aggregate import Driver
 from src.domain.exceptions import DispatchNotFoundError
 
 
 logger = getLogger(__name__)
 
+# Matches the start of dispatch_reference_seq in the database schema.
+FIRST_REFERENCE = 10000
+
+
+def _driver_name(driver: Driver) -> str | None:
+    if driver is None:
+        return None
+    return driver.nickname or f'{driver.first_name} {driver.last_name}'
+
 
 class InMemoryDispatchRepository(DispatchRepository):
     """In-memory implementation of DispatchRepository."""
 
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            event_bus: Optional[EventBus] = None,
+            event_store: Optional[DispatchEventStore] = None,
+            outbox: Optional[NotificationOutbox] = None,
+            container_inventory: Optional[ContainerInventory] = None,
+            chassis_inventory: Optional[ChassisInventory] = None,
+            task_durations: Optional[TaskDurationStatistics] = None,
+            ) -> None:
         self._dispatches: Dict[UUID, Dispatch] = {}
+        # Lookup indexes, kept up to date on every save and delete.
+        self._by_reference: Dict[int, UUID] = {}
+        self._by_container: Dict[str, set[UUID]] = {}
+        self._containers_of: Dict[UUID, set[str]] = {}
+        self.event_bus = event_bus or EventBus()
+        self.event_store = event_store
+        self.outbox = outbox
+        self.container_inventory = container_inventory
+        self.chassis_inventory = chassis_inventory
+        self.task_durations = task_durations
 
     def get(self, dispatch_id: UUID) -> Dispatch:
         """
@@ -42,6 +81,41 @@ class InMemoryDispatchRepository(DispatchRepository):
         """
         logger.debug(f"Saving dispatch {dispatch.id}")
         self._dispatches[dispatch.id] = dispatch
+        self._index(dispatch)
+
+        events = dispatch.peek_events()
+        if self.event_store:
+            self.event_store.append(dispatch, events)
+        if self.outbox:
+            self.outbox.add(StatusNotification.from_events(dispatch, events))
+        if self.container_inventory:
+            self.container_inventory.record(dispatch, events)
+        if self.chassis_inventory:
+            self.chassis_inventory.record(dispatch, events)
+        if self.task_durations:
+            self.task_durations.record(dispatch, events)
+        dispatch.pull_events()
+        self.event_bus.publish(events)
+        self.event_bus.publish_from(dispatch.current_driver)
+
+    def save_many(self, dispatches: list[Dispatch]) -> None:
+        """
+        Save many new dispatches, giving each the next free reference.
+
+        Args:
+            dispatches: The dispatches to save
+        """
+        logger.debug(f"Saving {len(dispatches)} dispatches")
+        references = [d.reference for d in self._dispatches.values() if d.reference is not None]
+        next_reference = max(references, default=FIRST_REFERENCE - 1) + 1
+
+        for offset, dispatch in enumerate(dispatches):
+            dispatch.reference = next_reference + offset
+            self._dispatches[dispatch.id] = dispatch
+            self._index(dispatch)
+            if self.event_store:
+                self.event_store.append(dispatch, [])
+        self.event_bus.publish_from(*dispatches)
 
     def delete(self, dispatch_id: UUID) -> None:
         """
@@ -50,7 +124,46 @@ class InMemoryDispatchRepository(DispatchRepository):
         Args:
             dispatch_id: The unique identifier of the dispatch to delete
         """
-        self._dispatches.pop(dispatch_id, None)
+        if dispatch := self._dispatches.pop(dispatch_id, None):
+            self._unindex(dispatch)
+
+    def get_by_reference(self, reference: int) -> Dispatch:
+        """
+        Retrieve a dispatch by its reference.
+
+        Raises:
+            DispatchNotFoundError: If no dispatch has the given reference
+        """
+        if (dispatch_id := self._by_reference.get(reference)) is not None:
+            return self._dispatches[dispatch_id]
+        raise DispatchNotFoundError(reference)
+
+    def get_by_container(self, container_number: str) -> list[Dispatch]:
+        """
+        Retrieve every dispatch with a task moving a container.
+        """
+        dispatch_ids = self._by_container.get(normalize_container_number(container_number), set())
+        return [self._dispatches[dispatch_id] for dispatch_id in dispatch_ids]
+
+    def _index(self, dispatch: Dispatch) -> None:
+        """Point the lookup indexes at a dispatch as it is now, forgetting what it was saved as before."""
+        self._unindex(dispatch)
+        if dispatch.reference is not None:
+            self._by_reference[dispatch.reference] = dispatch.id
+        containers = {
+            normalize_container_number(task.container.number) for task in dispatch.plan if task.container is not None
+        }
+        self._containers_of[dispatch.id] = containers
+        for container in containers:
+            self._by_container.setdefault(container, set()).add(dispatch.id)
+
+    def _unindex(self, dispatch: Dispatch) -> None:
+        if self._by_reference.get(dispatch.reference) == dispatch.id:
+            del self._by_reference[dispatch.reference]
+        for container in self._containers_of.pop(dispatch.id, set()):
+            self._by_container[container].discard(dispatch.id)
+            if not self._by_container[container]:
+                del self._by_container[container]
 
     def get_all(self) -> Sequence[Dispatch]:
         """
@@ -60,3 +173,85 @@ class InMemoryDispatchRepository(DispatchRepository):
             A sequence of all dispatchs
         """
         return [dispatch for dispatch in self._dispatches.values()]
+
+    def get_drafts_by_date(self, date: date) -> list[Dispatch]:
+        """
+        Get all draft dispatches whose earliest task falls on a date.
+        """
+        return [
+            dispatch for dispatch in self._dispatches.values()
+            if dispatch.status == DispatchStatus.DRAFT and min(task.date for task in dispatch.plan) == date
+        ]
+
+    def get_ids_by_date(self, date: date) -> list[UUID]:
+        """
+        Get the ID of every dispatch with a task dated on a date, whatever its status.
+        """
+        return [
+            dispatch.id for dispatch in self._dispatches.values()
+            if any(task.date == date for task in dispatch.plan)
+        ]
+
+    def get_in_progress(self) -> list[Dispatch]:
+        """
+        Get every dispatch in progress.
+        """
+        return [dispatch for dispatch in self._dispatches.values() if dispatch.status == DispatchStatus.IN_PROGRESS]
+
+    def get_booked(self, start_date: date, end_date: date, driver_id: Optional[UUID] = None) -> list[Dispatch]:
+        """
+        Get the dispatches holding a driver with a task dated within a range.
+        """
+        return [
+            dispatch for dispatch in self._dispatches.values()
+            if dispatch.current_driver is not None
+            and dispatch.status in BOOKING_STATUSES
+            and (driver_id is None or dispatch.current_driver.id == driver_id)
+            and any(start_date <= task.date <= end_date for task in dispatch.plan)
+        ]
+
+    def get_planned(self, start_date: date, end_date: date) -> list[Dispatch]:
+        """
+        Get the dispatches not yet finished with a task dated within a range.
+        """
+        return [
+            dispatch for dispatch in self._dispatches.values()
+            if dispatch.status in BOOKING_STATUSES
+            and any(start_date <= task.date <= end_date for task in dispatch.plan)
+        ]
+
+    def stream_history(self, start_date: date, end_date: date) -> Iterator[DispatchHistoryRecord]:
+        """
+        Stream the history of every dispatch with a task dated within a range.
+
+        Args:
+            start_date: First task date included in the export
+            end_date: Last task date included in the export
+        """
+        dispatches = [
+            dispatch for dispatch in self._dispatches.values()
+            if any(start_date <= task.date <= end_date for task in dispatch.plan)
+        ]
+        dispatches.sort(key=lambda dispatch: dispatch.reference or 0)
+
+        for dispatch in dispatches:
+            for task in dispatch.plan:
+                yield DispatchHistoryRecord(
+                    reference=dispatch.reference,
+                    dispatch_status=dispatch.status.value,
+                    broker_name=dispatch.broker.name,
+                    current_driver_name=_driver_name(dispatch.current_driver),
+                    task_priority=task.priority,
+                    task_status=task.status.value,
+                    instruction=task.instruction.value,
+                    location_name=task.location.name,
+                    date=task.date,
+                    appointment_type=task.appointment.appointment_type.value if task.appointment else None,
+                    appointment_start_time=task.appointment.start_time if task.appointment else None,
+                    appointment_end_time=task.appointment.end_time if task.appointment else None,
+                    container_number=task.container.number if task.container else None,
+                    container_size=task.container.size.value if task.container else None,
+                    check_in=task._check_in_datetime,
+                    check_out=task._check_out_datetime,
+                    completed_by=_driver_name(task.completed_by),
+                )
@@ -0,0 +1,190 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Table, func, insert, inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.application.repositories.dispatch_event_store import DispatchEventStore, SNAPSHOT_INTERVAL
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.history import DispatchState, replay
+from src.domain.common.events import DomainEvent
+from src.infrastructure.persistence.serialization import (
+    event_from_row,
+    event_to_row,
+    from_primitive,
+    to_primitive,
+)
+
+
+def _table(name: str) -> Table:
+    return inspect(Dispatch).local_table.metadata.tables[name]
+
+
+class SQLAlchemyDispatchEventStore(DispatchEventStore):
+    """
+    DispatchEventStore over the dispatch_events and dispatch_snapshots tables.
+
+    The dispatch repository writes history through append_in, inside the
+    transaction that saves the dispatch, so the history can never disagree
+    with the saved state. Event versions are part of the primary key, so
+    two writers appending to the same stream at once cannot both succeed.
+    """
+
+    def __init__(self, session_factory: sessionmaker, snapshot_interval: int = SNAPSHOT_INTERVAL):
+        self.session_factory = session_factory
+        self.snapshot_interval = snapshot_interval
+
+    def append(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Append the events a dispatch recorded since it was last saved, in a transaction of its own.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        session = self.session_factory()
+
+        try:
+            self.append_in(session, dispatch, events)
+            session.commit()
+        finally:
+            session.close()
+
+    def append_in(self, session: Session, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """Append events within the caller's transaction, without committing."""
+        event_table = _table('dispatch_events')
+        snapshot_table = _table('dispatch_snapshots')
+
+        version = session.scalar(
+            select(func.coalesce(func.max(event_table.c.version), 0))
+            .where(event_table.c.dispatch_id == dispatch.id)
+        )
+        if events:
+            session.execute(insert(event_table), [
+                {
+                    'dispatch_id': dispatch.id,
+                    'version': version + offset,
+                    'event_type': event_type,
+                    'payload': payload,
+                    'occurred_at': event.occurred_at,
+                }
+                for offset, event in enumerate(events, start=1)
+                for event_type, payload in [event_to_row(event)]
+            ])
+        version += len(events)
+
+        snapshot_version = session.scalar(
+            select(snapshot_table.c.version)
+            .where(snapshot_table.c.dispatch_id == dispatch.id)
+            .order_by(snapshot_table.c.id.desc())
+            .limit(1)
+        )
+        if not events or snapshot_version is None or version - snapshot_version >= self.snapshot_interval:
+            self._snapshot_in(session, [DispatchState.of(dispatch, version)])
+
+    def start_streams_in(self, session: Session, dispatches: list[Dispatch]) -> None:
+        """Snapshot many new dispatches within the caller's transaction, without committing."""
+        self._snapshot_in(session, [DispatchState.of(dispatch, 0) for dispatch in dispatches])
+
+    def _snapshot_in(self, session: Session, states: list[DispatchState]) -> None:
+        if not states:
+            return
+        taken_at = datetime.now()
+        session.execute(insert(_table('dispatch_snapshots')), [
+            {
+                'dispatch_id': state.dispatch_id,
+                'version': state.version,
+                'taken_at': taken_at,
+                'state': to_primitive(state),
+            }
+            for state in states
+        ])
+
+    def get_stream(self, dispatch_id: UUID, after_version: int = 0) -> list[DomainEvent]:
+        """
+        Retrieve the events of one dispatch in the order they were recorded.
+
+        Args:
+            dispatch_id: The unique identifier of the dispatch
+            after_version: Only return events after this many
+        """
+        event_table = _table('dispatch_events')
+        session = self.session_factory()
+
+        try:
+            rows = session.execute(
+                select(event_table.c.event_type, event_table.c.payload)
+                .where(event_table.c.dispatch_id == dispatch_id, event_table.c.version > after_version)
+                .order_by(event_table.c.version)
+            ).all()
+            return [event_from_row(row.event_type, row.payload) for row in rows]
+        finally:
+            session.close()
+
+    def load(self, dispatch_id: UUID, as_of: Optional[datetime] = None) -> Optional[DispatchState]:
+        """
+        Rebuild the state of a dispatch from its latest snapshot at `as_of`.
+
+        Args:
+            dispatch_id: The unique identifier of the dispatch
+            as_of: The moment to read the state at; now when None
+        """
+        states = self.load_many([dispatch_id], as_of)
+        return states[0] if states else None
+
+    def load_many(self, dispatch_ids: list[UUID], as_of: Optional[datetime] = None) -> list[DispatchState]:
+        """
+        Rebuild the state of many dispatches in two queries.
+
+        The first query finds the latest snapshot of each dispatch taken by
+        `as_of`, and the second the events recorded after each of those
+        snapshots, so no stream is read further back than its last snapshot.
+        """
+        if not dispatch_ids:
+            return []
+
+        event_table = _table('dispatch_events')
+        snapshot_table = _table('dispatch_snapshots')
+        session = self.session_factory()
+
+        try:
+            # Snapshot ids grow with taken_at, so the largest id is the latest snapshot.
+            latest = (
+                select(func.max(snapshot_table.c.id).label('id'))
+                .where(snapshot_table.c.dispatch_id.in_(dispatch_ids))
+                .group_by(snapshot_table.c.dispatch_id)
+            )
+            if as_of is not None:
+                latest = latest.where(snapshot_table.c.taken_at <= as_of)
+            latest = latest.subquery()
+            snapshots = (
+                select(snapshot_table.c.dispatch_id, snapshot_table.c.version, snapshot_table.c.state)
+                .join(latest, snapshot_table.c.id == latest.c.id)
+            ).subquery()
+
+            states = {
+                row.dispatch_id: from_primitive(DispatchState, row.state)
+                for row in session.execute(select(snapshots)).all()
+            }
+
+            events = (
+                select(event_table.c.dispatch_id, event_table.c.event_type, event_table.c.payload)
+                .join(snapshots, (event_table.c.dispatch_id == snapshots.c.dispatch_id)
+                      & (event_table.c.version > snapshots.c.version))
+                .order_by(event_table.c.dispatch_id, event_table.c.version)
+            )
+            if as_of is not None:
+                events = events.where(event_table.c.occurred_at <= as_of)
+
+            later = {}
+            for row in session.execute(events).all():
+                later.setdefault(row.dispatch_id, []).append(event_from_row(row.event_type, row.payload))
+        finally:
+            session.close()
+
+        return [
+            replay(states[dispatch_id], later.get(dispatch_id, ()))
+            for dispatch_id in dispatch_ids
+            if dispatch_id in states
+        ]
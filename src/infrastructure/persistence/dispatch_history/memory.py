@@ -0,0 +1,79 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime
+from itertools import takewhile
+from logging import getLogger
+from typing import Optional
+from uuid import UUID
+
+from src.application.repositories.dispatch_event_store import DispatchEventStore, SNAPSHOT_INTERVAL
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.history import DispatchState, replay
+from src.domain.common.events import DomainEvent
+
+
+logger = getLogger(__name__)
+
+
+class InMemoryDispatchEventStore(DispatchEventStore):
+    """In-memory implementation of DispatchEventStore."""
+
+    def __init__(self, snapshot_interval: int = SNAPSHOT_INTERVAL) -> None:
+        self.snapshot_interval = snapshot_interval
+        self._streams: dict[UUID, list[DomainEvent]] = defaultdict(list)
+        # Per dispatch, (taken_at, state) pairs in the order they were taken.
+        self._snapshots: dict[UUID, list[tuple[datetime, DispatchState]]] = defaultdict(list)
+
+    def append(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Append the events a dispatch recorded since it was last saved.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        logger.debug(f"Appending {len(events)} events for dispatch {dispatch.id}")
+        stream = self._streams[dispatch.id]
+        stream.extend(events)
+
+        snapshots = self._snapshots[dispatch.id]
+        if not events or not snapshots or len(stream) - snapshots[-1][1].version >= self.snapshot_interval:
+            snapshots.append((datetime.now(), DispatchState.of(dispatch, len(stream))))
+
+    def get_stream(self, dispatch_id: UUID, after_version: int = 0) -> list[DomainEvent]:
+        """
+        Retrieve the events of one dispatch in the order they were recorded.
+
+        Args:
+            dispatch_id: The unique identifier of the dispatch
+            after_version: Only return events after this many
+        """
+        return list(self._streams.get(dispatch_id, [])[after_version:])
+
+    def load(self, dispatch_id: UUID, as_of: Optional[datetime] = None) -> Optional[DispatchState]:
+        """
+        Rebuild the state of a dispatch from its latest snapshot at `as_of`.
+
+        Args:
+            dispatch_id: The unique identifier of the dispatch
+            as_of: The moment to read the state at; now when None
+        """
+        snapshots = self._snapshots.get(dispatch_id)
+        if not snapshots:
+            return None
+
+        if as_of is None:
+            _, state = snapshots[-1]
+            return replay(state, self._streams[dispatch_id][state.version:])
+
+        position = bisect_right(snapshots, as_of, key=lambda snapshot: snapshot[0])
+        if position == 0:
+            return None
+        _, state = snapshots[position - 1]
+        later = self._streams[dispatch_id][state.version:]
+        return replay(state, takewhile(lambda event: event.occurred_at <= as_of, later))
+
+    def load_many(self, dispatch_ids: list[UUID], as_of: Optional[datetime] = None) -> list[DispatchState]:
+        """Rebuild the state of many dispatches at once."""
+        states = (self.load(dispatch_id, as_of) for dispatch_id in dispatch_ids)
+        return [state for state in states if state is not None]
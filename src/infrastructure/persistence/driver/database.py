@@ -1,18 +1,33 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import inspect, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
+from src.application.common.event_bus import EventBus
 from src.domain.aggregates.driver.aggregate import Driver
 from src.domain.aggregates.driver.value_objects import DriverStatus
 from src.domain.exceptions import DriverNotFoundError
 from src.application.repositories.driver_repository import DriverRepository
+from src.infrastructure.persistence.bulk import bulk_insert
+from src.infrastructure.persistence.integrity import unique_violation
+from src.infrastructure.persistence.search import typeahead
+
+
+# Nicknames matched per query when looking up many drivers at once.
+LOOKUP_BATCH_SIZE = 1000
+
+# Messages for the unique constraints declared on the drivers table.
+UNIQUE_VIOLATIONS = {
+    'uq_drivers_nickname': 'A driver with that nickname already exists.',
+}
 
 
 class SQLAlchemyDriverRepository(DriverRepository):
-    def __init__(self, session_factory: sessionmaker):
+    def __init__(self, session_factory: sessionmaker, event_bus: Optional[EventBus] = None):
         self.session_factory = session_factory
+        self.event_bus = event_bus or EventBus()
 
     def get(self, driver_id: UUID) -> Driver:
         """
@@ -36,15 +51,35 @@ class SQLAlchemyDriverRepository(DriverRepository):
         finally:
             session.close()
 
-    def get_by_nickname(self, nickname: str) -> Driver:
+    def get_many(self, driver_ids: list[UUID]) -> list[Driver]:
+        """
+        Retrieve every driver with one of the given IDs.
+        """
         session = self.session_factory()
+
         try:
-            stmt = select(Driver).where(Driver.nickname == nickname)
+            drivers = session.scalars(select(Driver).where(Driver.id.in_(driver_ids))).all()
+            session.expunge_all()
+            return drivers
+        finally:
+            session.close()
 
-            if driver := session.scalars(stmt).first():
-                session.expunge(driver)
-            return driver
+    def get_by_nicknames(self, nicknames: list[str]) -> list[Driver]:
+        """
+        Retrieve every driver whose nickname is in the given list.
+        """
+        session = self.session_factory()
+
+        try:
+            drivers = []
+            for start in range(0, len(nicknames), LOOKUP_BATCH_SIZE):
+                stmt = select(Driver).where(
+                    Driver.nickname.in_(nicknames[start:start + LOOKUP_BATCH_SIZE])
+                )
+                drivers.extend(session.scalars(stmt).all())
 
+            session.expunge_all()
+            return drivers
         finally:
             session.close()
 
@@ -77,6 +112,27 @@ class SQLAlchemyDriverRepository(DriverRepository):
         finally:
             session.close()
 
+    def search(self, query: str, limit: int) -> list[tuple[Driver, float]]:
+        """
+        Search the drivers who have not been deactivated by first name, last name or nickname.
+
+        Returns:
+            (Driver, score) pairs, best match first
+        """
+        session = self.session_factory()
+
+        try:
+            return typeahead(
+                session,
+                Driver,
+                [Driver.first_name.concat(' ').concat(Driver.last_name), Driver.nickname],
+                Driver._status != DriverStatus.DEACTIVATED,
+                query,
+                limit,
+            )
+        finally:
+            session.close()
+
     def save(self, driver: Driver) -> None:
         """
         Save a driver to the repository.
@@ -90,9 +146,15 @@ class SQLAlchemyDriverRepository(DriverRepository):
             session.commit()
             session.refresh(driver)
             session.expunge(driver)
+        except IntegrityError as e:
+            if violation := unique_violation(e, inspect(Driver).local_table, UNIQUE_VIOLATIONS):
+                raise violation from e
+            raise
         finally:
             session.close()
 
+        self.event_bus.publish_from(driver)
+
     def delete(self, driver_id: UUID) -> None:
         """
         Delete a driver from the repository.
@@ -107,4 +169,32 @@ class SQLAlchemyDriverRepository(DriverRepository):
             session.delete(driver)
             session.commit()
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+
+    def add_many(self, drivers: list[Driver]) -> None:
+        """
+        Insert many new drivers in a single transaction.
+
+        Args:
+            drivers: The new Driver entities to insert
+        """
+        session = self.session_factory()
+
+        try:
+            bulk_insert(session, inspect(Driver).local_table, [
+                {
+                    'id': driver.id,
+                    'status': driver.status,
+                    'first_name': driver.first_name,
+                    'last_name': driver.last_name,
+                    'nickname': driver.nickname,
+                }
+                for driver in drivers
+            ])
+            session.commit()
+        except IntegrityError as e:
+            if violation := unique_violation(e, inspect(Driver).local_table, UNIQUE_VIOLATIONS):
+                raise violation from e
+            raise
+        finally:
+            session.close()
@@ -1,10 +1,14 @@
-from typing import Dict, Sequence
+from copy import copy
+from typing import Dict, Optional, Sequence
 from uuid import UUID
 from logging import getLogger
 
+from src.application.common.event_bus import EventBus
 from src.application.repositories.driver_repository import DriverRepository
 from src.domain.aggregates.driver.aggregate import Driver
-from src.domain.exceptions import DriverNotFoundError
+from src.domain.aggregates.driver.value_objects import DriverStatus
+from src.domain.exceptions import BusinessRuleViolation, DriverNotFoundError
+from src.infrastructure.persistence.search import NgramIndex
 
 
 logger = getLogger(__name__)
@@ -13,8 +17,10 @@ logger = getLogger(__name__)
 class InMemoryDriverRepository(DriverRepository):
     """In-memory implementation of DriverRepository."""
 
-    def __init__(self) -> None:
+    def __init__(self, event_bus: Optional[EventBus] = None) -> None:
         self._drivers: Dict[UUID, Driver] = {}
+        self._search = NgramIndex()
+        self.event_bus = event_bus or EventBus()
 
     def get(self, driver_id: UUID) -> Driver:
         """
@@ -30,9 +36,21 @@ class InMemoryDriverRepository(DriverRepository):
             DriverNotFoundError: If no driver exists with the given ID
         """
         if driver := self._drivers.get(driver_id):
-            return driver
+            return copy(driver)
         raise DriverNotFoundError(driver_id)
 
+    def get_many(self, driver_ids: list[UUID]) -> list[Driver]:
+        """
+        Retrieve every driver with one of the given IDs.
+
+        Args:
+            driver_ids: The unique identifiers of the drivers
+
+        Returns:
+            The drivers that exist
+        """
+        return [copy(self._drivers[driver_id]) for driver_id in set(driver_ids) if driver_id in self._drivers]
+
     def save(self, driver: Driver) -> None:
         """
         Save a driver.
@@ -40,8 +58,13 @@ class InMemoryDriverRepository(DriverRepository):
         Args:
             driver: The driver to save
         """
+        others = [other for other in self._drivers.values() if other.id != driver.id]
+        self._check_unique([driver], others)
+
         logger.debug(f"Saving driver {driver.id}")
-        self._drivers[driver.id] = driver
+        self._drivers[driver.id] = copy(driver)
+        self._index(driver)
+        self.event_bus.publish_from(driver)
 
     def delete(self, driver_id: UUID) -> None:
         """
@@ -51,6 +74,7 @@ class InMemoryDriverRepository(DriverRepository):
             driver_id: The unique identifier of the driver to delete
         """
         self._drivers.pop(driver_id, None)
+        self._search.remove(driver_id)
 
     def get_all(self) -> Sequence[Driver]:
         """
@@ -59,4 +83,54 @@ class InMemoryDriverRepository(DriverRepository):
         Returns:
             A sequence of all drivers
         """
-        return [driver for driver in self._drivers.values()]
+        return [copy(driver) for driver in self._drivers.values()]
+
+    def get_by_nicknames(self, nicknames: list[str]) -> list[Driver]:
+        """
+        Get every driver whose nickname is in the given list.
+
+        Returns:
+            The matching drivers
+        """
+        wanted = set(nicknames)
+        return [copy(driver) for driver in self._drivers.values() if driver.nickname in wanted]
+
+    def add_many(self, drivers: list[Driver]) -> None:
+        """
+        Save many new drivers.
+
+        Args:
+            drivers: The drivers to save
+        """
+        self._check_unique(drivers, list(self._drivers.values()))
+
+        logger.debug(f"Saving {len(drivers)} drivers")
+        self._drivers.update((driver.id, copy(driver)) for driver in drivers)
+        for driver in drivers:
+            self._index(driver)
+
+    def search(self, query: str, limit: int) -> list[tuple[Driver, float]]:
+        """
+        Search the drivers who have not been deactivated by first name, last name or nickname.
+
+        Returns:
+            (Driver, score) pairs, best match first
+        """
+        return [(copy(self._drivers[driver_id]), score) for driver_id, score in self._search.search(query, limit)]
+
+    def _index(self, driver: Driver) -> None:
+        """Keep the search index to the drivers who have not been deactivated."""
+        if driver.status != DriverStatus.DEACTIVATED:
+            self._search.put(driver.id, (f'{driver.first_name} {driver.last_name}', driver.nickname))
+        else:
+            self._search.remove(driver.id)
+
+    def _check_unique(self, drivers: list[Driver], others: list[Driver]) -> None:
+        """Enforce the unique nicknames the database schema declares."""
+        nicknames = {other.nickname for other in others if other.nickname}
+
+        for driver in drivers:
+            if driver.nickname and driver.nickname in nicknames:
+                raise BusinessRuleViolation('A driver with that nickname already exists.')
+            if driver.nickname:
+                nicknames.add(driver.nickname)
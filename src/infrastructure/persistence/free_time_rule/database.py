@@ -0,0 +1,54 @@
+from sqlalchemy import Table, delete, insert, inspect, select
+from sqlalchemy.orm import sessionmaker
+
+from src.application.repositories.free_time_rule_repository import FreeTimeRuleRepository
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.clocks import FreeTimeRule
+
+
+def _table() -> Table:
+    return inspect(Dispatch).local_table.metadata.tables['free_time_rules']
+
+
+class SQLAlchemyFreeTimeRuleRepository(FreeTimeRuleRepository):
+    """FreeTimeRuleRepository over the free_time_rules table."""
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def get_all(self) -> list[FreeTimeRule]:
+        """Retrieve every free-time rule."""
+        rules = _table()
+        session = self.session_factory()
+
+        try:
+            rows = session.execute(select(rules)).all()
+            return [
+                FreeTimeRule(row.clock, row.free_minutes, row.warning_minutes, row.broker_id, row.location_id)
+                for row in rows
+            ]
+        finally:
+            session.close()
+
+    def save(self, rule: FreeTimeRule) -> None:
+        """Save a free-time rule, replacing the one with the same scope."""
+        rules = _table()
+        session = self.session_factory()
+
+        try:
+            # A rule for every broker or location leaves its column NULL, which a unique key would not compare.
+            session.execute(delete(rules).where(
+                rules.c.clock == rule.clock,
+                rules.c.broker_id.is_(None) if rule.broker_id is None else rules.c.broker_id == rule.broker_id,
+                rules.c.location_id.is_(None) if rule.location_id is None else rules.c.location_id == rule.location_id,
+            ))
+            session.execute(insert(rules).values(
+                clock=rule.clock,
+                broker_id=rule.broker_id,
+                location_id=rule.location_id,
+                free_minutes=rule.free_minutes,
+                warning_minutes=rule.warning_minutes,
+            ))
+            session.commit()
+        finally:
+            session.close()
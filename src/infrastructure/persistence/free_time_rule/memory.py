@@ -0,0 +1,17 @@
+from src.application.repositories.free_time_rule_repository import FreeTimeRuleRepository
+from src.domain.aggregates.dispatch.clocks import FreeTimeRule
+
+
+class InMemoryFreeTimeRuleRepository(FreeTimeRuleRepository):
+    """In-memory implementation of FreeTimeRuleRepository."""
+
+    def __init__(self) -> None:
+        self._rules: dict[tuple, FreeTimeRule] = {}
+
+    def get_all(self) -> list[FreeTimeRule]:
+        """Retrieve every free-time rule."""
+        return list(self._rules.values())
+
+    def save(self, rule: FreeTimeRule) -> None:
+        """Save a free-time rule, replacing the one with the same scope."""
+        self._rules[rule.scope] = rule
@@ -0,0 +1,45 @@
+"""
+Translation of database constraint failures into domain errors.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Table, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.exceptions import BusinessRuleViolation
+
+
+def _violated_constraint(error: IntegrityError, table: Table) -> Optional[str]:
+    """Name of the unique constraint on `table` that the error reports, if any."""
+    # PostgreSQL reports the constraint by name.
+    diag = getattr(error.orig, 'diag', None)
+    if name := getattr(diag, 'constraint_name', None):
+        return name
+
+    # SQLite lists the columns instead: "UNIQUE constraint failed: t.a, t.b".
+    message = str(error.orig)
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            columns = ', '.join(f'{table.name}.{column.name}' for column in constraint.columns)
+            if message.endswith(columns):
+                return constraint.name
+    return None
+
+
+def unique_violation(error: IntegrityError, table: Table, messages: dict[str, str]) -> Optional[BusinessRuleViolation]:
+    """
+    Turn a unique constraint failure into a business rule violation.
+
+    Args:
+        error: The error raised while flushing or committing
+        table: The table that was written to
+        messages: Violation message for each unique constraint name
+
+    Returns:
+        The violation to raise, or None when the error is not one of the
+        given unique constraints and should propagate unchanged
+    """
+    if message := messages.get(_violated_constraint(error, table)):
+        return BusinessRuleViolation(message)
+    return None
@@ -1,7 +1,7 @@
-from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import inspect, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from src.domain.aggregates.location.aggregate import Location
@@ -9,6 +9,19 @@ from src.domain.aggregates.location.value_objects import LocationStatus
 from src.domain.aggregates.location.value_objects import Address
 from src.domain.exceptions import LocationNotFoundError
 from src.application.repositories.location_repository import LocationRepository
+from src.infrastructure.persistence.bulk import bulk_insert
+from src.infrastructure.persistence.integrity import unique_violation
+from src.infrastructure.persistence.search import typeahead
+
+
+# Names and addresses matched per query when looking up many locations at once.
+LOOKUP_BATCH_SIZE = 1000
+
+# Messages for the unique constraints declared on the locations table.
+UNIQUE_VIOLATIONS = {
+    'uq_locations_name': 'A location with that name already exists.',
+    'uq_locations_address': 'A location with that address already exists.',
+}
 
 
 class SQLAlchemyLocationRepository(LocationRepository):
@@ -38,55 +51,46 @@ class SQLAlchemyLocationRepository(LocationRepository):
         finally:
             session.close()
 
-    def get_by_name(self, location_name: str, location_id: Optional[UUID] = None) -> Location:
+    def get_many(self, location_ids: list[UUID]) -> list[Location]:
+        """
+        Retrieve every location with one of the given IDs.
+        """
         session = self.session_factory()
 
         try:
-            if location_id:
-                stmt = select(Location).where(and_(
-                    Location.id != location_id,
-                    Location.name == location_name
-                    )
-                )
-            else:
-                stmt = select(Location).where(Location.name == location_name)
-
-            if location := session.scalars(stmt).first():
-                session.expunge(location)
-            return location
-
+            locations = session.scalars(select(Location).where(Location.id.in_(location_ids))).all()
+            session.expunge_all()
+            return locations
         finally:
             session.close()
 
-    def get_by_address(self, address: Address, location_id: Optional[UUID] = None) -> Location:
+    def get_by_names_or_addresses(self, names: list[str], addresses: list[Address]) -> list[Location]:
+        """
+        Retrieve every location matching any of the given names or addresses.
+        """
         session = self.session_factory()
+        address_columns = tuple_(
+            Location.street_address, Location.city, Location.state, Location.zipcode
+        )
+        keys = [(a.street_address, a.city, a.state, a.zipcode) for a in addresses]
 
         try:
-            if location_id:
-                stmt = select(Location).where(and_(
-                    Location.id != location_id,
-                    Location.street_address == address.street_address,
-                    Location.city == address.city,
-                    Location.state == address.state,
-                    Location.zipcode == address.zipcode,
-                    )
-                )
-            else:
-                stmt = select(Location).where(and_(
-                        Location.street_address == address.street_address,
-                        Location.city == address.city,
-                        Location.state == address.state,
-                        Location.zipcode == address.zipcode,
+            locations = []
+            for start in range(0, max(len(names), len(keys)), LOOKUP_BATCH_SIZE):
+                name_batch = names[start:start + LOOKUP_BATCH_SIZE]
+                key_batch = keys[start:start + LOOKUP_BATCH_SIZE]
+                stmt = select(Location).where(or_(
+                    Location.name.in_(name_batch),
+                    address_columns.in_(key_batch),
                     )
                 )
-            if location := session.scalars(stmt).first():
-                session.expunge(location)
-            return location
+                locations.extend(session.scalars(stmt).all())
 
+            session.expunge_all()
+            return list({location.id: location for location in locations}.values())
         finally:
             session.close()
 
-
     def get_all(self) -> list[Location]:
         """
         Retrieve all locations.
@@ -117,6 +121,27 @@ class SQLAlchemyLocationRepository(LocationRepository):
         finally:
             session.close()
 
+    def search(self, query: str, limit: int) -> list[tuple[Location, float]]:
+        """
+        Search the active locations by name, street address or city.
+
+        Returns:
+            (Location, score) pairs, best match first
+        """
+        session = self.session_factory()
+
+        try:
+            return typeahead(
+                session,
+                Location,
+                [Location.name, Location.street_address, Location.city],
+                Location._status == LocationStatus.ACTIVE,
+                query,
+                limit,
+            )
+        finally:
+            session.close()
+
     def save(self, location: Location) -> None:
         """
         Save a location to the repository.
@@ -131,6 +156,10 @@ class SQLAlchemyLocationRepository(LocationRepository):
             session.commit()
             session.refresh(location)
             session.expunge(location)
+        except IntegrityError as e:
+            if violation := unique_violation(e, inspect(Location).local_table, UNIQUE_VIOLATIONS):
+                raise violation from e
+            raise
         finally:
             session.close()
 
@@ -149,3 +178,33 @@ class SQLAlchemyLocationRepository(LocationRepository):
             session.commit()
         finally:
             session.close()
+
+    def add_many(self, locations: list[Location]) -> None:
+        """
+        Insert many new locations in a single transaction.
+
+        Args:
+            locations: The new Location entities to insert
+        """
+        session = self.session_factory()
+
+        try:
+            bulk_insert(session, inspect(Location).local_table, [
+                {
+                    'id': location.id,
+                    'status': location.status,
+                    'name': location.name,
+                    'street_address': location.address.street_address,
+                    'city': location.address.city,
+                    'state': location.address.state,
+                    'zipcode': location.address.zipcode,
+                }
+                for location in locations
+            ])
+            session.commit()
+        except IntegrityError as e:
+            if violation := unique_violation(e, inspect(Location).local_table, UNIQUE_VIOLATIONS):
+                raise violation from e
+            raise
+        finally:
+            session.close()
@@ -1,20 +1,28 @@
+from copy import copy
 from typing import Dict, Sequence
 from uuid import UUID
 from logging import getLogger
 
 from src.application.repositories.location_repository import LocationRepository
 from src.domain.aggregates.location.aggregate import Location
-from src.domain.exceptions import LocationNotFoundError
+from src.domain.aggregates.location.value_objects import Address, LocationStatus
+from src.domain.exceptions import BusinessRuleViolation, LocationNotFoundError
+from src.infrastructure.persistence.search import NgramIndex
 
 
 logger = getLogger(__name__)
 
 
+def _address_key(address: Address) -> tuple:
+    return (address.street_address, address.city, address.state, address.zipcode)
+
+
 class InMemoryLocationRepository(LocationRepository):
     """In-memory implementation of LocationRepository."""
 
     def __init__(self) -> None:
         self._locations: Dict[UUID, Location] = {}
+        self._search = NgramIndex()
 
     def get(self, location_id: UUID) -> Location:
         """
@@ -30,9 +38,21 @@ class InMemoryLocationRepository(LocationRepository):
             LocationNotFoundError: If no location exists with the given ID
         """
         if location := self._locations.get(location_id):
-            return location
+            return copy(location)
         raise LocationNotFoundError(location_id)
     
+    def get_many(self, location_ids: list[UUID]) -> list[Location]:
+        """
+        Retrieve every location with one of the given IDs.
+
+        Args:
+            location_ids: The unique identifiers of the locations
+
+        Returns:
+            The locations that exist
+        """
+        return [copy(self._locations[location_id]) for location_id in set(location_ids) if location_id in self._locations]
+
     def save(self, location: Location) -> None:
         """
         Save a location.
@@ -40,8 +60,12 @@ class InMemoryLocationRepository(LocationRepository):
         Args:
             location: The location to save
         """
+        others = [other for other in self._locations.values() if other.id != location.id]
+        self._check_unique([location], others)
+
         logger.debug(f"Saving location {location.id}")
-        self._locations[location.id] = location
+        self._locations[location.id] = copy(location)
+        self._index(location)
 
     def delete(self, location_id: UUID) -> None:
         """
@@ -51,6 +75,7 @@ class InMemoryLocationRepository(LocationRepository):
             location_id: The unique identifier of the location to delete
         """
         self._locations.pop(location_id, None)
+        self._search.remove(location_id)
 
     def get_all(self) -> Sequence[Location]:
         """
@@ -59,4 +84,67 @@ class InMemoryLocationRepository(LocationRepository):
         Returns:
             A sequence of all locations
         """
-        return [location for location in self._locations.values()]
+        return [copy(location) for location in self._locations.values()]
+
+    def get_active(self) -> list[Location]:
+        """
+        Get all active locations.
+        """
+        return [copy(location) for location in self._locations.values() if location.status == LocationStatus.ACTIVE]
+
+    def get_by_names_or_addresses(self, names: list[str], addresses: list[Address]) -> list[Location]:
+        """
+        Get every location matching any of the given names or addresses.
+
+        Returns:
+            The matching locations
+        """
+        wanted_names = set(names)
+        wanted_addresses = {_address_key(address) for address in addresses}
+        return [
+            copy(location) for location in self._locations.values()
+            if location.name in wanted_names or _address_key(location.address) in wanted_addresses
+        ]
+
+    def add_many(self, locations: list[Location]) -> None:
+        """
+        Save many new locations.
+
+        Args:
+            locations: The locations to save
+        """
+        self._check_unique(locations, list(self._locations.values()))
+
+        logger.debug(f"Saving {len(locations)} locations")
+        self._locations.update((location.id, copy(location)) for location in locations)
+        for location in locations:
+            self._index(location)
+
+    def search(self, query: str, limit: int) -> list[tuple[Location, float]]:
+        """
+        Search the active locations by name, street address or city.
+
+        Returns:
+            (Location, score) pairs, best match first
+        """
+        return [(copy(self._locations[location_id]), score) for location_id, score in self._search.search(query, limit)]
+
+    def _index(self, location: Location) -> None:
+        """Keep the search index to the active locations."""
+        if location.status == LocationStatus.ACTIVE:
+            self._search.put(location.id, (location.name, location.address.street_address, location.address.city))
+        else:
+            self._search.remove(location.id)
+
+    def _check_unique(self, locations: list[Location], others: list[Location]) -> None:
+        """Enforce the unique names and addresses the database schema declares."""
+        names = {other.name for other in others}
+        addresses = {_address_key(other.address) for other in others}
+
+        for location in locations:
+            if location.name in names:
+                raise BusinessRuleViolation('A location with that name already exists.')
+            if _address_key(location.address) in addresses:
+                raise BusinessRuleViolation('A location with that address already exists.')
+            names.add(location.name)
+            addresses.add(_address_key(location.address))
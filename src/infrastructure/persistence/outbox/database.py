@@ -0,0 +1,116 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Table, exists, insert, inspect, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.application.dtos.notification_dtos import OutboxMessage, StatusNotification
+from src.application.repositories.notification_outbox import NotificationOutbox
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.infrastructure.persistence.serialization import from_primitive, to_primitive
+
+
+def _table() -> Table:
+    return inspect(Dispatch).local_table.metadata.tables['notification_outbox']
+
+
+class SQLAlchemyNotificationOutbox(NotificationOutbox):
+    """
+    NotificationOutbox over the notification_outbox table.
+
+    The dispatch repository adds notifications through add_in, inside the
+    transaction that saves the dispatch. Messages are expected to be read
+    by a single relay at a time.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def add(self, notifications: list[StatusNotification]) -> None:
+        """Add notifications, in order, in a transaction of their own."""
+        session = self.session_factory()
+
+        try:
+            self.add_in(session, notifications)
+            session.commit()
+        finally:
+            session.close()
+
+    def add_in(self, session: Session, notifications: list[StatusNotification]) -> None:
+        """Add notifications within the caller's transaction, without committing."""
+        if not notifications:
+            return
+        now = datetime.now()
+        session.execute(insert(_table()), [
+            {
+                'dispatch_id': notification.dispatch_id,
+                'payload': to_primitive(notification),
+                'created_at': now,
+                'attempts': 0,
+                'next_attempt_at': now,
+            }
+            for notification in notifications
+        ])
+
+    def due(self, limit: int, now: datetime) -> list[OutboxMessage]:
+        """Retrieve pending messages ready to be delivered, in order for each dispatch."""
+        outbox = _table()
+        earlier = outbox.alias('earlier')
+        pending = lambda table: table.c.delivered_at.is_(None) & table.c.abandoned_at.is_(None)
+
+        session = self.session_factory()
+
+        try:
+            rows = session.execute(
+                select(outbox.c.id, outbox.c.payload, outbox.c.attempts)
+                .where(pending(outbox), outbox.c.next_attempt_at <= now)
+                .where(~exists().where(
+                    earlier.c.dispatch_id == outbox.c.dispatch_id,
+                    earlier.c.id < outbox.c.id,
+                    pending(earlier),
+                    earlier.c.next_attempt_at > now,
+                ))
+                .order_by(outbox.c.id)
+                .limit(limit)
+            ).all()
+        finally:
+            session.close()
+
+        return [
+            OutboxMessage(
+                id=row.id,
+                notification=from_primitive(StatusNotification, row.payload),
+                attempts=row.attempts,
+            )
+            for row in rows
+        ]
+
+    def mark_delivered(self, message_ids: list[int]) -> None:
+        """Record that messages were delivered."""
+        outbox = _table()
+        session = self.session_factory()
+
+        try:
+            session.execute(
+                update(outbox).where(outbox.c.id.in_(message_ids)).values(delivered_at=datetime.now())
+            )
+            session.commit()
+        finally:
+            session.close()
+
+    def mark_failed(self, message_ids: list[int], error: str, retry_at: Optional[datetime]) -> None:
+        """Record a failed delivery of messages."""
+        outbox = _table()
+        values = {'attempts': outbox.c.attempts + 1, 'last_error': error}
+        if retry_at is None:
+            values['abandoned_at'] = datetime.now()
+        else:
+            values['next_attempt_at'] = retry_at
+
+        session = self.session_factory()
+
+        try:
+            session.execute(update(outbox).where(outbox.c.id.in_(message_ids)).values(**values))
+            session.commit()
+        finally:
+            session.close()
@@ -0,0 +1,77 @@
+from datetime import datetime
+from itertools import count
+from logging import getLogger
+import threading
+from typing import Optional
+
+from src.application.dtos.notification_dtos import OutboxMessage, StatusNotification
+from src.application.repositories.notification_outbox import NotificationOutbox
+
+
+logger = getLogger(__name__)
+
+
+class InMemoryNotificationOutbox(NotificationOutbox):
+    """
+    In-memory implementation of NotificationOutbox.
+
+    Saves add messages from request threads while the relay thread reads and
+    marks them, so every method holds the same lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ids = count(1)
+        # Pending messages by id; dicts keep insertion order, which is the delivery order.
+        self._pending: dict[int, OutboxMessage] = {}
+        self._retry_at: dict[int, datetime] = {}
+        self.delivered: list[OutboxMessage] = []
+        self.abandoned: list[OutboxMessage] = []
+
+    def add(self, notifications: list[StatusNotification]) -> None:
+        """Add notifications, in order, to be delivered."""
+        with self._lock:
+            for notification in notifications:
+                message = OutboxMessage(id=next(self._ids), notification=notification, attempts=0)
+                self._pending[message.id] = message
+                self._retry_at[message.id] = datetime.min
+
+    def due(self, limit: int, now: datetime) -> list[OutboxMessage]:
+        """Retrieve pending messages ready to be delivered, in order for each dispatch."""
+        blocked = set()
+        messages = []
+        with self._lock:
+            for message in self._pending.values():
+                if len(messages) == limit:
+                    break
+                if message.dispatch_id in blocked:
+                    continue
+                if self._retry_at[message.id] > now:
+                    blocked.add(message.dispatch_id)
+                    continue
+                messages.append(message)
+        return messages
+
+    def mark_delivered(self, message_ids: list[int]) -> None:
+        """Record that messages were delivered."""
+        with self._lock:
+            for message_id in message_ids:
+                self.delivered.append(self._pending.pop(message_id))
+                del self._retry_at[message_id]
+
+    def mark_failed(self, message_ids: list[int], error: str, retry_at: Optional[datetime]) -> None:
+        """Record a failed delivery of messages."""
+        logger.debug(f"Delivery of messages {message_ids} failed: {error}")
+        with self._lock:
+            for message_id in message_ids:
+                message = self._pending[message_id]
+                message = OutboxMessage(
+                    id=message.id, notification=message.notification, attempts=message.attempts + 1
+                )
+                if retry_at is None:
+                    self.abandoned.append(message)
+                    del self._pending[message_id]
+                    del self._retry_at[message_id]
+                else:
+                    self._pending[message_id] = message
+                    self._retry_at[message_id] = retry_at
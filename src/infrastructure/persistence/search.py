@@ -0,0 +1,170 @@
+"""
+Typeahead search over names and addresses, in memory and in the database.
+"""
+
+import re
+from array import array
+from math import ceil
+from typing import Hashable, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import ColumnElement, case, func, literal, or_, select
+from sqlalchemy.orm import Session
+
+
+# Share of a query's trigrams a text must contain to match, as pg_trgm's word_similarity_threshold.
+MATCH_THRESHOLD = 0.6
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def normalize(text: Optional[str]) -> str:
+    """Lower case words separated by single spaces, which is all a search compares."""
+    return ' '.join(_WORD.findall((text or '').lower()))
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    The trigrams of every word in a text.
+
+    Words are padded with two leading spaces, as pg_trgm pads them, but with
+    no trailing space, so that a word being typed shares every trigram with
+    the words it is the start of.
+    """
+    grams = set()
+    for word in normalize(text).split():
+        padded = '  ' + word
+        grams.update(padded[i:i + 3] for i in range(len(word)))
+    return grams
+
+
+class NgramIndex:
+    """
+    An inverted index from trigrams to the records whose texts contain them.
+
+    Each record takes a slot, and each trigram keeps the slots it appears
+    in. A search counts, for every slot at once, how many of the query's
+    trigrams it contains with one bincount over their postings, so its cost
+    follows the number of postings read rather than the number of records.
+    Records that match equally well are ranked with a text starting with
+    the query first, then shorter names first. Which texts start with the
+    query is read from postings too, kept for the first three characters of
+    every text.
+
+    Replaced and removed records leave their slot behind until dead slots
+    outnumber live ones, when the postings are rebuilt from the live records.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[Optional[Hashable]] = []
+        self._texts: list[tuple[str, ...]] = []
+        self._slots: dict[Hashable, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._arrays: dict[str, np.ndarray] = {}
+        self._alive = bytearray()
+        self._lengths = array('q')
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def put(self, key: Hashable, texts: Sequence[Optional[str]]) -> None:
+        """Index a record's texts, the first being its name, replacing any indexed under the same key."""
+        self.remove(key)
+        slot = len(self._keys)
+        normalized = tuple(normalize(text) for text in texts)
+        self._keys.append(key)
+        self._texts.append(normalized)
+        self._alive.append(1)
+        self._lengths.append(len(normalized[0]))
+        self._slots[key] = slot
+        grams = set().union(*(trigrams(text) for text in normalized))
+        # Texts starting with up to three characters, marked so they never collide with a trigram.
+        grams.update('^' + text[:size] for text in normalized for size in range(1, min(len(text), 3) + 1))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(slot)
+            self._arrays.pop(gram, None)
+
+    def remove(self, key: Hashable) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        self._keys[slot] = None
+        self._alive[slot] = 0
+        if len(self._keys) > 2 * len(self._slots) + 32:
+            self._compact()
+
+    def _compact(self) -> None:
+        live = [(key, self._texts[slot]) for key, slot in self._slots.items()]
+        self.__init__()
+        for key, texts in live:
+            self.put(key, texts)
+
+    def _posting(self, gram: str) -> np.ndarray:
+        if gram not in self._arrays:
+            self._arrays[gram] = np.array(self._postings.get(gram, []), dtype=np.int64)
+        return self._arrays[gram]
+
+    def search(self, query: str, limit: int) -> list[tuple[Hashable, float]]:
+        """
+        The records best matching a query.
+
+        Returns:
+            Up to `limit` (key, score) pairs, best first, scoring 1.0 when every trigram of the query matched
+        """
+        query = normalize(query)
+        grams = trigrams(query)
+        if not grams or not self._slots:
+            return []
+
+        slots = len(self._keys)
+        counts = np.bincount(np.concatenate([self._posting(gram) for gram in grams]), minlength=slots)
+        alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+        candidates = np.flatnonzero(alive & (counts >= ceil(MATCH_THRESHOLD * len(grams))))
+
+        starts = np.zeros(slots, dtype=bool)
+        starts[self._posting('^' + query[:3])] = True
+        starts = starts[candidates]
+        if len(query) > 3:
+            for position in np.flatnonzero(starts).tolist():
+                starts[position] = any(text.startswith(query) for text in self._texts[candidates[position]])
+
+        lengths = np.frombuffer(self._lengths, dtype=np.int64)[candidates]
+        best = candidates[np.lexsort((lengths, ~starts, -counts[candidates]))[:limit]]
+        return [(self._keys[slot], float(counts[slot]) / len(grams)) for slot in best.tolist()]
+
+
+def typeahead(session: Session, entity, columns: Sequence[ColumnElement], where, query: str, limit: int) -> list[tuple]:
+    """
+    The rows of `entity` best matching a query in any of `columns`, as (entity, score) pairs.
+
+    On PostgreSQL, matches are found with pg_trgm: a column containing the
+    query, or a word of it being similar enough, is answered from the
+    column's trigram index, and rows are ranked by word similarity. Other
+    databases only find columns containing the query, ranked as equally good.
+    Either way a column starting with the query wins ties, then the shortest
+    first column.
+    """
+    query = normalize(query)
+    if not query:
+        return []
+
+    texts = list(columns)
+    starts = case((or_(*(text.istartswith(query, autoescape=True) for text in texts)), 1), else_=0)
+    matches = [text.icontains(query, autoescape=True) for text in texts]
+
+    if session.get_bind().dialect.name == 'postgresql':
+        similarity = func.greatest(*(func.word_similarity(query, text) for text in texts))
+        score = func.greatest(similarity, case((or_(*matches), 1.0), else_=0.0))
+        matches += [literal(query).op('<%')(text) for text in texts]
+    else:
+        score = literal(1.0)
+
+    statement = (
+        select(entity, score)
+        .where(where, or_(*matches))
+        .order_by(score.desc(), starts.desc(), func.length(texts[0]), texts[0])
+        .limit(limit)
+    )
+    rows = [(found, float(found_score)) for found, found_score in session.execute(statement).all()]
+    session.expunge_all()
+    return rows
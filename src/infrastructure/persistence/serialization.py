@@ -0,0 +1,78 @@
+"""
+Conversion of domain events and history states to and from JSON-ready values.
+"""
+
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+import types
+from typing import Any, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from src.domain.aggregates.dispatch import events as dispatch_events
+from src.domain.aggregates.driver import events as driver_events
+from src.domain.common.events import DomainEvent
+
+
+def _event_types() -> dict[str, type[DomainEvent]]:
+    modules = (dispatch_events, driver_events)
+    return {
+        name: value
+        for module in modules
+        for name, value in vars(module).items()
+        if isinstance(value, type) and issubclass(value, DomainEvent) and value is not DomainEvent
+    }
+
+
+# Stored event rows name their class; this finds it again when they are read.
+EVENT_TYPES = _event_types()
+
+
+def to_primitive(value: Any) -> Any:
+    """Turn dataclasses, enums, UUIDs and datetimes into JSON-ready values."""
+    if is_dataclass(value):
+        return {field.name: to_primitive(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [to_primitive(item) for item in value]
+    return value
+
+
+def from_primitive(hint: Any, value: Any) -> Any:
+    """Rebuild a value of type `hint` from the output of to_primitive."""
+    if value is None:
+        return None
+
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        (inner,) = [arg for arg in get_args(hint) if arg is not type(None)]
+        return from_primitive(inner, value)
+    if origin in (tuple, list):
+        inner = get_args(hint)[0]
+        return origin(from_primitive(inner, item) for item in value)
+
+    if is_dataclass(hint):
+        hints = get_type_hints(hint)
+        return hint(**{field.name: from_primitive(hints[field.name], value[field.name]) for field in fields(hint)})
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint(value)
+    if hint is UUID:
+        return UUID(value)
+    if hint is datetime:
+        return datetime.fromisoformat(value)
+    if hint is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def event_to_row(event: DomainEvent) -> tuple[str, dict]:
+    return type(event).__name__, to_primitive(event)
+
+
+def event_from_row(event_type: str, payload: dict) -> DomainEvent:
+    return from_primitive(EVENT_TYPES[event_type], payload)
@@ -1,9 +1,16 @@
+from datetime import date
+from typing import Iterator
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import sessionmaker
 
+from src.application.dtos.export_dtos import TaskFactsChunk
+from src.domain.aggregates.dispatch.aggregate import Dispatch
 from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.value_objects import TaskStatus
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
 from src.domain.exceptions import TaskNotFoundError
 from src.application.repositories.task_repository import TaskRepository
 
@@ -48,6 +55,65 @@ class SQLAlchemyTaskRepository(TaskRepository):
         finally:
             session.close()
 
+    def stream_facts(self, start_date: date, end_date: date, chunk_size: int) -> Iterator[TaskFactsChunk]:
+        """
+        Stream timing facts for tasks dated within a range, in columnar chunks.
+
+        Rows are read as plain tuples through a server-side cursor and
+        pivoted into columns one partition at a time, so no ORM objects are
+        built and memory is bounded by the chunk size.
+        """
+        stmt = select(
+            Dispatch.reference,
+            Task.priority,
+            Task.instruction,
+            Location.name,
+            Task.date,
+            Task.appointment_type,
+            Task.appointment_start_time,
+            Task.appointment_end_time,
+            Task._check_in_datetime,
+            Task._check_out_datetime,
+            Task._status,
+            func.coalesce(Driver.nickname, Driver.first_name + ' ' + Driver.last_name),
+        ).join(
+            Dispatch, Dispatch.id == Task.dispatch_id
+        ).join(
+            Location, Location.id == Task.location_id
+        ).outerjoin(
+            Driver, Driver.id == Task.driver_id
+        ).where(
+            Task.date.between(start_date, end_date)
+        ).order_by(
+            Task.date, Dispatch.reference, Task.priority
+        ).execution_options(yield_per=chunk_size)
+
+        session = self.session_factory()
+
+        try:
+            for rows in session.execute(stmt).partitions():
+                chunk = TaskFactsChunk()
+                for (reference, priority, instruction, location_name, task_date,
+                     appointment_type, start_time, end_time, check_in, check_out,
+                     status, driver_name) in rows:
+                    chunk.reference.append(reference)
+                    chunk.priority.append(priority)
+                    chunk.instruction.append(instruction.value)
+                    chunk.location_name.append(location_name)
+                    chunk.date.append(task_date)
+                    chunk.appointment_type.append(appointment_type.value if appointment_type else None)
+                    chunk.appointment_start_time.append(start_time)
+                    chunk.appointment_end_time.append(end_time)
+                    chunk.check_in.append(check_in)
+                    chunk.check_out.append(check_out)
+                    chunk.duration.append(
+                        check_out - check_in if status == TaskStatus.COMPLETED else None
+                    )
+                    chunk.driver_name.append(driver_name)
+                yield chunk
+        finally:
+            session.close()
+
     def save(self, task: Task) -> None:
         """
         Save a task to the repository.
@@ -0,0 +1,164 @@
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Table, delete, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.application.repositories.task_duration_statistics import TaskDurationStatistics
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.task_durations import (
+    DurationChanges,
+    DurationEstimate,
+    DurationKey,
+    DurationSketch,
+    TaskDuration,
+    duration_changes,
+    duration_keys,
+    resolve_estimate,
+)
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from src.domain.common.events import DomainEvent
+
+
+def _tables() -> tuple[Table, Table]:
+    tables = inspect(Dispatch).local_table.metadata.tables
+    return tables['task_durations'], tables['task_duration_sketches']
+
+
+def _duration(row) -> TaskDuration:
+    return TaskDuration(
+        task_id=row.task_id,
+        dispatch_id=row.dispatch_id,
+        location_id=row.location_id,
+        instruction=row.instruction,
+        started_at=row.started_at,
+        minutes=row.minutes,
+    )
+
+
+class SQLAlchemyTaskDurationStatistics(TaskDurationStatistics):
+    """
+    TaskDurationStatistics over the task_durations and task_duration_sketches tables.
+
+    The dispatch repository records completions through record_in, inside
+    the transaction that saves the dispatch, which only writes the rows of
+    task_durations keyed by the tasks themselves. Every completion shares
+    its instruction's fleet-wide sketch, so the sketches are updated after
+    the save commits, through update_sketches, each in a short transaction
+    of its own; saves never wait on one another for a sketch. Each sketch
+    is a row keyed by its scope, so an estimate is a primary key lookup
+    however long the history.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """Record the durations of the tasks a dispatch's new events completed or reverted, then the sketches."""
+        session = self.session_factory()
+
+        try:
+            changes = self.record_in(session, dispatch, events)
+            session.commit()
+        finally:
+            session.close()
+        self.update_sketches(changes)
+
+    def record_in(self, session: Session, dispatch: Dispatch, events: list[DomainEvent]) -> DurationChanges:
+        """
+        Record durations within the caller's transaction, without committing.
+
+        Returns:
+            The changes to pass to update_sketches once the transaction commits
+        """
+        changes = duration_changes(dispatch, events, {})
+        if not changes.task_ids:
+            return changes
+        counted, _ = _tables()
+        rows = session.execute(select(counted).where(counted.c.task_id.in_(changes.task_ids))).all()
+        if rows:
+            changes = duration_changes(dispatch, events, {row.task_id: _duration(row) for row in rows})
+
+        session.execute(delete(counted).where(counted.c.task_id.in_(changes.task_ids)))
+        if changes.added:
+            session.execute(insert(counted), [
+                {
+                    'task_id': duration.task_id,
+                    'dispatch_id': duration.dispatch_id,
+                    'location_id': duration.location_id,
+                    'instruction': duration.instruction,
+                    'started_at': duration.started_at,
+                    'minutes': duration.minutes,
+                }
+                for duration in changes.added
+            ])
+        return changes
+
+    def update_sketches(self, changes: DurationChanges) -> None:
+        """Fold committed changes into the sketches, locking each sketch only while it is written."""
+        additions = changes.additions()
+        for key in changes.recount | additions.keys():
+            session = self.session_factory()
+
+            try:
+                sketch = self._lock(session, key.scope)
+                if key in changes.recount:
+                    sketch = self._count(session, key)
+                for minutes in additions.get(key, []):
+                    sketch.add(minutes)
+                _, sketches = _tables()
+                session.execute(
+                    update(sketches).where(sketches.c.scope == key.scope).values(state=sketch.to_state())
+                )
+                session.commit()
+            finally:
+                session.close()
+
+    def _lock(self, session: Session, scope: str) -> DurationSketch:
+        """Read a sketch for update, creating it empty the first time its scope is counted."""
+        _, sketches = _tables()
+        row = {'scope': scope, 'state': DurationSketch().to_state()}
+        if session.get_bind().dialect.name == 'postgresql':
+            session.execute(postgresql.insert(sketches).values(**row).on_conflict_do_nothing(index_elements=['scope']))
+        elif session.scalar(select(sketches.c.scope).where(sketches.c.scope == scope)) is None:
+            # Backends without ON CONFLICT here take one writer at a time.
+            session.execute(insert(sketches).values(**row))
+        state = session.scalar(select(sketches.c.state).where(sketches.c.scope == scope).with_for_update())
+        return DurationSketch.from_state(state)
+
+    def _count(self, session: Session, key: DurationKey) -> DurationSketch:
+        """Count a sketch again from the durations counted under its key, oldest first."""
+        counted, _ = _tables()
+        query = select(counted).where(counted.c.instruction == key.instruction)
+        if key.location_id is not None:
+            query = query.where(counted.c.location_id == key.location_id)
+        sketch = DurationSketch()
+        for row in session.execute(query.order_by(counted.c.started_at, counted.c.task_id)):
+            duration = _duration(row)
+            if key in duration.keys:
+                sketch.add(duration.minutes)
+        return sketch
+
+    def estimate(self, instruction: Instruction, location_id: UUID, at: datetime) -> Optional[DurationEstimate]:
+        """Retrieve the estimated duration of a task started at a moment."""
+        return self.estimate_many([(instruction, location_id, at)])[0]
+
+    def estimate_many(
+            self, tasks: Sequence[tuple[Instruction, UUID, datetime]]) -> list[Optional[DurationEstimate]]:
+        """Retrieve the estimated durations of many tasks at once, reading every sketch they need in one query."""
+        keys = [duration_keys(*task) for task in tasks]
+        scopes = {key.scope for task_keys in keys for key in task_keys}
+        if not scopes:
+            return []
+        _, sketches = _tables()
+        session = self.session_factory()
+
+        try:
+            rows = session.execute(select(sketches.c.scope, sketches.c.state).where(sketches.c.scope.in_(scopes))).all()
+        finally:
+            session.close()
+
+        stored = {scope: DurationSketch.from_state(state) for scope, state in rows}
+        return [resolve_estimate([stored.get(key.scope) for key in task_keys]) for task_keys in keys]
@@ -0,0 +1,67 @@
+from datetime import datetime
+from logging import getLogger
+from typing import Optional, Sequence
+from uuid import UUID
+
+from src.application.repositories.task_duration_statistics import TaskDurationStatistics
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.task_durations import (
+    DurationEstimate,
+    DurationKey,
+    DurationSketch,
+    TaskDuration,
+    duration_changes,
+    duration_keys,
+    resolve_estimate,
+)
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from src.domain.common.events import DomainEvent
+
+
+logger = getLogger(__name__)
+
+
+class InMemoryTaskDurationStatistics(TaskDurationStatistics):
+    """In-memory implementation of TaskDurationStatistics."""
+
+    def __init__(self) -> None:
+        self._sketches: dict[DurationKey, DurationSketch] = {}
+        self._counted: dict[UUID, TaskDuration] = {}
+
+    def record(self, dispatch: Dispatch, events: list[DomainEvent]) -> None:
+        """
+        Record the durations of the tasks a dispatch's new events completed, and take back those reverted.
+
+        Args:
+            dispatch: The Dispatch entity, as saved
+            events: Its new events, in the order they were recorded
+        """
+        tasks = {task.id for task in dispatch.plan}
+        changes = duration_changes(dispatch, events, {
+            task_id: duration for task_id, duration in self._counted.items() if task_id in tasks
+        })
+        for task_id in changes.task_ids:
+            self._counted.pop(task_id, None)
+        for duration in changes.added:
+            logger.debug(f"Recording duration of task {duration.task_id}")
+            self._counted[duration.task_id] = duration
+
+        for key, minutes in changes.additions().items():
+            sketch = self._sketches.setdefault(key, DurationSketch())
+            for value in minutes:
+                sketch.add(value)
+        for key in changes.recount:
+            sketch = DurationSketch()
+            for duration in self._counted.values():
+                if key in duration.keys:
+                    sketch.add(duration.minutes)
+            self._sketches[key] = sketch
+
+    def estimate(self, instruction: Instruction, location_id: UUID, at: datetime) -> Optional[DurationEstimate]:
+        """Retrieve the estimated duration of a task started at a moment."""
+        return resolve_estimate([self._sketches.get(key) for key in duration_keys(instruction, location_id, at)])
+
+    def estimate_many(
+            self, tasks: Sequence[tuple[Instruction, UUID, datetime]]) -> list[Optional[DurationEstimate]]:
+        """Retrieve the estimated durations of many tasks at once."""
+        return [self.estimate(*task) for task in tasks]
@@ -0,0 +1,82 @@
+import threading
+from typing import Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Table, insert, inspect, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.application.repositories.travel_time_repository import TravelTimeRepository
+from src.domain.aggregates.location.aggregate import Location
+from src.infrastructure.travel.centroids import load_zipcode_centroids
+from src.infrastructure.travel.estimates import TravelTimeEstimator, ZipcodeTravelTimes
+
+
+def _table() -> Table:
+    return inspect(Location).local_table.metadata.tables['travel_times']
+
+
+class SQLAlchemyTravelTimeRepository(TravelTimeRepository):
+    """
+    TravelTimeRepository over the travel_times table, held in memory as a matrix.
+
+    The table is read once, on first use. Minutes for zipcodes it does not
+    hold yet are estimated and written back, so the cache grows with the
+    locations in use instead of being rebuilt. Rows in the table win over
+    estimates, which lets measured times replace them.
+    """
+
+    def __init__(self, session_factory: sessionmaker, estimator: Optional[TravelTimeEstimator] = None):
+        self.session_factory = session_factory
+        self.times = ZipcodeTravelTimes(estimator or TravelTimeEstimator(load_zipcode_centroids()))
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def matrix(self, origins: Sequence[Location], destinations: Sequence[Location]) -> np.ndarray:
+        self.refresh([*origins, *destinations])
+        return self.times.between(origins, destinations)
+
+    def from_location(self, origin: Location, destinations: Sequence[Location]) -> np.ndarray:
+        return self.matrix([origin], destinations)[0]
+
+    def refresh(self, locations: Sequence[Location]) -> None:
+        zipcodes = [location.address.zipcode for location in locations]
+        if self._loaded and not self.times.missing(zipcodes):
+            return
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            origins, destinations, minutes = self.times.add(zipcodes)
+            if len(origins):
+                self._store(origins, destinations, minutes)
+
+    def _load(self) -> None:
+        travel_times = _table()
+        session = self.session_factory()
+
+        try:
+            rows = session.execute(select(
+                travel_times.c.origin_zipcode, travel_times.c.destination_zipcode, travel_times.c.minutes
+            )).all()
+        finally:
+            session.close()
+
+        if rows:
+            self.times.load(*zip(*rows))
+        self._loaded = True
+
+    def _store(self, origins: np.ndarray, destinations: np.ndarray, minutes: np.ndarray) -> None:
+        session = self.session_factory()
+
+        try:
+            session.execute(insert(_table()), [
+                {'origin_zipcode': origin, 'destination_zipcode': destination, 'minutes': value}
+                for origin, destination, value in zip(origins.tolist(), destinations.tolist(), minutes.tolist())
+            ])
+            session.commit()
+        except IntegrityError:
+            # Another process stored these zipcodes first; its estimates are the same.
+            session.rollback()
+        finally:
+            session.close()
@@ -0,0 +1,30 @@
+import threading
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.application.repositories.travel_time_repository import TravelTimeRepository
+from src.domain.aggregates.location.aggregate import Location
+from src.infrastructure.travel.centroids import load_zipcode_centroids
+from src.infrastructure.travel.estimates import TravelTimeEstimator, ZipcodeTravelTimes
+
+
+class InMemoryTravelTimeRepository(TravelTimeRepository):
+    """Estimates travel times as locations are asked about, keeping them for the life of the process."""
+
+    def __init__(self, estimator: Optional[TravelTimeEstimator] = None) -> None:
+        self.times = ZipcodeTravelTimes(estimator or TravelTimeEstimator(load_zipcode_centroids()))
+        self._lock = threading.Lock()
+
+    def matrix(self, origins: Sequence[Location], destinations: Sequence[Location]) -> np.ndarray:
+        self.refresh([*origins, *destinations])
+        return self.times.between(origins, destinations)
+
+    def from_location(self, origin: Location, destinations: Sequence[Location]) -> np.ndarray:
+        return self.matrix([origin], destinations)[0]
+
+    def refresh(self, locations: Sequence[Location]) -> None:
+        zipcodes = [location.address.zipcode for location in locations]
+        if self.times.missing(zipcodes):
+            with self._lock:
+                self.times.add(zipcodes)
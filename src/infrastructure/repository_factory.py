@@ -1,3 +1,5 @@
+from typing import Optional
+
 from .config import Config, RepositoryType
 from .persistence.broker.database import SQLAlchemyBrokerRepository
 from .persistence.dispatch.database import SQLAlchemyDispatchRepository
@@ -8,22 +10,131 @@ from .persistence.broker.memory import InMemoryBrokerRepository
 from .persistence.dispatch.memory import InMemoryDispatchRepository
 from .persistence.driver.memory import InMemoryDriverRepository
 from .persistence.location.memory import InMemoryLocationRepository
+from .persistence.chassis_inventory.database import SQLAlchemyChassisInventory
+from .persistence.chassis_inventory.memory import InMemoryChassisInventory
+from .persistence.container_inventory.database import SQLAlchemyContainerInventory
+from .persistence.container_inventory.memory import InMemoryContainerInventory
+from .persistence.free_time_rule.database import SQLAlchemyFreeTimeRuleRepository
+from .persistence.free_time_rule.memory import InMemoryFreeTimeRuleRepository
+from .persistence.dispatch_history.database import SQLAlchemyDispatchEventStore
+from .persistence.dispatch_history.memory import InMemoryDispatchEventStore
+from .persistence.outbox.database import SQLAlchemyNotificationOutbox
+from .persistence.outbox.memory import InMemoryNotificationOutbox
+from .persistence.task_durations.database import SQLAlchemyTaskDurationStatistics
+from .persistence.task_durations.memory import InMemoryTaskDurationStatistics
+from .persistence.travel_time.database import SQLAlchemyTravelTimeRepository
+from .persistence.travel_time.memory import InMemoryTravelTimeRepository
+from src.application.common.event_bus import EventBus
 from src.application.repositories.broker_repository import BrokerRepository
+from src.application.repositories.chassis_inventory import ChassisInventory
+from src.application.repositories.container_inventory import ContainerInventory
+from src.application.repositories.dispatch_event_store import DispatchEventStore
 from src.application.repositories.dispatch_repository import DispatchRepository
 from src.application.repositories.driver_repository import DriverRepository
+from src.application.repositories.free_time_rule_repository import FreeTimeRuleRepository
 from src.application.repositories.location_repository import LocationRepository
+from src.application.repositories.notification_outbox import NotificationOutbox
+from src.application.repositories.task_duration_statistics import TaskDurationStatistics
 from src.application.repositories.task_repository import TaskRepository
+from src.application.repositories.travel_time_repository import TravelTimeRepository
+
+
+def create_dispatch_event_store() -> DispatchEventStore:
+    repo_type = Config.get_repository_type()
+
+    if repo_type == RepositoryType.MEMORY:
+        return InMemoryDispatchEventStore()
+    if repo_type == RepositoryType.DATABASE:
+        return SQLAlchemyDispatchEventStore(Config.get_session_factory())
+    else:
+        raise ValueError(f"Invalid repository type: {repo_type}")
+
+
+def create_notification_outbox() -> NotificationOutbox:
+    repo_type = Config.get_repository_type()
+
+    if repo_type == RepositoryType.MEMORY:
+        return InMemoryNotificationOutbox()
+    if repo_type == RepositoryType.DATABASE:
+        return SQLAlchemyNotificationOutbox(Config.get_session_factory())
+    else:
+        raise ValueError(f"Invalid repository type: {repo_type}")
+
+
+def create_container_inventory() -> ContainerInventory:
+    repo_type = Config.get_repository_type()
+
+    if repo_type == RepositoryType.MEMORY:
+        return InMemoryContainerInventory()
+    if repo_type == RepositoryType.DATABASE:
+        return SQLAlchemyContainerInventory(Config.get_session_factory())
+    else:
+        raise ValueError(f"Invalid repository type: {repo_type}")
+
+
+def create_chassis_inventory() -> ChassisInventory:
+    repo_type = Config.get_repository_type()
+
+    if repo_type == RepositoryType.MEMORY:
+        return InMemoryChassisInventory()
+    if repo_type == RepositoryType.DATABASE:
+        return SQLAlchemyChassisInventory(Config.get_session_factory())
+    else:
+        raise ValueError(f"Invalid repository type: {repo_type}")
+
+
+def create_task_duration_statistics() -> TaskDurationStatistics:
+    repo_type = Config.get_repository_type()
+
+    if repo_type == RepositoryType.MEMORY:
+        return InMemoryTaskDurationStatistics()
+    if repo_type == RepositoryType.DATABASE:
+        return SQLAlchemyTaskDurationStatistics(Config.get_session_factory())
+    else:
+        raise ValueError(f"Invalid repository type: {repo_type}")
+
+
+def create_free_time_rule_repository() -> FreeTimeRuleRepository:
+    repo_type = Config.get_repository_type()
+
+    if repo_type == RepositoryType.MEMORY:
+        return InMemoryFreeTimeRuleRepository()
+    if repo_type == RepositoryType.DATABASE:
+        return SQLAlchemyFreeTimeRuleRepository(Config.get_session_factory())
+    else:
+        raise ValueError(f"Invalid repository type: {repo_type}")
+
+
+def create_travel_time_repository() -> TravelTimeRepository:
+    repo_type = Config.get_repository_type()
+
+    if repo_type == RepositoryType.MEMORY:
+        return InMemoryTravelTimeRepository()
+    if repo_type == RepositoryType.DATABASE:
+        return SQLAlchemyTravelTimeRepository(Config.get_session_factory())
+    else:
+        raise ValueError(f"Invalid repository type: {repo_type}")
 
 
-def create_repositories() -> tuple[
+def create_repositories(
+        event_bus: Optional[EventBus] = None,
+        dispatch_event_store: Optional[DispatchEventStore] = None,
+        notification_outbox: Optional[NotificationOutbox] = None,
+        container_inventory: Optional[ContainerInventory] = None,
+        chassis_inventory: Optional[ChassisInventory] = None,
+        task_durations: Optional[TaskDurationStatistics] = None,
+        ) -> tuple[
     BrokerRepository, DispatchRepository, 
     DriverRepository, LocationRepository, TaskRepository]:
     repo_type = Config.get_repository_type()
 
     if repo_type == RepositoryType.MEMORY:
         broker_repo = InMemoryBrokerRepository()
-        dispatch_repo = InMemoryDispatchRepository()
-        driver_repo = InMemoryDriverRepository()
+        dispatch_repo = InMemoryDispatchRepository(
+            event_bus, dispatch_event_store, notification_outbox, container_inventory, chassis_inventory,
+            task_durations,
+        )
+        driver_repo = InMemoryDriverRepository(event_bus)
         location_repo = InMemoryLocationRepository()
         return (
                 broker_repo,
@@ -34,8 +145,11 @@ def create_repositories() -> tuple[
     if repo_type == RepositoryType.DATABASE:
         session_factory = Config.get_session_factory()
         broker_repo = SQLAlchemyBrokerRepository(session_factory)
-        dispatch_repo = SQLAlchemyDispatchRepository(session_factory)
-        driver_repo = SQLAlchemyDriverRepository(session_factory)
+        dispatch_repo = SQLAlchemyDispatchRepository(
+            session_factory, event_bus, dispatch_event_store, notification_outbox, container_inventory,
+            chassis_inventory, task_durations,
+        )
+        driver_repo = SQLAlchemyDriverRepository(session_factory, event_bus)
         location_repo = SQLAlchemyLocationRepository(session_factory)
         task_repo = SQLAlchemyTaskRepository(session_factory)
         return (
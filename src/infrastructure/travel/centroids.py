@@ -0,0 +1,103 @@
+"""
+Zipcode centroids for estimating distances without a routing service.
+"""
+
+import csv
+from logging import getLogger
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.infrastructure.config import Config
+
+
+logger = getLogger(__name__)
+
+BUNDLED_CENTROIDS = Path(__file__).with_name('zip3_centroids.csv')
+
+
+class ZipcodeCentroids:
+    """
+    The latitude and longitude of zipcodes, looked up many at a time.
+
+    Centroids are keyed either by full five-digit zipcode or by three-digit
+    prefix, the sectional center a zipcode belongs to. Keys are kept sorted,
+    so a lookup is one searchsorted over the whole batch. A zipcode with no
+    centroid of its own is looked up in the fallback centroids, if any, and
+    is otherwise located at NaN rather than at a neighbouring key, which
+    can be hundreds of miles away.
+    """
+
+    def __init__(
+            self,
+            keys: np.ndarray,
+            latitudes: np.ndarray,
+            longitudes: np.ndarray,
+            digits: int,
+            fallback: Optional['ZipcodeCentroids'] = None,
+            ):
+        order = np.argsort(keys)
+        self.keys = np.asarray(keys)[order]
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)[order]
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)[order]
+        self.digits = digits
+        self.fallback = fallback
+
+    @classmethod
+    def bundled(cls) -> 'ZipcodeCentroids':
+        """
+        The three-digit prefix centroids shipped with the application.
+
+        Every prefix in use has a row, placed at the middle of the area its
+        sectional center serves to about a tenth of a degree. Military and
+        unassigned prefixes have none.
+        """
+        with open(BUNDLED_CENTROIDS, newline='') as file:
+            rows = list(csv.DictReader(file))
+        return cls(
+            np.array([int(row['prefix']) for row in rows]),
+            np.array([float(row['latitude']) for row in rows]),
+            np.array([float(row['longitude']) for row in rows]),
+            digits=3,
+        )
+
+    @classmethod
+    def from_gazetteer(cls, path: Path, fallback: Optional['ZipcodeCentroids'] = None) -> 'ZipcodeCentroids':
+        """Five-digit centroids from a Census Gazetteer ZCTA file, which is tab separated."""
+        with open(path, newline='') as file:
+            reader = csv.reader(file, delimiter='\t')
+            header = [column.strip() for column in next(reader)]
+            key, latitude, longitude = (header.index(name) for name in ('GEOID', 'INTPTLAT', 'INTPTLONG'))
+            rows = [(int(row[key]), float(row[latitude]), float(row[longitude])) for row in reader if row]
+        keys, latitudes, longitudes = (np.array(column) for column in zip(*rows))
+        return cls(keys, latitudes, longitudes, digits=5, fallback=fallback)
+
+    def locate(self, zipcodes) -> tuple[np.ndarray, np.ndarray]:
+        """The latitudes and longitudes of zipcodes, in the order given, NaN for those with no centroid."""
+        zipcodes = np.asarray(zipcodes, dtype=np.int64)
+        wanted = zipcodes // 10 ** (5 - self.digits)
+        found = np.minimum(np.searchsorted(self.keys, wanted), len(self.keys) - 1)
+        known = self.keys[found] == wanted
+        latitudes = np.where(known, self.latitudes[found], np.nan)
+        longitudes = np.where(known, self.longitudes[found], np.nan)
+        if self.fallback is not None and not known.all():
+            latitudes[~known], longitudes[~known] = self.fallback.locate(zipcodes[~known])
+        return latitudes, longitudes
+
+
+def load_zipcode_centroids(path: Optional[Path] = None) -> ZipcodeCentroids:
+    """
+    The configured Gazetteer file's centroids if there is one, otherwise the bundled prefixes.
+
+    Zipcodes missing from the Gazetteer, such as those of PO boxes, which
+    have no ZCTA, are located by their prefix instead.
+    """
+    path = path or Config.get_zipcode_centroids_path()
+    if path is None:
+        logger.warning(
+            "No Gazetteer file is configured in NOPALLI_ZIPCODE_CENTROIDS, so zipcodes are located by their "
+            "three-digit prefix and locations sharing one are taken to be in the same place."
+        )
+        return ZipcodeCentroids.bundled()
+    return ZipcodeCentroids.from_gazetteer(path, fallback=ZipcodeCentroids.bundled())
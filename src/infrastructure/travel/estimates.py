@@ -0,0 +1,116 @@
+"""
+Travel time estimates between zipcodes, and the matrix they are cached in.
+"""
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.common.geo import haversine_km
+from src.infrastructure.travel.centroids import ZipcodeCentroids
+
+
+class TravelTimeEstimator:
+    """
+    Estimates driving minutes from the straight-line distance between zipcode centroids.
+
+    Roads wind, so the distance is stretched by a circuity factor before it
+    is driven at an average speed. Two stops in the same zipcode, or in
+    zipcodes that share a centroid, still take the minutes of a local move.
+    A zipcode with no centroid cannot be placed, so every trip to or from
+    it takes the flat unknown minutes instead.
+    """
+
+    def __init__(
+            self,
+            centroids: ZipcodeCentroids,
+            speed_kmh: float = 65.0,
+            circuity: float = 1.2,
+            local_minutes: float = 10.0,
+            unknown_minutes: float = 60.0,
+            ):
+        self.centroids = centroids
+        self.speed_kmh = speed_kmh
+        self.circuity = circuity
+        self.local_minutes = local_minutes
+        self.unknown_minutes = unknown_minutes
+
+    def minutes(self, origins: Sequence[int], destinations: Sequence[int]) -> np.ndarray:
+        """A (origins, destinations) matrix of minutes between zipcodes."""
+        origin_latitudes, origin_longitudes = self.centroids.locate(origins)
+        latitudes, longitudes = self.centroids.locate(destinations)
+        kilometres = haversine_km(
+            origin_latitudes[:, None], origin_longitudes[:, None], latitudes[None, :], longitudes[None, :]
+        )
+        minutes = np.maximum(kilometres * self.circuity / self.speed_kmh * 60, self.local_minutes)
+        # NaN survives np.maximum, marking the pairs with a zipcode that has no centroid.
+        unknown = np.isnan(minutes)
+        same = np.equal.outer(np.asarray(origins, dtype=np.int64), np.asarray(destinations, dtype=np.int64))
+        minutes[unknown] = np.where(same, self.local_minutes, self.unknown_minutes)[unknown]
+        return minutes
+
+
+class ZipcodeTravelTimes:
+    """
+    A square matrix of minutes between every zipcode seen so far.
+
+    Estimates only depend on zipcodes, so locations that share one share
+    its row, and editing an address needs no invalidation. The matrix grows
+    incrementally: adding zipcodes estimates only their new rows and
+    columns, against every zipcode already held, in two vectorized calls.
+    """
+
+    def __init__(self, estimator: TravelTimeEstimator):
+        self.estimator = estimator
+        self.index: dict[int, int] = {}
+        self.minutes = np.zeros((0, 0))
+
+    def missing(self, zipcodes: Iterable[int]) -> list[int]:
+        return sorted({zipcode for zipcode in zipcodes if zipcode not in self.index})
+
+    def add(self, zipcodes: Iterable[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Estimate the minutes to and from zipcodes not held yet.
+
+        Returns:
+            The origins, destinations and minutes of the pairs added
+        """
+        new = self.missing(zipcodes)
+        known = list(self.index)
+        held = len(known)
+        everything = known + new
+        if not new:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])
+
+        minutes = np.empty((len(everything), len(everything)))
+        minutes[:held, :held] = self.minutes
+        minutes[held:, :] = self.estimator.minutes(new, everything)
+        minutes[:held, held:] = self.estimator.minutes(known, new)
+
+        self.minutes = minutes
+        self.index.update((zipcode, held + offset) for offset, zipcode in enumerate(new))
+        return (
+            np.concatenate([np.repeat(new, len(everything)), np.repeat(known, len(new))]).astype(np.int64),
+            np.concatenate([np.tile(everything, len(new)), np.tile(new, held)]).astype(np.int64),
+            np.concatenate([minutes[held:, :].ravel(), minutes[:held, held:].ravel()]),
+        )
+
+    def load(self, origins: Sequence[int], destinations: Sequence[int], minutes: Sequence[float]) -> None:
+        """Hold known minutes between zipcodes, which win over estimates."""
+        self.add([*origins, *destinations])
+        rows = [self.index[zipcode] for zipcode in origins]
+        columns = [self.index[zipcode] for zipcode in destinations]
+        self.minutes[rows, columns] = minutes
+
+    def between(self, origins: Sequence[Location], destinations: Sequence[Location]) -> np.ndarray:
+        """A (origins, destinations) matrix of minutes, zero from a location to itself."""
+        rows = [self.index[location.address.zipcode] for location in origins]
+        columns = [self.index[location.address.zipcode] for location in destinations]
+        minutes = self.minutes[np.ix_(rows, columns)]
+        codes = {location.id: code for code, location in enumerate([*origins, *destinations])}
+        same = np.equal.outer(
+            np.array([codes[location.id] for location in origins], dtype=np.int64),
+            np.array([codes[location.id] for location in destinations], dtype=np.int64),
+        )
+        return np.where(same, 0.0, minutes)
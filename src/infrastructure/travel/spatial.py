@@ -0,0 +1,128 @@
+"""
+A spatial index of locations by where their zipcodes are.
+"""
+
+import threading
+from math import isqrt
+from typing import Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from src.application.repositories.location_spatial_index import LocationSpatialIndex
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.common.geo import chord_to_miles, miles_to_chord, unit_vectors
+from src.domain.common.kdtree import KDTree
+from src.infrastructure.travel.centroids import ZipcodeCentroids, load_zipcode_centroids
+
+
+class InMemoryLocationSpatialIndex(LocationSpatialIndex):
+    """
+    A k-d tree over where locations are on the unit sphere, kept up to date as they change.
+
+    Each location is placed at its own five-digit zipcode's centroid when
+    the centroids have one, so two locations in the same sectional center
+    are told apart, and at its prefix's otherwise.
+
+    The tree itself is static. Locations put since it was built wait in a
+    small buffer that queries scan directly, and locations removed or moved
+    are hidden from the tree's answers until the next rebuild. Once the
+    buffer and the hidden locations outgrow the square root of the tree, it
+    is built again from what is live, which keeps both queries and upkeep
+    cheap. A location whose zipcode has no centroid cannot be placed, so it
+    is left out, and nothing is near such a zipcode.
+    """
+
+    def __init__(self, centroids: Optional[ZipcodeCentroids] = None) -> None:
+        self.centroids = centroids or load_zipcode_centroids()
+        self._lock = threading.Lock()
+        self._built = False
+        self._tree = KDTree(np.zeros((0, 3)))
+        self._ids: list[UUID] = []
+        self._points = np.zeros((0, 3))
+        self._rows: dict[UUID, int] = {}
+        self._hidden: set[UUID] = set()
+        self._pending: dict[UUID, np.ndarray] = {}
+
+    @property
+    def built(self) -> bool:
+        return self._built
+
+    def _vectors(self, zipcodes: Sequence[int]) -> np.ndarray:
+        return unit_vectors(*self.centroids.locate(zipcodes))
+
+    def rebuild(self, locations: Sequence[Location]) -> None:
+        vectors = self._vectors([location.address.zipcode for location in locations])
+        placed = ~np.isnan(vectors).any(axis=1)
+        with self._lock:
+            ids = [location.id for location, kept in zip(locations, placed.tolist()) if kept]
+            self._replace(ids, vectors[placed])
+            self._built = True
+
+    def _replace(self, ids: list[UUID], vectors: np.ndarray) -> None:
+        self._points = vectors.reshape(-1, 3)
+        self._tree = KDTree(self._points)
+        self._ids = ids
+        self._rows = {location_id: row for row, location_id in enumerate(ids)}
+        self._hidden = set()
+        self._pending = {}
+
+    def put(self, location: Location) -> None:
+        vector = self._vectors([location.address.zipcode])[0]
+        if np.isnan(vector).any():
+            self.remove(location.id)
+            return
+        with self._lock:
+            if location.id in self._rows:
+                self._hidden.add(location.id)
+            self._pending[location.id] = vector
+            self._compact_if_due()
+
+    def remove(self, location_id: UUID) -> None:
+        with self._lock:
+            self._pending.pop(location_id, None)
+            if location_id in self._rows:
+                self._hidden.add(location_id)
+            self._compact_if_due()
+
+    def _compact_if_due(self) -> None:
+        if len(self._pending) + len(self._hidden) <= max(32, isqrt(len(self._ids))):
+            return
+        kept = [row for row, location_id in enumerate(self._ids) if location_id not in self._hidden]
+        self._replace(
+            [self._ids[row] for row in kept] + list(self._pending),
+            np.concatenate([self._points[kept], self._pending_vectors()]),
+        )
+
+    def _pending_vectors(self) -> np.ndarray:
+        return np.array(list(self._pending.values())).reshape(-1, 3)
+
+    def nearest(self, zipcode: int, limit: int) -> list[tuple[UUID, float]]:
+        point = self._vectors([zipcode])[0]
+        if np.isnan(point).any():
+            return []
+        with self._lock:
+            # Hidden locations may take up places among the tree's nearest.
+            rows, chords = self._tree.nearest(point, limit + len(self._hidden))
+            return self._merge(rows, chords, point)[:limit]
+
+    def within(self, zipcode: int, miles: float) -> list[tuple[UUID, float]]:
+        point = self._vectors([zipcode])[0]
+        if np.isnan(point).any():
+            return []
+        radius = miles_to_chord(miles)
+        with self._lock:
+            rows, chords = self._tree.within(point, radius)
+            return [(location_id, distance) for location_id, distance in self._merge(rows, chords, point)
+                    if distance <= miles + 1e-9]
+
+    def _merge(self, rows: np.ndarray, chords: np.ndarray, point: np.ndarray) -> list[tuple[UUID, float]]:
+        """The tree's live answers and every pending location, closest first."""
+        found = [self._ids[row] for row in rows.tolist()]
+        pending = list(self._pending)
+        ids = found + pending
+        chords = np.concatenate([chords, np.sqrt(((self._pending_vectors() - point) ** 2).sum(axis=1))])
+        live = [location_id not in self._hidden for location_id in found] + [True] * len(pending)
+        by_distance = np.argsort(chords, kind='stable')
+        miles = chord_to_miles(chords)
+        return [(ids[i], float(miles[i])) for i in by_distance.tolist() if live[i]]
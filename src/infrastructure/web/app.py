@@ -21,12 +21,24 @@ def create_web_app(app_container: Application) -> Flask:
     from .routes.dispatch import bp as dispatch_bp
     flask_app.register_blueprint(dispatch_bp)
 
+    from .routes.export import bp as export_bp
+    flask_app.register_blueprint(export_bp)
+
     from .routes.home import bp as home_bp
     flask_app.register_blueprint(home_bp)
 
     from .routes.location import bp as location_bp
     flask_app.register_blueprint(location_bp)
 
+    from .routes.search import bp as search_bp
+    flask_app.register_blueprint(search_bp)
+
+    from .routes.container import bp as container_bp
+    flask_app.register_blueprint(container_bp)
+
+    from .routes.clock import bp as clock_bp
+    flask_app.register_blueprint(clock_bp)
+
     @flask_app.context_processor
     def inject_today():
         return {'today': date.today().isoformat()}
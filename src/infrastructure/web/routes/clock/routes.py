@@ -0,0 +1,56 @@
+"""
+Flask routes for Clocks.
+"""
+
+from flask import current_app, jsonify, request
+
+from src.infrastructure.web.routes.clock import bp
+
+
+@bp.get("/api/clocks")
+def board():
+    """Read the per diem and detention clocks, at ?as_of= or now; ?flagged=1 keeps only those charging or about to."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.clock_controller.handle_board(
+        as_of=request.args.get("as_of"),
+        flagged_only=request.args.get("flagged") in ("1", "true"),
+    )
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+
+@bp.get("/api/free-time-rules")
+def list_rules():
+    """List the free-time rules, the broadest first."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.clock_controller.handle_list_rules()
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+
+@bp.post("/api/free-time-rules")
+def set_rule():
+    """Set the free time of a clock, for a broker, a location, both, or every one of them."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.clock_controller.handle_set_rule(
+        clock=request.form.get("clock", ""),
+        free_minutes=request.form.get("free_minutes", ""),
+        warning_minutes=request.form.get("warning_minutes", ""),
+        broker_id=request.form.get("broker_id"),
+        location_id=request.form.get("location_id"),
+    )
+
+    if not result.is_success:
+        status = 404 if result.error.code == 'NOT_FOUND' else 400
+        return jsonify({"error": result.error.message}), status
+
+    return jsonify(result.success), 200
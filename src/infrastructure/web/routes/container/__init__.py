@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+bp = Blueprint('container', __name__)
+
+from . import routes
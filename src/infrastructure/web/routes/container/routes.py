@@ -0,0 +1,84 @@
+"""
+Flask routes for Containers.
+"""
+
+from flask import current_app, jsonify, request
+
+from src.infrastructure.web.routes.container import bp
+
+
+@bp.get("/api/locations/<location_id>/containers")
+def yard_inventory(location_id):
+    """List the containers dropped at a location and not moved since, longest standing first."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.container_controller.handle_yard_inventory(location_id=location_id)
+
+    if not result.is_success:
+        status = 404 if result.error.code == 'NOT_FOUND' else 400
+        return jsonify({"error": result.error.message}), status
+
+    return jsonify(result.success), 200
+
+
+@bp.get("/api/containers/<container_number>/timeline")
+def timeline(container_number):
+    """List every recorded move of a container, oldest first, and where it is now."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.container_controller.handle_timeline(container_number=container_number)
+
+    if not result.is_success:
+        status = 404 if result.error.code == 'NOT_FOUND' else 400
+        return jsonify({"error": result.error.message}), status
+
+    return jsonify(result.success), 200
+
+
+@bp.get("/api/chassis")
+def chassis_counts():
+    """Count the chassis at every pool, as of ?as_of= or now."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.container_controller.handle_chassis_counts(as_of=request.args.get("as_of"))
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+
+@bp.post("/api/chassis/<location_id>/count")
+def record_chassis_count(location_id):
+    """Set a pool's chassis count to the JSON body's "count", counted at its "counted_at" or now."""
+    app = current_app.config["APP_CONTAINER"]
+    payload = request.get_json(silent=True)
+    payload = payload if isinstance(payload, dict) else {}
+
+    result = app.container_controller.handle_record_chassis_count(
+        location_id=location_id,
+        count=payload.get("count"),
+        counted_at=payload.get("counted_at"),
+    )
+
+    if not result.is_success:
+        status = 404 if result.error.code == 'NOT_FOUND' else 400
+        return jsonify({"error": result.error.message}), status
+
+    return jsonify(result.success), 200
+
+
+@bp.get("/api/chassis/daily")
+def chassis_daily_report():
+    """Report each pool's chassis fetched, terminated and left at the end of every day from ?start= to ?end=."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.container_controller.handle_chassis_daily_report(
+        start_date=request.args.get("start", ""),
+        end_date=request.args.get("end", ""),
+    )
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
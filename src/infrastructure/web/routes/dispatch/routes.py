@@ -9,6 +9,18 @@ from src.infrastructure.web.routes.dispatch import bp
 from src.infrastructure.web.routes.dispatch.utilities import parse_new_dispatch_plan
 
 
+PLAN_RULES_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def _plan_rules(app):
+    """
+    The plan rules, whose version is rendered into the plan editors so they
+    fetch them at most once, and whose instructions are rendered as the
+    options to pick from until they are fetched.
+    """
+    return app.dispatch_controller.handle_plan_rules().success
+
+
 @bp.get("/dispatches/new")
 @bp.post("/dispatches/new")
 def create_dispatch():
@@ -31,7 +43,68 @@ def create_dispatch():
             return render_template(("dispatches/dispatches.html"))
         else:
             flash(f'Created Dispatch Ref. {result.success.reference}', 'success')
-    return render_template(("dispatches/new_dispatch.html"))
+    app = current_app.config["APP_CONTAINER"]
+    return render_template("dispatches/new_dispatch.html", plan_rules=_plan_rules(app))
+
+
+@bp.post("/dispatches/bulk")
+def bulk_create_dispatches():
+    """Create many dispatches from a JSON body of the form {"dispatches": [...]}."""
+    app = current_app.config["APP_CONTAINER"]
+
+    payload = request.get_json(silent=True)
+    dispatches = payload.get('dispatches') if isinstance(payload, dict) else None
+    result = app.dispatch_controller.handle_bulk_create(dispatches)
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+
+@bp.get("/dispatches/plan-rules")
+def plan_rules():
+    """
+    Serve the rules the plan editors validate against.
+
+    A request naming the current version with ?v= may be cached for good,
+    since any change to the rules changes the version. Other requests are
+    revalidated against the ETag.
+    """
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_plan_rules()
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    version = result.success.version
+    response = jsonify(result.success)
+    response.set_etag(version)
+    if request.args.get('v') == version:
+        response.cache_control.public = True
+        response.cache_control.max_age = PLAN_RULES_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+
+    return response.make_conditional(request)
+
+
+@bp.get("/dispatches/plan-completions")
+def plan_completions():
+    """Suggest ways to finish a partial plan given as repeated ?instruction= values."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_suggest_completions(
+        instructions=request.args.getlist('instruction'),
+        limit=request.args.get('limit', 5, type=int),
+    )
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
 
 
 @bp.get("/dispatches")
@@ -59,7 +132,11 @@ def edit_dispatch(dispatch_id):
         result = app.dispatch_controller.handle_get_dispatch(dispatch_id)
         if not result.is_success:
             abort(404)
-        return render_template("dispatches/edit_dispatch.html", dispatch=result.success)
+        return render_template(
+            "dispatches/edit_dispatch.html",
+            dispatch=result.success,
+            plan_rules=_plan_rules(app),
+        )
 
     print("INCOMING EDIT FORM:", request.form)
     plan = parse_new_dispatch_plan(request.form)
@@ -92,6 +169,20 @@ def start_dispatch(dispatch_id):
     return jsonify(result.success), 200
     
 
+@bp.get("/dispatches/<dispatch_id>/history")
+def history(dispatch_id):
+    """Show a dispatch and its events as of ?at=, or as it stands now."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_history(dispatch_id, as_of=request.args.get('at'))
+
+    if not result.is_success:
+        status = 404 if result.error.code == 'NOT_FOUND' else 400
+        return jsonify({"error": result.error.message}), status
+
+    return jsonify(result.success), 200
+
+
 @bp.get("/dispatches/<board_date>/loadboard/")
 def loadboard(board_date):
     """List loadboard dispatches."""
@@ -106,6 +197,90 @@ def loadboard(board_date):
 
     return render_template("dispatches/loadboard.html", dispatches=result.success, board_date=board_date)
 
+@bp.get("/dispatches/<board_date>/loadboard/as-of")
+def loadboard_as_of(board_date):
+    """Show the loadboard of a date as it stood at the moment given by ?at=."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_loadboard_as_of(date=board_date, as_of=request.args.get('at', ''))
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+@bp.get("/dispatches/<board_date>/assignments/proposal")
+def assignment_proposal(board_date):
+    """Propose drivers for the draft dispatches of a date."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_propose_assignments(date=board_date)
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+@bp.get("/dispatches/<dispatch_id>/sequence")
+def plan_sequence(dispatch_id):
+    """Propose the order of a draft dispatch's tasks that needs the least travel and lateness."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_propose_sequence(dispatch_id=dispatch_id)
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+@bp.get("/dispatches/lookup")
+def lookup():
+    """Find the dispatch with ?reference=, or every dispatch that moved ?container=."""
+    app = current_app.config["APP_CONTAINER"]
+
+    if 'reference' in request.args:
+        result = app.dispatch_controller.handle_get_by_reference(reference=request.args['reference'])
+    else:
+        result = app.dispatch_controller.handle_find_by_container(
+            container_number=request.args.get('container', '')
+        )
+
+    if not result.is_success:
+        status = 404 if result.error.code == 'NOT_FOUND' else 400
+        return jsonify({"error": result.error.message}), status
+
+    return jsonify(result.success), 200
+
+@bp.get("/dispatches/double-bookings")
+def double_bookings():
+    """List the drivers booked on overlapping dispatches between ?start= and ?end=."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_double_booking_report(
+        start_date=request.args.get('start', ''),
+        end_date=request.args.get('end', ''),
+    )
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
+@bp.get("/dispatches/street-turns")
+def street_turns():
+    """Propose street turns between the imports and exports planned from ?start= to ?end=."""
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.dispatch_controller.handle_propose_street_turns(
+        start_date=request.args.get('start', ''),
+        end_date=request.args.get('end', ''),
+    )
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
+
 @bp.post("/dispatches/<dispatch_id>/tasks/<task_priority>/start/")
 def start_task(dispatch_id, task_priority):
         
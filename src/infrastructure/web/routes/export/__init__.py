@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+bp = Blueprint('export', __name__)
+
+from . import routes
\ No newline at end of file
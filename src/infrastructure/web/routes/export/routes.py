@@ -0,0 +1,65 @@
+"""
+Flask routes for Exports.
+"""
+
+from tempfile import SpooledTemporaryFile
+
+from flask import Response, current_app, jsonify, request, send_file, stream_with_context
+
+from src.infrastructure.web.routes.export import bp
+
+
+_MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+    'npz': 'application/octet-stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+# Exports larger than this spill from memory to a temporary file.
+_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+
+@bp.get("/exports/dispatch-history")
+def export_dispatch_history():
+    """Stream dispatch and task history for a date range."""
+    start_date = request.args.get('start', '')
+    end_date = request.args.get('end', '')
+    format = request.args.get('format', 'csv')
+
+    app = current_app.config["APP_CONTAINER"]
+    result = app.export_controller.handle_export_history(start_date, end_date, format)
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    filename = f'dispatch_history_{start_date}_{end_date}.{format}'
+    return Response(
+        stream_with_context(result.success),
+        mimetype=_MIMETYPES[format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+    )
+
+
+@bp.get("/exports/task-facts")
+def export_task_facts():
+    """Download task timing facts for a date range in a columnar format."""
+    start_date = request.args.get('start', '')
+    end_date = request.args.get('end', '')
+    format = request.args.get('format', 'npz')
+
+    app = current_app.config["APP_CONTAINER"]
+    output = SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+    result = app.export_controller.handle_export_task_facts(start_date, end_date, format, lambda: output)
+
+    if not result.is_success:
+        output.close()
+        return jsonify({"error": result.error.message}), 400
+
+    output.seek(0)
+    return send_file(
+        output,
+        mimetype=_MIMETYPES[format],
+        as_attachment=True,
+        download_name=f'task_facts_{start_date}_{end_date}.{format}',
+    )
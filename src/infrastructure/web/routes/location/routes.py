@@ -98,4 +98,26 @@ def get_active_locations():
 
     result = app.location_controller.handle_active_locations()
 
-    return jsonify(result.success)
\ No newline at end of file
+    return jsonify(result.success)
+
+
+@bp.get("/api/locations/nearby")
+def nearby_locations():
+    """
+    List the active locations closest to ?zipcode= or to ?location_id=, closest first.
+
+    ?limit= caps how many are returned, and ?within= keeps only those at most that many miles away.
+    """
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.location_controller.handle_nearby(
+        zipcode=request.args.get("zipcode"),
+        location_id=request.args.get("location_id"),
+        limit=request.args.get("limit", 10, type=int),
+        within_miles=request.args.get("within", type=float),
+    )
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
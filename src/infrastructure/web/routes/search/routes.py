@@ -0,0 +1,30 @@
+"""
+Flask routes for Search.
+"""
+
+from flask import current_app, jsonify, request
+
+from src.infrastructure.web.routes.search import bp
+
+
+@bp.get("/api/search")
+def typeahead():
+    """
+    Page through the active locations, brokers and drivers best matching ?q=.
+
+    ?kinds= narrows the search to a comma separated list of location, broker
+    and driver; ?page= and ?per_page= choose the page of hits.
+    """
+    app = current_app.config["APP_CONTAINER"]
+
+    result = app.search_controller.handle_typeahead(
+        query=request.args.get("q", ""),
+        kinds=request.args.get("kinds"),
+        page=request.args.get("page", 1, type=int),
+        per_page=request.args.get("per_page", 10, type=int),
+    )
+
+    if not result.is_success:
+        return jsonify({"error": result.error.message}), 400
+
+    return jsonify(result.success), 200
@@ -0,0 +1,83 @@
+/*
+ * Client-side copy of the dispatch plan rules.
+ *
+ * The rules are fetched from /dispatches/plan-rules at most once per browser
+ * session and kept in sessionStorage under their version, so the plan
+ * editors can offer only valid instructions and report broken rules without
+ * posting the form. The server still validates every plan it receives.
+ */
+const PlanRules = {
+  storageKey(version) {
+    return `plan-rules:${version}`;
+  },
+
+  async load(url, version) {
+    const cached = sessionStorage.getItem(this.storageKey(version));
+    if (cached) return JSON.parse(cached);
+
+    const response = await fetch(url);
+    if (!response.ok) throw new Error(`Plan rules request failed with status ${response.status}`);
+    const rules = await response.json();
+
+    try {
+      sessionStorage.setItem(this.storageKey(rules.version), JSON.stringify(rules));
+    } catch (error) {
+      // Storage may be full or disabled; the rules still work for this page.
+    }
+    return rules;
+  },
+
+  // Instructions that may be chosen for the task at `position`, given the
+  // instructions chosen for the other tasks.
+  allowedAt(rules, instructions, position) {
+    const previous = position > 0 ? instructions[position - 1] : null;
+    let allowed = position === 0 ? rules.startable : (previous ? rules.follows[previous] : null);
+    if (!allowed) allowed = rules.instructions.map(option => option.value);
+
+    return allowed.filter(instruction =>
+      rules.repeatable.includes(instruction) ||
+      !instructions.some((other, index) => index !== position && other === instruction)
+    );
+  },
+
+  // Every rule the plan breaks, mirroring the server's PlanValidator messages.
+  // Tasks without an instruction yet are skipped rather than reported.
+  validate(rules, tasks) {
+    const violations = [];
+    const instructions = tasks.map(task => task.instruction);
+    const seen = new Set();
+
+    if (tasks.length < rules.minimum_tasks) {
+      violations.push(`A plan requires at least ${rules.minimum_tasks} tasks.`);
+    }
+    if (tasks.length > rules.maximum_tasks) {
+      violations.push(`A plan allows at most ${rules.maximum_tasks} tasks.`);
+    }
+
+    instructions.forEach((instruction, position) => {
+      if (!instruction) return;
+      const previous = position > 0 ? instructions[position - 1] : null;
+
+      if (position === 0 && !rules.startable.includes(instruction)) {
+        violations.push(`${instruction} is not a valid starting instruction.`);
+      }
+      if (previous && !rules.follows[previous].includes(instruction)) {
+        violations.push(`${instruction} cannot follow ${previous}.`);
+      }
+      if (seen.has(instruction) && !rules.repeatable.includes(instruction)) {
+        violations.push(`${instruction} can only appear once in a plan.`);
+      }
+      seen.add(instruction);
+      if (rules.needs_container.includes(instruction) && !tasks[position].selectedContainer) {
+        violations.push(`Task ${position + 1} (${instruction}) is missing its container assignment.`);
+      }
+    });
+
+    const last = instructions[instructions.length - 1];
+    if (last && !rules.endable.includes(last)) {
+      violations.push(`${last} is not a valid ending instruction.`);
+    }
+
+    return violations;
+  }
+};
@@ -0,0 +1,130 @@
+"""
+This module contains controllers that implement the Interface Adapters layer of Clean Architecture.
+
+Controllers are responsible for:
+1. Accepting input from external sources (CLI, web, etc.)
+2. Converting that input into the format required by use cases
+3. Executing the appropriate use case
+4. Converting the result into a view model suitable for the interface
+5. Handling and formatting any errors that occur
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.application.dtos.clock_dtos import ClockBoardRequest, SetFreeTimeRuleRequest
+from src.application.use_cases.clock_use_cases import (
+    GetClockBoardUseCase,
+    ListFreeTimeRulesUseCase,
+    SetFreeTimeRuleUseCase,
+)
+from src.domain.exceptions import ValidationError
+from src.interfaces.presenters.clock_presenter import ClockPresenter
+from src.interfaces.view_models.base import OperationResult
+from src.interfaces.view_models.clock_vm import ClockBoardViewModel, FreeTimeRuleViewModel
+
+
+@dataclass
+class ClockController:
+    """
+    Controller for per diem and detention clocks, and the free time they run against.
+
+    Attributes:
+        board_use_case: Use case for reading every clock
+        list_rules_use_case: Use case for listing free-time rules
+        set_rule_use_case: Use case for setting a free-time rule
+        presenter: Handles formatting of clocks for the interface
+    """
+
+    board_use_case: GetClockBoardUseCase
+    list_rules_use_case: ListFreeTimeRulesUseCase
+    set_rule_use_case: SetFreeTimeRuleUseCase
+    presenter: ClockPresenter
+
+    def handle_board(self, as_of: Optional[str] = None, flagged_only: bool = False) -> OperationResult[ClockBoardViewModel]:
+        """
+        Handle requests for the per diem and detention clocks.
+
+        Args:
+            as_of: The moment to read the clocks at, in ISO format; now when not given
+            flagged_only: Leave out the clocks with free time to spare
+
+        Returns:
+            OperationResult containing either:
+            - Success: ClockBoardViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ClockBoardRequest(as_of=as_of, flagged_only=flagged_only)
+
+            result = self.board_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_board(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_list_rules(self) -> OperationResult[list[FreeTimeRuleViewModel]]:
+        result = self.list_rules_use_case.execute()
+
+        if result.is_success:
+            view_models = [self.presenter.present_rule(rule) for rule in result.value]
+            return OperationResult.succeed(view_models)
+
+        error_vm = self.presenter.present_error(result.error.message, str(result.error.code.name))
+        return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_set_rule(
+            self,
+            clock: str,
+            free_minutes: str,
+            warning_minutes: str,
+            broker_id: Optional[str] = None,
+            location_id: Optional[str] = None,
+            ) -> OperationResult[FreeTimeRuleViewModel]:
+        """
+        Handle requests to set the free time of a clock.
+
+        Args:
+            clock: per_diem or detention
+            free_minutes: Minutes the clock runs before charging
+            warning_minutes: Minutes before charging a running clock is flagged
+            broker_id: The broker the rule is for, or every broker when not given
+            location_id: The location the rule is for, or every location when not given
+
+        Returns:
+            OperationResult containing either:
+            - Success: FreeTimeRuleViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = SetFreeTimeRuleRequest(
+                clock=clock,
+                free_minutes=free_minutes,
+                warning_minutes=warning_minutes,
+                broker_id=broker_id,
+                location_id=location_id,
+            )
+
+            result = self.set_rule_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_rule(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
@@ -0,0 +1,218 @@
+"""
+This module contains controllers that implement the Interface Adapters layer of Clean Architecture.
+
+Controllers are responsible for:
+1. Accepting input from external sources (CLI, web, etc.)
+2. Converting that input into the format required by use cases
+3. Executing the appropriate use case
+4. Converting the result into a view model suitable for the interface
+5. Handling and formatting any errors that occur
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.application.dtos.container_dtos import (
+    ChassisCountsRequest,
+    ChassisDailyReportRequest,
+    ContainerTimelineRequest,
+    RecordChassisCountRequest,
+    YardInventoryRequest,
+)
+from src.application.use_cases.container_use_cases import (
+    ChassisCountsUseCase,
+    ChassisDailyReportUseCase,
+    ContainerTimelineUseCase,
+    RecordChassisCountUseCase,
+    YardInventoryUseCase,
+)
+from src.domain.exceptions import ValidationError
+from src.interfaces.presenters.container_presenter import ContainerPresenter
+from src.interfaces.view_models.base import OperationResult
+from src.interfaces.view_models.container_vm import (
+    ChassisCountViewModel,
+    ChassisCountsViewModel,
+    ChassisDailyReportViewModel,
+    ContainerTimelineViewModel,
+    YardInventoryViewModel,
+)
+
+
+@dataclass
+class ContainerController:
+    """
+    Controller for where containers are and where they have been, and the chassis at each pool.
+
+    Attributes:
+        yard_inventory_use_case: Use case for the containers sitting at a location
+        timeline_use_case: Use case for the moves of one container
+        chassis_counts_use_case: Use case for the chassis count of every pool
+        chassis_daily_report_use_case: Use case for each pool's chassis day by day
+        record_chassis_count_use_case: Use case for setting a pool's count to what was counted
+        presenter: Handles formatting of container moves for the interface
+    """
+
+    yard_inventory_use_case: YardInventoryUseCase
+    timeline_use_case: ContainerTimelineUseCase
+    chassis_counts_use_case: ChassisCountsUseCase
+    chassis_daily_report_use_case: ChassisDailyReportUseCase
+    record_chassis_count_use_case: RecordChassisCountUseCase
+    presenter: ContainerPresenter
+
+    def handle_yard_inventory(self, location_id: str) -> OperationResult[YardInventoryViewModel]:
+        """
+        Handle requests for the containers sitting at a location.
+
+        Args:
+            location_id: The unique identifier of the location
+
+        Returns:
+            OperationResult containing either:
+            - Success: YardInventoryViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = YardInventoryRequest(location_id=location_id)
+
+            result = self.yard_inventory_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_yard_inventory(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_timeline(self, container_number: str) -> OperationResult[ContainerTimelineViewModel]:
+        """
+        Handle requests for where a container has been and where it is now.
+
+        Args:
+            container_number: The container number, with or without spaces and dashes
+
+        Returns:
+            OperationResult containing either:
+            - Success: ContainerTimelineViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ContainerTimelineRequest(container_number=container_number)
+
+            result = self.timeline_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_timeline(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_chassis_counts(self, as_of: Optional[str] = None) -> OperationResult[ChassisCountsViewModel]:
+        """
+        Handle requests for the chassis count of every pool.
+
+        Args:
+            as_of: The moment to count as of, in ISO format; now when not given
+
+        Returns:
+            OperationResult containing either:
+            - Success: ChassisCountsViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ChassisCountsRequest(as_of=as_of)
+
+            result = self.chassis_counts_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_chassis_counts(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_chassis_daily_report(self, start_date: str, end_date: str) -> OperationResult[ChassisDailyReportViewModel]:
+        """
+        Handle requests for each pool's chassis day by day over a date range.
+
+        Args:
+            start_date: The first day of the report, YYYY-MM-DD
+            end_date: The last day of the report, YYYY-MM-DD
+
+        Returns:
+            OperationResult containing either:
+            - Success: ChassisDailyReportViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ChassisDailyReportRequest(start_date=start_date, end_date=end_date)
+
+            result = self.chassis_daily_report_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_chassis_daily_report(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_record_chassis_count(
+            self,
+            location_id: str,
+            count: int,
+            counted_at: Optional[str] = None,
+            ) -> OperationResult[ChassisCountViewModel]:
+        """
+        Handle a count of the chassis at a pool.
+
+        Args:
+            location_id: The unique identifier of the pool's location
+            count: The chassis counted there
+            counted_at: The moment of the count, in ISO format; now when not given
+
+        Returns:
+            OperationResult containing either:
+            - Success: ChassisCountViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = RecordChassisCountRequest(location_id=location_id, count=count, counted_at=counted_at)
+
+            result = self.record_chassis_count_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_chassis_count(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
@@ -16,24 +16,46 @@ Key Clean Architecture benefits demonstrated in these controllers:
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 from src.application.dtos.dispatch_dtos import (
     CreateDispatchRequest,
+    BulkCreateDispatchesRequest,
+    SuggestPlanCompletionsRequest,
     GetDispatchRequest,
+    GetDispatchByReferenceRequest,
+    FindDispatchesByContainerRequest,
     EditDispatchRequest,
     StartDispatchRequest,
     GetLoadboardDispatchesRequest,
+    GetDispatchHistoryRequest,
+    GetLoadboardAsOfRequest,
+    ProposeDriverAssignmentsRequest,
+    DoubleBookingReportRequest,
+    ProposePlanSequenceRequest,
+    ProposeStreetTurnsRequest,
     StartTaskRequest,
     RevertTaskRequest,
     CompleteTaskRequest,
     )
 from src.application.use_cases.dispatch_use_cases import (
     CreateDispatchUseCase,
+    BulkCreateDispatchesUseCase,
+    SuggestPlanCompletionsUseCase,
+    GetPlanRulesUseCase,
     ListDispatchesUseCase,
     GetDispatchUseCase,
+    GetDispatchByReferenceUseCase,
+    FindDispatchesByContainerUseCase,
     EditDispatchUseCase,
     StartDispatchUseCase,
     GetLoadboardDispatchesUseCase,
+    GetDispatchHistoryUseCase,
+    GetLoadboardAsOfUseCase,
+    ProposeDriverAssignmentsUseCase,
+    DoubleBookingReportUseCase,
+    ProposePlanSequenceUseCase,
+    ProposeStreetTurnsUseCase,
     StartTaskUseCase,
     RevertTaskUseCase,
     CompleteTaskUseCase,
@@ -44,6 +66,15 @@ from src.interfaces.view_models.dispatch_vm import (
     DispatchViewModel,
     EditDispatchViewModel,
     DispatchSuccessViewModel,
+    BulkCreateDispatchesViewModel,
+    PlanCompletionsViewModel,
+    PlanRulesViewModel,
+    DispatchStateViewModel,
+    DispatchHistoryViewModel,
+    DriverAssignmentProposalViewModel,
+    DoubleBookingViewModel,
+    PlanSequenceViewModel,
+    StreetTurnViewModel,
     StartDispatchSuccessViewModel,
     StartTaskSuccessViewModel,
     RevertTaskSuccessViewModel,
@@ -82,6 +113,17 @@ class DispatchController:
     start_task_use_case: StartTaskUseCase
     revert_task_use_case: RevertTaskUseCase
     complete_task_use_case: CompleteTaskUseCase
+    bulk_create_use_case: BulkCreateDispatchesUseCase
+    suggest_completions_use_case: SuggestPlanCompletionsUseCase
+    plan_rules_use_case: GetPlanRulesUseCase
+    history_use_case: GetDispatchHistoryUseCase
+    loadboard_as_of_use_case: GetLoadboardAsOfUseCase
+    propose_assignments_use_case: ProposeDriverAssignmentsUseCase
+    double_booking_report_use_case: DoubleBookingReportUseCase
+    propose_sequence_use_case: ProposePlanSequenceUseCase
+    get_by_reference_use_case: GetDispatchByReferenceUseCase
+    find_by_container_use_case: FindDispatchesByContainerUseCase
+    propose_street_turns_use_case: ProposeStreetTurnsUseCase
     presenter: DispatchPresenter
     
 
@@ -149,6 +191,338 @@ class DispatchController:
             error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
             return OperationResult.fail(error_vm.message, error_vm.code)
 
+    def handle_bulk_create(self, dispatches: list[dict]) -> OperationResult[BulkCreateDispatchesViewModel]:
+        """
+        Handle requests to create many dispatches at once.
+
+        Args:
+            dispatches: Items shaped like single creations, each with a
+                broker_id, an optional driver_id and a plan
+
+        Returns:
+            OperationResult containing either:
+            - Success: BulkCreateDispatchesViewModel with one result per item
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = BulkCreateDispatchesRequest(dispatches=dispatches)
+
+            result = self.bulk_create_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_bulk_create(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_suggest_completions(
+            self,
+            instructions: list[str],
+            limit: int = 5,
+        ) -> OperationResult[PlanCompletionsViewModel]:
+        """
+        Handle requests for ways to finish a partial plan.
+
+        Args:
+            instructions: Instruction values of the plan so far, in order
+            limit: Most completions to return
+
+        Returns:
+            OperationResult containing either:
+            - Success: PlanCompletionsViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = SuggestPlanCompletionsRequest(instructions=instructions, limit=limit)
+
+            result = self.suggest_completions_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_plan_completions(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_plan_rules(self) -> OperationResult[PlanRulesViewModel]:
+        """
+        Handle requests for the rules plans are validated against.
+
+        Returns:
+            OperationResult containing either:
+            - Success: PlanRulesViewModel
+            - Failure: Error information formatted for the interface
+        """
+        result = self.plan_rules_use_case.execute()
+
+        if result.is_success:
+            view_model = self.presenter.present_plan_rules(result.value)
+            return OperationResult.succeed(view_model)
+
+        error_vm = self.presenter.present_error(
+            result.error.message, str(result.error.code.name)
+        )
+        return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_history(self, dispatch_id: str, as_of: Optional[str] = None) -> OperationResult[DispatchHistoryViewModel]:
+        """
+        Handle requests for a dispatch as it stood at a given moment.
+
+        Args:
+            dispatch_id: The dispatch to read
+            as_of: ISO date and time to read it at; now when None
+
+        Returns:
+            OperationResult containing either:
+            - Success: DispatchHistoryViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = GetDispatchHistoryRequest(dispatch_id=dispatch_id, as_of=as_of)
+
+            result = self.history_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_dispatch_history(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_loadboard_as_of(self, date: str, as_of: str) -> OperationResult[list[DispatchStateViewModel]]:
+        """
+        Handle requests for the loadboard of a date as it stood at a given moment.
+
+        Args:
+            date: ISO date of the loadboard
+            as_of: ISO date and time to read it at
+
+        Returns:
+            OperationResult containing either:
+            - Success: list of DispatchStateViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = GetLoadboardAsOfRequest(date=date, as_of=as_of)
+
+            result = self.loadboard_as_of_use_case.execute(request)
+
+            if result.is_success:
+                view_models = [self.presenter.present_dispatch_state(state) for state in result.value]
+                return OperationResult.succeed(view_models)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_propose_assignments(self, date: str) -> OperationResult[DriverAssignmentProposalViewModel]:
+        """
+        Handle requests for drivers to take the draft dispatches of a date.
+
+        Args:
+            date: ISO date of the draft dispatches
+
+        Returns:
+            OperationResult containing either:
+            - Success: DriverAssignmentProposalViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ProposeDriverAssignmentsRequest(date=date)
+
+            result = self.propose_assignments_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_assignment_proposal(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_double_booking_report(
+            self, start_date: str, end_date: str) -> OperationResult[list[DoubleBookingViewModel]]:
+        """
+        Handle requests for the drivers booked on overlapping dispatches.
+
+        Args:
+            start_date: First task date to check, in ISO format
+            end_date: Last task date to check, in ISO format
+
+        Returns:
+            OperationResult containing either:
+            - Success: List of DoubleBookingViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = DoubleBookingReportRequest(start_date=start_date, end_date=end_date)
+
+            result = self.double_booking_report_use_case.execute(request)
+
+            if result.is_success:
+                view_models = [self.presenter.present_double_booking(booking) for booking in result.value]
+                return OperationResult.succeed(view_models)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_propose_sequence(self, dispatch_id: str) -> OperationResult[PlanSequenceViewModel]:
+        """
+        Handle requests for the best order of a draft dispatch's tasks.
+
+        Args:
+            dispatch_id: The unique identifier of the draft dispatch
+
+        Returns:
+            OperationResult containing either:
+            - Success: PlanSequenceViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ProposePlanSequenceRequest(dispatch_id=dispatch_id)
+
+            result = self.propose_sequence_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_plan_sequence(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_propose_street_turns(
+            self, start_date: str, end_date: str) -> OperationResult[list[StreetTurnViewModel]]:
+        """
+        Handle requests for the street turns between the imports and exports planned over a date range.
+
+        Args:
+            start_date: First task date of the board, in ISO format
+            end_date: Last task date of the board, in ISO format
+
+        Returns:
+            OperationResult containing either:
+            - Success: List of StreetTurnViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ProposeStreetTurnsRequest(start_date=start_date, end_date=end_date)
+
+            result = self.propose_street_turns_use_case.execute(request)
+
+            if result.is_success:
+                view_models = [self.presenter.present_street_turn(turn) for turn in result.value]
+                return OperationResult.succeed(view_models)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_get_by_reference(self, reference: str) -> OperationResult[DispatchViewModel]:
+        """
+        Handle requests for the dispatch a reference number was given to.
+
+        Args:
+            reference: The dispatch's reference number
+
+        Returns:
+            OperationResult containing either:
+            - Success: DispatchViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = GetDispatchByReferenceRequest(reference=reference)
+
+            result = self.get_by_reference_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_dispatch(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_find_by_container(self, container_number: str) -> OperationResult[list[DispatchViewModel]]:
+        """
+        Handle requests for every dispatch that moved a container.
+
+        Args:
+            container_number: The container number, with or without spaces and dashes
+
+        Returns:
+            OperationResult containing either:
+            - Success: list of DispatchViewModel, earliest first
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = FindDispatchesByContainerRequest(container_number=container_number)
+
+            result = self.find_by_container_use_case.execute(request)
+
+            if result.is_success:
+                view_models = [self.presenter.present_dispatch(dispatch) for dispatch in result.value]
+                return OperationResult.succeed(view_models)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
     def handle_list(self) -> OperationResult[list[DispatchViewModel]]:
         try:
             # Convert primitive input to use case request model specifically designed for the
@@ -0,0 +1,129 @@
+"""
+This module contains controllers that implement the Interface Adapters layer of Clean Architecture.
+
+Controllers are responsible for:
+1. Accepting input from external sources (CLI, web, etc.)
+2. Converting that input into the format required by use cases
+3. Executing the appropriate use case
+4. Converting the result into a view model suitable for the interface
+5. Handling and formatting any errors that occur
+"""
+
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator
+
+from src.application.dtos.export_dtos import ExportDispatchHistoryRequest, ExportTaskFactsRequest
+from src.application.use_cases.export_use_cases import ExportDispatchHistoryUseCase, ExportTaskFactsUseCase
+from src.domain.exceptions import ValidationError
+from src.interfaces.presenters.export_presenter import ExportPresenter
+from src.interfaces.view_models.base import OperationResult
+
+
+@dataclass
+class ExportController:
+    """
+    Controller for bulk data exports.
+
+    Exports are returned as lazy iterators of serialized chunks so that the
+    web layer can stream them and the CLI can write them straight to a file.
+
+    Attributes:
+        export_history_use_case: Use case for streaming dispatch history
+        export_task_facts_use_case: Use case for columnar task fact exports
+        presenter: Handles serialization of exported records
+    """
+
+    export_history_use_case: ExportDispatchHistoryUseCase
+    export_task_facts_use_case: ExportTaskFactsUseCase
+    presenter: ExportPresenter
+
+    def handle_export_history(
+            self,
+            start_date: str,
+            end_date: str,
+            format: str = 'csv',
+        ) -> OperationResult[Iterator[str]]:
+        """
+        Handle dispatch history export requests from any interface.
+
+        Args:
+            start_date: First task date to export, in ISO format
+            end_date: Last task date to export, in ISO format
+            format: Either 'csv' or 'ndjson'
+
+        Returns:
+            OperationResult containing either:
+            - Success: Iterator of serialized text chunks
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ExportDispatchHistoryRequest(
+                start_date=start_date,
+                end_date=end_date,
+                format=format,
+            )
+
+            result = self.export_history_use_case.execute(request)
+
+            if result.is_success:
+                chunks = self.presenter.present_history(result.value, format)
+                return OperationResult.succeed(chunks)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_export_task_facts(
+            self,
+            start_date: str,
+            end_date: str,
+            format: str,
+            open_output: Callable[[], BinaryIO],
+        ) -> OperationResult[int]:
+        """
+        Handle columnar task fact export requests from any interface.
+
+        Args:
+            start_date: First task date to export, in ISO format
+            end_date: Last task date to export, in ISO format
+            format: Either 'npz' or 'parquet'
+            open_output: Opens the binary file the export is written to;
+                called only once the request is valid, so a rejected export
+                leaves nothing behind
+
+        Returns:
+            OperationResult containing either:
+            - Success: Number of tasks written
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ExportTaskFactsRequest(
+                start_date=start_date,
+                end_date=end_date,
+                format=format,
+            )
+
+            result = self.export_task_facts_use_case.execute(request)
+
+            if result.is_success:
+                written = self.presenter.present_task_facts(result.value, format, open_output())
+                return OperationResult.succeed(written)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
+        except ImportError:
+            error_vm = self.presenter.present_error(
+                'Parquet exports require the pyarrow package.', "VALIDATION_ERROR"
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
@@ -0,0 +1,91 @@
+"""
+This module contains controllers that implement the Interface Adapters layer of Clean Architecture.
+
+Controllers are responsible for:
+1. Accepting input from external sources (CLI, web, etc.)
+2. Converting that input into the format required by use cases
+3. Executing the appropriate use case
+4. Converting the result into a view model suitable for the interface
+5. Handling and formatting any errors that occur
+"""
+
+import csv
+from dataclasses import dataclass
+import io
+import json
+
+from src.application.dtos.import_dtos import ImportReferenceDataRequest
+from src.application.use_cases.import_use_cases import ImportReferenceDataUseCase
+from src.domain.exceptions import ValidationError
+from src.interfaces.presenters.import_presenter import ImportPresenter
+from src.interfaces.view_models.base import OperationResult
+from src.interfaces.view_models.import_vm import ImportReportViewModel
+
+
+IMPORT_FORMATS = ('csv', 'json')
+
+
+def _parse_rows(content: str, format: str) -> list[dict]:
+    """Read CSV with a header row, or a JSON array of objects, into row dicts."""
+    if format == 'csv':
+        return list(csv.DictReader(io.StringIO(content)))
+    if format == 'json':
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValidationError(f'The import file is not valid JSON: {e.msg}.')
+    raise ValidationError(f'Import format must be one of: {", ".join(IMPORT_FORMATS)}.')
+
+
+@dataclass
+class ImportController:
+    """
+    Controller for bulk reference data imports.
+
+    Attributes:
+        import_reference_use_case: Use case for importing locations, brokers and drivers
+        presenter: Handles formatting of the import report for the interface
+    """
+
+    import_reference_use_case: ImportReferenceDataUseCase
+    presenter: ImportPresenter
+
+    def handle_import_reference(
+            self,
+            kind: str,
+            content: str,
+            format: str = 'csv',
+        ) -> OperationResult[ImportReportViewModel]:
+        """
+        Handle reference data import requests from any interface.
+
+        Args:
+            kind: One of 'locations', 'brokers' or 'drivers'
+            content: The text of the import file
+            format: Either 'csv' or 'json'
+
+        Returns:
+            OperationResult containing either:
+            - Success: ImportReportViewModel with per-row outcomes
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = ImportReferenceDataRequest(
+                kind=kind,
+                rows=_parse_rows(content, format),
+            )
+
+            result = self.import_reference_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_import(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
@@ -16,17 +16,19 @@ Key Clean Architecture benefits demonstrated in these controllers:
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 from src.domain.exceptions import ValidationError
 
 from src.interfaces.presenters.location_presenter import LocationPresenter
-from src.interfaces.view_models.location_vm import LocationViewModel
+from src.interfaces.view_models.location_vm import LocationViewModel, NearbyLocationViewModel
 from src.interfaces.view_models.base import OperationResult
 from src.application.dtos.location_dtos import (
     CreateLocationRequest,
     DeactivateLocationRequest,
     ActivateLocationRequest,
-    EditLocationRequest
+    EditLocationRequest,
+    NearbyLocationsRequest,
     )
 from src.application.use_cases.location_use_cases import (
     ListLocationsUseCase,
@@ -34,7 +36,8 @@ from src.application.use_cases.location_use_cases import (
     DeactivateLocationUseCase,
     ActivateLocationUseCase,
     EditLocationUseCase,
-    ActiveLocationsUseCase
+    ActiveLocationsUseCase,
+    NearbyLocationsUseCase,
 )
 
 
@@ -65,6 +68,7 @@ class LocationController:
     activate_use_case: ActivateLocationUseCase
     edit_use_case: EditLocationUseCase
     active_locations_use_case: ActiveLocationsUseCase
+    nearby_use_case: NearbyLocationsUseCase
     presenter: LocationPresenter
 
     def handle_create(
@@ -231,4 +235,48 @@ class LocationController:
             return OperationResult.succeed(view_models)
 
         error_vm = self.presenter.present_error(result.error.message, str(result.error.code.name))
-        return OperationResult.fail(error_vm.message, error_vm.code)
\ No newline at end of file
+        return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_nearby(
+            self,
+            zipcode: Optional[str] = None,
+            location_id: Optional[str] = None,
+            limit: int = 10,
+            within_miles: Optional[float] = None,
+        ) -> OperationResult[list[NearbyLocationViewModel]]:
+        """
+        Handle requests for the active locations near a zipcode or another location.
+
+        Args:
+            zipcode: The zipcode to search around, when no location_id is given
+            location_id: The location to search around, which is left out of the results
+            limit: The most locations to return
+            within_miles: Only return locations at most this far away
+
+        Returns:
+            OperationResult containing either:
+            - Success: List of NearbyLocationViewModel, closest first
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = NearbyLocationsRequest(
+                zipcode=zipcode,
+                location_id=location_id,
+                limit=limit,
+                within_miles=within_miles,
+            )
+
+            result = self.nearby_use_case.execute(request)
+
+            if result.is_success:
+                view_models = [self.presenter.present_nearby_location(nearby) for nearby in result.value]
+                return OperationResult.succeed(view_models)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
@@ -0,0 +1,73 @@
+"""
+This module contains controllers that implement the Interface Adapters layer of Clean Architecture.
+
+Controllers are responsible for:
+1. Accepting input from external sources (CLI, web, etc.)
+2. Converting that input into the format required by use cases
+3. Executing the appropriate use case
+4. Converting the result into a view model suitable for the interface
+5. Handling and formatting any errors that occur
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.application.dtos.search_dtos import TypeaheadSearchRequest
+from src.application.use_cases.search_use_cases import TypeaheadSearchUseCase
+from src.domain.exceptions import ValidationError
+from src.interfaces.presenters.search_presenter import SearchPresenter
+from src.interfaces.view_models.base import OperationResult
+from src.interfaces.view_models.search_vm import SearchResultsViewModel
+
+
+@dataclass
+class SearchController:
+    """
+    Controller for typeahead search across locations, brokers and drivers.
+
+    Attributes:
+        typeahead_use_case: Use case for ranked, paginated search
+        presenter: Handles formatting of search hits for the interface
+    """
+
+    typeahead_use_case: TypeaheadSearchUseCase
+    presenter: SearchPresenter
+
+    def handle_typeahead(
+            self,
+            query: str,
+            kinds: Optional[str] = None,
+            page: int = 1,
+            per_page: int = 10,
+        ) -> OperationResult[SearchResultsViewModel]:
+        """
+        Handle typeahead search requests from any interface.
+
+        Args:
+            query: What has been typed so far
+            kinds: Comma separated kinds to search, among location, broker and driver; all of them if None
+            page: The 1-based page of hits
+            per_page: Hits per page
+
+        Returns:
+            OperationResult containing either:
+            - Success: SearchResultsViewModel
+            - Failure: Error information formatted for the interface
+        """
+        try:
+            request = TypeaheadSearchRequest(query=query, kinds=kinds, page=page, per_page=per_page)
+
+            result = self.typeahead_use_case.execute(request)
+
+            if result.is_success:
+                view_model = self.presenter.present_results(result.value)
+                return OperationResult.succeed(view_model)
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+        except ValidationError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.application.dtos.clock_dtos import ClockBoardResponse, ClockResponse, FreeTimeRuleResponse
+from src.interfaces.view_models.base import ErrorViewModel
+from src.interfaces.view_models.clock_vm import ClockBoardViewModel, ClockViewModel, FreeTimeRuleViewModel
+
+
+class ClockPresenter(ABC):
+    """Abstract base presenter for per diem and detention clocks."""
+
+    @abstractmethod
+    def present_board(self, board_response: ClockBoardResponse) -> ClockBoardViewModel:
+        """Convert clock board response to view model."""
+        pass
+
+    @abstractmethod
+    def present_rule(self, rule_response: FreeTimeRuleResponse) -> FreeTimeRuleViewModel:
+        """Convert free-time rule response to view model."""
+        pass
+
+    @abstractmethod
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error message for display."""
+        pass
+
+
+def _duration(minutes: int) -> str:
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f'{days}d {hours}h'
+    if hours:
+        return f'{hours}h {minutes}m'
+    return f'{minutes}m'
+
+
+class WebClockPresenter(ClockPresenter):
+    """Web-specific clock presenter."""
+
+    def present_board(self, board_response: ClockBoardResponse) -> ClockBoardViewModel:
+        """Format a clock board for web display."""
+        return ClockBoardViewModel(
+            as_of=board_response.as_of.strftime('%Y-%m-%d %H:%M'),
+            charging=sum(clock.status == 'charging' for clock in board_response.clocks),
+            warning=sum(clock.status == 'warning' for clock in board_response.clocks),
+            clocks=[self._present_clock(clock) for clock in board_response.clocks],
+        )
+
+    def present_rule(self, rule_response: FreeTimeRuleResponse) -> FreeTimeRuleViewModel:
+        """Format a free-time rule for web display."""
+        return FreeTimeRuleViewModel(
+            clock=rule_response.clock.replace('_', ' ').title(),
+            broker_id=rule_response.broker_id,
+            broker_name=rule_response.broker_name or 'All brokers',
+            location_id=rule_response.location_id,
+            location_name=rule_response.location_name or 'All locations',
+            free_minutes=rule_response.free_minutes,
+            warning_minutes=rule_response.warning_minutes,
+            free_display=_duration(rule_response.free_minutes),
+            warning_display=_duration(rule_response.warning_minutes),
+        )
+
+    def _present_clock(self, clock: ClockResponse) -> ClockViewModel:
+        return ClockViewModel(
+            clock=clock.clock.replace('_', ' ').title(),
+            status=clock.status.title(),
+            dispatch_id=clock.dispatch_id,
+            broker_name=clock.broker_name,
+            location_name=clock.location_name,
+            container_number=clock.container_number or '',
+            started_at=clock.started_at.strftime('%Y-%m-%d %H:%M'),
+            stopped_at=clock.stopped_at.strftime('%Y-%m-%d %H:%M') if clock.stopped_at else '',
+            running=clock.running,
+            elapsed_display=_duration(clock.elapsed_minutes),
+            free_display=_duration(clock.free_minutes),
+            remaining_display=_duration(clock.remaining_minutes),
+            chargeable_display=_duration(clock.chargeable_minutes),
+            remaining_minutes=clock.remaining_minutes,
+            chargeable_minutes=clock.chargeable_minutes,
+        )
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for web display."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.application.dtos.container_dtos import (
+    ChassisCountResponse,
+    ChassisCountsResponse,
+    ChassisDailyReportResponse,
+    ContainerMoveResponse,
+    ContainerTimelineResponse,
+    YardInventoryResponse,
+)
+from src.interfaces.view_models.base import ErrorViewModel
+from src.interfaces.view_models.container_vm import (
+    ChassisCountViewModel,
+    ChassisCountsViewModel,
+    ChassisDailyReportViewModel,
+    ChassisDayViewModel,
+    ContainerMoveViewModel,
+    ContainerTimelineViewModel,
+    YardInventoryViewModel,
+)
+
+
+class ContainerPresenter(ABC):
+    """Abstract base presenter for container inventory output."""
+
+    @abstractmethod
+    def present_yard_inventory(self, inventory_response: YardInventoryResponse) -> YardInventoryViewModel:
+        """Convert yard inventory response to view model."""
+        pass
+
+    @abstractmethod
+    def present_timeline(self, timeline_response: ContainerTimelineResponse) -> ContainerTimelineViewModel:
+        """Convert container timeline response to view model."""
+        pass
+
+    @abstractmethod
+    def present_chassis_counts(self, counts_response: ChassisCountsResponse) -> ChassisCountsViewModel:
+        """Convert chassis counts response to view model."""
+        pass
+
+    @abstractmethod
+    def present_chassis_count(self, count_response: ChassisCountResponse) -> ChassisCountViewModel:
+        """Convert a recorded chassis count to view model."""
+        pass
+
+    @abstractmethod
+    def present_chassis_daily_report(self, report_response: ChassisDailyReportResponse) -> ChassisDailyReportViewModel:
+        """Convert daily chassis report response to view model."""
+        pass
+
+    @abstractmethod
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error message for display."""
+        pass
+
+
+class WebContainerPresenter(ContainerPresenter):
+    """Web-specific container inventory presenter."""
+
+    def present_yard_inventory(self, inventory_response: YardInventoryResponse) -> YardInventoryViewModel:
+        """Format the containers at a location for web display."""
+        return YardInventoryViewModel(
+            location_id=inventory_response.location_id,
+            location_name=inventory_response.location_name,
+            containers=[self._present_move(move) for move in inventory_response.containers],
+        )
+
+    def present_timeline(self, timeline_response: ContainerTimelineResponse) -> ContainerTimelineViewModel:
+        """Format a container's timeline for web display."""
+        moves = [self._present_move(move) for move in timeline_response.moves]
+        return ContainerTimelineViewModel(
+            container_number=timeline_response.container_number,
+            current=moves[-1] if moves else None,
+            moves=moves,
+        )
+
+    def present_chassis_counts(self, counts_response: ChassisCountsResponse) -> ChassisCountsViewModel:
+        """Format the chassis count of every pool for web display."""
+        return ChassisCountsViewModel(
+            as_of=counts_response.as_of.strftime('%Y-%m-%d %H:%M'),
+            pools=[self.present_chassis_count(pool) for pool in counts_response.pools],
+        )
+
+    def present_chassis_count(self, count_response: ChassisCountResponse) -> ChassisCountViewModel:
+        """Format the chassis count of one pool for web display."""
+        return ChassisCountViewModel(count_response.location_id, count_response.location_name, count_response.count)
+
+    def present_chassis_daily_report(self, report_response: ChassisDailyReportResponse) -> ChassisDailyReportViewModel:
+        """Format a daily chassis report for web display."""
+        return ChassisDailyReportViewModel(
+            start_date=report_response.start_date.isoformat(),
+            end_date=report_response.end_date.isoformat(),
+            days=[
+                ChassisDayViewModel(
+                    location_id=chassis_day.location_id,
+                    location_name=chassis_day.location_name,
+                    day=chassis_day.day.isoformat(),
+                    fetched=chassis_day.fetched,
+                    terminated=chassis_day.terminated,
+                    balance=chassis_day.balance,
+                )
+                for chassis_day in report_response.days
+            ],
+        )
+
+    def _present_move(self, move: ContainerMoveResponse) -> ContainerMoveViewModel:
+        return ContainerMoveViewModel(
+            container_number=move.container_number,
+            dispatch_id=move.dispatch_id,
+            instruction=move.instruction.replace('_', ' ').title(),
+            location_id=move.location_id,
+            location_name=move.location_name,
+            state=move.state.replace('_', ' ').title(),
+            load_display={True: 'Loaded', False: 'Empty', None: ''}[move.loaded],
+            moved_at=move.moved_at.strftime('%Y-%m-%d %H:%M'),
+        )
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for web display."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
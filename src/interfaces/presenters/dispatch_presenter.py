@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
-from dataclasses import asdict
+from dataclasses import asdict, fields
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
+from src.domain.aggregates.dispatch.history import DispatchState
+from src.domain.common.events import DomainEvent
 from src.interfaces.presenters.task_presenter import WebTaskPresenter
 from src.interfaces.view_models.base import ErrorViewModel
+from src.application.dtos.task_dtos import TaskResponse
 from src.application.dtos.dispatch_dtos import (
     DispatchResponse,
+    BulkCreateDispatchesResponse,
+    DispatchHistoryResponse,
+    DriverAssignmentProposalResponse,
+    DoubleBookingResponse,
+    PlanSequenceResponse,
+    StreetTurnResponse,
+    PlanCompletionsResponse,
+    PlanRulesResponse,
     StartDispatchResponse,
     StartTaskResponse,
     RevertTaskResponse,
@@ -15,6 +28,17 @@ from src.interfaces.view_models.dispatch_vm import (
     DispatchViewModel,
     EditDispatchViewModel,
     DispatchSuccessViewModel,
+    BulkCreateDispatchesViewModel,
+    BulkDispatchResultViewModel,
+    PlanCompletionsViewModel,
+    PlanRulesViewModel,
+    DispatchStateViewModel,
+    DispatchHistoryViewModel,
+    ProposedAssignmentViewModel,
+    DriverAssignmentProposalViewModel,
+    DoubleBookingViewModel,
+    PlanSequenceViewModel,
+    StreetTurnViewModel,
     StartDispatchSuccessViewModel,
     StartTaskSuccessViewModel,
     RevertTaskSuccessViewModel,
@@ -40,6 +64,52 @@ class DispatchPresenter(ABC):
         """Convert dispatch response to an editing view model."""
         pass
 
+    @abstractmethod
+    def present_bulk_create(self, bulk_response: BulkCreateDispatchesResponse) -> BulkCreateDispatchesViewModel:
+        """Convert a bulk creation response to view model."""
+        pass
+
+    @abstractmethod
+    def present_plan_completions(self, completions_response: PlanCompletionsResponse) -> PlanCompletionsViewModel:
+        """Convert plan suggestions to view model."""
+        pass
+
+    @abstractmethod
+    def present_plan_rules(self, rules_response: PlanRulesResponse) -> PlanRulesViewModel:
+        """Convert the plan rules to view model."""
+        pass
+
+    @abstractmethod
+    def present_dispatch_state(self, state: DispatchState) -> DispatchStateViewModel:
+        """Convert a dispatch history state to view model."""
+        pass
+
+    @abstractmethod
+    def present_dispatch_history(self, history_response: DispatchHistoryResponse) -> DispatchHistoryViewModel:
+        """Convert a dispatch history to view model."""
+        pass
+
+    @abstractmethod
+    def present_assignment_proposal(
+            self, proposal_response: DriverAssignmentProposalResponse) -> DriverAssignmentProposalViewModel:
+        """Convert a driver assignment proposal to view model."""
+        pass
+
+    @abstractmethod
+    def present_double_booking(self, booking_response: DoubleBookingResponse) -> DoubleBookingViewModel:
+        """Convert a double booking to view model."""
+        pass
+
+    @abstractmethod
+    def present_plan_sequence(self, sequence_response: PlanSequenceResponse) -> PlanSequenceViewModel:
+        """Convert a proposed plan order to view model."""
+        pass
+
+    @abstractmethod
+    def present_street_turn(self, turn_response: StreetTurnResponse) -> StreetTurnViewModel:
+        """Convert a proposed street turn to view model."""
+        pass
+
     @abstractmethod
     def present_start_dispatch_success(self, dispatch_response: StartDispatchResponse) -> StartDispatchSuccessViewModel:
         """Convert dispatch response to an editing view model."""
@@ -96,7 +166,17 @@ class WebDispatchPresenter(DispatchPresenter):
                     'start_time': a[1].start_time.strftime("%I:%M %p") if a[1].start_time else None,
                     'end_time': a[1].end_time.strftime("%I:%M %p") if a[1].end_time else None,
                 } for a in dispatch_response.appointments],
-            plan=[self.task_presenter.present_task(task) for task in dispatch_response.plan]
+            plan=[self.task_presenter.present_task(task) for task in dispatch_response.plan],
+            etas=[
+                {
+                    'priority': str(eta.priority),
+                    'arrival': eta.arrival.strftime("%I:%M %p"),
+                    'departure': eta.departure.strftime("%I:%M %p"),
+                    'latest_arrival': eta.latest_arrival.strftime("%I:%M %p"),
+                    'arrival_date': eta.arrival.date().isoformat(),
+                    'risk': eta.risk.value if eta.risk else None,
+                } for eta in dispatch_response.etas],
+            risk=dispatch_response.risk.value if dispatch_response.risk else None,
         )
     
     def present_edit_dispatch(self, dispatch_response: DispatchResponse) -> EditDispatchViewModel:
@@ -121,6 +201,183 @@ class WebDispatchPresenter(DispatchPresenter):
         """Format error for web display."""
         return DispatchSuccessViewModel(reference=str(dispatch_response.reference))
     
+    def present_bulk_create(self, bulk_response: BulkCreateDispatchesResponse) -> BulkCreateDispatchesViewModel:
+        """Format per-item bulk creation results for web display."""
+        return BulkCreateDispatchesViewModel(
+            created=bulk_response.created,
+            failed=len(bulk_response.results) - bulk_response.created,
+            results=[
+                BulkDispatchResultViewModel(
+                    index=result.index,
+                    id=result.id,
+                    reference=str(result.reference) if result.reference is not None else None,
+                    error=result.error,
+                )
+                for result in bulk_response.results
+            ],
+        )
+
+    def present_plan_completions(self, completions_response: PlanCompletionsResponse) -> PlanCompletionsViewModel:
+        """Format plan suggestions as instruction values for the plan editors."""
+        return PlanCompletionsViewModel(
+            violations=completions_response.violations,
+            completions=[
+                [instruction.value for instruction in completion]
+                for completion in completions_response.completions
+            ],
+        )
+
+    def present_plan_rules(self, rules_response: PlanRulesResponse) -> PlanRulesViewModel:
+        """Format the plan rules as instruction values, with a label for each instruction."""
+        rules = rules_response.rules
+        values = lambda instructions: [instruction.value for instruction in instructions]
+        return PlanRulesViewModel(
+            version=rules_response.version,
+            instructions=[
+                {"value": instruction.value, "label": instruction.value.replace('_', ' ').title()}
+                for instruction in rules.instructions
+            ],
+            startable=values(rules.startable),
+            follows={instruction.value: values(following) for instruction, following in rules.follows.items()},
+            endable=values(rules.endable),
+            repeatable=values(rules.repeatable),
+            needs_container=values(rules.needs_container),
+            minimum_tasks=rules_response.minimum_tasks,
+            maximum_tasks=rules_response.maximum_tasks,
+        )
+
+    def present_dispatch_state(self, state: DispatchState) -> DispatchStateViewModel:
+        """Format a dispatch history state for web display."""
+        moment = lambda value: value.isoformat() if value else None
+        return DispatchStateViewModel(
+            id=str(state.dispatch_id),
+            reference=str(state.reference),
+            status=state.status.value,
+            driver_id=str(state.driver_id) if state.driver_id else None,
+            version=state.version,
+            tasks=[
+                {
+                    'id': str(task.task_id),
+                    'priority': task.priority,
+                    'instruction': task.instruction.value,
+                    'status': task.status.value,
+                    'check_in': moment(task.check_in),
+                    'check_out': moment(task.check_out),
+                    'completed_by': str(task.completed_by) if task.completed_by else None,
+                }
+                for task in state.tasks
+            ],
+        )
+
+    def _present_event(self, event: DomainEvent) -> dict:
+        data = {'type': type(event).__name__}
+        for field in fields(event):
+            value = getattr(event, field.name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, UUID):
+                value = str(value)
+            data[field.name] = getattr(value, 'value', value)
+        return data
+
+    def present_dispatch_history(self, history_response: DispatchHistoryResponse) -> DispatchHistoryViewModel:
+        """Format a dispatch history, with its events in the order they were recorded."""
+        return DispatchHistoryViewModel(
+            state=self.present_dispatch_state(history_response.state),
+            events=[self._present_event(event) for event in history_response.events],
+        )
+
+    def present_assignment_proposal(
+            self, proposal_response: DriverAssignmentProposalResponse) -> DriverAssignmentProposalViewModel:
+        """Format a driver assignment proposal for web display."""
+        return DriverAssignmentProposalViewModel(
+            assignments=[
+                ProposedAssignmentViewModel(
+                    dispatch_id=assignment.dispatch_id,
+                    reference=str(assignment.reference),
+                    driver_id=str(assignment.driver.id),
+                    driver_name=self._extract_driver_names([assignment.driver])[0],
+                    idle_minutes=assignment.idle_minutes,
+                    late_minutes=assignment.late_minutes,
+                    misses_appointment=assignment.late_minutes > 0,
+                )
+                for assignment in proposal_response.assignments
+            ],
+            unassigned=[
+                {'id': dispatch.id, 'reference': str(dispatch.reference)}
+                for dispatch in proposal_response.unassigned
+            ],
+        )
+
+    def present_double_booking(self, booking_response: DoubleBookingResponse) -> DoubleBookingViewModel:
+        """Format a double booking for web display."""
+        return DoubleBookingViewModel(
+            driver_id=str(booking_response.driver.id),
+            driver_name=self._extract_driver_names([booking_response.driver])[0],
+            date=booking_response.date.isoformat(),
+            dispatch_id=booking_response.dispatch_id,
+            reference=str(booking_response.reference),
+            other_dispatch_id=booking_response.other_dispatch_id,
+            other_reference=str(booking_response.other_reference),
+            start=booking_response.start.strftime('%H:%M'),
+            end=booking_response.end.strftime('%H:%M'),
+        )
+
+    def present_plan_sequence(self, sequence_response: PlanSequenceResponse) -> PlanSequenceViewModel:
+        """Format a proposed plan order for web display, numbering the tasks in their new order."""
+        return PlanSequenceViewModel(
+            dispatch_id=sequence_response.dispatch_id,
+            reference=str(sequence_response.reference),
+            tasks=[
+                {
+                    'priority': priority,
+                    'current_priority': task.priority,
+                    'instruction': task.instruction.value,
+                    'location_name': task.location.name,
+                    'date': task.date.isoformat(),
+                }
+                for priority, task in enumerate(sequence_response.tasks, start=1)
+            ],
+            travel_minutes=sequence_response.travel_minutes,
+            late_minutes=sequence_response.late_minutes,
+            missed_appointments=sequence_response.missed_appointments,
+            current_travel_minutes=sequence_response.current_travel_minutes,
+            current_late_minutes=sequence_response.current_late_minutes,
+            current_missed_appointments=sequence_response.current_missed_appointments,
+            changed=any(task.priority != priority for priority, task in enumerate(sequence_response.tasks, start=1)),
+        )
+
+    def present_street_turn(self, turn_response: StreetTurnResponse) -> StreetTurnViewModel:
+        """Format a proposed street turn for web display, with both plans as they would read."""
+        return StreetTurnViewModel(
+            import_dispatch_id=turn_response.import_dispatch_id,
+            import_reference=str(turn_response.import_reference),
+            export_dispatch_id=turn_response.export_dispatch_id,
+            export_reference=str(turn_response.export_reference),
+            container_number=turn_response.container.number,
+            container_size=turn_response.container.size.value,
+            freed_at=turn_response.freed_at.name,
+            freed_on=turn_response.freed_on.isoformat(),
+            loaded_at=turn_response.loaded_at.name,
+            loaded_on=turn_response.loaded_on.isoformat(),
+            saved_minutes=turn_response.saved_minutes,
+            waiting_days=turn_response.waiting_days,
+            import_plan=self._format_plan(turn_response.import_plan),
+            export_plan=self._format_plan(turn_response.export_plan),
+        )
+
+    def _format_plan(self, tasks: list[TaskResponse]) -> list[dict]:
+        return [
+            {
+                'priority': task.priority,
+                'instruction': task.instruction.value,
+                'location_name': task.location.name,
+                'container_number': task.container.number if task.container else None,
+                'date': task.date.isoformat(),
+            }
+            for task in tasks
+        ]
+
     def present_start_dispatch_success(self, dispatch_response: StartDispatchResponse) -> StartDispatchSuccessViewModel:
         """Format error for web display."""
         return StartDispatchSuccessViewModel(
@@ -0,0 +1,222 @@
+from abc import ABC, abstractmethod
+import csv
+from dataclasses import astuple, fields
+from datetime import date, datetime, time
+import io
+import json
+from tempfile import TemporaryFile
+from typing import BinaryIO, Iterable, Iterator, Optional
+import zipfile
+
+import numpy as np
+
+from src.interfaces.view_models.base import ErrorViewModel
+from src.application.dtos.export_dtos import DispatchHistoryRecord, TaskFactsChunk
+from src.domain.aggregates.dispatch.value_objects import AppointmentType, Instruction
+
+
+# Number of rows buffered into each chunk handed to the streaming response.
+ROWS_PER_CHUNK = 500
+
+HISTORY_COLUMNS = [field.name for field in fields(DispatchHistoryRecord)]
+
+# Categorical columns are stored as small integer codes into these tables,
+# which are written alongside the data. Missing values use code -1.
+INSTRUCTION_CATEGORIES = [instruction.value for instruction in Instruction]
+APPOINTMENT_TYPE_CATEGORIES = [appointment_type.value for appointment_type in AppointmentType]
+_INSTRUCTION_CODES = {value: code for code, value in enumerate(INSTRUCTION_CATEGORIES)}
+_APPOINTMENT_TYPE_CODES = {value: code for code, value in enumerate(APPOINTMENT_TYPE_CATEGORIES)}
+
+
+def _format_value(value):
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    return value
+
+
+def _minutes_after_midnight(times: list[Optional[time]]) -> np.ndarray:
+    minutes = np.array([t.hour * 60 + t.minute if t else 0 for t in times], dtype='timedelta64[m]')
+    minutes[[t is None for t in times]] = np.timedelta64('NaT')
+    return minutes
+
+
+def task_fact_arrays(chunk: TaskFactsChunk) -> dict[str, np.ndarray]:
+    """Convert a chunk of task facts into typed NumPy columns."""
+    return {
+        'reference': np.array(chunk.reference, dtype=np.int64),
+        'priority': np.array(chunk.priority, dtype=np.int8),
+        'instruction': np.array(
+            [_INSTRUCTION_CODES[value] for value in chunk.instruction], dtype=np.int8),
+        'location_name': np.array(chunk.location_name, dtype=np.str_),
+        'date': np.array(chunk.date, dtype='datetime64[D]'),
+        'appointment_type': np.array(
+            [_APPOINTMENT_TYPE_CODES[value] if value else -1 for value in chunk.appointment_type],
+            dtype=np.int8),
+        'appointment_start_time': _minutes_after_midnight(chunk.appointment_start_time),
+        'appointment_end_time': _minutes_after_midnight(chunk.appointment_end_time),
+        'check_in': np.array(chunk.check_in, dtype='datetime64[s]'),
+        'check_out': np.array(chunk.check_out, dtype='datetime64[s]'),
+        'duration': np.array(chunk.duration, dtype='timedelta64[s]'),
+        'driver_name': np.array([name or '' for name in chunk.driver_name], dtype=np.str_),
+    }
+
+
+class _ColumnSpool:
+    """One column of an .npz export, kept in a temporary file until every chunk of it is written."""
+
+    def __init__(self) -> None:
+        self._file = TemporaryFile()
+        self._parts: list[tuple[np.dtype, int]] = []
+
+    def __len__(self) -> int:
+        return sum(count for _, count in self._parts)
+
+    def append(self, array: np.ndarray) -> None:
+        self._file.write(array.tobytes())
+        self._parts.append((array.dtype, len(array)))
+
+    def write_to(self, member: BinaryIO) -> None:
+        """Write the column as a .npy file, widening the strings of narrower chunks to the widest."""
+        dtype = np.result_type(*(part_dtype for part_dtype, _ in self._parts))
+        np.lib.format.write_array_header_1_0(member, {
+            'descr': np.lib.format.dtype_to_descr(dtype),
+            'fortran_order': False,
+            'shape': (len(self),),
+        })
+        self._file.seek(0)
+        for part_dtype, count in self._parts:
+            part = np.frombuffer(self._file.read(count * part_dtype.itemsize), dtype=part_dtype)
+            member.write(part.astype(dtype, copy=False).tobytes())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ExportPresenter(ABC):
+    """Abstract base presenter for exported data."""
+
+    @abstractmethod
+    def present_history(self, records: Iterable[DispatchHistoryRecord], format: str) -> Iterator[str]:
+        """Convert history records into chunks of serialized text."""
+        pass
+
+    @abstractmethod
+    def present_task_facts(self, chunks: Iterable[TaskFactsChunk], format: str, output: BinaryIO) -> int:
+        """Write task fact chunks to a binary file in a columnar format."""
+        pass
+
+    @abstractmethod
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error message for display."""
+        pass
+
+
+class StreamingExportPresenter(ExportPresenter):
+    """Serializes exports progressively so large ranges never sit in memory."""
+
+    def present_history(self, records: Iterable[DispatchHistoryRecord], format: str) -> Iterator[str]:
+        """Format history records as CSV or NDJSON chunks."""
+        if format == 'ndjson':
+            return self._history_ndjson(records)
+        return self._history_csv(records)
+
+    def _history_csv(self, records: Iterable[DispatchHistoryRecord]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(HISTORY_COLUMNS)
+
+        for count, record in enumerate(records, start=1):
+            writer.writerow([_format_value(value) for value in astuple(record)])
+            if count % ROWS_PER_CHUNK == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue()
+
+    def _history_ndjson(self, records: Iterable[DispatchHistoryRecord]) -> Iterator[str]:
+        lines = []
+
+        for record in records:
+            row = dict(zip(HISTORY_COLUMNS, (_format_value(value) for value in astuple(record))))
+            lines.append(json.dumps(row))
+            if len(lines) == ROWS_PER_CHUNK:
+                yield '\n'.join(lines) + '\n'
+                lines.clear()
+
+        if lines:
+            yield '\n'.join(lines) + '\n'
+
+    def present_task_facts(self, chunks: Iterable[TaskFactsChunk], format: str, output: BinaryIO) -> int:
+        """
+        Write task facts as an .npz of typed arrays or as Parquet.
+
+        Returns:
+            The number of tasks written
+        """
+        if format == 'parquet':
+            return self._task_facts_parquet(chunks, output)
+        return self._task_facts_npz(chunks, output)
+
+    def _task_facts_npz(self, chunks: Iterable[TaskFactsChunk], output: BinaryIO) -> int:
+        # Each column is spooled to its own temporary file as chunks arrive,
+        # then copied into one .npy member of the archive once its length is
+        # known, so only a chunk is ever held in memory.
+        columns: dict[str, _ColumnSpool] = {}
+        try:
+            for chunk in chunks:
+                for name, array in task_fact_arrays(chunk).items():
+                    columns.setdefault(name, _ColumnSpool()).append(array)
+            if not columns:
+                for name, array in task_fact_arrays(TaskFactsChunk()).items():
+                    columns.setdefault(name, _ColumnSpool()).append(array)
+
+            with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+                for name, categories in (
+                        ('instruction_categories', INSTRUCTION_CATEGORIES),
+                        ('appointment_type_categories', APPOINTMENT_TYPE_CATEGORIES),
+                        ):
+                    with archive.open(f'{name}.npy', 'w') as member:
+                        np.lib.format.write_array(member, np.array(categories))
+                for name, column in columns.items():
+                    with archive.open(f'{name}.npy', 'w', force_zip64=True) as member:
+                        column.write_to(member)
+            return len(columns['reference'])
+        finally:
+            for column in columns.values():
+                column.close()
+
+    def _task_facts_parquet(self, chunks: Iterable[TaskFactsChunk], output: BinaryIO) -> int:
+        # pyarrow is optional; only Parquet exports need it.
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([
+            ('reference', pa.int64()),
+            ('priority', pa.int8()),
+            ('instruction', pa.dictionary(pa.int8(), pa.string())),
+            ('location_name', pa.string()),
+            ('date', pa.date32()),
+            ('appointment_type', pa.dictionary(pa.int8(), pa.string())),
+            ('appointment_start_time', pa.time32('s')),
+            ('appointment_end_time', pa.time32('s')),
+            ('check_in', pa.timestamp('s')),
+            ('check_out', pa.timestamp('s')),
+            ('duration', pa.duration('s')),
+            ('driver_name', pa.string()),
+        ])
+
+        written = 0
+        with pq.ParquetWriter(output, schema) as writer:
+            for chunk in chunks:
+                table = pa.Table.from_pydict(
+                    {name: getattr(chunk, name) for name in schema.names},
+                    schema=schema,
+                )
+                writer.write_table(table)
+                written += len(chunk)
+        return written
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for display."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
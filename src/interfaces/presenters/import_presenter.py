@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.application.dtos.import_dtos import ImportReferenceDataResponse
+from src.interfaces.view_models.base import ErrorViewModel
+from src.interfaces.view_models.import_vm import ImportReportViewModel, ImportRowViewModel
+
+
+class ImportPresenter(ABC):
+    """Abstract base presenter for bulk import output."""
+
+    @abstractmethod
+    def present_import(self, import_response: ImportReferenceDataResponse) -> ImportReportViewModel:
+        """Convert import response to view model."""
+        pass
+
+    @abstractmethod
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error message for display."""
+        pass
+
+
+class CliImportPresenter(ImportPresenter):
+    """Command line import presenter."""
+
+    def present_import(self, import_response: ImportReferenceDataResponse) -> ImportReportViewModel:
+        """Format an import report for the command line, listing rows in file order."""
+        rows = [
+            ImportRowViewModel(row=report.row, outcome='Error', message=report.message)
+            for report in import_response.errors
+        ] + [
+            ImportRowViewModel(row=report.row, outcome='Skipped', message=report.message)
+            for report in import_response.skipped
+        ]
+
+        return ImportReportViewModel(
+            kind=import_response.kind.capitalize(),
+            created=import_response.created,
+            skipped=len(import_response.skipped),
+            failed=len(import_response.errors),
+            rows=sorted(rows, key=lambda row: row.row),
+        )
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for the command line."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
+
+
+class WebImportPresenter(ImportPresenter):
+    """Web-specific import presenter."""
+
+    def present_import(self, import_response: ImportReferenceDataResponse) -> ImportReportViewModel:
+        """Format an import report for web display, keeping the kind and outcomes as values pages can key on."""
+        rows = [
+            ImportRowViewModel(row=report.row, outcome='error', message=report.message)
+            for report in import_response.errors
+        ] + [
+            ImportRowViewModel(row=report.row, outcome='skipped', message=report.message)
+            for report in import_response.skipped
+        ]
+
+        return ImportReportViewModel(
+            kind=import_response.kind,
+            created=import_response.created,
+            skipped=len(import_response.skipped),
+            failed=len(import_response.errors),
+            rows=sorted(rows, key=lambda row: row.row),
+        )
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for web display."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
@@ -2,8 +2,8 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 from src.interfaces.view_models.base import ErrorViewModel
-from src.application.dtos.location_dtos import LocationResponse
-from src.interfaces.view_models.location_vm import LocationViewModel
+from src.application.dtos.location_dtos import LocationResponse, NearbyLocationResponse
+from src.interfaces.view_models.location_vm import LocationViewModel, NearbyLocationViewModel
 
 
 class LocationPresenter(ABC):
@@ -14,6 +14,11 @@ class LocationPresenter(ABC):
         """Convert location response to view model."""
         pass
 
+    @abstractmethod
+    def present_nearby_location(self, nearby_response: NearbyLocationResponse) -> NearbyLocationViewModel:
+        """Convert a nearby location response to view model."""
+        pass
+
     @abstractmethod
     def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
         """Format error message for display."""
@@ -35,6 +40,15 @@ class WebLocationPresenter(LocationPresenter):
             zipcode=location_response.zipcode,
         )
 
+    def present_nearby_location(self, nearby_response: NearbyLocationResponse) -> NearbyLocationViewModel:
+        """Format a nearby location for web display."""
+        miles = round(nearby_response.miles, 1)
+        return NearbyLocationViewModel(
+            location=self.present_location(nearby_response.location),
+            miles=miles,
+            distance_display=f"{miles:g} mi",
+        )
+
     def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
         """Format error for web display."""
         return ErrorViewModel(message=error_msg, code=code or "ERROR")
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.application.dtos.search_dtos import TypeaheadSearchResponse
+from src.interfaces.view_models.base import ErrorViewModel
+from src.interfaces.view_models.search_vm import SearchHitViewModel, SearchResultsViewModel
+
+
+class SearchPresenter(ABC):
+    """Abstract base presenter for search output."""
+
+    @abstractmethod
+    def present_results(self, search_response: TypeaheadSearchResponse) -> SearchResultsViewModel:
+        """Convert search response to view model."""
+        pass
+
+    @abstractmethod
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error message for display."""
+        pass
+
+
+class WebSearchPresenter(SearchPresenter):
+    """Web-specific search presenter."""
+
+    def present_results(self, search_response: TypeaheadSearchResponse) -> SearchResultsViewModel:
+        """Format a page of search hits for web display, keeping their ranking."""
+        return SearchResultsViewModel(
+            query=search_response.query,
+            page=search_response.page,
+            per_page=search_response.per_page,
+            has_more=search_response.has_more,
+            hits=[
+                SearchHitViewModel(kind=hit.kind, id=hit.id, label=hit.label, detail=hit.detail)
+                for hit in search_response.hits
+            ],
+        )
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for web display."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
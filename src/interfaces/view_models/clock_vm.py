@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ClockViewModel:
+    """View-specific representation of a per diem or detention clock."""
+
+    clock: str
+    status: str
+    dispatch_id: str
+    broker_name: str
+    location_name: str
+    container_number: str
+    started_at: str
+    stopped_at: str
+    running: bool
+    elapsed_display: str
+    free_display: str
+    remaining_display: str
+    chargeable_display: str
+    remaining_minutes: int
+    chargeable_minutes: int
+
+
+@dataclass(frozen=True)
+class ClockBoardViewModel:
+    """View-specific board of clocks, charging first, with how many are charging and about to."""
+
+    as_of: str
+    charging: int
+    warning: int
+    clocks: list[ClockViewModel]
+
+
+@dataclass(frozen=True)
+class FreeTimeRuleViewModel:
+    """View-specific representation of a free-time rule."""
+
+    clock: str
+    broker_id: Optional[str]
+    broker_name: str
+    location_id: Optional[str]
+    location_name: str
+    free_minutes: int
+    warning_minutes: int
+    free_display: str
+    warning_display: str
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ContainerMoveViewModel:
+    """View-specific representation of a container move."""
+
+    container_number: str
+    dispatch_id: str
+    instruction: str
+    location_id: str
+    location_name: str
+    state: str
+    load_display: str
+    moved_at: str
+
+
+@dataclass(frozen=True)
+class YardInventoryViewModel:
+    """View-specific list of the containers sitting at a location."""
+
+    location_id: str
+    location_name: str
+    containers: list[ContainerMoveViewModel]
+
+
+@dataclass(frozen=True)
+class ContainerTimelineViewModel:
+    """View-specific timeline of a container, and where it is now."""
+
+    container_number: str
+    current: Optional[ContainerMoveViewModel]
+    moves: list[ContainerMoveViewModel]
+
+
+@dataclass(frozen=True)
+class ChassisCountViewModel:
+    """View-specific chassis count of a pool."""
+
+    location_id: str
+    location_name: str
+    count: int
+
+
+@dataclass(frozen=True)
+class ChassisCountsViewModel:
+    """View-specific chassis counts of every pool, as of a moment."""
+
+    as_of: str
+    pools: list[ChassisCountViewModel]
+
+
+@dataclass(frozen=True)
+class ChassisDayViewModel:
+    """View-specific day of a chassis pool."""
+
+    location_id: str
+    location_name: str
+    day: str
+    fetched: int
+    terminated: int
+    balance: int
+
+
+@dataclass(frozen=True)
+class ChassisDailyReportViewModel:
+    """View-specific daily chassis report over a date range."""
+
+    start_date: str
+    end_date: str
+    days: list[ChassisDayViewModel]
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
@@ -18,6 +18,8 @@ class DispatchViewModel:
     containers: list[dict]
     appointments: list[tuple[date, dict]]
     plan: list[TaskViewModel]
+    etas: list[dict] = field(default_factory=list)
+    risk: Optional[str] = None
 
 @dataclass(frozen=True)
 class EditDispatchViewModel:
@@ -67,4 +69,127 @@ class RevertTaskSuccessViewModel:
 class CompleteTaskSuccessViewModel:
     """View model for projects in hierarchical list."""
 
-    reference: str
\ No newline at end of file
+    reference: str
+
+@dataclass(frozen=True)
+class BulkDispatchResultViewModel:
+    """View model for one item of a bulk dispatch creation."""
+
+    index: int
+    id: Optional[str]
+    reference: Optional[str]
+    error: Optional[str]
+
+@dataclass(frozen=True)
+class BulkCreateDispatchesViewModel:
+    """View model for the outcome of a bulk dispatch creation."""
+
+    created: int
+    failed: int
+    results: list[BulkDispatchResultViewModel]
+
+@dataclass(frozen=True)
+class PlanCompletionsViewModel:
+    """View model for plan suggestions shown while a plan is edited."""
+
+    violations: list[str]
+    completions: list[list[str]]
+
+@dataclass(frozen=True)
+class PlanRulesViewModel:
+    """View model for the plan rules the editors validate against, keyed by instruction value."""
+
+    version: str
+    instructions: list[dict]
+    startable: list[str]
+    follows: dict[str, list[str]]
+    endable: list[str]
+    repeatable: list[str]
+    needs_container: list[str]
+    minimum_tasks: int
+    maximum_tasks: int
+
+@dataclass(frozen=True)
+class DispatchStateViewModel:
+    """View model for a dispatch as it stood at a point in its history."""
+
+    id: str
+    reference: str
+    status: str
+    driver_id: Optional[str]
+    version: int
+    tasks: list[dict]
+
+@dataclass(frozen=True)
+class DispatchHistoryViewModel:
+    """View model for a dispatch at a moment and the events that led up to it."""
+
+    state: DispatchStateViewModel
+    events: list[dict]
+
+@dataclass(frozen=True)
+class ProposedAssignmentViewModel:
+    """View model for a driver proposed for a draft dispatch."""
+
+    dispatch_id: str
+    reference: str
+    driver_id: str
+    driver_name: str
+    idle_minutes: int
+    late_minutes: int
+    misses_appointment: bool
+
+@dataclass(frozen=True)
+class DriverAssignmentProposalViewModel:
+    """View model for the drivers proposed for a date's draft dispatches."""
+
+    assignments: list[ProposedAssignmentViewModel]
+    unassigned: list[dict]
+
+@dataclass(frozen=True)
+class PlanSequenceViewModel:
+    """View model for a draft dispatch's tasks in their proposed order."""
+
+    dispatch_id: str
+    reference: str
+    tasks: list[dict]
+    travel_minutes: int
+    late_minutes: int
+    missed_appointments: int
+    current_travel_minutes: int
+    current_late_minutes: int
+    current_missed_appointments: int
+    changed: bool
+
+@dataclass(frozen=True)
+class DoubleBookingViewModel:
+    """View model for a driver booked on two dispatches at once."""
+
+    driver_id: str
+    driver_name: str
+    date: str
+    dispatch_id: str
+    reference: str
+    other_dispatch_id: str
+    other_reference: str
+    start: str
+    end: str
+
+@dataclass(frozen=True)
+class StreetTurnViewModel:
+    """View model for an import's empty proposed for an export, with both rewritten plans."""
+
+    import_dispatch_id: str
+    import_reference: str
+    export_dispatch_id: str
+    export_reference: str
+    container_number: str
+    container_size: str
+    freed_at: str
+    freed_on: str
+    loaded_at: str
+    loaded_on: str
+    saved_minutes: int
+    waiting_days: int
+    import_plan: list[dict]
+    export_plan: list[dict]
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ImportRowViewModel:
+    """View-specific representation of a row that was not imported."""
+
+    row: int
+    outcome: str
+    message: str
+
+
+@dataclass(frozen=True)
+class ImportReportViewModel:
+    """View-specific summary of a reference data import."""
+
+    kind: str
+    created: int
+    skipped: int
+    failed: int
+    rows: list[ImportRowViewModel]
@@ -15,6 +15,15 @@ class LocationViewModel:
     zipcode: int
 
 
+@dataclass(frozen=True)
+class NearbyLocationViewModel:
+    """A location and its distance, as shown to someone searching nearby."""
+
+    location: LocationViewModel
+    miles: float
+    distance_display: str
+
+
 @dataclass(frozen=True)
 class LocationListItemViewModel:
     """View model for projects in hierarchical list."""
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SearchHitViewModel:
+    """View-specific representation of a search hit."""
+
+    kind: str
+    id: str
+    label: str
+    detail: str
+
+
+@dataclass(frozen=True)
+class SearchResultsViewModel:
+    """View-specific page of search hits."""
+
+    query: str
+    page: int
+    per_page: int
+    has_more: bool
+    hits: list[SearchHitViewModel]
@@ -0,0 +1,18 @@
+"""
+An in-memory SQLite database with the ORM mapping, shared by the tests of the SQLAlchemy repositories.
+"""
+
+from functools import cache
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.orm import set_orm_mapping
+
+
+@cache
+def session_factory() -> sessionmaker:
+    # The domain classes can only be mapped once, so every test shares one engine.
+    engine = create_engine('sqlite://')
+    set_orm_mapping(engine)
+    return sessionmaker(bind=engine)
@@ -0,0 +1,111 @@
+"""
+Locations, a broker, a container and dispatch factories shared by the dispatch tests.
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.dispatch import entities
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.value_objects import (
+    Appointment,
+    AppointmentType,
+    Container,
+    ContainerSize,
+    Instruction,
+)
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+
+
+DAY = date(2026, 3, 2)
+CONTAINER = Container('CMAU1234567', ContainerSize.FORTY_STANDARD)
+BROKER = Broker('Cornerstone', Address('2 First St.', 'Chicago', 'IL', 60601))
+
+TERMINAL = Location('Terminal', Address('1 Rail Rd.', 'Chicago', 'IL', 60609))
+WAREHOUSE = Location('Warehouse', Address('1 First St.', 'Chicago', 'IL', 60601))
+YARD = Location('Yard', Address('2 First St.', 'Chicago', 'IL', 60601))
+CONSIGNEE = Location('Consignee', Address('3 First St.', 'Chicago', 'IL', 60601))
+SHIPPER = Location('Shipper', Address('4 First St.', 'Chicago', 'IL', 60601))
+CUSTOMER = Location('Customer', Address('3 Main St.', 'Joliet', 'IL', 60431))
+POOL = Location('Pool', Address('2 Rail Rd.', 'Chicago', 'IL', 60609))
+
+# Instructions that move a tractor or a chassis but no container.
+CONTAINERLESS = (Instruction.FETCH_CHASSIS, Instruction.BOBTAIL_TO, Instruction.TERMINATE_CHASSIS)
+
+IMPORT = [
+    (TERMINAL, Instruction.PICKUP_LOADED),
+    (CONSIGNEE, Instruction.LIVE_UNLOAD),
+    (TERMINAL, Instruction.TERMINATE_EMPTY),
+]
+EXPORT = [
+    (TERMINAL, Instruction.PICKUP_EMPTY),
+    (SHIPPER, Instruction.LIVE_LOAD),
+    (TERMINAL, Instruction.INGATE),
+]
+
+
+def create_plan(
+        plan: list[tuple[Location, Instruction]] = IMPORT,
+        container: Optional[Container] = CONTAINER,
+        day: date = DAY,
+        appointment: Optional[Appointment] = Appointment(AppointmentType.OPEN),
+        ) -> list[Task]:
+    """The tasks of a plan of stops on one day, the first of them with an appointment."""
+    return [
+        Task(
+            priority, location, instruction,
+            None if instruction in CONTAINERLESS else container,
+            day,
+            appointment if priority == 1 else None,
+        )
+        for priority, (location, instruction) in enumerate(plan, start=1)
+    ]
+
+
+def create_draft(plan: list[tuple[Location, Instruction]] = IMPORT, **kwargs) -> Dispatch:
+    """A draft dispatch of a plan of stops, without a driver; takes create_plan's arguments."""
+    return Dispatch(BROKER, None, create_plan(plan, **kwargs))
+
+
+def create_dispatch(
+        plan: list[tuple[Location, Instruction]] = IMPORT,
+        driver: Optional[Driver] = None,
+        **kwargs,
+        ) -> Dispatch:
+    """A draft dispatch of a plan of stops, with a driver of its own unless one is given."""
+    return Dispatch(BROKER, driver or Driver('Juan', 'Perez', None), create_plan(plan, **kwargs))
+
+
+def start_dispatch(plan: list[tuple[Location, Instruction]] = IMPORT, **kwargs) -> Dispatch:
+    """A dispatch of a plan of stops, started by its driver."""
+    dispatch = create_dispatch(plan, **kwargs)
+    dispatch.start()
+    return dispatch
+
+
+def complete(repository: InMemoryDispatchRepository, dispatch: Dispatch, priority: int) -> None:
+    """Start and complete a task of a started dispatch, and save it."""
+    dispatch.start_task(priority)
+    dispatch.complete_task(priority)
+    repository.save(dispatch)
+
+
+class Clock(datetime):
+    """Stands in for datetime in the task entities, so tasks check in and out at the moment set on it."""
+
+    moment = datetime(2026, 3, 2, 8)
+
+    @classmethod
+    def now(cls, tz=None) -> datetime:
+        return cls.moment
+
+
+def set_clock(monkeypatch, moment: datetime) -> None:
+    """Make tasks check in and out at a moment, until the test ends."""
+    monkeypatch.setattr(entities, 'datetime', Clock)
+    monkeypatch.setattr(Clock, 'moment', moment)
@@ -0,0 +1,43 @@
+from datetime import time
+
+from src.domain.aggregates.dispatch.booking import DriverBookings
+from src.domain.aggregates.dispatch.value_objects import Appointment, AppointmentType
+from src.domain.aggregates.driver.aggregate import Driver
+from tests.dispatch.fixtures import create_dispatch
+
+
+DRIVER = Driver('Juan', 'Perez', None)
+
+
+def test_overlapping_appointments_conflict():
+    booked = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.TIME_WINDOW, time(8), time(10)))
+    bookings = DriverBookings([booked])
+
+    overlapping = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.EXACT_TIME, time(9, 30)))
+    later = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.EXACT_TIME, time(11)))
+    open_ended = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.OPEN))
+    other_driver = create_dispatch(driver=Driver('Ana', 'Lopez', None), appointment=Appointment(AppointmentType.EXACT_TIME, time(9)))
+
+    conflicts = bookings.conflicts_with(overlapping)
+    assert [conflict.other.id for conflict in conflicts] == [booked.id]
+    assert (conflicts[0].start, conflicts[0].end) == (9 * 60 + 30, 9 * 60 + 30)
+    assert not bookings.conflicts_with(later)
+    assert not bookings.conflicts_with(open_ended)
+    assert not bookings.conflicts_with(other_driver)
+    # A dispatch being edited is not in conflict with what was saved of itself.
+    assert not bookings.conflicts_with(booked)
+
+
+def test_report_finds_every_overlapping_pair():
+    first = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.TIME_WINDOW, time(8), time(12)))
+    second = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.EXACT_TIME, time(9)))
+    third = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.FINISH_BY, None, time(11)))
+    apart = create_dispatch(driver=DRIVER, appointment=Appointment(AppointmentType.EXACT_TIME, time(14)))
+
+    conflicts = DriverBookings([first, second, third, apart]).conflicts()
+
+    pairs = {frozenset((conflict.dispatch.id, conflict.other.id)) for conflict in conflicts}
+    assert pairs == {
+        frozenset((first.id, second.id)),
+        frozenset((first.id, third.id)),
+    }
@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.dispatch_dtos import BulkCreateDispatchesRequest, MAXIMUM_BULK_DISPATCHES
+from src.application.use_cases.dispatch_use_cases import BulkCreateDispatchesUseCase
+from src.domain.exceptions import ValidationError
+from src.infrastructure.persistence.broker.memory import InMemoryBrokerRepository
+from src.infrastructure.persistence.dispatch.memory import FIRST_REFERENCE, InMemoryDispatchRepository
+from src.infrastructure.persistence.driver.memory import InMemoryDriverRepository
+from src.infrastructure.persistence.location.memory import InMemoryLocationRepository
+from tests.dispatch.fixtures import BROKER, CONSIGNEE, TERMINAL
+
+
+def create_use_case(dispatches: InMemoryDispatchRepository) -> BulkCreateDispatchesUseCase:
+    brokers, locations = InMemoryBrokerRepository(), InMemoryLocationRepository()
+    brokers.save(BROKER)
+    locations.save(TERMINAL)
+    locations.save(CONSIGNEE)
+    return BulkCreateDispatchesUseCase(dispatches, brokers, InMemoryDriverRepository(), locations)
+
+
+def item(broker_id=BROKER.id, unload_at=CONSIGNEE.id) -> dict:
+    def task(priority, location_id, instruction):
+        return {
+            'priority': priority, 'location_id': str(location_id), 'instruction': instruction,
+            'container': {'number': 'CMAU1234567', 'size': 'forty_standard'}, 'date': '2026-03-02',
+            'appointment': {'type': 'open' if priority == 1 else None, 'start_time': None, 'end_time': None},
+        }
+    return {
+        'broker_id': str(broker_id),
+        'driver_id': None,
+        'plan': [
+            task(1, TERMINAL.id, 'pickup_loaded'),
+            task(2, unload_at, 'live_unload'),
+            task(3, TERMINAL.id, 'terminate_empty'),
+        ],
+    }
+
+
+def test_each_item_succeeds_or_fails_on_its_own():
+    repository = InMemoryDispatchRepository()
+    missing_field = item()
+    del missing_field['plan'][0]['date']
+    request = BulkCreateDispatchesRequest([
+        item(), item(broker_id=uuid4()), 'not a dispatch', missing_field, item(unload_at=uuid4()), item(),
+    ])
+
+    response = create_use_case(repository).execute(request).value
+
+    assert response.created == 2
+    assert [(result.index, result.reference) for result in response.results if result.error is None] == [
+        (0, FIRST_REFERENCE), (5, FIRST_REFERENCE + 1),
+    ]
+    errors = {result.index: result.error for result in response.results if result.error}
+    assert sorted(errors) == [1, 2, 3, 4]
+    assert errors[2] == 'Each dispatch must be an object.'
+    assert errors[3] == "Missing field 'date'."
+    assert [len(dispatch.plan) for dispatch in repository.get_all()] == [3, 3]
+
+
+def test_empty_and_oversized_batches_are_rejected():
+    use_case = create_use_case(InMemoryDispatchRepository())
+
+    for dispatches in ([], [item()] * (MAXIMUM_BULK_DISPATCHES + 1)):
+        with pytest.raises(ValidationError):
+            BulkCreateDispatchesRequest(dispatches)
+    assert use_case.execute(BulkCreateDispatchesRequest([item()])).value.created == 1
@@ -0,0 +1,113 @@
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.container_dtos import ChassisCountResponse, ChassisCountsRequest, RecordChassisCountRequest
+from src.application.use_cases.container_use_cases import ChassisCountsUseCase, RecordChassisCountUseCase
+from src.domain.aggregates.dispatch.chassis_moves import ChassisDay, ChassisMove, daily_chassis_report
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from src.domain.exceptions import ValidationError
+from src.infrastructure.persistence.chassis_inventory.memory import InMemoryChassisInventory
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from src.infrastructure.persistence.location.memory import InMemoryLocationRepository
+from tests.dispatch.fixtures import POOL, TERMINAL, YARD, complete, set_clock, start_dispatch
+
+
+# Fetches a chassis from the pool and terminates it at the terminal.
+CHASSIS_RUN = [
+    (POOL, Instruction.FETCH_CHASSIS), (YARD, Instruction.PICKUP_EMPTY),
+    (TERMINAL, Instruction.TERMINATE_EMPTY), (TERMINAL, Instruction.TERMINATE_CHASSIS),
+]
+
+
+def test_pools_count_chassis_fetched_and_terminated_as_tasks_complete_and_revert(monkeypatch):
+    inventory = InMemoryChassisInventory()
+    repository = InMemoryDispatchRepository(chassis_inventory=inventory)
+    dispatch = start_dispatch(CHASSIS_RUN)
+
+    set_clock(monkeypatch, datetime(2026, 3, 2, 8))
+    complete(repository, dispatch, 1)
+    complete(repository, dispatch, 2)
+    assert inventory.counts(datetime(2026, 3, 2, 9)) == {POOL.id: -1}
+    set_clock(monkeypatch, datetime(2026, 3, 2, 10))
+    complete(repository, dispatch, 3)
+    complete(repository, dispatch, 4)
+    assert inventory.counts(datetime(2026, 3, 2, 10)) == {POOL.id: -1, TERMINAL.id: 1}
+    assert inventory.counts(datetime(2026, 3, 2, 7, 59)) == {POOL.id: 0, TERMINAL.id: 0}
+
+    report = inventory.daily_report(date(2026, 3, 1), date(2026, 3, 2))
+    assert {(day.location_id, day.day): (day.fetched, day.terminated, day.balance) for day in report} == {
+        (POOL.id, date(2026, 3, 1)): (0, 0, 0),
+        (POOL.id, date(2026, 3, 2)): (1, 0, -1),
+        (TERMINAL.id, date(2026, 3, 1)): (0, 0, 0),
+        (TERMINAL.id, date(2026, 3, 2)): (0, 1, 1),
+    }
+
+    dispatch.revert_task(4)
+    repository.save(dispatch)
+    assert inventory.counts(datetime(2026, 3, 2, 10)) == {POOL.id: -1}
+
+
+def test_counting_a_pool_sets_its_opening_count_and_corrects_it_later(monkeypatch):
+    inventory = InMemoryChassisInventory()
+    repository = InMemoryDispatchRepository(chassis_inventory=inventory)
+    locations = InMemoryLocationRepository()
+    locations.save(POOL)
+    use_case = RecordChassisCountUseCase(inventory, locations)
+
+    opening = use_case.execute(RecordChassisCountRequest(str(POOL.id), 12, '2026-03-01T18:00:00'))
+    assert opening.value == ChassisCountResponse(str(POOL.id), 'Pool', 12)
+    set_clock(monkeypatch, datetime(2026, 3, 2, 8))
+    complete(repository, start_dispatch(CHASSIS_RUN), 1)
+    assert inventory.counts(datetime(2026, 3, 2, 9)) == {POOL.id: 11}
+
+    # Counted with an offset: 15:00 UTC is read in local time, like the recorded check-outs.
+    counted_at = datetime(2026, 3, 2, 15, tzinfo=timezone.utc)
+    assert use_case.execute(RecordChassisCountRequest(str(POOL.id), 9, counted_at.isoformat())).is_success
+    local = counted_at.astimezone().replace(tzinfo=None)
+    assert inventory.counts(local) == {POOL.id: 9}
+    assert inventory.counts(local - timedelta(seconds=1)) == {POOL.id: 11}
+    report = inventory.daily_report(date(2026, 3, 1), date(2026, 3, 2))
+    assert [(day.day, day.fetched, day.terminated, day.balance) for day in report] == [
+        (date(2026, 3, 1), 0, 0, 12),
+        (date(2026, 3, 2), 1, 0, 9),
+    ]
+
+    assert use_case.execute(RecordChassisCountRequest(str(YARD.id), 3)).error.code.name == 'NOT_FOUND'
+    with pytest.raises(ValidationError):
+        RecordChassisCountRequest(str(POOL.id), -1)
+
+
+def test_chassis_counts_read_moments_with_an_offset_in_local_time():
+    inventory = InMemoryChassisInventory()
+    inventory.adjust(POOL.id, 4, datetime(2026, 3, 2, 8))
+    locations = InMemoryLocationRepository()
+    locations.save(POOL)
+    use_case = ChassisCountsUseCase(inventory, locations)
+
+    moment = datetime(2026, 3, 2, 8).astimezone()
+    counts = use_case.execute(ChassisCountsRequest(moment.astimezone(timezone.utc).isoformat())).value
+
+    assert counts.as_of == datetime(2026, 3, 2, 8)
+    assert [(pool.location_name, pool.count) for pool in counts.pools] == [('Pool', 4)]
+    assert not use_case.execute(ChassisCountsRequest('yesterday')).is_success
+
+
+def test_daily_report_carries_opening_counts_through_days_without_moves():
+    pool = uuid4()
+    moves = [
+        ChassisMove(uuid4(), uuid4(), pool, -1, datetime(2026, 3, 2, 8)),
+        ChassisMove(uuid4(), uuid4(), pool, -1, datetime(2026, 3, 2, 9)),
+        ChassisMove(uuid4(), uuid4(), pool, 1, datetime(2026, 3, 4, 17)),
+    ]
+
+    report = daily_chassis_report({pool: 10}, moves, date(2026, 3, 1), date(2026, 3, 4))
+
+    assert report == [
+        ChassisDay(pool, date(2026, 3, 1), 0, 0, 10),
+        ChassisDay(pool, date(2026, 3, 2), 2, 0, 8),
+        ChassisDay(pool, date(2026, 3, 3), 0, 0, 8),
+        ChassisDay(pool, date(2026, 3, 4), 0, 1, 9),
+    ]
+
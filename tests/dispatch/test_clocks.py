@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from src.domain.aggregates.dispatch.clocks import (
+    ClockStart,
+    ClockStatus,
+    ClockType,
+    FreeTimeRule,
+    FreeTimeRules,
+    detention_starts,
+    per_diem_start,
+    read_clocks,
+)
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from src.infrastructure.persistence.container_inventory.memory import InMemoryContainerInventory
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from tests.dispatch.fixtures import BROKER, CUSTOMER, TERMINAL, YARD, complete, set_clock, start_dispatch
+
+
+NOW = datetime(2026, 3, 6, 12)
+
+
+def detention(minutes_ago: int, stopped: bool = False, stopped_minutes_ago: int = 0) -> ClockStart:
+    started = NOW - timedelta(minutes=minutes_ago)
+    return ClockStart(ClockType.DETENTION, uuid4(), uuid4(), BROKER.id, CUSTOMER.id, None,
+                      started, NOW - timedelta(minutes=stopped_minutes_ago) if stopped else None)
+
+
+def test_clocks_charge_past_free_time_and_warn_before_it_runs_out():
+    rules = FreeTimeRules([
+        FreeTimeRule(ClockType.DETENTION, 120, 30),
+        FreeTimeRule(ClockType.DETENTION, 60, 15, location_id=CUSTOMER.id),
+        FreeTimeRule(ClockType.DETENTION, 90, 10, broker_id=BROKER.id, location_id=CUSTOMER.id),
+    ])
+    assert rules.resolve(ClockType.DETENTION, BROKER.id, CUSTOMER.id) == (90, 10)
+    assert rules.resolve(ClockType.DETENTION, uuid4(), CUSTOMER.id) == (60, 15)
+    assert rules.resolve(ClockType.DETENTION, BROKER.id, YARD.id) == (120, 30)
+    assert rules.resolve(ClockType.PER_DIEM, BROKER.id, YARD.id) == (4 * 24 * 60, 24 * 60)
+
+    clocks = read_clocks([detention(30), detention(85), detention(150), detention(85, stopped=True)], rules, NOW)
+
+    assert [(clock.status, clock.elapsed_minutes, clock.remaining_minutes, clock.chargeable_minutes)
+            for clock in clocks] == [
+        (ClockStatus.CHARGING, 150, 0, 60),
+        (ClockStatus.WARNING, 85, 5, 0),
+        (ClockStatus.FREE, 85, 5, 0),
+        (ClockStatus.FREE, 30, 60, 0),
+    ]
+
+
+def test_per_diem_runs_across_dispatches_until_the_container_is_returned():
+    inventory = InMemoryContainerInventory()
+    repository = InMemoryDispatchRepository(container_inventory=inventory)
+    delivery = start_dispatch([
+        (TERMINAL, Instruction.PICKUP_LOADED), (YARD, Instruction.DROP_LOADED), (TERMINAL, Instruction.BOBTAIL_TO),
+    ])
+    complete(repository, delivery, 1)
+    complete(repository, delivery, 2)
+
+    unload = start_dispatch([
+        (YARD, Instruction.PICKUP_LOADED), (CUSTOMER, Instruction.LIVE_UNLOAD), (TERMINAL, Instruction.TERMINATE_EMPTY),
+    ])
+    complete(repository, unload, 1)
+    unload.start_task(2)
+    repository.save(unload)
+
+    assert [move.task_id for move in inventory.outstanding()] == [delivery.plan[0].id]
+    starts = [per_diem_start(move) for move in inventory.outstanding()] + detention_starts(unload)
+    assert [(start.clock, start.location_id, start.stopped_at) for start in starts] == [
+        (ClockType.PER_DIEM, TERMINAL.id, None),
+        (ClockType.DETENTION, CUSTOMER.id, None),
+    ]
+
+    unload.complete_task(2)
+    repository.save(unload)
+    complete(repository, unload, 3)
+    assert inventory.outstanding() == []
+    assert detention_starts(unload)[0].stopped_at == unload.plan[1]._check_out_datetime
+
+
+def test_clocks_read_at_a_past_moment_run_until_they_stopped():
+    rules = FreeTimeRules([FreeTimeRule(ClockType.DETENTION, 60, 15)])
+    then = NOW - timedelta(minutes=60)
+    stopped_since, started_since = detention(150, stopped=True, stopped_minutes_ago=30), detention(30)
+
+    clocks = read_clocks([stopped_since, started_since, detention(120, stopped=True, stopped_minutes_ago=90)],
+                         rules, then)
+
+    assert [(clock.running, clock.elapsed_minutes, clock.status) for clock in clocks] == [
+        (True, 90, ClockStatus.CHARGING),
+        (False, 30, ClockStatus.FREE),
+    ]
+    assert clocks[0].start is stopped_since
+    assert [clock.running for clock in read_clocks([stopped_since], rules, NOW)] == [False]
+
+
+def test_per_diem_at_a_past_moment_replays_the_moves_up_to_it(monkeypatch):
+    inventory = InMemoryContainerInventory()
+    repository = InMemoryDispatchRepository(container_inventory=inventory)
+    dispatch = start_dispatch([
+        (TERMINAL, Instruction.PICKUP_LOADED), (YARD, Instruction.DROP_LOADED), (TERMINAL, Instruction.BOBTAIL_TO),
+    ])
+    set_clock(monkeypatch, datetime(2026, 3, 2, 8))
+    complete(repository, dispatch, 1)
+    set_clock(monkeypatch, datetime(2026, 3, 2, 10))
+    complete(repository, dispatch, 2)
+
+    unload = start_dispatch([
+        (YARD, Instruction.PICKUP_LOADED), (CUSTOMER, Instruction.LIVE_UNLOAD), (TERMINAL, Instruction.TERMINATE_EMPTY),
+    ])
+    set_clock(monkeypatch, datetime(2026, 3, 4, 7))
+    complete(repository, unload, 1)
+    set_clock(monkeypatch, datetime(2026, 3, 4, 8))
+    complete(repository, unload, 2)
+    set_clock(monkeypatch, datetime(2026, 3, 4, 9))
+    complete(repository, unload, 3)
+
+    assert inventory.outstanding() == []
+    assert inventory.outstanding(datetime(2026, 3, 2, 7)) == []
+    assert [move.task_id for move in inventory.outstanding(datetime(2026, 3, 3, 12))] == [dispatch.plan[0].id]
+    assert [move.task_id for move in inventory.outstanding(datetime(2026, 3, 4, 8, 30))] == [dispatch.plan[0].id]
+    assert inventory.outstanding(datetime(2026, 3, 4, 9)) == []
@@ -0,0 +1,69 @@
+from src.domain.aggregates.dispatch import completion
+from src.domain.aggregates.dispatch.aggregate import MAXIMUM_TASKS_PERMITTED
+from src.domain.aggregates.dispatch.completion import PLAN_COMPLETER, PlanCompleter
+from src.domain.aggregates.dispatch.validation import PLAN_VALIDATOR
+from src.domain.aggregates.dispatch.value_objects import Instruction
+
+
+def test_completing_a_loaded_pickup():
+    completions = PLAN_COMPLETER.complete([Instruction.PICKUP_LOADED])
+
+    assert completions == [[Instruction.INGATE]]
+
+
+def test_only_shortest_completions_are_returned():
+    completions = PLAN_COMPLETER.complete([Instruction.PICKUP_LOADED, Instruction.LIVE_UNLOAD])
+
+    assert completions == [[Instruction.TERMINATE_EMPTY], [Instruction.STREET_TURN]]
+
+
+def test_every_completion_makes_a_valid_plan():
+    prefix = [Instruction.FETCH_CHASSIS]
+
+    completions = PLAN_COMPLETER.complete(prefix, limit=20)
+
+    assert completions
+    for completion in completions:
+        assert PLAN_VALIDATOR.validate(prefix + completion) == []
+
+
+def test_empty_plan_is_completed_to_the_minimum_length():
+    completions = PLAN_COMPLETER.complete([])
+
+    assert completions
+    assert all(len(completion) == 2 for completion in completions)
+
+
+def test_complete_plan_needs_nothing_more():
+    assert PLAN_COMPLETER.complete([Instruction.PICKUP_LOADED, Instruction.INGATE]) == [[]]
+
+
+def test_invalid_prefix_cannot_be_completed():
+    assert PLAN_COMPLETER.complete([Instruction.LIVE_LOAD]) == []
+    assert PLAN_COMPLETER.complete([Instruction.PICKUP_LOADED, Instruction.PICKUP_EMPTY]) == []
+
+
+def test_completions_respect_the_maximum_plan_length():
+    prefix = [Instruction.PICKUP_EMPTY] + [Instruction.LIVE_LOAD] * (MAXIMUM_TASKS_PERMITTED - 1)
+
+    assert PLAN_COMPLETER.complete(prefix) == []
+
+
+def test_limit_caps_the_number_of_completions():
+    assert len(PLAN_COMPLETER.complete([], limit=1)) == 1
+
+
+def test_completions_are_remembered_per_completer_and_bounded(monkeypatch):
+    monkeypatch.setattr(completion, '_CACHE_SIZE', 2)
+    completer = PlanCompleter()
+
+    first = completer.complete([Instruction.PICKUP_LOADED])
+    assert completer.complete([Instruction.PICKUP_LOADED]) == first
+    completer.complete([Instruction.PICKUP_EMPTY])
+    completer.complete([])
+
+    assert list(completer._completions) == [
+        ((completer.codes[Instruction.PICKUP_EMPTY],), 5),
+        ((), 5),
+    ]
+    assert PlanCompleter()._completions == {}
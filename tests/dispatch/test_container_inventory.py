@@ -0,0 +1,88 @@
+from src.application.dtos.container_dtos import ContainerTimelineRequest
+from src.application.use_cases.container_use_cases import ContainerTimelineUseCase
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.container_moves import ContainerState
+from src.domain.aggregates.dispatch.value_objects import Container, ContainerSize, Instruction
+from src.domain.aggregates.location.aggregate import Location
+from src.infrastructure.persistence.container_inventory.memory import InMemoryContainerInventory
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from src.infrastructure.persistence.location.memory import InMemoryLocationRepository
+from tests.dispatch.fixtures import CUSTOMER, TERMINAL, YARD, complete, start_dispatch
+
+
+def create_dispatch(number: str, plan: list[tuple[Location, Instruction]]) -> Dispatch:
+    return start_dispatch(plan, container=Container(number, ContainerSize.FORTY_STANDARD))
+
+
+def test_yard_holds_containers_dropped_there_until_they_move_again():
+    inventory = InMemoryContainerInventory()
+    repository = InMemoryDispatchRepository(container_inventory=inventory)
+    delivery = create_dispatch('CMAU1234567', [
+        (TERMINAL, Instruction.PICKUP_LOADED), (YARD, Instruction.DROP_LOADED), (TERMINAL, Instruction.BOBTAIL_TO),
+    ])
+    other = create_dispatch('TGHU7654321', [
+        (TERMINAL, Instruction.PICKUP_LOADED), (YARD, Instruction.DROP_LOADED), (TERMINAL, Instruction.BOBTAIL_TO),
+    ])
+
+    complete(repository, delivery, 1)
+    assert inventory.at_location(YARD.id) == []
+    complete(repository, delivery, 2)
+    complete(repository, other, 1)
+    complete(repository, other, 2)
+    assert [move.container_number for move in inventory.at_location(YARD.id)] == ['CMAU1234567', 'TGHU7654321']
+
+    pull = create_dispatch('cmau-123 4567', [
+        (YARD, Instruction.PICKUP_LOADED), (CUSTOMER, Instruction.LIVE_UNLOAD), (TERMINAL, Instruction.TERMINATE_EMPTY),
+    ])
+    complete(repository, pull, 1)
+    assert [move.container_number for move in inventory.at_location(YARD.id)] == ['TGHU7654321']
+
+    complete(repository, pull, 2)
+    complete(repository, pull, 3)
+    timeline = inventory.timeline('CMAU 1234567')
+    assert [move.instruction for move in timeline] == [
+        Instruction.PICKUP_LOADED, Instruction.DROP_LOADED, Instruction.PICKUP_LOADED,
+        Instruction.LIVE_UNLOAD, Instruction.TERMINATE_EMPTY,
+    ]
+    assert (timeline[-1].state, timeline[-1].location_id, timeline[-1].loaded) == (
+        ContainerState.RETURNED, TERMINAL.id, False
+    )
+    assert inventory.at_location(TERMINAL.id) == []
+
+
+def test_reverting_a_completed_task_takes_its_move_back():
+    inventory = InMemoryContainerInventory()
+    repository = InMemoryDispatchRepository(container_inventory=inventory)
+    dispatch = create_dispatch('CMAU1234567', [
+        (TERMINAL, Instruction.PICKUP_EMPTY), (YARD, Instruction.DROP_EMPTY), (TERMINAL, Instruction.BOBTAIL_TO),
+    ])
+    complete(repository, dispatch, 1)
+    complete(repository, dispatch, 2)
+    assert [move.task_id for move in inventory.at_location(YARD.id)] == [dispatch.plan[1].id]
+
+    dispatch.revert_task(2)
+    repository.save(dispatch)
+    assert inventory.at_location(YARD.id) == []
+    assert [move.state for move in inventory.timeline('CMAU1234567')] == [ContainerState.ON_CHASSIS]
+
+
+def test_timeline_names_each_location_and_reports_what_is_missing():
+    inventory = InMemoryContainerInventory()
+    repository = InMemoryDispatchRepository(container_inventory=inventory)
+    locations = InMemoryLocationRepository()
+    locations.save(TERMINAL)
+    dispatch = create_dispatch('CMAU1234567', [
+        (TERMINAL, Instruction.PICKUP_EMPTY), (YARD, Instruction.DROP_EMPTY), (TERMINAL, Instruction.BOBTAIL_TO),
+    ])
+    complete(repository, dispatch, 1)
+    use_case = ContainerTimelineUseCase(inventory, locations)
+
+    timeline = use_case.execute(ContainerTimelineRequest('CMAU1234567')).value
+    assert [(move.instruction, move.location_name) for move in timeline.moves] == [('pickup_empty', 'Terminal')]
+
+    complete(repository, dispatch, 2)
+    missing_location = use_case.execute(ContainerTimelineRequest('CMAU1234567'))
+    assert missing_location.error.code.name == 'NOT_FOUND' and str(YARD.id) in missing_location.error.message
+
+    unknown = use_case.execute(ContainerTimelineRequest('TGHU7654321'))
+    assert unknown.error.code.name == 'NOT_FOUND' and 'TGHU7654321' in unknown.error.message
@@ -0,0 +1,46 @@
+from datetime import time
+from itertools import permutations
+
+import numpy as np
+
+from src.domain.aggregates.dispatch.driver_assignment import DRIVER_ASSIGNMENT_OPTIMIZER
+from src.domain.aggregates.dispatch.value_objects import Appointment, AppointmentType
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.common.assignment import linear_sum_assignment
+from tests.dispatch.fixtures import DAY, create_draft
+
+
+def test_assignment_matches_brute_force():
+    rng = np.random.default_rng(7)
+    for rows, columns in [(4, 4), (3, 5), (5, 3)]:
+        cost = rng.integers(0, 5, (rows, columns)).astype(float)
+        chosen_rows, chosen_columns = linear_sum_assignment(cost)
+
+        if rows <= columns:
+            best = min(cost[range(rows), list(p)].sum() for p in permutations(range(columns), rows))
+        else:
+            best = min(cost[list(p), range(columns)].sum() for p in permutations(range(rows), columns))
+        assert len(chosen_rows) == min(rows, columns)
+        assert cost[chosen_rows, chosen_columns].sum() == best
+
+
+def test_drivers_are_proposed_to_keep_appointments():
+    morning = create_draft(appointment=Appointment(AppointmentType.EXACT_TIME, time(7)))
+    afternoon = create_draft(appointment=Appointment(AppointmentType.TIME_WINDOW, time(13), time(15)))
+    early, busy = Driver('Juan', 'Perez', None), Driver('Ana', 'Lopez', None)
+
+    proposal = DRIVER_ASSIGNMENT_OPTIMIZER.propose([morning, afternoon], [busy, early], DAY, {busy.id: 12 * 60})
+
+    pairs = {assignment.dispatch.id: assignment.driver.id for assignment in proposal.assignments}
+    assert pairs == {morning.id: early.id, afternoon.id: busy.id}
+    assert not any(assignment.misses_appointment for assignment in proposal.assignments)
+
+
+def test_dispatches_beyond_the_drivers_are_left_unassigned():
+    drafts = [create_draft(appointment=Appointment(AppointmentType.EXACT_TIME, time(8))) for _ in range(2)]
+    late = Driver('Juan', 'Perez', None)
+
+    proposal = DRIVER_ASSIGNMENT_OPTIMIZER.propose(drafts, [late], DAY, {late.id: 9 * 60})
+
+    assert len(proposal.assignments) == 1 and len(proposal.unassigned) == 1
+    assert proposal.assignments[0].late_minutes == 60
@@ -0,0 +1,89 @@
+from datetime import datetime, time
+
+import numpy as np
+
+from src.application.common.eta_cache import EtaCache
+from src.application.common.event_bus import EventBus
+from src.application.dtos.dispatch_dtos import DispatchResponse
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.eta import AppointmentRisk, predict_etas
+from src.domain.aggregates.dispatch.task_durations import DurationEstimate
+from src.domain.aggregates.dispatch.value_objects import Appointment, AppointmentType, Instruction
+from src.domain.aggregates.driver.aggregate import Driver
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from tests.dispatch.fixtures import BROKER, CONSIGNEE, CONTAINER, DAY, TERMINAL
+
+
+INDEX = {TERMINAL.id: 0, CONSIGNEE.id: 1}
+TRAVEL = np.array([[0, 60], [60, 0]])
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime.combine(DAY, time(hour, minute))
+
+
+def create_dispatch() -> Dispatch:
+    """An import with its first task checked into at 7:50, unloading in a window and returning by 13:00."""
+    tasks = [
+        Task(1, TERMINAL, Instruction.PICKUP_LOADED, CONTAINER, DAY, Appointment(AppointmentType.OPEN)),
+        Task(2, CONSIGNEE, Instruction.LIVE_UNLOAD, CONTAINER, DAY,
+             Appointment(AppointmentType.TIME_WINDOW, time(10), time(11))),
+        Task(3, TERMINAL, Instruction.TERMINATE_EMPTY, CONTAINER, DAY,
+             Appointment(AppointmentType.FINISH_BY, None, time(13))),
+    ]
+    dispatch = Dispatch(BROKER, Driver('Juan', 'Perez', None), tasks)
+    dispatch.start()
+    dispatch.start_task(1)
+    dispatch.plan[0]._check_in_datetime = at(7, 50)
+    return dispatch
+
+
+def test_arrivals_follow_the_plan_and_flag_appointments_by_their_type():
+    dispatch = create_dispatch()
+
+    # On the default stop times, the two-hour unload makes the return miss its finish-by.
+    eta = predict_etas(dispatch, INDEX, TRAVEL, at(8))
+    assert [(task.arrival, task.departure, task.risk) for task in eta.tasks] == [
+        (at(7, 50), at(8, 5), None),
+        (at(9, 5), at(12), AppointmentRisk.ON_TIME),
+        (at(13), at(13, 15), AppointmentRisk.LATE),
+    ]
+    assert eta.valid_until == at(8, 5)
+    assert eta.risk == AppointmentRisk.LATE
+    assert DispatchResponse.from_entity(dispatch, eta).risk == AppointmentRisk.LATE
+
+    # An hour's median unload keeps it, but not a three-hour 90th percentile.
+    eta = predict_etas(dispatch, INDEX, TRAVEL, at(8), [None, DurationEstimate(10, 60, 180), None])
+    assert [(task.departure, task.latest_departure, task.risk) for task in eta.tasks[1:]] == [
+        (at(11), at(13), AppointmentRisk.ON_TIME),
+        (at(12, 15), at(14, 15), AppointmentRisk.AT_RISK),
+    ]
+
+    # Running over its duration pushes everything after it back from now.
+    eta = predict_etas(dispatch, INDEX, TRAVEL, at(9, 30))
+    assert eta.tasks[0].departure == at(9, 30)
+    assert eta.tasks[1].arrival == at(10, 30)
+    assert eta.valid_until == at(9, 35)
+
+
+def test_predictions_are_dropped_when_a_task_transitions_or_the_plan_is_edited():
+    bus = EventBus()
+    cache = EtaCache()
+    cache.subscribe(bus)
+    repository = InMemoryDispatchRepository(event_bus=bus)
+    dispatch = create_dispatch()
+    repository.save(dispatch)
+
+    cache.put(predict_etas(dispatch, INDEX, TRAVEL, at(8)))
+    assert cache.get(dispatch, at(8, 1)) is not None
+    assert cache.get(dispatch, at(8, 5)) is None
+
+    dispatch.complete_task(1)
+    repository.save(dispatch)
+    assert cache.get(dispatch, at(8, 1)) is None
+
+    cache.put(predict_etas(dispatch, INDEX, TRAVEL, at(8, 10)))
+    assert cache.get(dispatch, at(8, 11)) is not None
+    dispatch.set_appointment(3, Appointment(AppointmentType.FINISH_BY, None, time(15)))
+    assert cache.get(dispatch, at(8, 11)) is None
@@ -0,0 +1,53 @@
+from src.domain.aggregates.dispatch.events import (
+    DispatchStarted,
+    TaskCompleted,
+    TaskReverted,
+    TaskStarted,
+    TaskStoppedOff,
+)
+from src.domain.aggregates.dispatch.value_objects import TaskStatus
+from tests.dispatch.fixtures import create_dispatch
+
+
+def test_dispatch_and_task_transitions_record_events_in_order():
+    dispatch = create_dispatch()
+
+    dispatch.start()
+    dispatch.start_task(1)
+    dispatch.complete_task(1)
+    dispatch.revert_task(1)
+
+    events = dispatch.pull_events()
+    assert [type(event) for event in events] == [DispatchStarted, TaskStarted, TaskCompleted, TaskReverted]
+    assert events[0].driver_id == dispatch.current_driver.id
+    assert events[2].priority == 1 and events[2].driver_id == dispatch.current_driver.id
+    assert events[3].status == TaskStatus.IN_PROGRESS
+
+
+def test_marking_a_stopoff_records_it_for_the_current_driver():
+    dispatch = create_dispatch()
+    dispatch.start()
+    dispatch.start_task(1)
+    dispatch.complete_task(1)
+    dispatch.start_task(2)
+
+    dispatch.mark_stopoff(2)
+
+    event = dispatch.pull_events()[-1]
+    assert isinstance(event, TaskStoppedOff)
+    assert event.priority == 2 and event.task_id == dispatch.get_task(2).id
+    assert event.driver_id == dispatch.current_driver.id
+    assert event.occurred_at == dispatch.get_task(2)._check_out_datetime
+    assert dispatch.get_task(2).status == TaskStatus.STOP_OFF
+    assert dispatch.get_task(2).completed_by == dispatch.current_driver
+
+
+def test_rejected_transition_records_nothing():
+    dispatch = create_dispatch()
+
+    try:
+        dispatch.start_task(1)
+    except ValueError:
+        pass
+
+    assert dispatch.pull_events() == []
@@ -0,0 +1,111 @@
+import csv
+from datetime import date, datetime, time
+import io
+import json
+from typing import Optional
+
+import numpy as np
+
+from src.application.dtos.export_dtos import TaskFactsChunk
+from src.application.use_cases.export_use_cases import ExportDispatchHistoryUseCase, ExportTaskFactsUseCase
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from src.interfaces.controllers.export_controller import ExportController
+from src.interfaces.presenters import export_presenter
+from src.interfaces.presenters.export_presenter import StreamingExportPresenter
+from tests.dispatch.fixtures import create_dispatch
+
+
+class ChunkedTaskRepository:
+    def __init__(self, chunks: list[TaskFactsChunk]):
+        self.chunks = chunks
+
+    def stream_facts(self, start_date: date, end_date: date, chunk_size: int):
+        return iter(self.chunks)
+
+
+def create_controller(
+        repository: Optional[InMemoryDispatchRepository] = None,
+        chunks: Optional[list[TaskFactsChunk]] = None,
+        ) -> ExportController:
+    return ExportController(
+        export_history_use_case=ExportDispatchHistoryUseCase(repository or InMemoryDispatchRepository()),
+        export_task_facts_use_case=ExportTaskFactsUseCase(ChunkedTaskRepository(chunks or [])),
+        presenter=StreamingExportPresenter(),
+    )
+
+
+def test_history_streams_the_tasks_of_dispatches_in_range_in_chunks(monkeypatch):
+    monkeypatch.setattr(export_presenter, 'ROWS_PER_CHUNK', 2)
+    repository = InMemoryDispatchRepository()
+    inside, outside = create_dispatch(day=date(2026, 3, 2)), create_dispatch(day=date(2026, 3, 9))
+    repository.save_many([inside, outside])
+    controller = create_controller(repository)
+
+    chunks = list(controller.handle_export_history('2026-03-01', '2026-03-07', 'csv').success)
+    rows = list(csv.DictReader(io.StringIO(''.join(chunks))))
+    assert len(chunks) == 2
+    assert [(row['reference'], row['task_priority'], row['instruction']) for row in rows] == [
+        (str(inside.reference), '1', 'pickup_loaded'),
+        (str(inside.reference), '2', 'live_unload'),
+        (str(inside.reference), '3', 'terminate_empty'),
+    ]
+    assert rows[0]['date'] == '2026-03-02' and rows[0]['check_in'] == ''
+
+    chunks = list(controller.handle_export_history('2026-03-01', '2026-03-09', 'ndjson').success)
+    records = [json.loads(line) for line in ''.join(chunks).splitlines()]
+    assert len(chunks) == 3
+    assert [record['reference'] for record in records] == [inside.reference] * 3 + [outside.reference] * 3
+    assert records[0]['appointment_type'] == 'open' and records[1]['appointment_type'] is None
+
+
+def test_history_export_rejects_bad_ranges_and_formats():
+    controller = create_controller()
+
+    assert controller.handle_export_history('2026-03-07', '2026-03-01').error.code == 'VALIDATION_ERROR'
+    assert not controller.handle_export_history('03/01/2026', '2026-03-07').is_success
+    assert not controller.handle_export_history('2026-03-01', '2026-03-07', 'xml').is_success
+    assert list(controller.handle_export_history('2026-03-01', '2026-03-07').success) == [
+        ','.join(export_presenter.HISTORY_COLUMNS) + '\r\n'
+    ]
+
+
+def create_chunk(reference: int, location_name: str, completed: bool) -> TaskFactsChunk:
+    check_in = datetime(2026, 3, 2, 8) if completed else None
+    check_out = datetime(2026, 3, 2, 9, 30) if completed else None
+    return TaskFactsChunk(
+        reference=[reference], priority=[1], instruction=['live_unload'], location_name=[location_name],
+        date=[date(2026, 3, 2)], appointment_type=['time_window' if completed else None],
+        appointment_start_time=[time(8) if completed else None], appointment_end_time=[time(10) if completed else None],
+        check_in=[check_in], check_out=[check_out], duration=[check_out - check_in if completed else None],
+        driver_name=['Juanito' if completed else None],
+    )
+
+
+def test_task_facts_npz_holds_every_chunk_as_typed_columns():
+    chunks = [create_chunk(10000, 'Yard', True), create_chunk(10001, 'Consignee Warehouse', False)]
+    controller = create_controller(chunks=chunks)
+    output = io.BytesIO()
+
+    assert controller.handle_export_task_facts('2026-03-01', '2026-03-07', 'npz', lambda: output).success == 2
+
+    arrays = np.load(io.BytesIO(output.getvalue()))
+    assert arrays['reference'].tolist() == [10000, 10001]
+    assert arrays['location_name'].tolist() == ['Yard', 'Consignee Warehouse']
+    assert arrays['driver_name'].tolist() == ['Juanito', '']
+    assert arrays['instruction_categories'][arrays['instruction'][0]] == 'live_unload'
+    assert arrays['appointment_type'][1] == -1
+    assert arrays['appointment_start_time'][0] == np.timedelta64(480, 'm')
+    assert arrays['duration'][0] == np.timedelta64(90 * 60, 's') and np.isnat(arrays['duration'][1])
+
+    empty = io.BytesIO()
+    StreamingExportPresenter().present_task_facts([], 'npz', empty)
+    assert np.load(io.BytesIO(empty.getvalue()))['reference'].shape == (0,)
+
+
+def test_task_facts_output_is_opened_only_for_valid_requests():
+    opened = []
+    controller = create_controller()
+
+    result = controller.handle_export_task_facts('2026-03-07', '2026-03-01', 'npz', lambda: opened.append(1))
+
+    assert not result.is_success and opened == []
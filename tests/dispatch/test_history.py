@@ -0,0 +1,72 @@
+from datetime import date, datetime
+
+from src.application.dtos.dispatch_dtos import GetLoadboardAsOfRequest
+from src.application.use_cases.dispatch_use_cases import GetLoadboardAsOfUseCase
+from src.domain.aggregates.dispatch.history import DispatchState, replay
+from src.domain.aggregates.dispatch.value_objects import DispatchStatus, TaskStatus
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from src.infrastructure.persistence.dispatch_history.memory import InMemoryDispatchEventStore
+from tests.dispatch.fixtures import DAY, complete, create_dispatch
+
+
+def test_replaying_events_matches_the_dispatch():
+    dispatch = create_dispatch()
+    state = DispatchState.of(dispatch, 0)
+
+    dispatch.start()
+    dispatch.start_task(1)
+    dispatch.complete_task(1)
+    dispatch.start_task(2)
+    dispatch.revert_task(2)
+    state = replay(state, dispatch.pull_events())
+
+    assert state == DispatchState.of(dispatch, 5)
+    assert state.status == DispatchStatus.IN_PROGRESS
+    assert [task.status for task in state.tasks] == [
+        TaskStatus.COMPLETED, TaskStatus.NOT_STARTED, TaskStatus.NOT_STARTED,
+    ]
+
+
+def test_store_reads_states_back_as_of_earlier_moments():
+    dispatch = create_dispatch()
+    store = InMemoryDispatchEventStore(snapshot_interval=2)
+    store.append(dispatch, [])
+
+    dispatch.start()
+    dispatch.start_task(1)
+    store.append(dispatch, dispatch.pull_events())
+    started = datetime.now()
+
+    dispatch.complete_task(1)
+    dispatch.start_task(2)
+    dispatch.complete_task(2)
+    store.append(dispatch, dispatch.pull_events())
+
+    assert store.load(dispatch.id) == DispatchState.of(dispatch, 5)
+    assert store.load(dispatch.id, as_of=started).tasks[0].status == TaskStatus.IN_PROGRESS
+    assert len(store.get_stream(dispatch.id, after_version=2)) == 3
+
+
+def test_loadboard_as_of_shows_dispatches_in_progress_then_whatever_their_status_now():
+    store = InMemoryDispatchEventStore()
+    repository = InMemoryDispatchRepository(event_store=store)
+    finished, draft, other_day = create_dispatch(), create_dispatch(), create_dispatch(day=date(2026, 3, 3))
+    repository.save_many([finished, draft, other_day])
+    for dispatch in (finished, other_day):
+        dispatch.start()
+        repository.save(dispatch)
+    complete(repository, finished, 1)
+    moment = datetime.now()
+    for priority in (2, 3):
+        complete(repository, finished, priority)
+    finished.complete()
+    repository.save(finished)
+    use_case = GetLoadboardAsOfUseCase(repository, store)
+
+    then = use_case.execute(GetLoadboardAsOfRequest(DAY.isoformat(), moment.isoformat())).value
+    now = use_case.execute(GetLoadboardAsOfRequest(DAY.isoformat(), datetime.now().isoformat())).value
+
+    assert finished.status == DispatchStatus.COMPLETED
+    assert [(state.dispatch_id, state.tasks[0].status) for state in then] == [(finished.id, TaskStatus.COMPLETED)]
+    assert then[0].tasks[1].status == TaskStatus.NOT_STARTED
+    assert now == []
@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+
+from src.application.dtos.dispatch_dtos import FindDispatchesByContainerRequest, GetDispatchByReferenceRequest
+from src.application.use_cases.dispatch_use_cases import (
+    FindDispatchesByContainerUseCase,
+    GetDispatchByReferenceUseCase,
+)
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.value_objects import Container, ContainerSize, Instruction
+from src.domain.exceptions import ValidationError
+from src.infrastructure.persistence.dispatch.memory import FIRST_REFERENCE, InMemoryDispatchRepository
+from tests.dispatch.fixtures import WAREHOUSE, create_draft
+
+
+def create_dispatch(number: str, day: date) -> Dispatch:
+    return create_draft(container=Container(number, ContainerSize.FORTY_STANDARD), day=day)
+
+
+def test_container_lookup_ignores_how_the_number_is_typed():
+    repository = InMemoryDispatchRepository()
+    later = create_dispatch('CMAU1234567', date(2026, 3, 3))
+    earlier = create_dispatch('cmau-123 4567', date(2026, 3, 2))
+    other = create_dispatch('TGHU7654321', date(2026, 3, 2))
+    repository.save_many([later, earlier, other])
+
+    result = FindDispatchesByContainerUseCase(repository).execute(FindDispatchesByContainerRequest('cmau 1234567'))
+    assert [dispatch.id for dispatch in result.value] == [str(earlier.id), str(later.id)]
+
+    # Editing a task's container moves the dispatch in the index once it is saved.
+    other.edit_task(1, WAREHOUSE, Instruction.PICKUP_LOADED,
+                    Container('CMAU1234567', ContainerSize.FORTY_STANDARD), date(2026, 3, 4), None)
+    repository.save(other)
+    assert {dispatch.id for dispatch in repository.get_by_container('CMAU1234567')} == {
+        earlier.id, later.id, other.id
+    }
+    assert [dispatch.id for dispatch in repository.get_by_container('TGHU7654321')] == [other.id]
+
+    repository.delete(later.id)
+    assert {dispatch.id for dispatch in repository.get_by_container('CMAU1234567')} == {earlier.id, other.id}
+    with pytest.raises(ValidationError):
+        FindDispatchesByContainerRequest('TGHU-765432!')
+
+
+def test_reference_lookup():
+    repository = InMemoryDispatchRepository()
+    first, second = create_dispatch('CMAU1234567', date(2026, 3, 2)), create_dispatch('TGHU7654321', date(2026, 3, 2))
+    repository.save_many([first, second])
+    use_case = GetDispatchByReferenceUseCase(repository)
+
+    assert use_case.execute(GetDispatchByReferenceRequest(str(FIRST_REFERENCE + 1))).value.id == str(second.id)
+    missing = use_case.execute(GetDispatchByReferenceRequest(str(FIRST_REFERENCE + 2)))
+    assert missing.error.code.name == 'NOT_FOUND'
+    repository.delete(first.id)
+    assert not use_case.execute(GetDispatchByReferenceRequest(str(FIRST_REFERENCE))).is_success
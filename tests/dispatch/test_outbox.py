@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+from src.infrastructure.notifications.relay import OutboxRelay
+from src.infrastructure.notifications.sinks import InMemoryNotificationSink
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from src.infrastructure.persistence.outbox.memory import InMemoryNotificationOutbox
+from tests.dispatch.fixtures import create_dispatch
+
+
+class FlakySink(InMemoryNotificationSink):
+    def __init__(self, failing: set):
+        super().__init__()
+        self.failing = failing
+
+    def deliver(self, messages):
+        if messages[0].dispatch_id in self.failing:
+            raise ConnectionError('Sink unavailable')
+        super().deliver(messages)
+
+
+def test_saving_a_dispatch_queues_check_in_and_check_out_notifications():
+    outbox = InMemoryNotificationOutbox()
+    repository = InMemoryDispatchRepository(outbox=outbox)
+    dispatch = create_dispatch()
+
+    dispatch.start()
+    dispatch.start_task(1)
+    dispatch.complete_task(1)
+    repository.save(dispatch)
+
+    messages = outbox.due(10, datetime.now())
+    assert [message.notification.status for message in messages] == ['checked_in', 'checked_out']
+    assert messages[0].notification.location_name == 'Terminal'
+
+
+def test_failed_dispatch_is_retried_in_order_without_holding_up_others():
+    outbox = InMemoryNotificationOutbox()
+    repository = InMemoryDispatchRepository(outbox=outbox)
+    failing, working = create_dispatch(), create_dispatch()
+    for dispatch in (failing, working):
+        dispatch.start()
+        dispatch.start_task(1)
+        repository.save(dispatch)
+
+    sink = FlakySink({failing.id})
+    relay = OutboxRelay(outbox, sink, base_delay=timedelta(seconds=2))
+    now = datetime.now()
+    assert relay.relay_once(now) == 1
+
+    failing.complete_task(1)
+    repository.save(failing)
+    assert outbox.due(10, now + timedelta(seconds=1)) == []
+
+    sink.failing.clear()
+    assert relay.relay_once(now + timedelta(seconds=2)) == 2
+    assert [message.notification.status for message in sink.messages[1:]] == ['checked_in', 'checked_out']
+    assert sink.messages[1].attempts == 1
+
+
+def test_relay_gives_up_after_max_attempts():
+    outbox = InMemoryNotificationOutbox()
+    repository = InMemoryDispatchRepository(outbox=outbox)
+    dispatch = create_dispatch()
+    dispatch.start()
+    dispatch.start_task(1)
+    repository.save(dispatch)
+
+    relay = OutboxRelay(outbox, FlakySink({dispatch.id}), max_attempts=2)
+    now = datetime.now()
+    relay.relay_once(now)
+    relay.relay_once(now + timedelta(hours=1))
+
+    assert [message.attempts for message in outbox.abandoned] == [2]
+    assert outbox.due(10, now + timedelta(days=1)) == []
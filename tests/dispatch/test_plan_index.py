@@ -0,0 +1,59 @@
+from datetime import date
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.value_objects import Appointment, AppointmentType, Container, ContainerSize, Instruction
+from src.domain.aggregates.driver.aggregate import Driver
+from tests.dispatch.fixtures import BROKER, CONTAINER, WAREHOUSE
+
+
+SECOND = Container('UMXU123456', ContainerSize.FORTY_HIGHCUBE)
+
+
+def create_dispatch() -> Dispatch:
+    plan = [
+        Task(1, WAREHOUSE, Instruction.PICKUP_LOADED, CONTAINER, date(2026, 3, 3), None),
+        Task(2, WAREHOUSE, Instruction.LIVE_UNLOAD, CONTAINER, date(2026, 3, 2), Appointment(AppointmentType.OPEN)),
+        Task(3, WAREHOUSE, Instruction.TERMINATE_EMPTY, CONTAINER, date(2026, 3, 4), None),
+    ]
+    return Dispatch(BROKER, Driver('Juan', 'Perez', 'Juanito'), plan)
+
+
+def test_views_follow_added_and_removed_tasks():
+    dispatch = create_dispatch()
+    assert dispatch.containers == [CONTAINER]
+
+    dispatch.add_task(Task(3, WAREHOUSE, Instruction.DROP_EMPTY, SECOND, date(2026, 3, 1), None))
+    dispatch.edit_task(3, WAREHOUSE, Instruction.DROP_EMPTY, SECOND, date(2026, 3, 1), Appointment(AppointmentType.OPEN))
+    assert dispatch.containers == [CONTAINER, SECOND]
+    assert [day for day, _ in dispatch.appointments] == [date(2026, 3, 1), date(2026, 3, 2)]
+
+    dispatch.remove_task(3)
+    assert dispatch.containers == [CONTAINER]
+    assert [day for day, _ in dispatch.appointments] == [date(2026, 3, 2)]
+
+
+def test_current_container_and_drivers_follow_task_transitions():
+    dispatch = create_dispatch()
+    dispatch.start()
+    assert dispatch.current_container is None
+
+    dispatch.start_task(1)
+    assert dispatch.current_container == CONTAINER
+
+    dispatch.complete_task(1)
+    assert dispatch.current_container is None
+    assert dispatch.assigned_drivers == [dispatch.current_driver]
+
+    dispatch.revert_task(1)
+    assert dispatch.current_container == CONTAINER
+
+
+def test_refresh_index_picks_up_changes_made_outside_the_aggregate():
+    dispatch = create_dispatch()
+    assert dispatch.containers == [CONTAINER]
+
+    dispatch.plan[0].container = SECOND
+    dispatch.refresh_index()
+
+    assert dispatch.containers == [SECOND, CONTAINER]
@@ -0,0 +1,62 @@
+from datetime import time
+
+import numpy as np
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.sequencing import PLAN_SEQUENCER, plan_locations
+from src.domain.aggregates.dispatch.value_objects import Appointment, AppointmentType, Instruction
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from tests.dispatch.fixtures import BROKER, CONTAINER, DAY, TERMINAL
+
+
+NORTH, SOUTH = (Location(name, Address('1 First St.', 'Chicago', 'IL', 60601)) for name in ('North', 'South'))
+
+
+def create_draft(stops: list[tuple[Location, Instruction, Appointment]]) -> Dispatch:
+    plan = [
+        Task(priority, location, instruction, CONTAINER, DAY, appointment)
+        for priority, (location, instruction, appointment) in enumerate(stops, start=1)
+    ]
+    return Dispatch(BROKER, None, plan)
+
+
+def travel(dispatch: Dispatch) -> np.ndarray:
+    # North is close to the terminal and far from the south.
+    minutes = {(TERMINAL.id, NORTH.id): 10, (TERMINAL.id, SOUTH.id): 40, (NORTH.id, SOUTH.id): 60}
+    locations = plan_locations(dispatch)
+    return np.array([
+        [minutes.get((a.id, b.id), minutes.get((b.id, a.id), 0)) for b in locations]
+        for a in locations
+    ])
+
+
+def test_live_unloads_are_reordered_to_keep_appointments():
+    dispatch = create_draft([
+        (TERMINAL, Instruction.PICKUP_LOADED, Appointment(AppointmentType.OPEN)),
+        (SOUTH, Instruction.LIVE_UNLOAD, Appointment(AppointmentType.EXACT_TIME, time(13))),
+        (NORTH, Instruction.LIVE_UNLOAD, Appointment(AppointmentType.EXACT_TIME, time(7))),
+        (TERMINAL, Instruction.TERMINATE_EMPTY, None),
+    ])
+
+    proposal = PLAN_SEQUENCER.propose(dispatch, travel(dispatch))
+
+    assert proposal.best.order == (0, 2, 1, 3)
+    assert proposal.best.missed_appointments == 0
+    assert proposal.current.missed_appointments == 1
+    assert proposal.changed
+
+
+def test_orders_that_break_the_follow_rules_are_never_proposed():
+    # Terminating first would save travel, but nothing may follow a termination.
+    dispatch = create_draft([
+        (SOUTH, Instruction.PICKUP_LOADED, None),
+        (NORTH, Instruction.LIVE_UNLOAD, None),
+        (SOUTH, Instruction.TERMINATE_EMPTY, None),
+    ])
+
+    proposal = PLAN_SEQUENCER.propose(dispatch, travel(dispatch))
+
+    assert proposal.best.order == (0, 1, 2)
+    assert not proposal.changed
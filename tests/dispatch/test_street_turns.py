@@ -0,0 +1,81 @@
+from datetime import date
+
+import numpy as np
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.street_turns import (
+    STREET_TURN_MATCHER,
+    empty_needs,
+    freed_empties,
+    street_turn_locations,
+)
+from src.domain.aggregates.dispatch.validation import PLAN_VALIDATOR
+from src.domain.aggregates.dispatch.value_objects import Container, ContainerSize, Instruction
+from tests.dispatch.fixtures import CONSIGNEE, EXPORT, IMPORT, POOL, SHIPPER, TERMINAL, create_draft
+
+
+MINUTES = {
+    (TERMINAL.id, CONSIGNEE.id): 60,
+    (TERMINAL.id, SHIPPER.id): 60,
+    (CONSIGNEE.id, SHIPPER.id): 10,
+}
+
+
+def create_import(container: Container, day: date) -> Dispatch:
+    return create_draft(IMPORT, container=container, day=day)
+
+
+def create_export(container: Container, day: date) -> Dispatch:
+    return create_draft(EXPORT, container=container, day=day)
+
+
+def propose(dispatches: list[Dispatch]):
+    freed = [empty for dispatch in dispatches for empty in freed_empties(dispatch)]
+    needs = [need for dispatch in dispatches for need in empty_needs(dispatch)]
+    locations = street_turn_locations(freed, needs)
+    travel = np.array([
+        [MINUTES.get((a.id, b.id), MINUTES.get((b.id, a.id), 0)) for b in locations]
+        for a in locations
+    ])
+    return STREET_TURN_MATCHER.propose(freed, needs, locations, travel)
+
+
+def test_an_unloaded_empty_is_street_turned_to_the_shipper_of_an_export_of_its_size():
+    freed = Container('CMAU1234567', ContainerSize.FORTY_STANDARD)
+    imported = create_import(freed, date(2026, 3, 2))
+    exported = create_export(Container('TGHU7654321', ContainerSize.FORTY_STANDARD), date(2026, 3, 3))
+
+    [turn] = propose([imported, exported])
+
+    assert turn.empty.dispatch is imported and turn.need.dispatch is exported
+    assert turn.saved_minutes == 110
+    assert turn.waiting_days == 1
+    assert [(task.location, task.instruction) for task in turn.import_plan] == [
+        (TERMINAL, Instruction.PICKUP_LOADED), (CONSIGNEE, Instruction.LIVE_UNLOAD), (SHIPPER, Instruction.STREET_TURN),
+    ]
+    assert [(task.location, task.instruction) for task in turn.export_plan] == [
+        (SHIPPER, Instruction.PICKUP_EMPTY), (SHIPPER, Instruction.LIVE_LOAD), (TERMINAL, Instruction.INGATE),
+    ]
+    assert all(task.container == freed for task in turn.export_plan)
+    for plan in (turn.import_plan, turn.export_plan):
+        assert PLAN_VALIDATOR.validate(
+            [task.instruction for task in plan], [task.container for task in plan]
+        ) == []
+
+
+def test_an_empty_is_not_street_turned_when_the_import_has_tasks_after_its_return():
+    imported = create_draft(IMPORT + [(POOL, Instruction.TERMINATE_CHASSIS)],
+                            container=Container('CMAU1234567', ContainerSize.FORTY_STANDARD), day=date(2026, 3, 2))
+    exported = create_export(Container('TGHU7654321', ContainerSize.FORTY_STANDARD), date(2026, 3, 2))
+
+    assert PLAN_VALIDATOR.validate([task.instruction for task in imported.plan]) == []
+    assert freed_empties(imported) == []
+    assert propose([imported, exported]) == []
+
+
+def test_empties_are_not_street_turned_across_sizes_or_too_long_after_they_are_freed():
+    imported = create_import(Container('CMAU1234567', ContainerSize.FORTY_STANDARD), date(2026, 3, 2))
+    other_size = create_export(Container('TGHU7654321', ContainerSize.TWENTY_STANDARD), date(2026, 3, 2))
+    too_late = create_export(Container('TGHU7654322', ContainerSize.FORTY_STANDARD), date(2026, 3, 5))
+
+    assert propose([imported, other_size, too_late]) == []
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.task_durations import MIN_DURATION_SAMPLES, DurationSketch
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from src.infrastructure.persistence.dispatch.memory import InMemoryDispatchRepository
+from src.infrastructure.persistence.task_durations.memory import InMemoryTaskDurationStatistics
+from tests.dispatch.fixtures import CONSIGNEE, TERMINAL, start_dispatch
+
+
+def unload(repository: InMemoryDispatchRepository, started_at: datetime, minutes: int) -> Dispatch:
+    dispatch = start_dispatch()
+    for priority in (1, 2):
+        dispatch.start_task(priority)
+        dispatch.complete_task(priority)
+    unloading = dispatch.plan[1]
+    unloading._check_in_datetime = started_at
+    unloading._check_out_datetime = started_at + timedelta(minutes=minutes)
+    repository.save(dispatch)
+    return dispatch
+
+
+def test_sketch_quantiles_follow_the_stream():
+    minutes = np.random.default_rng(7).lognormal(4, 0.5, 5000)
+    sketch = DurationSketch()
+    for value in minutes:
+        sketch.add(float(value))
+
+    estimate = sketch.estimate()
+    p50, p90 = np.quantile(minutes, [0.5, 0.9])
+    assert estimate.count == 5000
+    assert abs(estimate.p50_minutes - p50) / p50 < 0.02
+    assert abs(estimate.p90_minutes - p90) / p90 < 0.02
+    assert DurationSketch.from_state(sketch.to_state()).estimate() == estimate
+
+
+def test_estimates_come_from_the_hour_with_enough_completions_else_the_location():
+    statistics = InMemoryTaskDurationStatistics()
+    repository = InMemoryDispatchRepository(task_durations=statistics)
+    monday_eight = datetime(2026, 3, 2, 8, 15)
+    for day in range(MIN_DURATION_SAMPLES):
+        unload(repository, monday_eight + timedelta(weeks=day), 90)
+    dispatch = unload(repository, datetime(2026, 3, 3, 14), 30)
+
+    # Reverting and completing again does not count the task twice.
+    dispatch.revert_task(2)
+    dispatch.complete_task(2)
+    repository.save(dispatch)
+
+    at_eight = statistics.estimate(Instruction.LIVE_UNLOAD, CONSIGNEE.id, datetime(2026, 4, 6, 8, 40))
+    at_two = statistics.estimate(Instruction.LIVE_UNLOAD, CONSIGNEE.id, datetime(2026, 4, 7, 14, 5))
+    elsewhere = statistics.estimate(Instruction.LIVE_UNLOAD, TERMINAL.id, datetime(2026, 4, 7, 14, 5))
+
+    assert (at_eight.count, at_eight.p50_minutes) == (MIN_DURATION_SAMPLES, 90)
+    assert at_two.count == MIN_DURATION_SAMPLES + 1
+    assert elsewhere == at_two
+    assert statistics.estimate(Instruction.LIVE_LOAD, CONSIGNEE.id, monday_eight) is None
+    assert statistics.estimate_many([
+        (Instruction.LIVE_UNLOAD, CONSIGNEE.id, datetime(2026, 4, 6, 8, 40)),
+        (Instruction.LIVE_LOAD, CONSIGNEE.id, monday_eight),
+    ]) == [at_eight, None]
+
+
+def test_a_reverted_task_is_taken_back_out_of_the_sketches():
+    statistics = InMemoryTaskDurationStatistics()
+    repository = InMemoryDispatchRepository(task_durations=statistics)
+    monday_eight = datetime(2026, 3, 2, 8, 15)
+    outlier = unload(repository, monday_eight, 600)
+    for day in range(1, MIN_DURATION_SAMPLES + 1):
+        unload(repository, monday_eight + timedelta(weeks=day), 30 + day)
+    at = datetime(2026, 5, 4, 8, 40)
+    assert statistics.estimate(Instruction.LIVE_UNLOAD, CONSIGNEE.id, at).count == MIN_DURATION_SAMPLES + 1
+
+    outlier.revert_task(2)
+    repository.save(outlier)
+
+    remaining = DurationSketch()
+    for day in range(1, MIN_DURATION_SAMPLES + 1):
+        remaining.add(30 + day)
+    assert statistics.estimate(Instruction.LIVE_UNLOAD, CONSIGNEE.id, at) == remaining.estimate()
+    assert statistics.estimate(Instruction.LIVE_UNLOAD, TERMINAL.id, at) == remaining.estimate()
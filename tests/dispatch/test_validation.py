@@ -0,0 +1,130 @@
+import numpy as np
+
+from src.domain.aggregates.dispatch.validation import PLAN_VALIDATOR, PlanRule, PlanValidator
+from src.domain.aggregates.dispatch.value_objects import Instruction
+from tests.dispatch.fixtures import CONTAINER
+
+
+def rules(violations):
+    return [(v.rule, v.position) for v in violations]
+
+
+def test_valid_plan_has_no_violations():
+    plan = [
+        Instruction.FETCH_CHASSIS,
+        Instruction.PICKUP_LOADED,
+        Instruction.LIVE_UNLOAD,
+        Instruction.TERMINATE_EMPTY,
+        Instruction.TERMINATE_CHASSIS,
+    ]
+    containers = [None, CONTAINER, CONTAINER, CONTAINER, None]
+
+    assert PLAN_VALIDATOR.validate(plan, containers) == []
+
+
+def test_every_bad_transition_is_reported_with_its_position():
+    plan = [
+        Instruction.LIVE_LOAD,
+        Instruction.PICKUP_EMPTY,
+        Instruction.INGATE,
+        Instruction.DROP_EMPTY,
+    ]
+
+    assert rules(PLAN_VALIDATOR.validate(plan)) == [
+        (PlanRule.START, 0),
+        (PlanRule.FOLLOW, 1),
+        (PlanRule.FOLLOW, 2),
+        (PlanRule.FOLLOW, 3),
+        (PlanRule.END, 3),
+    ]
+
+
+def test_violation_messages_name_the_instructions():
+    violations = PLAN_VALIDATOR.validate([Instruction.PICKUP_LOADED, Instruction.PICKUP_EMPTY])
+
+    assert [v.message for v in violations] == [
+        'pickup_empty cannot follow pickup_loaded.',
+        'pickup_empty is not a valid ending instruction.',
+    ]
+
+
+def test_instructions_outside_allowed_repeat_can_only_appear_once():
+    plan = [
+        Instruction.BOBTAIL_TO,
+        Instruction.PICKUP_EMPTY,
+        Instruction.DROP_EMPTY,
+        Instruction.BOBTAIL_TO,
+    ]
+
+    assert rules(PLAN_VALIDATOR.validate(plan)) == [(PlanRule.REPEAT, 3)]
+
+
+def test_missing_containers_are_reported_per_task():
+    plan = [Instruction.PICKUP_EMPTY, Instruction.LIVE_LOAD, Instruction.INGATE]
+    containers = [CONTAINER, None, None]
+
+    assert rules(PLAN_VALIDATOR.validate(plan, containers)) == [
+        (PlanRule.CONTAINER, 1),
+        (PlanRule.CONTAINER, 2),
+    ]
+
+
+def test_container_rules_are_skipped_without_containers():
+    plan = [Instruction.PICKUP_EMPTY, Instruction.LIVE_LOAD, Instruction.INGATE]
+
+    assert PLAN_VALIDATOR.validate(plan) == []
+
+
+def test_empty_plan():
+    assert rules(PLAN_VALIDATOR.validate([])) == [(PlanRule.EMPTY, None)]
+
+
+def test_validate_many_matches_validate():
+    plans = [
+        [Instruction.PICKUP_EMPTY, Instruction.LIVE_LOAD, Instruction.INGATE],
+        [Instruction.LIVE_LOAD, Instruction.INGATE],
+        [Instruction.PICKUP_EMPTY, Instruction.LIVE_LOAD, Instruction.INGATE],
+    ]
+
+    assert PLAN_VALIDATOR.validate_many(plans) == [PLAN_VALIDATOR.validate(p) for p in plans]
+
+
+def test_validator_compiles_custom_tables():
+    validator = PlanValidator(
+        startable=[Instruction.PICKUP_EMPTY],
+        allowed_follows={Instruction.PICKUP_EMPTY: [Instruction.INGATE]},
+        endable=[Instruction.INGATE],
+        allowed_repeat=[],
+    )
+
+    assert validator.can_follow(Instruction.PICKUP_EMPTY, Instruction.INGATE)
+    assert not validator.can_follow(Instruction.PICKUP_EMPTY, Instruction.LIVE_LOAD)
+    assert validator.validate([Instruction.PICKUP_EMPTY, Instruction.INGATE]) == []
+
+
+def test_rules_decode_the_compiled_tables():
+    rules = PLAN_VALIDATOR.rules()
+
+    assert rules.instructions == tuple(Instruction)
+    assert Instruction.LIVE_UNLOAD in rules.follows[Instruction.PICKUP_LOADED]
+    assert all(
+        PLAN_VALIDATOR.can_follow(current, following) == (following in rules.follows[current])
+        for current in Instruction for following in Instruction
+    )
+    assert Instruction.FETCH_CHASSIS not in rules.needs_container
+
+
+def test_validate_many_matches_validate_on_random_plans():
+    random = np.random.default_rng(7)
+    instructions = list(Instruction)
+    plans, containers = [], []
+    for _ in range(300):
+        length = random.integers(0, 7)
+        plans.append([instructions[code] for code in random.integers(0, len(instructions), length)])
+        containers.append([CONTAINER if random.random() < 0.8 else None for _ in range(length)])
+
+    assert PLAN_VALIDATOR.validate_many(plans, containers) == [
+        PLAN_VALIDATOR.validate(plan, plan_containers) for plan, plan_containers in zip(plans, containers)
+    ]
+    assert PLAN_VALIDATOR.validate_many(plans) == [PLAN_VALIDATOR.validate(plan) for plan in plans]
+    assert PLAN_VALIDATOR.validate_many([]) == []
@@ -0,0 +1,44 @@
+from src.application.common.event_bus import EventBus
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.driver.events import DriverBeganOperating, DriverReleased
+from src.domain.common.events import DomainEvent
+
+
+def test_transitions_record_events_until_pulled():
+    driver = Driver('Juan', 'Perez', 'Juanito')
+
+    driver.begin_operating()
+    driver.release()
+
+    events = driver.pull_events()
+    assert [type(event) for event in events] == [DriverBeganOperating, DriverReleased]
+    assert all(event.driver_id == driver.id for event in events)
+    assert driver.pull_events() == []
+
+
+def test_bus_delivers_to_subscribers_of_the_event_and_its_bases():
+    bus = EventBus()
+    specific, everything = [], []
+    bus.subscribe(DriverReleased, specific.append)
+    bus.subscribe(DomainEvent, everything.append)
+    driver = Driver('Juan', 'Perez', 'Juanito')
+    driver.begin_operating()
+    driver.release()
+
+    bus.publish_from(driver)
+
+    assert [type(event) for event in specific] == [DriverReleased]
+    assert [type(event) for event in everything] == [DriverBeganOperating, DriverReleased]
+
+
+def test_failing_handler_does_not_stop_the_others():
+    bus = EventBus()
+    received = []
+    bus.subscribe(DomainEvent, lambda event: 1 / 0)
+    bus.subscribe(DomainEvent, received.append)
+    driver = Driver('Juan', 'Perez', 'Juanito')
+    driver.sit_out()
+
+    bus.publish_from(driver)
+
+    assert len(received) == 1
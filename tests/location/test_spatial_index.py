@@ -0,0 +1,106 @@
+import numpy as np
+
+from src.application.dtos.location_dtos import NearbyLocationsRequest
+from src.application.use_cases.location_use_cases import NearbyLocationsUseCase
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.domain.common.geo import unit_vectors
+from src.domain.common.kdtree import KDTree
+from src.infrastructure.persistence.location.memory import InMemoryLocationRepository
+from src.infrastructure.travel.centroids import ZipcodeCentroids
+from src.infrastructure.travel.spatial import InMemoryLocationSpatialIndex
+
+
+# One degree of latitude apart, about 69 miles.
+CENTROIDS = ZipcodeCentroids(np.array([100, 200, 300, 400]), np.array([40.0, 41.0, 42.0, 43.0]),
+                             np.zeros(4), digits=3)
+
+
+class CountingLocationRepository(InMemoryLocationRepository):
+    def __init__(self):
+        super().__init__()
+        self.fetched = []
+
+    def get_many(self, location_ids):
+        self.fetched.append(list(location_ids))
+        return super().get_many(location_ids)
+
+
+def create_location(name: str, zipcode: int) -> Location:
+    return Location(name, Address('1 First St.', 'Chicago', 'IL', zipcode))
+
+
+def test_tree_answers_match_brute_force():
+    generator = np.random.default_rng(7)
+    points = unit_vectors(generator.uniform(25, 49, 2000), generator.uniform(-124, -67, 2000))
+    tree = KDTree(points)
+
+    for point in unit_vectors(generator.uniform(25, 49, 20), generator.uniform(-124, -67, 20)):
+        distances = np.sqrt(((points - point) ** 2).sum(axis=1))
+
+        indexes, found = tree.nearest(point, 5)
+        assert np.allclose(found, np.sort(distances)[:5])
+        assert np.allclose(distances[indexes], found)
+
+        indexes, found = tree.within(point, 0.05)
+        assert set(indexes.tolist()) == set(np.flatnonzero(distances <= 0.05).tolist())
+        assert np.all(np.diff(found) >= 0)
+
+
+def test_index_follows_locations_as_they_change():
+    index = InMemoryLocationSpatialIndex(CENTROIDS)
+    first, second, third = create_location('A', 10001), create_location('B', 20001), create_location('C', 30001)
+    index.rebuild([first, second, third])
+
+    assert [location_id for location_id, _ in index.nearest(30001, 2)] == [third.id, second.id]
+    assert [location_id for location_id, _ in index.within(10001, 70)] == [first.id, second.id]
+
+    index.remove(third.id)
+    first.address = Address('1 First St.', 'Chicago', 'IL', 40001)
+    index.put(first)
+    fourth = create_location('D', 30001)
+    index.put(fourth)
+
+    nearest = index.nearest(40001, 3)
+    assert [location_id for location_id, _ in nearest] == [first.id, fourth.id, second.id]
+    assert abs(nearest[1][1] - 69) < 1
+
+
+def test_nearby_locations_fetches_only_the_nearest_in_one_call():
+    repository = CountingLocationRepository()
+    locations = [create_location(name, zipcode) for name, zipcode in
+                 [('A', 10001), ('B', 20001), ('C', 30001), ('D', 40001)]]
+    for location in locations:
+        repository.save(location)
+    use_case = NearbyLocationsUseCase(repository, InMemoryLocationSpatialIndex(CENTROIDS))
+
+    result = use_case.execute(NearbyLocationsRequest(location_id=str(locations[0].id), limit=2))
+
+    assert [(nearby.location.name, round(nearby.miles)) for nearby in result.value] == [('B', 69), ('C', 138)]
+    assert repository.fetched == [[locations[1].id, locations[2].id]]
+
+
+def test_locations_without_a_centroid_are_left_out():
+    index = InMemoryLocationSpatialIndex(CENTROIDS)
+    placed, unplaced = create_location('A', 10001), create_location('B', 50001)
+    index.rebuild([placed, unplaced])
+
+    assert [location_id for location_id, _ in index.nearest(10001, 5)] == [placed.id]
+    assert index.nearest(50001, 5) == [] and index.within(50001, 1000) == []
+
+    placed.address = Address('1 First St.', 'Chicago', 'IL', 50001)
+    index.put(placed)
+    assert index.nearest(10001, 5) == []
+
+
+def test_locations_in_the_same_prefix_are_placed_by_their_own_zipcode():
+    zipcodes = ZipcodeCentroids(np.array([10001, 10002, 30001]), np.array([40.0, 40.5, 42.0]), np.zeros(3),
+                                digits=5, fallback=CENTROIDS)
+    index = InMemoryLocationSpatialIndex(zipcodes)
+    near, far, other = create_location('A', 10001), create_location('B', 10002), create_location('C', 20001)
+    index.rebuild([near, far, other])
+
+    found = dict(index.within(30001, 200))
+    assert set(found) == {near.id, far.id, other.id}
+    assert found[near.id] - found[far.id] > 30
+    assert abs(found[other.id] - 69) < 1
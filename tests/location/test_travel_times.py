@@ -0,0 +1,71 @@
+import numpy as np
+
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.domain.common.geo import haversine_km
+from src.infrastructure.persistence.travel_time.memory import InMemoryTravelTimeRepository
+from src.infrastructure.travel.centroids import ZipcodeCentroids
+from src.infrastructure.travel.estimates import TravelTimeEstimator
+
+
+def create_location(name: str, zipcode: int) -> Location:
+    return Location(name, Address('1 First St.', 'Chicago', 'IL', zipcode))
+
+
+def test_haversine_broadcasts_to_a_matrix():
+    latitudes, longitudes = np.array([41.88, 40.75]), np.array([-87.63, -73.99])
+
+    kilometres = haversine_km(latitudes[:, None], longitudes[:, None], latitudes[None, :], longitudes[None, :])
+
+    assert kilometres.shape == (2, 2)
+    assert np.allclose(np.diag(kilometres), 0)
+    # Chicago to New York is about 1,145 km as the crow flies.
+    assert abs(kilometres[0, 1] - 1145) < 15
+
+
+def test_unknown_zipcodes_are_not_given_a_neighbours_centroid():
+    prefixes = ZipcodeCentroids(np.array([606, 608, 620]), np.array([1.0, 2.0, 3.0]), np.array([0, 0, 0]), digits=3)
+    zipcodes = ZipcodeCentroids(np.array([60616]), np.array([4.0]), np.array([0]), digits=5, fallback=prefixes)
+
+    latitudes, _ = prefixes.locate([60616, 60701, 62099, 99999, 10001])
+    assert np.isnan(latitudes).tolist() == [False, True, False, True, True]
+    assert latitudes[[0, 2]].tolist() == [1.0, 3.0]
+
+    latitudes, _ = zipcodes.locate([60616, 60617, 60801, 60701])
+    assert latitudes[:3].tolist() == [4.0, 1.0, 2.0] and np.isnan(latitudes[3])
+
+
+def test_bundled_prefixes_are_located_in_their_own_area():
+    centroids = ZipcodeCentroids.bundled()
+
+    # Crown Point, in northwest Indiana, not Indianapolis 130 miles south.
+    latitudes, longitudes = centroids.locate([46307, 46204])
+    assert abs(latitudes[0] - 41.42) < 0.3 and abs(longitudes[0] + 87.37) < 0.4
+    assert haversine_km(latitudes[0], longitudes[0], latitudes[1], longitudes[1]) > 150
+
+    latitudes, longitudes = centroids.locate([60616, 60707, 60803])
+    assert len(set(zip(latitudes.tolist(), longitudes.tolist()))) == 3
+    assert not np.isnan(centroids.locate([10001, 33101, 59801, 99501])[0]).any()
+
+
+def test_zipcodes_with_no_centroid_take_the_unknown_minutes():
+    centroids = ZipcodeCentroids(np.array([606]), np.array([41.84]), np.array([-87.68]), digits=3)
+    estimator = TravelTimeEstimator(centroids)
+
+    minutes = estimator.minutes([60616, 9001], [60616, 60632, 9001])
+
+    assert minutes[0].tolist() == [estimator.local_minutes] * 2 + [estimator.unknown_minutes]
+    assert minutes[1].tolist() == [estimator.unknown_minutes] * 2 + [estimator.local_minutes]
+
+
+def test_matrix_grows_as_locations_are_asked_about():
+    repository = InMemoryTravelTimeRepository()
+    chicago, rail_yard, gary = create_location('Chicago', 60616), create_location('Yard', 60632), create_location('Gary', 46402)
+
+    minutes = repository.matrix([chicago, rail_yard], [chicago, rail_yard])
+    assert minutes[0, 0] == 0 and minutes[0, 1] == repository.times.estimator.local_minutes
+
+    towards_gary = repository.from_location(chicago, [rail_yard, gary])
+    assert towards_gary[1] > towards_gary[0]
+    assert set(repository.times.index) == {60616, 60632, 46402}
+    assert np.allclose(repository.matrix([gary], [chicago]), towards_gary[1])
@@ -0,0 +1,77 @@
+from datetime import date
+
+import pytest
+
+from src.application.common.event_bus import EventBus
+from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.events import TaskCompleted
+from src.domain.aggregates.dispatch.value_objects import (
+    Appointment,
+    AppointmentType,
+    Container,
+    ContainerSize,
+    Instruction,
+)
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.infrastructure.persistence.broker.database import SQLAlchemyBrokerRepository
+from src.infrastructure.persistence.container_inventory.database import SQLAlchemyContainerInventory
+from src.infrastructure.persistence.dispatch.database import SQLAlchemyDispatchRepository
+from src.infrastructure.persistence.driver.database import SQLAlchemyDriverRepository
+from src.infrastructure.persistence.location.database import SQLAlchemyLocationRepository
+from tests.database import session_factory
+
+
+class FailingContainerInventory(SQLAlchemyContainerInventory):
+    """Fails the next save it records moves in, once armed."""
+
+    armed = False
+
+    def record_in(self, session, dispatch, events):
+        if self.armed:
+            self.armed = False
+            raise RuntimeError('Inventory unavailable')
+        super().record_in(session, dispatch, events)
+
+
+def test_a_failed_save_keeps_the_events_for_the_retry():
+    # Entities are created here rather than shared, as they are mapped once the database is set up.
+    factory = session_factory()
+    terminal = Location('Retry Terminal', Address('1 Retry Rd.', 'Chicago', 'IL', 60609))
+    consignee = Location('Retry Consignee', Address('2 Retry Rd.', 'Chicago', 'IL', 60609))
+    broker = Broker('Retry Broker', Address('3 Retry Rd.', 'Chicago', 'IL', 60609))
+    driver = Driver('Reintento', 'Perez', 'Retry')
+    for location in (terminal, consignee):
+        SQLAlchemyLocationRepository(factory).save(location)
+    SQLAlchemyBrokerRepository(factory).save(broker)
+    SQLAlchemyDriverRepository(factory).save(driver)
+
+    bus, published = EventBus(), []
+    bus.subscribe(TaskCompleted, published.append)
+    inventory = FailingContainerInventory(factory)
+    repository = SQLAlchemyDispatchRepository(factory, bus, container_inventory=inventory)
+    container = Container('RTRU1234567', ContainerSize.FORTY_STANDARD)
+    dispatch = Dispatch(broker, driver, [
+        Task(1, terminal, Instruction.PICKUP_LOADED, container, date(2026, 3, 2), Appointment(AppointmentType.OPEN)),
+        Task(2, consignee, Instruction.LIVE_UNLOAD, container, date(2026, 3, 2), None),
+        Task(3, terminal, Instruction.TERMINATE_EMPTY, container, date(2026, 3, 2), None),
+    ])
+    repository.save_many([dispatch])
+    dispatch.start()
+    repository.save(dispatch)
+
+    dispatch.start_task(1)
+    dispatch.complete_task(1)
+    inventory.armed = True
+    with pytest.raises(RuntimeError):
+        repository.save(dispatch)
+    assert published == []
+    assert inventory.outstanding() == []
+
+    repository.save(dispatch)
+    assert [event.task_id for event in published] == [dispatch.plan[0].id]
+    assert [move.task_id for move in inventory.outstanding()] == [dispatch.plan[0].id]
+    assert dispatch.peek_events() == []
@@ -0,0 +1,62 @@
+from datetime import date, datetime, timedelta
+
+from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.dispatch.aggregate import Dispatch
+from src.domain.aggregates.dispatch.entities import Task
+from src.domain.aggregates.dispatch.task_durations import DurationSketch
+from src.domain.aggregates.dispatch.value_objects import (
+    Appointment,
+    AppointmentType,
+    Container,
+    ContainerSize,
+    Instruction,
+)
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.infrastructure.persistence.task_durations.database import SQLAlchemyTaskDurationStatistics
+from tests.database import session_factory
+
+
+def unload(statistics: SQLAlchemyTaskDurationStatistics, consignee: Location, started_at: datetime,
+           minutes: int) -> Dispatch:
+    # Entities are created here rather than shared, as they are mapped once the database is set up.
+    terminal = Location('Sketch Terminal', Address('1 Rail Rd.', 'Chicago', 'IL', 60609))
+    container = Container('CMAU1234567', ContainerSize.FORTY_STANDARD)
+    dispatch = Dispatch(
+        Broker('Sketch Broker', Address('2 First St.', 'Chicago', 'IL', 60601)),
+        Driver('Juan', 'Perez', None),
+        [
+            Task(1, terminal, Instruction.PICKUP_LOADED, container, date(2026, 3, 2), Appointment(AppointmentType.OPEN)),
+            Task(2, consignee, Instruction.LIVE_UNLOAD, container, date(2026, 3, 2), None),
+            Task(3, terminal, Instruction.TERMINATE_EMPTY, container, date(2026, 3, 2), None),
+        ],
+    )
+    dispatch.start()
+    for priority in (1, 2):
+        dispatch.start_task(priority)
+        dispatch.complete_task(priority)
+    dispatch.plan[1]._check_in_datetime = started_at
+    dispatch.plan[1]._check_out_datetime = started_at + timedelta(minutes=minutes)
+    statistics.record(dispatch, dispatch.pull_events())
+    return dispatch
+
+
+def test_sketches_are_written_after_the_durations_and_take_reverts_back():
+    statistics = SQLAlchemyTaskDurationStatistics(session_factory())
+    consignee = Location('Sketch Consignee', Address('3 First St.', 'Chicago', 'IL', 60601))
+    monday_eight = datetime(2026, 3, 2, 8, 15)
+    outlier = unload(statistics, consignee, monday_eight, 600)
+    for week in range(1, 6):
+        unload(statistics, consignee, monday_eight + timedelta(weeks=week), 30 + week)
+    at = datetime(2026, 5, 4, 8, 40)
+    assert statistics.estimate(Instruction.LIVE_UNLOAD, consignee.id, at).count == 6
+
+    outlier.revert_task(2)
+    statistics.record(outlier, outlier.pull_events())
+
+    remaining = DurationSketch()
+    for week in range(1, 6):
+        remaining.add(30 + week)
+    assert statistics.estimate(Instruction.LIVE_UNLOAD, consignee.id, at) == remaining.estimate()
+    assert statistics.estimate_many([(Instruction.LIVE_UNLOAD, consignee.id, at)]) == [remaining.estimate()]
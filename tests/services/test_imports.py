@@ -0,0 +1,75 @@
+import json
+
+from src.application.use_cases.import_use_cases import ImportReferenceDataUseCase
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.infrastructure.persistence.broker.memory import InMemoryBrokerRepository
+from src.infrastructure.persistence.driver.memory import InMemoryDriverRepository
+from src.infrastructure.persistence.location.memory import InMemoryLocationRepository
+from src.interfaces.controllers.import_controller import ImportController
+from src.interfaces.presenters.import_presenter import CliImportPresenter, WebImportPresenter
+
+
+def create_controller(locations=None, drivers=None, presenter=None) -> ImportController:
+    use_case = ImportReferenceDataUseCase(
+        locations or InMemoryLocationRepository(), InMemoryBrokerRepository(), drivers or InMemoryDriverRepository()
+    )
+    return ImportController(use_case, presenter or CliImportPresenter())
+
+
+def test_locations_are_created_once_and_duplicates_and_invalid_rows_reported_by_row():
+    locations = InMemoryLocationRepository()
+    locations.save(Location('Yard', Address('2 First St.', 'Chicago', 'IL', 60601)))
+    content = '\n'.join([
+        'name,street_address,city,state,zipcode',
+        'Terminal,1 Rail Rd.,Chicago,IL,60609',
+        'Terminal,9 Rail Rd.,Chicago,IL,60609',
+        'Other Yard,2 First St.,Chicago,IL,60601',
+        'Warehouse,1 First St.,Chicago,Illinois,60601',
+        'Consignee,3 First St.,Chicago,IL,60601',
+    ])
+
+    report = create_controller(locations=locations).handle_import_reference('locations', content).success
+
+    assert (report.kind, report.created, report.skipped, report.failed) == ('Locations', 2, 2, 1)
+    assert [(row.row, row.outcome, row.message) for row in report.rows] == [
+        (2, 'Skipped', 'Duplicate of row 1.'),
+        (3, 'Skipped', 'A location with that address already exists.'),
+        (4, 'Error', 'State abbreviation must be 2 characters'),
+    ]
+    assert sorted(location.name for location in locations.get_all()) == ['Consignee', 'Terminal', 'Yard']
+
+
+def test_drivers_are_unique_by_nickname_only():
+    drivers = InMemoryDriverRepository()
+    drivers.save(Driver('Ana', 'Lopez', 'Annie'))
+    content = json.dumps([
+        {'first_name': 'Juan', 'last_name': 'Perez', 'nickname': 'Juanito'},
+        {'first_name': 'Juan', 'last_name': 'Perez'},
+        {'first_name': 'Juan', 'last_name': 'Perez', 'nickname': ''},
+        {'first_name': 'Ana', 'last_name': 'Ruiz', 'nickname': 'Annie'},
+    ])
+    controller = create_controller(drivers=drivers)
+
+    report = controller.handle_import_reference('drivers', content, 'json').success
+
+    assert (report.created, report.skipped, report.failed) == (3, 1, 0)
+    assert report.rows[0].message == 'A driver with that nickname already exists.'
+    assert len(drivers.get_all()) == 4
+    assert not controller.handle_import_reference('drivers', '[{"first_name": ', 'json').is_success
+    assert not controller.handle_import_reference('trucks', content, 'json').is_success
+
+
+def test_web_reports_keep_the_kind_and_outcomes_as_values():
+    content = '\n'.join([
+        'name,street_address,city,state,zipcode',
+        'Warehouse,1 First St.,Chicago,Illinois,60601',
+        'Warehouse,1 First St.,Chicago,IL,60601',
+        'Warehouse,2 First St.,Chicago,IL,60601',
+    ])
+
+    report = create_controller(presenter=WebImportPresenter()).handle_import_reference('locations', content).success
+
+    assert (report.kind, report.created, report.skipped, report.failed) == ('locations', 1, 1, 1)
+    assert [(row.row, row.outcome) for row in report.rows] == [(1, 'error'), (3, 'skipped')]
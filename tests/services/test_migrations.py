@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.migrations import MigrationError, add_driver_uniqueness, add_location_uniqueness
+from tests.database import session_factory
+
+
+def test_existing_duplicates_are_listed_before_a_unique_constraint_is_added():
+    engine = create_engine('sqlite://')
+    with engine.begin() as connection:
+        # Tables as they stood before their unique constraints.
+        connection.execute(text(
+            'CREATE TABLE locations (id TEXT PRIMARY KEY, name TEXT, street_address TEXT, city TEXT, '
+            'state TEXT, zipcode INTEGER)'
+        ))
+        connection.execute(text('CREATE TABLE drivers (id TEXT PRIMARY KEY, nickname TEXT)'))
+        connection.execute(text(
+            "INSERT INTO locations VALUES ('1', 'Yard', '1 Rail Rd.', 'Chicago', 'IL', 60609), "
+            "('2', 'Yard', '2 Rail Rd.', 'Chicago', 'IL', 60609), ('3', 'Pool', '3 Rail Rd.', 'Chicago', 'IL', 60609)"
+        ))
+        connection.execute(text("INSERT INTO drivers VALUES ('1', NULL), ('2', NULL), ('3', 'Flaco'), ('4', 'Flaco')"))
+
+    with engine.begin() as connection, pytest.raises(MigrationError) as error:
+        add_location_uniqueness(connection)
+    assert str(error.value) == (
+        "Cannot add uq_locations_name to locations, rows share these values of (name): 'Yard' (2 rows)."
+    )
+
+    # Drivers without a nickname do not conflict.
+    with engine.begin() as connection, pytest.raises(MigrationError, match=r"'Flaco' \(2 rows\)\.$"):
+        add_driver_uniqueness(connection)
+
+
+def test_tables_created_with_their_constraints_are_left_alone():
+    with session_factory().kw['bind'].begin() as connection:
+        add_location_uniqueness(connection)
+        add_driver_uniqueness(connection)
@@ -0,0 +1,48 @@
+from src.application.dtos.search_dtos import TypeaheadSearchRequest
+from src.application.use_cases.search_use_cases import TypeaheadSearchUseCase
+from src.domain.aggregates.broker.aggregate import Broker
+from src.domain.aggregates.driver.aggregate import Driver
+from src.domain.aggregates.location.aggregate import Location
+from src.domain.aggregates.location.value_objects import Address
+from src.infrastructure.persistence.broker.memory import InMemoryBrokerRepository
+from src.infrastructure.persistence.driver.memory import InMemoryDriverRepository
+from src.infrastructure.persistence.location.memory import InMemoryLocationRepository
+from src.infrastructure.persistence.search import NgramIndex
+
+
+def test_index_ranks_prefixes_and_tolerates_typos():
+    index = NgramIndex()
+    index.put('yard', ('BNSF Chicago Yard', '2 Rail St. Chicago'))
+    index.put('chicago', ('Chicago Ridge Warehouse', '1 First St. Chicago Ridge'))
+    index.put('joliet', ('Acme', '3 Main St. Joliet'))
+
+    assert [key for key, _ in index.search('chic', 10)] == ['chicago', 'yard']
+    assert [key for key, _ in index.search('joilet', 10)] == []
+    assert [key for key, _ in index.search('jolet', 10)] == ['joliet']
+
+    index.put('chicago', ('Ridge Warehouse', '1 First St. Alsip'))
+    index.remove('yard')
+    assert index.search('chic', 10) == []
+
+
+def test_search_pages_through_every_kind():
+    locations, brokers, drivers = InMemoryLocationRepository(), InMemoryBrokerRepository(), InMemoryDriverRepository()
+    for number in range(3):
+        locations.save(Location(f'Marquette Yard {number}', Address(f'{number} Rail St.', 'Chicago', 'IL', 60609)))
+    brokers.save(Broker('Marquette Logistics', Address('2 First St.', 'Chicago', 'IL', 60601)))
+    drivers.save(Driver('Marco', 'Perez', 'Marq'))
+    inactive = Broker('Marquette Freight', Address('3 First St.', 'Chicago', 'IL', 60601))
+    inactive.deactivate()
+    brokers.save(inactive)
+    use_case = TypeaheadSearchUseCase(locations, brokers, drivers)
+
+    first = use_case.execute(TypeaheadSearchRequest('marq', per_page=3)).value
+    second = use_case.execute(TypeaheadSearchRequest('marq', page=2, per_page=3)).value
+
+    assert first.has_more and not second.has_more
+    hits = first.hits + second.hits
+    assert sorted(hit.kind for hit in hits) == ['broker', 'driver', 'location', 'location', 'location']
+    assert 'Marquette Freight' not in {hit.label for hit in hits}
+
+    only_drivers = use_case.execute(TypeaheadSearchRequest('marq', kinds='driver')).value
+    assert [hit.label for hit in only_drivers.hits] == ['Marco Perez']
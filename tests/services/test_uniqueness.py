@@ -0,0 +1,77 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.application.dtos.broker_dtos import CreateBrokerRequest, EditBrokerRequest
+from src.application.dtos.driver_dtos import CreateDriverRequest, EditDriverRequest
+from src.application.dtos.location_dtos import CreateLocationRequest, EditLocationRequest
+from src.application.use_cases.broker_use_cases import CreateBrokerUseCase, EditBrokerUseCase
+from src.application.use_cases.driver_use_cases import CreateDriverUseCase, EditDriverUseCase
+from src.application.use_cases.location_use_cases import CreateLocationUseCase, EditLocationUseCase
+from src.infrastructure.persistence.broker.database import SQLAlchemyBrokerRepository
+from src.infrastructure.persistence.broker.memory import InMemoryBrokerRepository
+from src.infrastructure.persistence.driver.database import SQLAlchemyDriverRepository
+from src.infrastructure.persistence.driver.memory import InMemoryDriverRepository
+from src.infrastructure.persistence.location.database import SQLAlchemyLocationRepository
+from src.infrastructure.persistence.location.memory import InMemoryLocationRepository
+from tests.database import session_factory
+
+
+STORAGES = ('memory', 'database')
+ADDRESSED = {
+    'location': (
+        InMemoryLocationRepository, SQLAlchemyLocationRepository,
+        CreateLocationUseCase, EditLocationUseCase, CreateLocationRequest, EditLocationRequest,
+    ),
+    'broker': (
+        InMemoryBrokerRepository, SQLAlchemyBrokerRepository,
+        CreateBrokerUseCase, EditBrokerUseCase, CreateBrokerRequest, EditBrokerRequest,
+    ),
+}
+
+
+def create_repository(storage: str, memory_type, database_type):
+    return memory_type() if storage == 'memory' else database_type(session_factory())
+
+
+def addressed(name: str, street: str) -> dict:
+    # The database is shared by every test, so names and streets are made unique to each one.
+    return {'name': name, 'street_address': street, 'city': 'Chicago', 'state': 'IL', 'zipcode': '60601'}
+
+
+@pytest.mark.parametrize('kind', ADDRESSED)
+@pytest.mark.parametrize('storage', STORAGES)
+def test_names_and_addresses_are_unique_on_create_and_edit(storage, kind):
+    memory_type, database_type, create, edit, create_request, edit_request = ADDRESSED[kind]
+    repository = create_repository(storage, memory_type, database_type)
+    run = uuid4().hex[:8]
+    first = create(repository).execute(create_request(**addressed(f'Yard {run}', f'1 {run} St.'))).value
+    second = create(repository).execute(create_request(**addressed(f'Dock {run}', f'2 {run} St.'))).value
+
+    same_name = create(repository).execute(create_request(**addressed(f'Yard {run}', f'3 {run} St.')))
+    same_address = create(repository).execute(create_request(**addressed(f'Pier {run}', f'1 {run} St.')))
+    assert same_name.error.message == f'A {kind} with that name already exists.'
+    assert same_address.error.message == f'A {kind} with that address already exists.'
+
+    renamed = edit(repository).execute(edit_request(second.id, **addressed(f'Yard {run}', f'2 {run} St.')))
+    assert renamed.error.message == f'A {kind} with that name already exists.'
+    # The rejected edit leaves the stored record as it was.
+    assert repository.get(UUID(second.id)).name == f'Dock {run}'
+    assert edit(repository).execute(edit_request(second.id, **addressed(f'Dock {run}', f'4 {run} St.'))).is_success
+    assert first.name == f'Yard {run}'
+
+
+@pytest.mark.parametrize('storage', STORAGES)
+def test_nicknames_are_unique_on_create_and_edit(storage):
+    repository = create_repository(storage, InMemoryDriverRepository, SQLAlchemyDriverRepository)
+    run = uuid4().hex[:8]
+    first = CreateDriverUseCase(repository).execute(CreateDriverRequest('Juan', 'Perez', f'Juanito {run}')).value
+    second = CreateDriverUseCase(repository).execute(CreateDriverRequest('Ana', 'Lopez', f'Annie {run}')).value
+
+    duplicate = CreateDriverUseCase(repository).execute(CreateDriverRequest('Juan', 'Ruiz', f'Juanito {run}'))
+    assert duplicate.error.message == 'A driver with that nickname already exists.'
+
+    renamed = EditDriverUseCase(repository).execute(EditDriverRequest(second.id, 'Ana', 'Lopez', f'Juanito {run}'))
+    assert renamed.error.message == 'A driver with that nickname already exists.'
+    assert repository.get(UUID(second.id)).nickname == f'Annie {run}'
+    assert first.nickname == f'Juanito {run}'
@@ -1,14 +1,23 @@
 """
 Entry point for the web interface of the Todo App.
 """
+import os
+
 from dotenv import load_dotenv
 
 from src.infrastructure.configuration.container import create_application
+from src.infrastructure.notifications.relay import OutboxRelay
+from src.infrastructure.notifications.sinks import create_notification_sink
 from src.infrastructure.web.app import create_web_app
 from src.interfaces.presenters.broker_presenter import WebBrokerPresenter
+from src.interfaces.presenters.clock_presenter import WebClockPresenter
+from src.interfaces.presenters.container_presenter import WebContainerPresenter
 from src.interfaces.presenters.dispatch_presenter import WebDispatchPresenter
 from src.interfaces.presenters.driver_presenter import WebDriverPresenter
+from src.interfaces.presenters.export_presenter import StreamingExportPresenter
+from src.interfaces.presenters.import_presenter import WebImportPresenter
 from src.interfaces.presenters.location_presenter import WebLocationPresenter
+from src.interfaces.presenters.search_presenter import WebSearchPresenter
 from src.interfaces.presenters.task_presenter import WebTaskPresenter
 
 
@@ -22,9 +31,22 @@ def main():
         dispatch_presenter=WebDispatchPresenter(),
         driver_presenter=WebDriverPresenter(),
         location_presenter=WebLocationPresenter(),
-        task_presenter=WebTaskPresenter()
+        task_presenter=WebTaskPresenter(),
+        export_presenter=StreamingExportPresenter(),
+        import_presenter=WebImportPresenter(),
+        search_presenter=WebSearchPresenter(),
+        container_presenter=WebContainerPresenter(),
+        clock_presenter=WebClockPresenter(),
     )
     web_app = create_web_app(app_container)
+
+    # Estimate travel times between the active locations now, not on the first request that needs them.
+    app_container.travel_time_repository.refresh(app_container.location_repository.get_active())
+
+    # With the reloader on, only the child process serves requests; relay from there alone.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        OutboxRelay(app_container.notification_outbox, create_notification_sink()).start()
+
     web_app.run(
         debug=True,
         host='0.0.0.0',